@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from codex_django.cabinet.selector.dashboard import DashboardSelector
 from codex_django.cabinet.types.widgets import ListItem, ListWidgetData, MetricWidgetData
-from django.db.models import Count, DecimalField, Sum
-from django.db.models.functions import Coalesce, TruncDate
+from django.db.models import Q, Sum
 from django.urls import reverse_lazy
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -27,30 +26,34 @@ def _week_range() -> tuple[Any, Any]:
     return now - timedelta(days=6), now
 
 
+def _revenue_statuses() -> list[str]:
+    from features.booking.models import Appointment
+
+    return [Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED]
+
+
 @dataclass
 class AnalyticsService:
     @staticmethod
     def get_kpi_metrics() -> dict[str, MetricWidgetData]:
-        from features.booking.models import Appointment
+        from features.booking.services.rollup import rollup_rows
 
-        month_start, now = _month_range()
+        month_start, _now = _month_range()
         prev_start = (month_start - timedelta(days=1)).replace(day=1)
-
-        def _appt_qs(start: Any, end: Any):  # type: ignore[no-untyped-def]
-            return Appointment.objects.filter(
-                datetime_start__gte=start,
-                datetime_start__lt=end,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
-            )
-
-        this_month = _appt_qs(month_start, now)
-        prev_month = _appt_qs(prev_start, month_start)
-
-        _price = Coalesce("price_actual", "price", output_field=DecimalField())
-        revenue = this_month.aggregate(total=Sum(_price))["total"] or 0
-        prev_revenue = prev_month.aggregate(total=Sum(_price))["total"] or 0
-        bookings = this_month.count()
-        prev_bookings = prev_month.count()
+        today, month_day = timezone.localdate(), timezone.localtime(month_start).date()
+
+        this_month = Q(day__gte=month_day)
+        prev_month = Q(day__lt=month_day)
+        months = rollup_rows(timezone.localtime(prev_start).date(), today, _revenue_statuses()).aggregate(
+            this_revenue=Sum("revenue", filter=this_month),
+            prev_revenue=Sum("revenue", filter=prev_month),
+            bookings=Sum("appointment_count", filter=this_month),
+            prev_bookings=Sum("appointment_count", filter=prev_month),
+        )
+        revenue = months["this_revenue"] or 0
+        prev_revenue = months["prev_revenue"] or 0
+        bookings = months["bookings"] or 0
+        prev_bookings = months["prev_bookings"] or 0
 
         rev_trend = ""
         if prev_revenue:
@@ -79,14 +82,12 @@ class AnalyticsService:
         else:
             avg_trend = ""
 
-        _price_expr = Coalesce("price_actual", "price", output_field=DecimalField())
-        total_appointments_alltime = Appointment.objects.count()
-        total_revenue_alltime = (
-            Appointment.objects.filter(
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED]
-            ).aggregate(total=Sum(_price_expr))["total"]
-            or 0
+        alltime = rollup_rows().aggregate(
+            appointments=Sum("appointment_count"),
+            total_revenue=Sum("revenue", filter=Q(status__in=_revenue_statuses())),
         )
+        total_appointments_alltime = alltime["appointments"] or 0
+        total_revenue_alltime = alltime["total_revenue"] or 0
 
         return {
             "revenue": MetricWidgetData(
@@ -144,59 +145,37 @@ class AnalyticsService:
 
     @staticmethod
     def get_chart_data() -> dict[str, dict[str, Any]]:
-        from features.booking.models import Appointment
+        from features.booking.services.rollup import rollup_rows
 
-        _price = Coalesce("price_actual", "price", output_field=DecimalField())
-        now = timezone.now()
-        period_start = now - timedelta(days=29)
+        today = timezone.localdate()
+        period_start = today - timedelta(days=29)
 
         # Daily data for last 30 days
-        daily_qs = (
-            Appointment.objects.filter(
-                datetime_start__gte=period_start,
-                datetime_start__lte=now,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
-            )
-            .annotate(day=TruncDate("datetime_start"))
+        day_map = {
+            row["day"]: float(row["total"] or 0)
+            for row in rollup_rows(period_start, today, _revenue_statuses())
             .values("day")
-            .annotate(total=Sum(_price))
+            .annotate(total=Sum("revenue"))
             .order_by("day")
-        )
-
-        day_map: dict[str, float] = {}
-        for row in daily_qs:
-            day = row["day"]
-            if day:
-                # SQLite can return str, date, or datetime. Normalize to 'YYYY-MM-DD'
-                if not isinstance(day, str):
-                    day = day.strftime("%Y-%m-%d")
-                day_map[day] = float(row["total"] or 0)
+        }
 
         labels: list[str] = []
         values: list[float] = []
         for i in range(30):
-            d = (period_start + timedelta(days=i)).date()
+            d = period_start + timedelta(days=i)
             labels.append(f"{d.day} {d.strftime('%b')}" if i % 5 == 0 else "")
-            values.append(day_map.get(d.isoformat(), 0.0))
+            values.append(day_map.get(d, 0.0))
 
         # Trend: this month vs prev month
         month_start, _now = _month_range()
         prev_start = (month_start - timedelta(days=1)).replace(day=1)
-        cur_month_rev = (
-            Appointment.objects.filter(
-                datetime_start__gte=month_start,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
-            ).aggregate(t=Sum(_price))["t"]
-            or 0
-        )
-        prev_month_rev = (
-            Appointment.objects.filter(
-                datetime_start__gte=prev_start,
-                datetime_start__lt=month_start,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
-            ).aggregate(t=Sum(_price))["t"]
-            or 0
+        month_day = timezone.localtime(month_start).date()
+        months = rollup_rows(timezone.localtime(prev_start).date(), None, _revenue_statuses()).aggregate(
+            current=Sum("revenue", filter=Q(day__gte=month_day)),
+            previous=Sum("revenue", filter=Q(day__lt=month_day)),
         )
+        cur_month_rev = months["current"] or 0
+        prev_month_rev = months["previous"] or 0
         if prev_month_rev:
             diff = ((cur_month_rev - prev_month_rev) / prev_month_rev) * 100
             kpi_trend = f"{'+' if diff >= 0 else ''}{diff:.0f}%"
@@ -204,21 +183,14 @@ class AnalyticsService:
             kpi_trend = ""
 
         # Services donut: top 4 by appointment count
-        top_services = (
-            Appointment.objects.filter(status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED])
-            .values("service__name")
-            .annotate(cnt=Count("id"))
-            .order_by("-cnt")[:4]
-        )
+        alltime = rollup_rows(statuses=_revenue_statuses())
+        top_services = alltime.values("service__name").annotate(cnt=Sum("appointment_count")).order_by("-cnt")[:4]
         donut_labels = [row["service__name"] for row in top_services]
         donut_data = [row["cnt"] for row in top_services]
 
         # Categories donut: top 5 by appointment count (ALL TIME)
         top_categories = (
-            Appointment.objects.filter(status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED])
-            .values("service__category__name")
-            .annotate(cnt=Count("id"))
-            .order_by("-cnt")[:5]
+            alltime.values("service__category__name").annotate(cnt=Sum("appointment_count")).order_by("-cnt")[:5]
         )
         cat_labels = [row["service__category__name"] or str(_("Other")) for row in top_categories]
         cat_data = [row["cnt"] for row in top_categories]
@@ -270,29 +242,20 @@ class AnalyticsService:
 
     @staticmethod
     def get_top_lists() -> dict[str, ListWidgetData]:
-        from features.booking.models import Appointment
+        from features.booking.services.rollup import rollup_rows
 
-        month_start, now = _month_range()
+        month_start, _now = _month_range()
+        this_month = rollup_rows(timezone.localtime(month_start).date(), timezone.localdate(), _revenue_statuses())
 
         top_masters = (
-            Appointment.objects.filter(
-                datetime_start__gte=month_start,
-                datetime_start__lte=now,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
-            )
-            .values("master__name")
-            .annotate(revenue=Sum(Coalesce("price_actual", "price", output_field=DecimalField())), cnt=Count("id"))
+            this_month.values("master__name")
+            .annotate(revenue=Sum("revenue"), cnt=Sum("appointment_count"))
             .order_by("-revenue")[:5]
         )
 
         top_services = (
-            Appointment.objects.filter(
-                datetime_start__gte=month_start,
-                datetime_start__lte=now,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
-            )
-            .values("service__name")
-            .annotate(revenue=Sum(Coalesce("price_actual", "price", output_field=DecimalField())), cnt=Count("id"))
+            this_month.values("service__name")
+            .annotate(revenue=Sum("revenue"), cnt=Sum("appointment_count"))
             .order_by("-revenue")[:5]
         )
 
@@ -331,7 +294,7 @@ class AnalyticsService:
 
     @staticmethod
     def get_reports_context(request: HttpRequest) -> dict[str, object]:
-        from features.booking.models import Appointment
+        from features.booking.services.rollup import rollup_rows
 
         tab = request.GET.get("tab", "revenue")
         active_period = request.GET.get("period", "month")
@@ -346,14 +309,13 @@ class AnalyticsService:
             period_start, period_end = _month_range()
 
         rows_qs = (
-            Appointment.objects.filter(
-                datetime_start__gte=period_start,
-                datetime_start__lte=period_end,
-                status__in=[Appointment.STATUS_CONFIRMED, Appointment.STATUS_COMPLETED],
+            rollup_rows(
+                timezone.localtime(period_start).date(),
+                timezone.localtime(period_end).date(),
+                _revenue_statuses(),
             )
-            .annotate(day=TruncDate("datetime_start"))
             .values("day")
-            .annotate(revenue=Sum(Coalesce("price_actual", "price", output_field=DecimalField())), bookings=Count("id"))
+            .annotate(revenue=Sum("revenue"), bookings=Sum("appointment_count"))
             .order_by("day")
         )
 
@@ -67,6 +67,10 @@ class BookingService:
     def create_new_booking(cls, request: HttpRequest) -> dict[str, Any]:
         return get_booking_cabinet_workflow().create_new_booking(request)
 
+    @classmethod
+    def search_clients(cls, request: HttpRequest) -> dict[str, Any]:
+        return get_booking_cabinet_workflow().search_clients(request)
+
     @classmethod
     def _build_modal_action(cls, booking_id: int, action: BookingModalActionState) -> ModalAction:
         if action.kind == "open_mode":
@@ -16,8 +16,8 @@ from codex_django.cabinet import (
     TableColumn,
     resolve_report_period,
 )
-from django.db.models import Count, DecimalField, Q, Sum
-from django.db.models.functions import Coalesce, TruncDate
+from django.db.models import Count, Exists, OuterRef, Q, Sum
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -78,10 +78,6 @@ def _growth(current: Decimal | int | float, previous: Decimal | int | float) ->
     return f"{sign}{diff:.0f}%", direction
 
 
-def _price_expr() -> Coalesce:
-    return Coalesce("price_actual", "price", output_field=DecimalField(max_digits=10, decimal_places=2))
-
-
 def _appointment_statuses() -> tuple[list[str], list[str]]:
     from features.booking.models import Appointment
 
@@ -148,47 +144,45 @@ class LilyReportsService:
             qs = qs.filter(status__in=list(statuses))
         return qs
 
+    @staticmethod
+    def _rollup(period_from: date, period_to: date, statuses: Iterable[str] | None = None) -> Any:
+        from features.booking.services.rollup import rollup_rows
+
+        return rollup_rows(period_from, period_to, statuses)
+
     @staticmethod
     def _revenue_report(period: Any) -> dict[str, Any]:
         from features.booking.models import Appointment
 
         revenue_statuses, counted_statuses = _appointment_statuses()
-        revenue_qs = LilyReportsService._base_appointments(period.date_from, period.date_to, revenue_statuses)
-        bookings_qs = LilyReportsService._base_appointments(period.date_from, period.date_to, counted_statuses)
-        previous_revenue_qs = LilyReportsService._base_appointments(
-            period.previous_from, period.previous_to, revenue_statuses
-        )
-        previous_bookings_qs = LilyReportsService._base_appointments(
-            period.previous_from, period.previous_to, counted_statuses
+        is_revenue = Q(status__in=revenue_statuses)
+        is_counted = Q(status__in=counted_statuses)
+        daily = {
+            row["day"]: row
+            for row in LilyReportsService._rollup(period.date_from, period.date_to)
+            .values("day")
+            .annotate(
+                revenue=Sum("revenue", filter=is_revenue),
+                bookings=Sum("appointment_count", filter=is_counted),
+                completed=Sum("appointment_count", filter=Q(status=Appointment.STATUS_COMPLETED)),
+            )
+        }
+        previous = LilyReportsService._rollup(period.previous_from, period.previous_to).aggregate(
+            previous_revenue=Sum("revenue", filter=is_revenue),
+            previous_bookings=Sum("appointment_count", filter=is_counted),
         )
-
-        revenue_total = _money(revenue_qs.aggregate(total=Sum(_price_expr()))["total"])
-        previous_revenue = _money(previous_revenue_qs.aggregate(total=Sum(_price_expr()))["total"])
-        booking_count = bookings_qs.count()
-        completed_count = bookings_qs.filter(status=Appointment.STATUS_COMPLETED).count()
+        daily_revenue = {day: _money(row["revenue"]) for day, row in daily.items()}
+        daily_bookings = {day: row["bookings"] or 0 for day, row in daily.items()}
+        daily_completed = {day: row["completed"] or 0 for day, row in daily.items()}
+
+        revenue_total = sum(daily_revenue.values(), Decimal("0"))
+        previous_revenue = _money(previous["previous_revenue"])
+        booking_count = sum(daily_bookings.values())
+        completed_count = sum(daily_completed.values())
         average_check = revenue_total / booking_count if booking_count else Decimal("0")
         completion_rate = (completed_count / booking_count) * 100 if booking_count else None
         trend_value, trend_direction = _growth(revenue_total, previous_revenue)
 
-        daily_revenue = {
-            row["day"]: _money(row["revenue"])
-            for row in revenue_qs.annotate(day=TruncDate("datetime_start"))
-            .values("day")
-            .annotate(revenue=Sum(_price_expr()))
-        }
-        daily_bookings = {
-            row["day"]: row["bookings"]
-            for row in bookings_qs.annotate(day=TruncDate("datetime_start"))
-            .values("day")
-            .annotate(bookings=Count("id"))
-        }
-        daily_completed = {
-            row["day"]: row["completed"]
-            for row in bookings_qs.annotate(day=TruncDate("datetime_start"))
-            .values("day")
-            .annotate(completed=Count("id", filter=Q(status=Appointment.STATUS_COMPLETED)))
-        }
-
         labels: list[str] = []
         revenue_values: list[float] = []
         booking_values: list[int] = []
@@ -293,17 +287,17 @@ class LilyReportsService:
                     ),
                 ],
             ),
-            "previous_bookings": previous_bookings_qs.count(),
+            "previous_bookings": previous["previous_bookings"] or 0,
         }
 
     @staticmethod
     def _services_report(period: Any) -> dict[str, Any]:
         revenue_statuses, _counted_statuses = _appointment_statuses()
-        qs = LilyReportsService._base_appointments(period.date_from, period.date_to, revenue_statuses)
-        total_revenue = _money(qs.aggregate(total=Sum(_price_expr()))["total"])
+        qs = LilyReportsService._rollup(period.date_from, period.date_to, revenue_statuses)
+        total_revenue = _money(qs.aggregate(total=Sum("revenue"))["total"])
         services = list(
             qs.values("service__name", "service__category__name")
-            .annotate(revenue=Sum(_price_expr()), bookings=Count("id"))
+            .annotate(revenue=Sum("revenue"), bookings=Sum("appointment_count"))
             .order_by("-revenue", "-bookings")[:12]
         )
         labels = [row["service__name"] or str(_("Service")) for row in services[:8]]
@@ -407,15 +401,19 @@ class LilyReportsService:
 
     @staticmethod
     def _clients_report(period: Any) -> dict[str, Any]:
+        from features.booking.models import Appointment
         from features.conversations.models import Message
         from system.models import Client
 
         _revenue_statuses, counted_statuses = _appointment_statuses()
         appointments_qs = LilyReportsService._base_appointments(period.date_from, period.date_to, counted_statuses)
-        previous_client_ids = set(
-            LilyReportsService._base_appointments(date(2000, 1, 1), period.previous_to, counted_statuses)
-            .exclude(client_id__isnull=True)
-            .values_list("client_id", flat=True)
+        _previous_start, previous_end = _date_range_bounds(period.previous_to, period.previous_to)
+        seen_before = Exists(
+            Appointment.objects.filter(
+                client_id=OuterRef("client_id"),
+                status__in=counted_statuses,
+                datetime_start__lt=previous_end,
+            )
         )
 
         client_start, client_end = _date_range_bounds(period.date_from, period.date_to)
@@ -429,24 +427,22 @@ class LilyReportsService:
         }
         appointments_by_day = {
             row["day"]: row["appointments"]
-            for row in appointments_qs.annotate(day=TruncDate("datetime_start"))
+            for row in LilyReportsService._rollup(period.date_from, period.date_to, counted_statuses)
             .values("day")
-            .annotate(appointments=Count("id"))
+            .annotate(appointments=Sum("appointment_count"))
         }
-        active_clients_by_day = {
-            row["day"]: row["active_clients"]
-            for row in appointments_qs.exclude(client_id__isnull=True)
+        # Distinct clients per day do not add up across rollup rows, so they come from the period's appointments.
+        client_days = (
+            appointments_qs.exclude(client_id__isnull=True)
             .annotate(day=TruncDate("datetime_start"))
             .values("day")
-            .annotate(active_clients=Count("client_id", distinct=True))
-        }
-        repeat_clients_by_day = {
-            row["day"]: row["repeat_clients"]
-            for row in appointments_qs.filter(client_id__in=previous_client_ids)
-            .annotate(day=TruncDate("datetime_start"))
-            .values("day")
-            .annotate(repeat_clients=Count("client_id", distinct=True))
-        }
+            .annotate(
+                active_clients=Count("client_id", distinct=True),
+                repeat_clients=Count("client_id", distinct=True, filter=seen_before),
+            )
+        )
+        active_clients_by_day = {row["day"]: row["active_clients"] for row in client_days}
+        repeat_clients_by_day = {row["day"]: row["repeat_clients"] for row in client_days}
         messages_by_day = {
             row["day"]: row["messages"]
             for row in Message.objects.filter(created_at__gte=client_start, created_at__lt=client_end)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import calendar
 import datetime as dt
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from django.db import transaction
@@ -9,9 +10,20 @@ from django.utils.translation import gettext_lazy as _
 from system.selectors.masters import MasterSelector
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.http import HttpRequest
     from features.booking.models.master import Master
 
+MAX_DAYS_OFF_RANGE_DAYS = 366
+
+
+@dataclass(frozen=True)
+class DaysOffWriteResult:
+    created: int
+    deleted: int
+    blocked: list[tuple[int, dt.date]]
+
 
 class StaffService:
     """Service for cabinet staff management."""
@@ -60,6 +72,7 @@ class StaffService:
             "prev_month": prev_month,
             "next_month": next_month,
             "selected_days_count": len(days_off),
+            "weekday_choices": list(MasterSelector.WEEKDAY_LABELS.items()),
             "active_appointment_count": sum(appointment_counts.values()),
         }
 
@@ -74,40 +87,120 @@ class StaffService:
         selected_dates: list[str],
     ) -> dict[str, object]:
         from features.booking.models.master import Master
-        from features.booking.models.schedule import MasterDayOff
 
         master = Master.objects.get(pk=master_id)
         month_start = cls._resolve_month_start(year, month)
         month_end = cls._month_end(month_start)
-        existing_dates = set(
-            MasterDayOff.objects.filter(master=master, date__gte=month_start, date__lte=month_end).values_list(
-                "date", flat=True
-            )
-        )
         requested_dates = cls._parse_dates_for_month(selected_dates, month_start, month_end)
-        blocked_dates = set(cls._get_active_appointment_counts(master, month_start, month_end))
+        month_days = {month_start + dt.timedelta(days=offset) for offset in range(month_end.day)}
+
+        result = cls._write_days_off(
+            month_start,
+            month_end,
+            add={(master.pk, day) for day in requested_dates},
+            remove={(master.pk, day) for day in month_days - requested_dates},
+        )
+        return {
+            "master": master,
+            "created": result.created,
+            "deleted": result.deleted,
+            "blocked_dates": [day for _master_id, day in result.blocked],
+        }
 
-        dates_to_create = sorted(requested_dates - existing_dates - blocked_dates)
-        dates_to_delete = sorted(existing_dates - requested_dates)
+    @classmethod
+    @transaction.atomic
+    def save_days_off_ranges(
+        cls,
+        *,
+        master_ids: Iterable[int],
+        ranges: Iterable[tuple[dt.date, dt.date]],
+        weekdays: Iterable[int] | None = None,
+        remove: bool = False,
+        reason: str = "",
+    ) -> dict[str, object]:
+        """Close (or with ``remove`` reopen) every day of ``ranges`` for several masters at once.
 
-        for day in dates_to_create:
-            MasterDayOff.objects.get_or_create(master=master, date=day)
+        ``weekdays`` (0 = Monday) limits the ranges to a recurrence such as every
+        Monday in August. Days with active appointments are never closed; they are
+        returned in ``conflicts`` as ``{master_id: [date, ...]}``. Unknown master
+        ids are ignored.
+        """
+        from features.booking.models.master import Master
 
-        if dates_to_delete:
-            MasterDayOff.objects.filter(master=master, date__in=dates_to_delete).delete()
+        days = cls._expand_date_ranges(ranges, weekdays)
+        master_ids = sorted(Master.objects.filter(pk__in=set(master_ids)).values_list("pk", flat=True))
+        if not days or not master_ids:
+            return {"created": 0, "deleted": 0, "conflicts": {}}
 
-        return {
-            "master": master,
-            "created": len(dates_to_create),
-            "deleted": len(dates_to_delete),
-            "blocked_dates": sorted((requested_dates - existing_dates) & blocked_dates),
+        pairs = {(master_id, day) for master_id in master_ids for day in days}
+        result = cls._write_days_off(
+            days[0],
+            days[-1],
+            add=set() if remove else pairs,
+            remove=pairs if remove else set(),
+            reason=reason,
+        )
+        conflicts: dict[int, list[dt.date]] = {}
+        for master_id, day in result.blocked:
+            conflicts.setdefault(master_id, []).append(day)
+        return {"created": result.created, "deleted": result.deleted, "conflicts": conflicts}
+
+    @classmethod
+    def _write_days_off(
+        cls,
+        window_start: dt.date,
+        window_end: dt.date,
+        *,
+        add: set[tuple[int, dt.date]],
+        remove: set[tuple[int, dt.date]],
+        reason: str = "",
+    ) -> DaysOffWriteResult:
+        """Apply (master_id, date) additions and removals inside one date window in set-based writes.
+
+        Reads the existing rows and the days with active appointments in one query
+        each, then writes with one ``bulk_create`` and one delete. Additions that
+        collide with active appointments are skipped and returned as ``blocked``.
+        """
+        from features.booking.models.schedule import MasterDayOff
+        from features.booking.selector.intervals import invalidate_master_day
+        from features.booking.selector.staff import invalidate_staff_overview
+
+        master_ids = {master_id for master_id, _day in add | remove}
+        existing = {
+            (master_id, day): pk
+            for pk, master_id, day in MasterDayOff.objects.filter(
+                master_id__in=master_ids, date__gte=window_start, date__lte=window_end
+            ).values_list("pk", "master_id", "date")
         }
+        blocked = set(cls._get_active_appointment_days(master_ids, window_start, window_end)) if add else set()
+
+        to_create = sorted(add - existing.keys() - blocked)
+        to_delete = [existing[pair] for pair in sorted(remove & existing.keys())]
+
+        if to_create:
+            MasterDayOff.objects.bulk_create(
+                [MasterDayOff(master_id=master_id, date=day, reason=reason) for master_id, day in to_create],
+                ignore_conflicts=True,
+            )
+            # bulk_create sends no post_save, so drop the availability caches the signals would have.
+            for master_id, day in to_create:
+                invalidate_master_day(master_id, day)
+            invalidate_staff_overview(MasterDayOff)
+        if to_delete:
+            # Deleted rows still go through post_delete, which drops their cache entries.
+            MasterDayOff.objects.filter(pk__in=to_delete).delete()
+
+        return DaysOffWriteResult(
+            created=len(to_create),
+            deleted=len(to_delete),
+            blocked=sorted((add - existing.keys()) & blocked),
+        )
 
     @staticmethod
     def _get_days_off_masters() -> list[Master]:
         from features.booking.models.master import Master
 
-        return list(Master.objects.order_by("order", "name"))
+        return list(Master.objects.only("pk", "name", "order").order_by("order", "name"))
 
     @staticmethod
     def _resolve_selected_master(masters: list[Master], master_id: int | None) -> Master | None:
@@ -150,25 +243,39 @@ class StaffService:
             )
         )
 
-    @staticmethod
+    @classmethod
     def _get_active_appointment_counts(
+        cls,
         master: Master | None,
         month_start: dt.date,
         month_end: dt.date,
     ) -> dict[dt.date, int]:
         if master is None:
             return {}
+        return {
+            day: count
+            for (_master_id, day), count in cls._get_active_appointment_days(
+                {master.pk}, month_start, month_end
+            ).items()
+        }
 
+    @staticmethod
+    def _get_active_appointment_days(
+        master_ids: Iterable[int],
+        start_date: dt.date,
+        end_date: dt.date,
+    ) -> dict[tuple[int, dt.date], int]:
+        """Active appointment counts per (master_id, local date) in one grouped query."""
         from django.db.models import Count
         from django.db.models.functions import TruncDate
         from django.utils import timezone
         from features.booking.models.appointment import Appointment
 
-        start = timezone.make_aware(dt.datetime.combine(month_start, dt.time.min))
-        end = timezone.make_aware(dt.datetime.combine(month_end + dt.timedelta(days=1), dt.time.min))
+        start = timezone.make_aware(dt.datetime.combine(start_date, dt.time.min))
+        end = timezone.make_aware(dt.datetime.combine(end_date + dt.timedelta(days=1), dt.time.min))
         rows = (
             Appointment.objects.filter(
-                master=master,
+                master_id__in=master_ids,
                 datetime_start__gte=start,
                 datetime_start__lt=end,
                 status__in=[
@@ -178,10 +285,11 @@ class StaffService:
                 ],
             )
             .annotate(day=TruncDate("datetime_start"))
-            .values("day")
+            .values("master_id", "day")
             .annotate(count=Count("id"))
+            .order_by()
         )
-        return {row["day"]: row["count"] for row in rows}
+        return {(row["master_id"], row["day"]): row["count"] for row in rows}
 
     @classmethod
     def _build_month_weeks(
@@ -209,6 +317,24 @@ class StaffService:
             )
         return weeks
 
+    @staticmethod
+    def _expand_date_ranges(
+        ranges: Iterable[tuple[dt.date, dt.date]],
+        weekdays: Iterable[int] | None = None,
+    ) -> list[dt.date]:
+        """Sorted days covered by inclusive ranges, optionally limited to some weekdays."""
+        allowed_weekdays = set(weekdays) if weekdays is not None else None
+        days: set[dt.date] = set()
+        for range_start, range_end in ranges:
+            if range_end < range_start or (range_end - range_start).days >= MAX_DAYS_OFF_RANGE_DAYS:
+                raise ValueError(f"Invalid days off range {range_start}..{range_end}")
+            day = range_start
+            while day <= range_end:
+                if allowed_weekdays is None or day.weekday() in allowed_weekdays:
+                    days.add(day)
+                day += dt.timedelta(days=1)
+        return sorted(days)
+
     @staticmethod
     def _parse_dates_for_month(selected_dates: list[str], month_start: dt.date, month_end: dt.date) -> set[dt.date]:
         parsed_dates = set()
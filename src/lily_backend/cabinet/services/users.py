@@ -15,7 +15,9 @@ class UserService:
     """Page-service contract for cabinet users pages.
 
     Returns:
-        cards: CardGridData for ``cabinet/components/card_grid.html``
+        cards: CardGridData for ``cabinet/components/card_grid.html`` (current page only)
+        page_obj: page of the merged users/ghost clients list
+        search_query: server-side search string (``?q=``)
         header_title: page heading
         header_subtitle: segment-specific page title
         active_segment: current querystring segment
@@ -34,8 +36,12 @@ class UserService:
     @classmethod
     def get_list_context(cls, request: HttpRequest) -> dict[str, object]:
         segment = request.GET.get("segment", "all")
+        search = request.GET.get("q", "").strip()
+        page_obj = UserSelector.get_users_page(segment, search=search, page=request.GET.get("page"))
         return {
-            "cards": UserSelector.get_users_grid(segment=segment),
+            "cards": UserSelector.build_users_grid(page_obj),
+            "page_obj": page_obj,
+            "search_query": search,
             "header_title": str(_("Administration")),
             "header_subtitle": cls._SEGMENT_TITLES.get(segment, str(_("Users"))),
             "active_segment": segment,
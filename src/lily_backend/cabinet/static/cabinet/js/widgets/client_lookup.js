@@ -34,11 +34,65 @@
             clientEmail: '',
             clients: config.clients || [],
             minSearchLength: config.minSearchLength || 3,
+            searchUrl: config.searchUrl || '',
+            searchPage: 1,
+            searchHasMore: false,
+            searchLoading: false,
+            searchRequestId: 0,
+            searchTimer: null,
+
+            init() {
+                if (this.searchUrl) {
+                    this.$watch('search', () => this.scheduleSearch());
+                }
+            },
+
+            scheduleSearch() {
+                clearTimeout(this.searchTimer);
+                if (this.search.trim().length < this.minSearchLength || this.search === this.selectedName) {
+                    this.clients = [];
+                    this.searchHasMore = false;
+                    return;
+                }
+                this.searchTimer = setTimeout(() => this.fetchClients(1), config.searchDelay || 200);
+            },
+
+            async fetchClients(page) {
+                const requestId = ++this.searchRequestId;
+                const params = new URLSearchParams({ q: this.search.trim(), page: String(page) });
+                this.searchLoading = true;
+                try {
+                    const resp = await fetch(`${this.searchUrl}?${params.toString()}`);
+                    const data = await resp.json();
+                    if (requestId !== this.searchRequestId) {
+                        return;
+                    }
+                    const results = Array.isArray(data.results) ? data.results : [];
+                    this.clients = page > 1 ? this.clients.concat(results) : results;
+                    this.searchPage = page;
+                    this.searchHasMore = Boolean(data.has_more);
+                } catch (err) {
+                    console.error('Failed to search clients', err);
+                } finally {
+                    if (requestId === this.searchRequestId) {
+                        this.searchLoading = false;
+                    }
+                }
+            },
+
+            loadMoreClients() {
+                if (this.searchHasMore && !this.searchLoading) {
+                    this.fetchClients(this.searchPage + 1);
+                }
+            },
 
             get filteredClients() {
                 if (this.search.trim().length < this.minSearchLength) {
                     return [];
                 }
+                if (this.searchUrl) {
+                    return this.clients;
+                }
                 const query = this.search.trim().toLowerCase();
                 return this.clients.filter((client) => {
                     return client.name.toLowerCase().includes(query)
@@ -2,6 +2,7 @@ from django.urls import path
 
 from ..views.booking import (
     BookingActionView,
+    BookingClientSearchView,
     BookingCreateView,
     BookingDayFetchView,
     BookingGroupActionView,
@@ -27,4 +28,5 @@ booking_urlpatterns = [
     path("booking/groups/<int:pk>/action/<str:action>/", BookingGroupActionView.as_view(), name="booking_group_action"),
     path("booking/fetch-days/", BookingDayFetchView.as_view(), name="booking_fetch_days"),
     path("booking/fetch-slots/", BookingSlotFetchView.as_view(), name="booking_fetch_slots"),
+    path("booking/clients/search/", BookingClientSearchView.as_view(), name="booking_client_search"),
 ]
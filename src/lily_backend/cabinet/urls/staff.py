@@ -1,7 +1,7 @@
 from django.urls import path
 
 from ..views.services import CategoryStatusToggleView, ServiceQuickEditView, ServicesListView
-from ..views.staff import StaffDaysOffView, StaffListView, StaffQuickEditView
+from ..views.staff import StaffDaysOffRangeView, StaffDaysOffView, StaffListView, StaffQuickEditView
 from ..views.users import ClientDetailView, UserListView
 
 staff_urlpatterns = [
@@ -13,6 +13,7 @@ staff_urlpatterns = [
     # Staff / Masters
     path("staff/", StaffListView.as_view(), name="staff_list"),
     path("staff/days-off/", StaffDaysOffView.as_view(), name="staff_days_off"),
+    path("staff/days-off/range/", StaffDaysOffRangeView.as_view(), name="staff_days_off_range"),
     path("staff/modal/<int:pk>/", StaffQuickEditView.as_view(), name="staff_modal"),
     # Services catalog management
     path("services/", ServicesListView.as_view(), name="services_list"),
@@ -14,6 +14,7 @@ from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.generic import TemplateView
 from features.booking.booking_settings import BookingSettings
+from features.booking.selector.snapshot import get_booking_settings_snapshot
 from features.booking.services.cabinet_availability import (
     CabinetBookingAvailabilityService,
     parse_resource_selections,
@@ -313,6 +314,13 @@ class BookingGroupActionView(StaffRequiredMixin, TemplateView):
             return response
 
 
+class BookingClientSearchView(StaffRequiredMixin, View):
+    """AJAX endpoint for the client typeahead in the booking builders and quick-create."""
+
+    def get(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        return JsonResponse(BookingService.search_clients(request))
+
+
 class BookingSlotFetchView(StaffRequiredMixin, View):
     """AJAX endpoint to fetch smart slots for cabinet wizard."""
 
@@ -371,8 +379,8 @@ class BookingDayFetchView(StaffRequiredMixin, View):
         if not service_ids:
             return JsonResponse({"available_dates": [], "first_available_date": ""})
 
-        availability = CabinetBookingAvailabilityService()
-        settings = BookingSettings.load()
+        settings = get_booking_settings_snapshot()
+        availability = CabinetBookingAvailabilityService(settings=settings)
         start_date = timezone.localdate()
 
         available_dates = sorted(
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -13,6 +14,7 @@ from django.utils import formats, timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView, View
 from features.booking.models.appointment import Appointment
+from features.booking.services.outbox import record_booking_event
 
 from cabinet.services.client import ClientService
 
@@ -78,14 +80,14 @@ class ClientRescheduleModalView(LoginRequiredMixin, TemplateView):
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-        from features.booking.booking_settings import BookingSettings
+        from features.booking.selector.snapshot import get_booking_settings_snapshot
         from features.booking.services.cabinet_availability import CabinetBookingAvailabilityService
         from features.booking.views.public.scheduler import _build_calendar_grid
 
         context = super().get_context_data(**kwargs)
         appointment = get_object_or_404(Appointment, finalize_token=self.kwargs["token"])
-        settings = BookingSettings.load()
-        availability = CabinetBookingAvailabilityService(audience="public")
+        settings = get_booking_settings_snapshot()
+        availability = CabinetBookingAvailabilityService(audience="public", settings=settings)
         today = timezone.localdate()
 
         min_date = today + dt_module.timedelta(days=1 if settings.book_only_from_next_day else 0)
@@ -201,11 +203,9 @@ class ClientRescheduleConfirmView(LoginRequiredMixin, View):
             return redirect(reverse("cabinet:client_manage_appointment", kwargs={"token": appointment.finalize_token}))
 
         appointment.datetime_start = target_dt
-        appointment.save(update_fields=["datetime_start", "updated_at"])
-
-        from features.conversations.services.notifications import _get_engine
-
-        _get_engine().dispatch_event("booking.rescheduled", appointment)
+        with transaction.atomic():
+            appointment.save(update_fields=["datetime_start", "updated_at"])
+            record_booking_event(appointment, "booking.rescheduled")
 
         messages.success(request, _("Your appointment has been rescheduled."))
         return redirect(reverse("cabinet:client_manage_appointment", kwargs={"token": appointment.finalize_token}))
@@ -219,9 +219,6 @@ class ClientCancelAppointmentView(LoginRequiredMixin, View):
         reason = request.POST.get("reason", Appointment.CANCEL_REASON_CLIENT)
         try:
             appointment.cancel(reason=reason)
-            from features.conversations.services.notifications import _get_engine
-
-            _get_engine().dispatch_event("booking.cancelled", appointment)
             messages.success(request, _("Your appointment has been cancelled."))
         except ValidationError:
             messages.error(request, _("This appointment cannot be cancelled."))
@@ -8,13 +8,13 @@ from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import TemplateView, UpdateView
+from django.views.generic import TemplateView, UpdateView, View
 from features.booking.booking_settings import BookingSettings
 from features.booking.models.master import Master
 from features.booking.models.schedule import MasterWorkingDay
 
 from cabinet.mixins import StaffRequiredMixin
-from cabinet.services.staff import StaffService
+from cabinet.services.staff import MAX_DAYS_OFF_RANGE_DAYS, StaffService
 
 
 class MasterQuickEditForm(forms.ModelForm):
@@ -86,6 +86,31 @@ class MasterQuickEditForm(forms.ModelForm):
                 )
 
 
+class DaysOffRangeForm(forms.Form):
+    ACTION_ADD = "add"
+    ACTION_REMOVE = "remove"
+
+    masters = forms.ModelMultipleChoiceField(queryset=Master.objects.order_by("order", "name"))
+    date_from = forms.DateField()
+    date_to = forms.DateField()
+    weekdays = forms.MultipleChoiceField(required=False, choices=MasterQuickEditForm.WEEKDAY_CHOICES)
+    action = forms.ChoiceField(
+        choices=[(ACTION_ADD, _("Close days")), (ACTION_REMOVE, _("Reopen days"))],
+        initial=ACTION_ADD,
+    )
+    reason = forms.CharField(required=False, max_length=255)
+
+    def clean(self) -> dict[str, Any]:
+        cleaned_data = super().clean()
+        date_from, date_to = cleaned_data.get("date_from"), cleaned_data.get("date_to")
+        if date_from and date_to:
+            if date_to < date_from:
+                raise forms.ValidationError(_("The end date must not be before the start date."))
+            if (date_to - date_from).days >= MAX_DAYS_OFF_RANGE_DAYS:
+                raise forms.ValidationError(_("A range can span at most one year."))
+        return cleaned_data
+
+
 class StaffListView(StaffRequiredMixin, TemplateView):
     template_name = "cabinet/staff/list.html"
 
@@ -152,6 +177,47 @@ class StaffDaysOffView(StaffRequiredMixin, TemplateView):
             return None
 
 
+class StaffDaysOffRangeView(StaffRequiredMixin, View):
+    """Closes or reopens a date range, optionally on some weekdays only, for several masters."""
+
+    def post(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        form = DaysOffRangeForm(request.POST)
+        if not form.is_valid():
+            messages.error(request, _("Please select masters and a valid date range."))
+            return redirect("cabinet:staff_days_off")
+
+        data = form.cleaned_data
+        masters = list(data["masters"])
+        result = StaffService.save_days_off_ranges(
+            master_ids=[master.pk for master in masters],
+            ranges=[(data["date_from"], data["date_to"])],
+            weekdays=[int(day) for day in data["weekdays"]] or None,
+            remove=data["action"] == DaysOffRangeForm.ACTION_REMOVE,
+            reason=data["reason"],
+        )
+        if result["conflicts"]:
+            names = {master.pk: master.name for master in masters}
+            messages.warning(
+                request,
+                _("Days with active appointments were kept open: %(details)s")
+                % {
+                    "details": "; ".join(
+                        f"{names[master_id]} ({', '.join(day.isoformat() for day in days)})"
+                        for master_id, days in result["conflicts"].items()
+                    )
+                },
+            )
+        messages.success(
+            request,
+            _("Days off saved: %(created)s closed, %(deleted)s reopened.")
+            % {"created": result["created"], "deleted": result["deleted"]},
+        )
+        query = urlencode(
+            {"master_id": masters[0].pk, "year": data["date_from"].year, "month": data["date_from"].month}
+        )
+        return redirect(f"{reverse('cabinet:staff_days_off')}?{query}")
+
+
 class StaffQuickEditView(StaffRequiredMixin, UpdateView):
     model = Master
     form_class = MasterQuickEditForm
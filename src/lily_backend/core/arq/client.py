@@ -1,12 +1,57 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import os
+import threading
+from typing import TYPE_CHECKING, Any
 
 from arq.connections import RedisSettings, create_pool
-from asgiref.sync import async_to_sync
+from core.arq.metrics import ARQ_CLIENT_POOLS
 from django.conf import settings
 
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+SYNC_ENQUEUE_TIMEOUT_SECONDS = 5.0
+
+
+class _BackgroundLoop:
+    """
+    One event loop per process, running in a daemon thread.
+
+    Synchronous callers submit coroutines here instead of spinning up a fresh
+    loop per call, so the ARQ pool created on this loop lives as long as the
+    process. A forked child starts its own loop on first use.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pid: int | None = None
+
+    def owns(self, loop: asyncio.AbstractEventLoop) -> bool:
+        return loop is self._loop and self._pid == os.getpid()
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            # Stop the coroutine as well, or it keeps running on the loop after the caller gave up
+            future.cancel()
+            raise
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="lily-arq-enqueue", daemon=True).start()
+                self._loop, self._pid = loop, os.getpid()
+            return self._loop
+
+
+_sync_loop = _BackgroundLoop()
+
 
 class DjangoArqClient:
     """
@@ -15,26 +60,54 @@ class DjangoArqClient:
     Supported contracts:
     - ``enqueue()/aenqueue()`` for ``codex_django.notifications``
     - ``enqueue_job()`` for direct ARQ usage
+    - ``enqueue_job_sync()`` for direct ARQ usage from synchronous code
+
+    Sync calls run on a process-wide background loop that owns its own pool, so
+    request handlers and services reuse one Redis connection pool per process.
     """
 
     _pool: Any | None = None
     _pool_loop: asyncio.AbstractEventLoop | None = None
+    _sync_pool: Any | None = None
+    _sync_pool_loop: asyncio.AbstractEventLoop | None = None
 
     @classmethod
     async def get_pool(cls) -> Any:
         current_loop = asyncio.get_running_loop()
+        if _sync_loop.owns(current_loop):
+            if cls._sync_pool is None or cls._sync_pool_loop is not current_loop:
+                cls._sync_pool = await cls._create_pool()
+                cls._sync_pool_loop = current_loop
+                ARQ_CLIENT_POOLS.labels(path="sync", result="created").inc()
+            else:
+                ARQ_CLIENT_POOLS.labels(path="sync", result="reused").inc()
+            return cls._sync_pool
+
         if cls._pool is None or cls._pool_loop is not current_loop:
-            cls._pool = await create_pool(
-                RedisSettings(
-                    host=getattr(settings, "REDIS_HOST", "localhost"),
-                    port=getattr(settings, "REDIS_PORT", 6379),
-                    password=getattr(settings, "REDIS_PASSWORD", None),
-                    database=0,
-                )
-            )
+            cls._pool = await cls._create_pool()
             cls._pool_loop = current_loop
+            ARQ_CLIENT_POOLS.labels(path="async", result="created").inc()
+        else:
+            ARQ_CLIENT_POOLS.labels(path="async", result="reused").inc()
         return cls._pool
 
+    @staticmethod
+    async def _create_pool() -> Any:
+        return await create_pool(
+            RedisSettings(
+                host=getattr(settings, "REDIS_HOST", "localhost"),
+                port=getattr(settings, "REDIS_PORT", 6379),
+                password=getattr(settings, "REDIS_PASSWORD", None),
+                database=0,
+            )
+        )
+
+    @staticmethod
+    def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+        """Runs ``coro`` on the background enqueue loop and waits for its result."""
+        timeout = getattr(settings, "ARQ_SYNC_ENQUEUE_TIMEOUT", SYNC_ENQUEUE_TIMEOUT_SECONDS)
+        return _sync_loop.run(coro, timeout)
+
     @staticmethod
     def _job_id(job: Any) -> str | None:
         if job is None:
@@ -46,6 +119,10 @@ class DjangoArqClient:
         pool = await cls.get_pool()
         return await pool.enqueue_job(function, *args, **kwargs)
 
+    @classmethod
+    def enqueue_job_sync(cls, function: str, *args: Any, **kwargs: Any) -> Any:
+        return cls.run_sync(cls.enqueue_job(function, *args, **kwargs))
+
     @classmethod
     async def aenqueue(
         cls,
@@ -85,7 +162,7 @@ class DjangoArqClient:
             kwargs["defer_by"] = defer_by
         if job_id is not None:
             kwargs["job_id"] = job_id
-        return async_to_sync(cls.aenqueue)(task_name, payload, **kwargs)
+        return cls.run_sync(cls.aenqueue(task_name, payload, **kwargs))
 
 
 arq_client = DjangoArqClient
@@ -0,0 +1,13 @@
+"""Prometheus metrics of the Django-side ARQ client.
+
+Kept apart from ``client`` so the collectors are registered once even when the
+client module is imported under more than one package path.
+"""
+
+from prometheus_client import Counter
+
+ARQ_CLIENT_POOLS = Counter(
+    "lily_arq_client_pools_total",
+    "ARQ Redis pool lookups by enqueue path (async, sync) and result (created, reused).",
+    ["path", "result"],
+)
@@ -4,13 +4,17 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from features.booking.models import Appointment
 from features.booking.services.completion import complete_finished_confirmed_appointments
+from features.booking.services.outbox import relay_booking_outbox
 from features.booking.services.reminders import build_reminder_payload, should_send_reminder
+from features.booking.services.rollup import refresh_pending_days
 from ninja import Router, Schema
 from system.api.auth import require_internal_scope
+from system.services.loyalty import LoyaltyService
 
 router = Router(tags=["Booking Worker"])
 
 REMINDER_WINDOW_HOURS = 3
+ROLLUP_REFRESH_DAYS = 366
 
 
 class ReschedulePayload(Schema):
@@ -117,3 +121,24 @@ def complete_past_appointments(request):
     require_internal_scope(request, "booking.worker")
     completed = complete_finished_confirmed_appointments()
     return {"success": True, "completed": completed}
+
+
+@router.post("/loyalty/refresh-dirty")
+def refresh_dirty_loyalty(request):
+    require_internal_scope(request, "booking.worker")
+    refreshed = LoyaltyService.refresh_dirty()
+    return {"success": True, "refreshed": refreshed}
+
+
+@router.post("/analytics/refresh-rollup")
+def refresh_analytics_rollup(request):
+    require_internal_scope(request, "booking.worker")
+    rebuilt = refresh_pending_days(limit=ROLLUP_REFRESH_DAYS)
+    return {"success": True, "rebuilt_days": rebuilt}
+
+
+@router.post("/outbox/relay")
+def relay_notification_outbox(request):
+    require_internal_scope(request, "booking.worker")
+    result = relay_booking_outbox()
+    return {"success": True, **result}
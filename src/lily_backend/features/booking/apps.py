@@ -12,6 +12,115 @@ class BookingConfig(AppConfig):
     def ready(self):
         import sys
 
+        from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+
+        from features.booking.booking_settings import BookingSettings
+        from features.booking.models import Appointment, Master, MasterDayOff, MasterWorkingDay
+        from features.booking.selector import catalog, intervals, snapshot, staff
+        from features.booking.services import rollup
+        from features.main.models import Service, ServiceCategory
+
+        # Keep the per-(master, date) interval index in step with the rows it is built from.
+        # Appointment receivers compare against Appointment.origin, the values as loaded.
+        post_save.connect(
+            intervals.invalidate_appointment_intervals,
+            sender=Appointment,
+            dispatch_uid="features.booking.interval_index_appointment_save",
+        )
+        post_delete.connect(
+            intervals.invalidate_appointment_intervals,
+            sender=Appointment,
+            dispatch_uid="features.booking.interval_index_appointment_delete",
+        )
+        post_init.connect(
+            intervals.remember_day_off_origin,
+            sender=MasterDayOff,
+            dispatch_uid="features.booking.interval_index_day_off_origin",
+        )
+        post_save.connect(
+            intervals.invalidate_day_off_intervals,
+            sender=MasterDayOff,
+            dispatch_uid="features.booking.interval_index_day_off_save",
+        )
+        post_delete.connect(
+            intervals.invalidate_day_off_intervals,
+            sender=MasterDayOff,
+            dispatch_uid="features.booking.interval_index_day_off_delete",
+        )
+        for schedule_model in (MasterWorkingDay, BookingSettings):
+            post_save.connect(
+                intervals.invalidate_schedule_intervals,
+                sender=schedule_model,
+                dispatch_uid=f"features.booking.interval_index_{schedule_model.__name__}_save",
+            )
+            post_delete.connect(
+                intervals.invalidate_schedule_intervals,
+                sender=schedule_model,
+                dispatch_uid=f"features.booking.interval_index_{schedule_model.__name__}_delete",
+            )
+
+        # Analytics read a daily rollup; appointment writes mark their days for rebuild.
+        post_save.connect(
+            rollup.mark_appointment_rollup_days,
+            sender=Appointment,
+            dispatch_uid="features.booking.rollup_appointment_save",
+        )
+        post_delete.connect(
+            rollup.mark_appointment_rollup_days,
+            sender=Appointment,
+            dispatch_uid="features.booking.rollup_appointment_delete",
+        )
+
+        # Settings snapshots carry salon hours and per-service start limits.
+        for snapshot_model in (BookingSettings, Service, ServiceCategory):
+            post_save.connect(
+                snapshot.invalidate_booking_settings_snapshot,
+                sender=snapshot_model,
+                dispatch_uid=f"features.booking.settings_snapshot_{snapshot_model.__name__}_save",
+            )
+            post_delete.connect(
+                snapshot.invalidate_booking_settings_snapshot,
+                sender=snapshot_model,
+                dispatch_uid=f"features.booking.settings_snapshot_{snapshot_model.__name__}_delete",
+            )
+
+        # Which services are bookable depends on master status and weekly schedules.
+        for catalog_model in (Master, MasterWorkingDay):
+            post_save.connect(
+                catalog.invalidate_bookable_catalog,
+                sender=catalog_model,
+                dispatch_uid=f"features.booking.bookable_catalog_{catalog_model.__name__}_save",
+            )
+            post_delete.connect(
+                catalog.invalidate_bookable_catalog,
+                sender=catalog_model,
+                dispatch_uid=f"features.booking.bookable_catalog_{catalog_model.__name__}_delete",
+            )
+
+        # The cabinet staff overview counts schedules, days off, appointments and service links per master.
+        for staff_model, handler in (
+            (Master, staff.invalidate_staff_overview),
+            (MasterWorkingDay, staff.invalidate_staff_overview),
+            (MasterDayOff, staff.invalidate_staff_overview),
+            (Service, staff.invalidate_staff_overview),
+            (Appointment, staff.invalidate_staff_overview_for_appointment),
+        ):
+            post_save.connect(
+                handler,
+                sender=staff_model,
+                dispatch_uid=f"features.booking.staff_overview_{staff_model.__name__}_save",
+            )
+            post_delete.connect(
+                handler,
+                sender=staff_model,
+                dispatch_uid=f"features.booking.staff_overview_{staff_model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            staff.invalidate_staff_overview,
+            sender=Service.masters.through,
+            dispatch_uid="features.booking.staff_overview_service_masters",
+        )
+
         if not any(
             arg in sys.argv
             for arg in [
@@ -0,0 +1,83 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def backfill_daily_rollup(apps, schema_editor):
+    Appointment = apps.get_model("booking", "Appointment")
+    AppointmentDailyRollup = apps.get_model("booking", "AppointmentDailyRollup")
+    rows = (
+        Appointment.objects.annotate(day=TruncDate("datetime_start"))
+        .values("day", "master_id", "service_id", "status")
+        .annotate(
+            appointment_count=Count("id"),
+            revenue=Sum(Coalesce("price_actual", "price", output_field=DecimalField())),
+            client_count=Count("client_id", distinct=True),
+        )
+        .order_by()
+    )
+    AppointmentDailyRollup.objects.bulk_create(
+        (AppointmentDailyRollup(**{**row, "revenue": row["revenue"] or 0}) for row in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("booking", "0002_initial"),
+        ("main", "0003_servicecategory_booking_start_time"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppointmentRollupPendingDay",
+            fields=[
+                ("day", models.DateField(primary_key=True, serialize=False, verbose_name="day")),
+                ("marked_at", models.DateTimeField(auto_now_add=True, verbose_name="marked at")),
+            ],
+            options={
+                "verbose_name": "Pending Rollup Day",
+                "verbose_name_plural": "Pending Rollup Days",
+            },
+        ),
+        migrations.CreateModel(
+            name="AppointmentDailyRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(verbose_name="day")),
+                ("status", models.CharField(max_length=20, verbose_name="status")),
+                ("appointment_count", models.PositiveIntegerField(default=0, verbose_name="appointments")),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name="revenue (€)"),
+                ),
+                ("client_count", models.PositiveIntegerField(default=0, verbose_name="distinct clients")),
+                (
+                    "master",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="booking.master",
+                        verbose_name="master",
+                    ),
+                ),
+                (
+                    "service",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="main.service",
+                        verbose_name="service",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Appointment Rollup",
+                "verbose_name_plural": "Daily Appointment Rollups",
+                "indexes": [models.Index(fields=["status", "day"], name="booking_app_status_24e30e_idx")],
+                "unique_together": {("day", "master", "service", "status")},
+            },
+        ),
+        migrations.RunPython(backfill_daily_rollup, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.15 on 2026-10-18 15:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("booking", "0003_appointment_daily_rollup"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingNotificationOutbox",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("event", models.CharField(max_length=64, verbose_name="event")),
+                (
+                    "origin",
+                    models.CharField(
+                        choices=[("client", "Client"), ("staff", "Staff")],
+                        default="client",
+                        max_length=10,
+                        verbose_name="origin",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("sent", "Sent"), ("failed", "Failed")],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="attempts")),
+                ("last_error", models.TextField(blank=True, verbose_name="last error")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="created at")),
+                ("processed_at", models.DateTimeField(blank=True, null=True, verbose_name="processed at")),
+                (
+                    "appointment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification_outbox",
+                        to="booking.appointment",
+                        verbose_name="appointment",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Booking Notification Outbox Entry",
+                "verbose_name_plural": "Booking Notification Outbox",
+                "indexes": [models.Index(fields=["status", "id"], name="booking_boo_status_c06eb0_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.15 on 2026-10-18 17:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("booking", "0004_booking_notification_outbox"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="appointmentdailyrollup",
+            name="client_count",
+        ),
+    ]
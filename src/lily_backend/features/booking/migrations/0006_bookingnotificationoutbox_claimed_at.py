@@ -0,0 +1,17 @@
+# Generated by Django 5.2.15 on 2026-10-18 17:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("booking", "0005_remove_appointmentdailyrollup_client_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bookingnotificationoutbox",
+            name="claimed_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="claimed at"),
+        ),
+    ]
@@ -1,12 +1,17 @@
 from .appointment import Appointment
 from .appointment_group import AppointmentGroup, AppointmentGroupItem
 from .master import Master
+from .outbox import BookingNotificationOutbox
+from .rollup import AppointmentDailyRollup, AppointmentRollupPendingDay
 from .schedule import MasterDayOff, MasterWorkingDay
 
 __all__ = [
     "Appointment",
+    "AppointmentDailyRollup",
     "AppointmentGroup",
     "AppointmentGroupItem",
+    "AppointmentRollupPendingDay",
+    "BookingNotificationOutbox",
     "Master",
     "MasterDayOff",
     "MasterWorkingDay",
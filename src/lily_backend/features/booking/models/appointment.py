@@ -1,4 +1,3 @@
-import logging
 import secrets
 from typing import Any, ClassVar
 
@@ -10,7 +9,18 @@ from features.main.models import Service
 
 from .master import Master
 
-log = logging.getLogger(__name__)
+# Loaded values the post_save/post_delete receivers compare against: the interval
+# index and rollup day of an appointment, and the inputs of its client's loyalty.
+ORIGIN_FIELDS = (
+    "master_id",
+    "client_id",
+    "datetime_start",
+    "status",
+    "price",
+    "price_actual",
+    "cancelled_at",
+    "cancel_reason",
+)
 
 
 class Appointment(AbstractBookableAppointment):
@@ -95,11 +105,10 @@ class Appointment(AbstractBookableAppointment):
         self.cancelled_at = timezone.now()
         self.cancel_reason = reason
         self.cancel_note = note
-        self.save(update_fields=["status", "cancelled_at", "cancel_reason", "cancel_note", "updated_at"])
-
-        from features.conversations.services.notifications import _get_engine
-
-        _get_engine().dispatch_event("booking.cancelled", self)
+        self._save_with_event(
+            "booking.cancelled",
+            update_fields=["status", "cancelled_at", "cancel_reason", "cancel_note", "updated_at"],
+        )
 
     def confirm(self) -> None:
         """Confirm a pending appointment."""
@@ -108,17 +117,7 @@ class Appointment(AbstractBookableAppointment):
 
             raise ValidationError(_("Only pending appointments can be confirmed."))
         self.status = self.STATUS_CONFIRMED
-        self.save(update_fields=["status", "updated_at"])
-
-        from features.conversations.services.notifications import _get_engine
-
-        _get_engine().dispatch_event("booking.confirmed", self)
-        try:
-            from features.booking.services import reminders
-
-            reminders.schedule_booking_reminder(self)
-        except Exception:
-            log.exception("Failed to schedule booking reminder for appointment_id=%s", self.pk)
+        self._save_with_event("booking.confirmed", update_fields=["status", "updated_at"])
 
     def mark_completed(self) -> None:
         """Mark a confirmed appointment as completed."""
@@ -132,20 +131,26 @@ class Appointment(AbstractBookableAppointment):
     def mark_no_show(self) -> None:
         """Mark appointment as no-show."""
         self.status = self.STATUS_NO_SHOW
-        self.save(update_fields=["status", "updated_at"])
-
-        from features.conversations.services.notifications import _get_engine
-
-        _get_engine().dispatch_event("booking.no_show", self)
+        self._save_with_event("booking.no_show", update_fields=["status", "updated_at"])
 
     def propose_reschedule(self) -> None:
         """Set status to reschedule proposed."""
         self.status = self.STATUS_RESCHEDULE_PROPOSED
-        self.save(update_fields=["status", "updated_at"])
+        self._save_with_event("booking.rescheduled", update_fields=["status", "updated_at"])
+
+    def _save_with_event(self, event: str, *, update_fields: list[str]) -> None:
+        """Save and record ``event`` in the notification outbox in one transaction.
+
+        The system worker relays the outbox to the notification queue, and
+        schedules the reminder for ``booking.confirmed``.
+        """
+        from django.db import transaction
 
-        from features.conversations.services.notifications import _get_engine
+        from features.booking.services.outbox import record_booking_event
 
-        _get_engine().dispatch_event("booking.rescheduled", self)
+        with transaction.atomic():
+            self.save(update_fields=update_fields)
+            record_booking_event(self, event)
 
     class Meta:
         verbose_name = _("Appointment")
@@ -159,7 +164,24 @@ class Appointment(AbstractBookableAppointment):
     def __str__(self) -> str:
         return f"{self.client} → {self.master} ({self.datetime_start})"
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Any, values: Any) -> "Appointment":
+        instance = super().from_db(db, field_names, values)
+        instance.remember_origin()
+        return instance
+
+    @property
+    def origin(self) -> dict[str, Any]:
+        """``ORIGIN_FIELDS`` as last loaded or saved; empty for instances built in memory."""
+        return getattr(self, "_origin", {})
+
+    def remember_origin(self) -> None:
+        # Read from __dict__ so deferred fields are not fetched just for this.
+        self._origin = {name: self.__dict__.get(name) for name in ORIGIN_FIELDS}
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         if not self.finalize_token:
             self.finalize_token = secrets.token_urlsafe(32)
         super().save(*args, **kwargs)
+        # post_save receivers have compared against the previous values by now.
+        self.remember_origin()
@@ -0,0 +1,50 @@
+from typing import ClassVar
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .appointment import Appointment
+
+
+class BookingNotificationOutbox(models.Model):
+    """A booking lifecycle event waiting to be dispatched to the notification queue.
+
+    Written in the same transaction as the status change by ``Appointment``
+    methods and cabinet actions; ``features.booking.services.outbox`` drains it
+    in batches when the system worker calls the relay endpoint.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        SENT = "sent", _("Sent")
+        FAILED = "failed", _("Failed")
+
+    class Origin(models.TextChoices):
+        CLIENT = "client", _("Client")
+        STAFF = "staff", _("Staff")
+
+    event = models.CharField(_("event"), max_length=64)
+    appointment = models.ForeignKey(
+        Appointment,
+        on_delete=models.CASCADE,
+        related_name="notification_outbox",
+        verbose_name=_("appointment"),
+    )
+    origin = models.CharField(_("origin"), max_length=10, choices=Origin.choices, default=Origin.CLIENT)
+    status = models.CharField(_("status"), max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(_("attempts"), default=0)
+    last_error = models.TextField(_("last error"), blank=True)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    processed_at = models.DateTimeField(_("processed at"), null=True, blank=True)
+    # Set while a relay is enqueueing the row; an old stamp means that relay died
+    claimed_at = models.DateTimeField(_("claimed at"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Booking Notification Outbox Entry")
+        verbose_name_plural = _("Booking Notification Outbox")
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["status", "id"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event} #{self.appointment_id} ({self.status})"
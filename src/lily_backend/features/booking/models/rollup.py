@@ -0,0 +1,56 @@
+from typing import ClassVar
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .master import Master
+
+
+class AppointmentDailyRollup(models.Model):
+    """Appointment count and revenue per local day, master, service and status.
+
+    Rows are rebuilt a whole day at a time from ``Appointment`` by
+    ``features.booking.services.rollup``; never edit them directly.
+    """
+
+    day = models.DateField(_("day"))
+    master = models.ForeignKey(
+        Master,
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+        verbose_name=_("master"),
+    )
+    service = models.ForeignKey(
+        "main.Service",
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+        verbose_name=_("service"),
+    )
+    status = models.CharField(_("status"), max_length=20)
+    appointment_count = models.PositiveIntegerField(_("appointments"), default=0)
+    revenue = models.DecimalField(_("revenue (€)"), max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = _("Daily Appointment Rollup")
+        verbose_name_plural = _("Daily Appointment Rollups")
+        unique_together: ClassVar[list[tuple[str, ...]]] = [("day", "master", "service", "status")]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["status", "day"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.master_id}/{self.service_id} {self.status}: {self.appointment_count}"
+
+
+class AppointmentRollupPendingDay(models.Model):
+    """A local day whose rollup rows are out of date."""
+
+    day = models.DateField(_("day"), primary_key=True)
+    marked_at = models.DateTimeField(_("marked at"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Pending Rollup Day")
+        verbose_name_plural = _("Pending Rollup Days")
+
+    def __str__(self) -> str:
+        return str(self.day)
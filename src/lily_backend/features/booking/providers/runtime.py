@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt_module
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from codex_django.booking import (
     BookingActionResult,
@@ -15,15 +15,21 @@ from codex_django.booking import (
 )
 from core.logger import logger
 from django.db import transaction
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from system.models import Client
+from system.selectors.client_search import ClientSearchSelector
 
-from features.main.models import Service, ServiceCategory
+from features.main.models import Service
 
 from ..booking_settings import BookingSettings
 from ..models import Appointment, Master, MasterDayOff, MasterWorkingDay
+from ..selector.catalog import get_bookable_catalog
+from ..services.outbox import record_booking_event
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 class RuntimeBookingProvider(BookingProjectDataProvider):
@@ -79,59 +85,27 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
     # ── Category / Service lists ──────────────────────────────────────────────
 
     def get_service_categories(self) -> Any:
-        category_ids = self.get_cabinet_bookable_services_queryset().values_list("category_id", flat=True)
-        return ServiceCategory.objects.prefetch_related(
-            Prefetch("services", queryset=self.get_cabinet_bookable_services_queryset())
-        ).filter(is_active=True, is_planned=False, id__in=category_ids)
+        return get_bookable_catalog().cabinet_categories()
 
     def get_public_services(self) -> list[dict[str, Any]]:
         """Services for the public booking page — includes conflict rule data."""
-        from features.main.models import ServiceConflictRule
-
-        # Build a mapping: service_id → list of conflict rules
-        rules_from: dict[int, list[dict]] = {}
-        for rule in ServiceConflictRule.objects.filter(is_active=True).select_related("target"):
-            rules_from.setdefault(rule.source_id, []).append({"target_id": rule.target_id, "rule_type": rule.rule_type})
-
-        result = []
-        for s in self.get_bookable_services_queryset():
-            result.append(
-                {
-                    "id": s.id,
-                    "title": s.name,
-                    "slug": s.slug,
-                    "price": str(s.price),
-                    "duration": s.duration,
-                    "category_id": s.category_id,
-                    "category_slug": s.category.slug,
-                    "category_name": s.category.name,
-                    "is_addon": s.is_addon,
-                    "is_hit": s.is_hit,
-                    "conflict_rules": rules_from.get(s.id, []),
-                }
-            )
-        return result
+        catalog = get_bookable_catalog()
+        return [catalog.public_service(s) for s in catalog.services]
 
     def get_cabinet_services(self) -> list[dict[str, Any]]:
-        from features.main.models import ServiceConflictRule
-
-        # Build a mapping: service_id → list of conflict rules
-        rules_from: dict[int, list[dict]] = {}
-        for rule in ServiceConflictRule.objects.filter(is_active=True):
-            rules_from.setdefault(rule.source_id, []).append({"target_id": rule.target_id, "rule_type": rule.rule_type})
-
+        catalog = get_bookable_catalog()
         return [
             {
                 "id": s.id,
                 "title": s.name,
                 "price": float(s.price),
                 "duration": s.duration,
-                "category": s.category.bento_group or s.category.slug,
-                "master_ids": list(s.masters.values_list("id", flat=True)),
-                "conflicts_with": [r["target_id"] for r in rules_from.get(s.id, [])],
-                "conflict_rules": rules_from.get(s.id, []),
+                "category": catalog.category(s).bento_group or catalog.category(s).slug,
+                "master_ids": sorted(s.master_ids),
+                "conflicts_with": [rule["target_id"] for rule in catalog.rules_for(s.id)],
+                "conflict_rules": catalog.rules_for(s.id),
             }
-            for s in self.get_cabinet_bookable_services_queryset()
+            for s in catalog.cabinet_services()
         ]
 
     # ── Master list ───────────────────────────────────────────────────────────
@@ -141,27 +115,49 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
 
     # ── Client list ───────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _cabinet_client_dict(c: Client) -> dict[str, Any]:
+        return {
+            "id": c.id,
+            "name": c.full_name or c.phone or c.email or str(c),
+            "phone": c.phone or "",
+            "email": c.email or "",
+        }
+
     def get_cabinet_clients(self) -> list[dict[str, Any]]:
         return [
-            {
-                "id": c.id,
-                "name": c.full_name or c.phone or c.email or str(c),
-                "phone": c.phone or "",
-                "email": c.email or "",
-            }
+            self._cabinet_client_dict(c)
             for c in Client.objects.exclude(status=Client.STATUS_BLOCKED).order_by("last_name", "first_name")
         ]
 
+    def search_cabinet_clients(self, query: str, *, page: int = 1) -> dict[str, Any]:
+        """Return one page (at most 20) of non-blocked clients matching a typeahead query."""
+        result = ClientSearchSelector.search(query, page=page)
+        return {
+            "results": [self._cabinet_client_dict(c) for c in result.results],
+            "page": result.page,
+            "has_more": result.has_more,
+        }
+
+    def get_cabinet_client(self, client_id: int | str) -> dict[str, Any] | None:
+        if not str(client_id).isdigit():
+            return None
+        client = Client.objects.exclude(status=Client.STATUS_BLOCKED).filter(pk=int(client_id)).first()
+        return self._cabinet_client_dict(client) if client else None
+
     # ── Appointment list ──────────────────────────────────────────────────────
 
-    def get_cabinet_appointments(self, **kwargs: Any) -> list[dict[str, Any]]:
+    CABINET_APPOINTMENT_RELATED = ("master", "service", "client", "group_item")
+
+    def get_cabinet_appointments_queryset(self, **kwargs: Any) -> Any:
+        """Return the filtered, stably ordered appointment queryset behind the cabinet list."""
         status = kwargs.get("status")
         master_id = kwargs.get("master_id")
         search = kwargs.get("search")
-        date_from = kwargs.get("date_from")
-        date_to = kwargs.get("date_to")
+        date_from = self._parse_filter_date(kwargs.get("date_from"))
+        date_to = self._parse_filter_date(kwargs.get("date_to"))
 
-        qs = Appointment.objects.select_related("master", "service", "client", "group_item")
+        qs = Appointment.objects.select_related(*self.CABINET_APPOINTMENT_RELATED)
 
         if status and status != "all":
             qs = qs.filter(status=status)
@@ -175,36 +171,136 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
                 | Q(client__email__icontains=search)
                 | Q(service__name__icontains=search)
             )
+        # Local-day bounds keep the (status, datetime_start) index usable, unlike ``__date`` lookups.
         if date_from:
-            qs = qs.filter(datetime_start__date__gte=date_from)
+            qs = qs.filter(
+                datetime_start__gte=timezone.make_aware(dt_module.datetime.combine(date_from, dt_module.time.min))
+            )
         if date_to:
-            qs = qs.filter(datetime_start__date__lte=date_to)
+            qs = qs.filter(
+                datetime_start__lt=timezone.make_aware(
+                    dt_module.datetime.combine(date_to + dt_module.timedelta(days=1), dt_module.time.min)
+                )
+            )
+        return qs.order_by("-datetime_start", "-id")
 
-        result = []
-        qs = qs.order_by("-datetime_start")
-        for appt in qs:
-            local_dt = timezone.localtime(appt.datetime_start)
-            client = appt.client
-            client_name = getattr(client, "full_name", str(client)) if client else str(_("Unnamed Client"))
-            price = appt.price_actual if appt.price_actual is not None else appt.price
+    @staticmethod
+    def _parse_filter_date(value: Any) -> dt_module.date | None:
+        if not value:
+            return None
+        if isinstance(value, dt_module.date):
+            return value
+        try:
+            return dt_module.date.fromisoformat(str(value))
+        except ValueError:
+            return None
+
+    def get_cabinet_appointment_status_counts(self, **kwargs: Any) -> dict[str, int]:
+        """Count filtered appointments per status with a single grouped query."""
+        qs = self.get_cabinet_appointments_queryset(**{**kwargs, "status": None})
+        return {
+            row["status"]: row["total"]
+            for row in qs.order_by().values("status").annotate(total=Count("id")).values("status", "total")
+        }
 
+    @staticmethod
+    def serialize_cabinet_appointment(appt: Appointment) -> dict[str, Any]:
+        local_dt = timezone.localtime(appt.datetime_start)
+        client = appt.client
+        client_name = getattr(client, "full_name", str(client)) if client else str(_("Unnamed Client"))
+        price = appt.price_actual if appt.price_actual is not None else appt.price
+        return {
+            "id": appt.id,
+            "master_id": appt.master_id,
+            "date": local_dt.strftime("%Y-%m-%d"),
+            "time": local_dt.strftime("%H:%M"),
+            "duration": appt.duration_minutes,
+            "client_name": client_name,
+            "admin_notes": appt.admin_notes,
+            "client_notes": appt.client_notes,
+            "client_created_at": client.created_at.isoformat() if client else None,
+            "phone": client.phone if client else "",
+            "email": client.email if client else "",
+            "service_title": appt.service.name,
+            "price": float(price),
+            "status": appt.status,
+            "group_id": appt.group_item.group_id if hasattr(appt, "group_item") else None,
+        }
+
+    def get_cabinet_appointments(self, **kwargs: Any) -> list[dict[str, Any]]:
+        return [self.serialize_cabinet_appointment(appt) for appt in self.get_cabinet_appointments_queryset(**kwargs)]
+
+    def get_cabinet_appointment(self, booking_id: int) -> dict[str, Any] | None:
+        """Fetch one cabinet appointment by primary key with the list projection."""
+        appt = Appointment.objects.select_related(*self.CABINET_APPOINTMENT_RELATED).filter(pk=booking_id).first()
+        return self.serialize_cabinet_appointment(appt) if appt else None
+
+    # ── Schedule grid (day / range) ───────────────────────────────────────────
+
+    def get_cabinet_schedule_appointments(
+        self,
+        *,
+        date_from: dt_module.date,
+        date_to: dt_module.date | None = None,
+        statuses: Iterable[str] | None = None,
+        resource_ids: Iterable[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return compact calendar rows for appointments starting between ``date_from`` and ``date_to``.
+
+        Day bounds, statuses and masters are filtered in SQL and only the columns the
+        schedule grid renders are fetched, so the cost follows the visible range instead
+        of the whole appointment history.
+        """
+        range_start = timezone.make_aware(dt_module.datetime.combine(date_from, dt_module.time.min))
+        range_end = timezone.make_aware(
+            dt_module.datetime.combine((date_to or date_from) + dt_module.timedelta(days=1), dt_module.time.min)
+        )
+        qs = Appointment.objects.filter(datetime_start__gte=range_start, datetime_start__lt=range_end)
+        if statuses is not None:
+            qs = qs.filter(status__in=list(statuses))
+        if resource_ids is not None:
+            qs = qs.filter(master_id__in=list(resource_ids))
+
+        rows = qs.order_by("datetime_start", "id").values(
+            "id",
+            "master_id",
+            "datetime_start",
+            "duration_minutes",
+            "status",
+            "price",
+            "price_actual",
+            "admin_notes",
+            "client_notes",
+            "service__name",
+            "client_id",
+            "client__first_name",
+            "client__last_name",
+            "client__created_at",
+        )
+
+        result = []
+        for row in rows:
+            local_dt = timezone.localtime(row["datetime_start"])
+            has_client = row["client_id"] is not None
+            price = row["price_actual"] if row["price_actual"] is not None else row["price"]
             result.append(
                 {
-                    "id": appt.id,
-                    "master_id": appt.master_id,
+                    "id": row["id"],
+                    "master_id": row["master_id"],
                     "date": local_dt.strftime("%Y-%m-%d"),
                     "time": local_dt.strftime("%H:%M"),
-                    "duration": appt.duration_minutes,
-                    "client_name": client_name,
-                    "admin_notes": appt.admin_notes,
-                    "client_notes": appt.client_notes,
-                    "client_created_at": client.created_at.isoformat() if client else None,
-                    "phone": client.phone if client else "",
-                    "email": client.email if client else "",
-                    "service_title": appt.service.name,
+                    "duration": row["duration_minutes"],
+                    "client_name": (
+                        f"{row['client__first_name']} {row['client__last_name']}".strip()
+                        if has_client
+                        else str(_("Unnamed Client"))
+                    ),
+                    "admin_notes": row["admin_notes"],
+                    "client_notes": row["client_notes"],
+                    "client_created_at": row["client__created_at"].isoformat() if has_client else None,
+                    "service_title": row["service__name"],
                     "price": float(price),
-                    "status": appt.status,
-                    "group_id": appt.group_item.group_id if hasattr(appt, "group_item") else None,
+                    "status": row["status"],
                 }
             )
         return result
@@ -214,6 +310,8 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
     def get_schedule_prefill(self, *, schedule_date: str, col: int, row: int) -> BookingCalendarPrefillState:
         masters = list(self.get_bookable_masters_queryset().order_by("order", "name"))
         master = masters[col] if 0 <= col < len(masters) else None
+        if master is None and masters:
+            master = self._first_free_master(masters, schedule_date=schedule_date, start_time=self._row_to_time(row))
         return BookingCalendarPrefillState(
             resource_id=master.id if master else None,
             resource_name=master.name if master else "Any specialist",
@@ -224,6 +322,24 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
             row=row,
         )
 
+    @staticmethod
+    def _first_free_master(masters: list[Master], *, schedule_date: str, start_time: str) -> Master | None:
+        """First master (in column order) who can start a grid slot at ``start_time``."""
+        from features.booking.selector.engine import get_booking_engine_gateway
+
+        try:
+            target_date = dt_module.date.fromisoformat(schedule_date)
+            start = dt_module.time.fromisoformat(start_time)
+        except ValueError:
+            return None
+        free_ids = get_booking_engine_gateway().get_resources_free_at(
+            resource_ids=[master.pk for master in masters],
+            target_date=target_date,
+            start_time=start,
+            duration_minutes=30,
+        )
+        return next((master for master in masters if master.pk in free_ids), None)
+
     @staticmethod
     def _row_to_time(row: int) -> str:
         """Convert calendar row index (30-min slots from 08:00) to HH:MM string."""
@@ -240,9 +356,6 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
         start_time: str,
     ) -> list[BookingQuickCreateServiceOptionState]:
         del booking_date, start_time
-        qs = self.get_cabinet_bookable_services_queryset()
-        if resource_id:
-            qs = qs.filter(masters__id=resource_id)
         return [
             BookingQuickCreateServiceOptionState(
                 value=str(s.id),
@@ -250,21 +363,23 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
                 price_label=f"€{s.price}",
                 duration_label=f"{s.duration} min",
             )
-            for s in qs
+            for s in get_bookable_catalog().cabinet_services()
+            if not resource_id or int(resource_id) in s.master_ids
         ]
 
     # ── Quick-create: client dropdown ─────────────────────────────────────────
 
-    def get_quick_create_clients(self) -> list[BookingQuickCreateClientOptionState]:
+    def get_quick_create_clients(self, query: str = "") -> list[BookingQuickCreateClientOptionState]:
+        """Options for the quick-create dropdown; further matches are fetched while typing."""
         return [
             BookingQuickCreateClientOptionState(
                 value=str(c.id),
                 label=c.full_name or c.phone or c.email or str(c),
                 subtitle=c.phone or c.email or "",
                 email=c.email or "",
-                search_text=" ".join(part.lower() for part in [c.full_name, c.phone or "", c.email or ""] if part),
+                search_text=c.search_text,
             )
-            for c in Client.objects.exclude(status=Client.STATUS_BLOCKED).order_by("last_name", "first_name")
+            for c in ClientSearchSelector.search(query).results
         ]
 
     # ── Quick-create: available time slots ────────────────────────────────────
@@ -398,6 +513,7 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
                 resource_id=master.id,
                 start_at=aware_dt,
                 duration_minutes=service.duration,
+                use_index=False,
             ):
                 return {
                     "id": 0,
@@ -446,8 +562,21 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
             exclude_appointment_id=appt.id,
         ):
             return {"id": 0, "error": "Selected slot is already occupied. Choose another time.", "code": "slot-overlap"}
-        appt.datetime_start = aware_dt
-        appt.save(update_fields=["datetime_start", "updated_at"])
+        with transaction.atomic():
+            if self._has_blocking_overlap(
+                resource_id=appt.master_id,
+                start_at=aware_dt,
+                duration_minutes=appt.duration_minutes,
+                exclude_appointment_id=appt.id,
+                use_index=False,
+            ):
+                return {
+                    "id": 0,
+                    "error": "Selected slot is already occupied. Choose another time.",
+                    "code": "slot-overlap",
+                }
+            appt.datetime_start = aware_dt
+            appt.save(update_fields=["datetime_start", "updated_at"])
         return {"id": appt.id, "date": booking_date, "time": start_time}
 
     def _has_blocking_overlap(
@@ -457,8 +586,20 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
         start_at: dt_module.datetime,
         duration_minutes: int,
         exclude_appointment_id: int | None = None,
+        use_index: bool = True,
     ) -> bool:
+        """Check the master's blocking appointments on the start date for an overlap.
+
+        Pre-checks read the interval index; re-checks inside the write
+        transaction pass ``use_index=False`` to read the database directly.
+        """
         end_at = start_at + dt_module.timedelta(minutes=duration_minutes)
+        if use_index:
+            from ..selector.intervals import get_master_day_intervals
+
+            day = get_master_day_intervals([resource_id], timezone.localtime(start_at).date())[int(resource_id)]
+            return day.overlaps(start_at, end_at, exclude_id=exclude_appointment_id)
+
         day_start = start_at.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + dt_module.timedelta(days=1)
         qs = Appointment.objects.filter(
@@ -502,12 +643,8 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
             from django.core.exceptions import ValidationError
 
             try:
+                # 6.4: confirm() queues the confirmation notification in the outbox
                 appt.confirm()
-                # 6.4: Send confirmation notification
-                from features.conversations.services.notifications import _get_engine
-
-                _get_engine().dispatch_event("booking.confirmed", appt)
-
                 return BookingActionResult(
                     ok=True,
                     code="booking-confirm",
@@ -533,12 +670,9 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
                 if self._is_past_active_appointment(appt):
                     self._cancel_without_notifications(appt, reason=reason, note=note)
                 else:
-                    appt.cancel(reason=reason, note=note)
-                    # 6.4: Send cancellation notification
-                    from features.conversations.services.notifications import _get_engine
-
+                    # 6.4: cancel() queues the cancellation notification in the outbox
                     appt._booking_origin = "staff"
-                    _get_engine().dispatch_event("booking.cancelled", appt)
+                    appt.cancel(reason=reason, note=note)
 
                 return BookingActionResult(
                     ok=True,
@@ -610,11 +744,9 @@ class RuntimeBookingProvider(BookingProjectDataProvider):
                     naive_dt = dt_module.datetime.strptime(new_dt_str, "%d.%m.%Y %H:%M")
                     appt._booking_origin = "staff"
                     appt.datetime_start = timezone.make_aware(naive_dt)
-                    appt.save(update_fields=["datetime_start", "updated_at"])
-
-                    from features.conversations.services.notifications import _get_engine
-
-                    _get_engine().dispatch_event("booking.rescheduled", appt)
+                    with transaction.atomic():
+                        appt.save(update_fields=["datetime_start", "updated_at"])
+                        record_booking_event(appt, "booking.rescheduled")
 
                     return BookingActionResult(
                         ok=True,
@@ -0,0 +1,181 @@
+"""Redis managers for the booking interval index, settings snapshot, catalog and staff overview."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from codex_django.core.redis.managers.booking import BookingCacheManager
+
+
+class BookingIntervalIndexManager(BookingCacheManager):
+    """
+    Stores working hours and blocking appointments per (master, date).
+
+    Lives next to the codex-django busy-slot cache under the same ``booking``
+    prefix. Day entries are keyed by a schedule generation so that changes
+    touching every day at once (salon hours, weekly schedules) are a single
+    ``INCR`` instead of a key scan. They are also keyed by the version of
+    their date: dropping an entry bumps that version, so an entry built from
+    rows read before the drop lands under the old version and is never read.
+
+    Keys:
+        ``booking:day:generation`` -- current schedule generation.
+        ``booking:day:version:{date}`` -- bumped whenever an entry of that date is dropped.
+        ``booking:day:{generation}:{version}:{master_id}:{date}`` -- JSON day entry.
+    """
+
+    GENERATION_KEY = "day:generation"
+    DAY_VERSION_TTL_SECONDS = 7 * 24 * 60 * 60
+
+    def _day_key(self, stamp: str, master_id: int, date_str: str) -> str:
+        return self.make_key(f"day:{stamp}:{master_id}:{date_str}")
+
+    def _version_key(self, date_str: str) -> str:
+        return self.make_key(f"day:version:{date_str}")
+
+    def get_versions(self, date_strs: list[str]) -> tuple[str, ...] | None:
+        """
+        Returns the schedule generation followed by the version of each date,
+        or ``None`` when Redis is disabled.
+        """
+        if self._is_disabled():
+            return None
+        with self.sync_string() as redis:
+            values = redis.mget(
+                self.make_key(self.GENERATION_KEY), *[self._version_key(date_str) for date_str in date_strs]
+            )
+        return tuple(value or "0" for value in values)
+
+    def get_days(self, master_ids: list[int], date_str: str) -> tuple[dict[int, dict[str, Any]], str | None]:
+        """
+        Returns cached day entries for the masters plus the ``{generation}:{version}``
+        stamp they were read under. Callers must read the stamp before loading rows
+        from the database and write back under it. The stamp is ``None`` when Redis
+        is disabled, so callers skip write-back.
+        """
+        if self._is_disabled():
+            return {}, None
+        with self.sync_string() as redis:
+            generation, version = redis.mget(self.make_key(self.GENERATION_KEY), self._version_key(date_str))
+            stamp = f"{generation or '0'}:{version or '0'}"
+            raw_entries = redis.mget(*[self._day_key(stamp, master_id, date_str) for master_id in master_ids])
+        entries = {master_id: json.loads(raw) for master_id, raw in zip(master_ids, raw_entries, strict=True) if raw}
+        return entries, stamp
+
+    def set_days(self, stamp: str, date_str: str, entries: dict[int, dict[str, Any]], timeout: int) -> None:
+        """
+        Stores freshly built day entries under the stamp they were read against.
+        """
+        if self._is_disabled() or not entries:
+            return
+        with self.sync_string() as redis:
+            for master_id, entry in entries.items():
+                redis.set(self._day_key(stamp, master_id, date_str), json.dumps(entry), ttl=timeout)
+
+    def invalidate_day(self, date_str: str) -> None:
+        """
+        Bumps the date version, which drops every entry of that date; old keys expire by TTL.
+        """
+        if self._is_disabled():
+            return
+        with self.sync_string() as redis:
+            redis.incr(self._version_key(date_str))
+            redis.expire(self._version_key(date_str), self.DAY_VERSION_TTL_SECONDS)
+
+    def bump_generation(self) -> None:
+        """
+        Invalidates every day entry at once; stale generations expire by TTL.
+        """
+        if self._is_disabled():
+            return
+        with self.sync_string() as redis:
+            redis.incr(self.make_key(self.GENERATION_KEY))
+
+
+class BookingVersionManager(BookingCacheManager):
+    """
+    One shared version counter under ``VERSION_KEY``.
+
+    Processes stamp their cached values with it and drop them once it moves;
+    see ``features.booking.selector.versioned.VersionedCache``.
+    """
+
+    VERSION_KEY: str
+
+    def get_version(self) -> str | None:
+        """
+        Returns the current version, or ``None`` when Redis is disabled.
+        """
+        if self._is_disabled():
+            return None
+        with self.sync_string() as redis:
+            return redis.get(self.make_key(self.VERSION_KEY)) or "0"
+
+    def bump_version(self) -> None:
+        if self._is_disabled():
+            return
+        with self.sync_string() as redis:
+            redis.incr(self.make_key(self.VERSION_KEY))
+
+
+class BookingSettingsVersionManager(BookingVersionManager):
+    """
+    Shared version of the booking settings snapshot.
+
+    Bumped when booking settings, services or service categories are saved so
+    every process drops its cached ``BookingSettingsSnapshot``.
+
+    Keys:
+        ``booking:settings:version`` -- current snapshot version.
+    """
+
+    VERSION_KEY = "settings:version"
+
+
+class BookingCatalogManager(BookingVersionManager):
+    """
+    Shared version and serialized payload of the bookable catalog snapshot.
+
+    Bumped when services, categories, conflict rules, service masters or
+    master schedules change. The payload is stored per version and language so
+    a process that sees a new version rebuilds from Redis instead of the
+    database when another process already did the work.
+
+    Keys:
+        ``booking:catalog:version`` -- current catalog version.
+        ``booking:catalog:{version}:{language}`` -- JSON catalog payload.
+    """
+
+    VERSION_KEY = "catalog:version"
+    PAYLOAD_TTL_SECONDS = 24 * 60 * 60
+
+    def _payload_key(self, version: str, language: str) -> str:
+        return self.make_key(f"catalog:{version}:{language}")
+
+    def get_payload(self, version: str, language: str) -> dict[str, Any] | None:
+        if self._is_disabled():
+            return None
+        with self.sync_string() as redis:
+            raw = redis.get(self._payload_key(version, language))
+        return json.loads(raw) if raw else None
+
+    def set_payload(self, version: str, language: str, payload: dict[str, Any]) -> None:
+        if self._is_disabled():
+            return
+        with self.sync_string() as redis:
+            redis.set(self._payload_key(version, language), json.dumps(payload), ttl=self.PAYLOAD_TTL_SECONDS)
+
+
+class StaffOverviewVersionManager(BookingVersionManager):
+    """
+    Shared version of the cabinet staff overview.
+
+    Bumped when masters, their weekly schedules, days off, appointments or
+    service links change so every process drops its cached ``StaffOverview``.
+
+    Keys:
+        ``booking:staff:version`` -- current overview version.
+    """
+
+    VERSION_KEY = "staff:version"
@@ -0,0 +1,306 @@
+"""Read-only snapshot of the bookable service catalog.
+
+``BookableCatalogSnapshot`` holds every bookable service with its category,
+the ids of the masters linked to it and the active cart conflict rules keyed
+by source service. Its ``cart_graph`` indexes those rules for the public
+cart. It is built in three queries, cached per process and
+language, and shared between processes through ``BookingCatalogManager``:
+the signals wired in ``MainConfig.ready`` and ``BookingConfig.ready`` bump its
+version whenever services, categories, conflict rules, service masters or
+master schedules change. When Redis is disabled or unreachable the snapshot
+is rebuilt on every call.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from django.utils.translation import get_language
+
+from ..redis import BookingCatalogManager
+from .versioned import VersionedCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Set on the database connection of a transaction that wrote catalog rows and has not committed yet.
+PENDING_WRITE_ATTR = "_booking_catalog_pending_write"
+# Keyed by language
+_cache = VersionedCache("Booking catalog", lambda: get_catalog_manager())
+
+
+@dataclass(frozen=True)
+class CatalogCategory:
+    id: int
+    name: str
+    slug: str
+    bento_group: str
+    order: int
+    is_active: bool
+    is_planned: bool
+
+
+@dataclass(frozen=True)
+class CatalogService:
+    id: int
+    name: str
+    slug: str
+    price: Decimal
+    duration: int
+    category_id: int
+    is_addon: bool
+    is_hit: bool
+    master_ids: frozenset[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class CartConflictGraph:
+    """Conflict rules of the public cart as adjacency sets, with the grouped public service list.
+
+    ``replaces`` maps a service to the services it pushes out of the cart, in
+    rule order. ``excludes`` is symmetric: a rule on either side blocks the pair.
+    The category groups are shared between requests and must be treated as read-only.
+    """
+
+    services: Mapping[int, CatalogService]
+    replaces: Mapping[int, tuple[int, ...]]
+    excludes: Mapping[int, frozenset[int]]
+    categories: tuple[dict[str, Any], ...]
+
+    def resolve_add(self, service_id: int, cart_ids: Iterable[int]) -> tuple[int, ...] | None:
+        """Ids the service replaces in the cart, or ``None`` when the cart holds a service it excludes."""
+        cart_ids = set(cart_ids)
+        if not self.excludes.get(service_id, frozenset()).isdisjoint(cart_ids):
+            return None
+        return tuple(target_id for target_id in self.replaces.get(service_id, ()) if target_id in cart_ids)
+
+
+@dataclass(frozen=True)
+class BookableCatalogSnapshot:
+    """Bookable services in display order with categories, master ids and conflict rules."""
+
+    services: tuple[CatalogService, ...]
+    categories: Mapping[int, CatalogCategory]
+    conflict_rules: Mapping[int, tuple[tuple[int, str], ...]] = field(default_factory=lambda: MappingProxyType({}))
+    version: tuple[Any, ...] | None = None
+
+    def category(self, service: CatalogService) -> CatalogCategory:
+        return self.categories[service.category_id]
+
+    def is_cabinet_bookable(self, service: CatalogService) -> bool:
+        category = self.category(service)
+        return category.is_active and not category.is_planned
+
+    def cabinet_services(self) -> list[CatalogService]:
+        return [service for service in self.services if self.is_cabinet_bookable(service)]
+
+    def cabinet_categories(self) -> list[CatalogCategory]:
+        """Active, non-planned categories that have at least one bookable service."""
+        category_ids = {service.category_id for service in self.cabinet_services()}
+        return sorted(
+            (self.categories[category_id] for category_id in category_ids),
+            key=lambda category: (category.order, category.name),
+        )
+
+    def rules_for(self, service_id: int) -> list[dict[str, Any]]:
+        """Fresh rule dicts so callers can never mutate the cached snapshot."""
+        return [
+            {"target_id": target_id, "rule_type": rule_type}
+            for target_id, rule_type in self.conflict_rules.get(service_id, ())
+        ]
+
+    def public_service(self, service: CatalogService) -> dict[str, Any]:
+        """Service row of the public booking page, with its conflict rules."""
+        category = self.category(service)
+        return {
+            "id": service.id,
+            "title": service.name,
+            "slug": service.slug,
+            "price": str(service.price),
+            "duration": service.duration,
+            "category_id": service.category_id,
+            "category_slug": category.slug,
+            "category_name": category.name,
+            "is_addon": service.is_addon,
+            "is_hit": service.is_hit,
+            "conflict_rules": self.rules_for(service.id),
+        }
+
+    @cached_property
+    def cart_graph(self) -> CartConflictGraph:
+        """Built once per snapshot, so once per catalog version and language in each process."""
+        from features.main.models import ServiceConflictRule
+
+        replaces: dict[int, list[int]] = {}
+        excludes: dict[int, set[int]] = {}
+        for source_id, rules in self.conflict_rules.items():
+            for target_id, rule_type in rules:
+                if rule_type == ServiceConflictRule.REPLACES:
+                    replaces.setdefault(source_id, []).append(target_id)
+                elif rule_type == ServiceConflictRule.EXCLUDES:
+                    excludes.setdefault(source_id, set()).add(target_id)
+                    excludes.setdefault(target_id, set()).add(source_id)
+
+        categories: dict[str, dict[str, Any]] = {}
+        for service in self.services:
+            row = self.public_service(service)
+            group = categories.setdefault(
+                row["category_slug"],
+                {"slug": row["category_slug"], "name": row["category_name"], "services": []},
+            )
+            group["services"].append(row)
+
+        return CartConflictGraph(
+            services=MappingProxyType({service.id: service for service in self.services}),
+            replaces=MappingProxyType({source_id: tuple(targets) for source_id, targets in replaces.items()}),
+            excludes=MappingProxyType({service_id: frozenset(ids) for service_id, ids in excludes.items()}),
+            categories=tuple(categories.values()),
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "services": [
+                {**asdict(service), "price": str(service.price), "master_ids": sorted(service.master_ids)}
+                for service in self.services
+            ],
+            "categories": [asdict(category) for category in self.categories.values()],
+            "conflict_rules": [[source_id, list(rules)] for source_id, rules in self.conflict_rules.items()],
+        }
+
+    @classmethod
+    def from_payload(
+        cls, payload: dict[str, Any], *, version: tuple[Any, ...] | None = None
+    ) -> BookableCatalogSnapshot:
+        return cls(
+            services=tuple(
+                CatalogService(
+                    **{**row, "price": Decimal(row["price"]), "master_ids": frozenset(row["master_ids"])},
+                )
+                for row in payload["services"]
+            ),
+            categories=MappingProxyType({row["id"]: CatalogCategory(**row) for row in payload["categories"]}),
+            conflict_rules=MappingProxyType(
+                {
+                    source_id: tuple((target_id, rule_type) for target_id, rule_type in rules)
+                    for source_id, rules in payload["conflict_rules"]
+                }
+            ),
+            version=version,
+        )
+
+
+def get_catalog_manager() -> BookingCatalogManager:
+    return BookingCatalogManager()
+
+
+def load_bookable_catalog(*, version: tuple[Any, ...] | None = None) -> BookableCatalogSnapshot:
+    """Build the catalog from the database in three queries."""
+    from features.main.models import Service, ServiceConflictRule
+
+    from ..providers.runtime import RuntimeBookingProvider
+
+    rows = list(RuntimeBookingProvider.get_bookable_services_queryset().prefetch_related(None))
+    master_ids: dict[int, set[int]] = {}
+    for service_id, master_id in Service.masters.through.objects.filter(
+        service_id__in=[row.pk for row in rows]
+    ).values_list("service_id", "master_id"):
+        master_ids.setdefault(service_id, set()).add(master_id)
+    conflict_rules: dict[int, list[tuple[int, str]]] = {}
+    for source_id, target_id, rule_type in (
+        ServiceConflictRule.objects.filter(is_active=True)
+        .order_by("pk")
+        .values_list("source_id", "target_id", "rule_type")
+    ):
+        conflict_rules.setdefault(source_id, []).append((target_id, rule_type))
+
+    return BookableCatalogSnapshot(
+        services=tuple(
+            CatalogService(
+                id=row.pk,
+                name=row.name,
+                slug=row.slug,
+                price=row.price,
+                duration=row.duration,
+                category_id=row.category_id,
+                is_addon=row.is_addon,
+                is_hit=row.is_hit,
+                master_ids=frozenset(master_ids.get(row.pk, ())),
+            )
+            for row in rows
+        ),
+        categories=MappingProxyType(
+            {
+                row.category_id: CatalogCategory(
+                    id=row.category.pk,
+                    name=row.category.name,
+                    slug=row.category.slug,
+                    bento_group=row.category.bento_group,
+                    order=row.category.order,
+                    is_active=row.category.is_active,
+                    is_planned=row.category.is_planned,
+                )
+                for row in rows
+            }
+        ),
+        conflict_rules=MappingProxyType({source_id: tuple(rules) for source_id, rules in conflict_rules.items()}),
+        version=version,
+    )
+
+
+def get_bookable_catalog() -> BookableCatalogSnapshot:
+    """Return the cached catalog for the active language, reloading it when its version moved."""
+    language = get_language() or ""
+    skip_shared = _has_pending_write()
+
+    def _load(version: tuple[Any, ...]) -> BookableCatalogSnapshot:
+        shared_version = version[1]
+        if shared_version is None or skip_shared:
+            return load_bookable_catalog(version=version)
+        manager = get_catalog_manager()
+        try:
+            payload = manager.get_payload(shared_version, language)
+        except Exception as exc:
+            logger.warning("Booking catalog payload read failed: %s", exc)
+            payload = None
+        if payload is not None:
+            return BookableCatalogSnapshot.from_payload(payload, version=version)
+        catalog = load_bookable_catalog(version=version)
+        try:
+            manager.set_payload(shared_version, language, catalog.to_payload())
+        except Exception as exc:
+            logger.warning("Booking catalog payload write failed: %s", exc)
+        return catalog
+
+    # A catalog built inside an uncommitted write is private to this transaction.
+    return _cache.get_or_load(_load, key=language, store=not skip_shared)
+
+
+def _has_pending_write() -> bool:
+    """Whether this connection's open transaction wrote catalog rows the shared payload does not have yet."""
+    from django.db import connection
+
+    if not getattr(connection, PENDING_WRITE_ATTR, False):
+        return False
+    if connection.in_atomic_block:
+        return True
+    # The transaction ended without running its commit hook, so it rolled back.
+    setattr(connection, PENDING_WRITE_ATTR, False)
+    return False
+
+
+def invalidate_bookable_catalog(sender: Any, **kwargs: Any) -> None:
+    """post_save/post_delete/m2m_changed of catalog inputs: drop every cached catalog."""
+    from django.db import connection
+
+    if kwargs.get("action", "post_").startswith("pre_"):
+        return
+    # Until the shared version moves the Redis payload predates this write.
+    setattr(connection, PENDING_WRITE_ATTR, True)
+    _cache.invalidate(after_commit=lambda: setattr(connection, PENDING_WRITE_ATTR, False))
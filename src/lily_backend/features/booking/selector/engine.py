@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import zoneinfo
-from datetime import date, datetime, time, timedelta
+from datetime import UTC, date, datetime, time, timedelta
 from typing import Any
 
 from codex_django.booking.adapters.availability import DjangoAvailabilityAdapter
@@ -22,23 +22,20 @@ from codex_django.booking.selectors import (
 from codex_django.booking.selectors import (
     get_nearest_slots as runtime_get_nearest_slots,
 )
+from codex_services.booking.slot_master import BookingEngineRequest, ChainFinder, MasterAvailability, ServiceRequest
 
 from ..persistence import LilyBookingPersistenceHook, build_single_service_extra_fields
 from ..providers.runtime import get_booking_project_data_provider
+from .grid import get_day_grids
+from .intervals import get_master_day_intervals, get_schedule_version
+from .memo import SlotResultMemo
+from .snapshot import BookingSettingsSnapshot, get_booking_settings_snapshot
 
 logger = logging.getLogger(__name__)
 
 MULTI_SERVICE_MAX_UNIQUE_STARTS = 100
 MULTI_SERVICE_MAX_SOLUTIONS = 1000
-DAY_NAMES = (
-    "monday",
-    "tuesday",
-    "wednesday",
-    "thursday",
-    "friday",
-    "saturday",
-    "sunday",
-)
+NEAREST_SLOTS_SEARCH_DAYS = 60
 
 
 def _day_bounds(target_date: date) -> tuple[datetime, datetime]:
@@ -48,16 +45,14 @@ def _day_bounds(target_date: date) -> tuple[datetime, datetime]:
     return start, start + timedelta(days=1)
 
 
-def _get_settings_day_schedule(settings: Any, weekday: int) -> tuple[time, time] | None:
-    """Return Lily salon hours for a weekday from BookingSettings only."""
-    day_name = DAY_NAMES[weekday]
-    if getattr(settings, f"{day_name}_is_closed", False):
-        return None
-    start_time = getattr(settings, f"work_start_{day_name}", None)
-    end_time = getattr(settings, f"work_end_{day_name}", None)
-    if not start_time or not end_time:
-        return None
-    return start_time, end_time
+def _freeze(value: Any) -> Any:
+    """Hashable form of slot search kwargs (dicts and lists become sorted/ordered tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple | set):
+        items = [_freeze(item) for item in value]
+        return tuple(sorted(items, key=str) if isinstance(value, set) else items)
+    return value
 
 
 class EmptyAvailableSlots:
@@ -172,14 +167,16 @@ class LilyBookingAvailabilityAdapter(LoadAwareDjangoAvailabilityAdapter):
     """Lily availability adapter.
 
     In Lily, BookingSettings owns working hours. MasterWorkingDay only marks
-    whether a master works on a weekday.
+    whether a master works on a weekday. Settings come from the snapshot the
+    gateway hands in, so building an adapter does not query them again.
     """
 
+    def __init__(self, *args: Any, settings_snapshot: BookingSettingsSnapshot | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.settings_snapshot = settings_snapshot or get_booking_settings_snapshot()
+
     def _get_booking_settings(self) -> Any:
-        if self._booking_settings is None:
-            load = getattr(self.booking_settings_model, "load", None)
-            self._booking_settings = load() if callable(load) else self.booking_settings_model.objects.first()
-        return self._booking_settings
+        return self.settings_snapshot.settings
 
     def _get_tz(self, master: Any) -> zoneinfo.ZoneInfo:
         tz_name = getattr(master, "timezone", None)
@@ -195,7 +192,7 @@ class LilyBookingAvailabilityAdapter(LoadAwareDjangoAvailabilityAdapter):
         if not self.working_day_model.objects.filter(master_id=master.pk, weekday=weekday).exists():
             return None
 
-        schedule = _get_settings_day_schedule(self._get_booking_settings(), weekday)
+        schedule = self.settings_snapshot.day_schedule(weekday)
         if schedule is None:
             return None
 
@@ -209,6 +206,65 @@ class LilyBookingAvailabilityAdapter(LoadAwareDjangoAvailabilityAdapter):
         del master, target_date
         return None
 
+    def build_master_availability(
+        self,
+        master: Any,
+        target_date: date,
+        hours: tuple[time, time],
+        busy_intervals: list[tuple[datetime, datetime]],
+    ) -> MasterAvailability:
+        """Free windows of one master for the given salon hours and busy intervals."""
+        tz = self._get_tz(master)
+        buffer = self._get_buffer_minutes(master, self._get_booking_settings())
+        start_time, end_time = hours
+        return MasterAvailability(
+            resource_id=str(master.pk),
+            free_windows=self._calc.merge_free_windows(
+                work_start=datetime.combine(target_date, start_time, tzinfo=tz),
+                work_end=datetime.combine(target_date, end_time, tzinfo=tz),
+                busy_intervals=[(start.astimezone(tz), end.astimezone(tz)) for start, end in busy_intervals],
+                break_interval=None,
+                buffer_minutes=buffer,
+                min_duration_minutes=self.step_minutes,
+            ),
+            buffer_between_minutes=buffer,
+        )
+
+    def build_resources_availability(
+        self,
+        resource_ids: list[int],
+        target_date: date,
+        cache_ttl: int = 0,
+        exclude_appointment_ids: list[int] | None = None,
+    ) -> dict[str, MasterAvailability]:
+        """Read hours and busy intervals from the interval index.
+
+        ``cache_ttl=0`` is how the booking flow asks for fresh data under a
+        resource lock, so that path keeps reading the database directly.
+        """
+        if not cache_ttl:
+            return super().build_resources_availability(
+                resource_ids,
+                target_date,
+                cache_ttl=cache_ttl,
+                exclude_appointment_ids=exclude_appointment_ids,
+            )
+
+        intervals = get_master_day_intervals(resource_ids, target_date, settings=self.settings_snapshot)
+        exclude_ids = set(exclude_appointment_ids or ())
+        availability: dict[str, MasterAvailability] = {}
+        for master in self.resource_model.objects.filter(pk__in=resource_ids):
+            day = intervals.get(master.pk)
+            if day is None or day.hours is None:
+                continue
+            availability[str(master.pk)] = self.build_master_availability(
+                master,
+                target_date,
+                day.hours,
+                day.busy_intervals(exclude_ids=exclude_ids),
+            )
+        return availability
+
     def _get_busy_intervals(
         self,
         resource_ids: list[int],
@@ -235,19 +291,191 @@ class LilyBookingAvailabilityAdapter(LoadAwareDjangoAvailabilityAdapter):
         return busy_by_resource
 
 
+class RangeAvailabilitySnapshot:
+    """Booking inputs for a whole date range, loaded in a constant number of queries.
+
+    Mirrors how ``LilyBookingAvailabilityAdapter`` resolves resources, working
+    hours and busy intervals for a single day, but reads schedules, days off
+    and blocking appointments for every day of the range up front. Each day is
+    then solved in memory with the same ``ChainFinder`` the slot search uses.
+    """
+
+    def __init__(
+        self,
+        adapter: LilyBookingAvailabilityAdapter,
+        *,
+        service_ids: list[int],
+        target_dates: list[date],
+        locked_resource_id: int | None = None,
+        resource_selections: dict[str, str] | None = None,
+    ) -> None:
+        self.adapter = adapter
+        self.settings = adapter.settings_snapshot
+        self.service_ids = service_ids
+        self.locked_resource_id = locked_resource_id
+        self.resource_selections = adapter._normalize_resource_selections(service_ids, resource_selections)
+
+        services = adapter.service_model.objects.filter(id__in=service_ids).select_related("category")
+        self.services = {service.pk: service for service in services}
+        start_times = [
+            service.category.booking_start_time
+            for service in self.services.values()
+            if service.is_active and service.category.booking_start_time is not None
+        ]
+        self.minimum_start_time: time | None = max(start_times) if start_times else None
+
+        self.category_resource_ids = self._load_category_resource_ids()
+        resource_ids = set(self.resource_selections.values()) - {None}
+        resource_ids.update(*self.category_resource_ids.values())
+        if locked_resource_id:
+            resource_ids.add(locked_resource_id)
+        self.resources = {master.pk: master for master in adapter.resource_model.objects.filter(pk__in=resource_ids)}
+
+        self.working_weekdays: dict[int, set[int]] = {}
+        for master_id, weekday in adapter.working_day_model.objects.filter(master_id__in=self.resources).values_list(
+            "master_id", "weekday"
+        ):
+            self.working_weekdays.setdefault(master_id, set()).add(weekday)
+
+        self.days_off: set[tuple[int, date]] = set()
+        self.busy_by_day: dict[date, dict[int, list[tuple[datetime, datetime]]]] = {}
+        if target_dates and self.resources:
+            first_date, last_date = min(target_dates), max(target_dates)
+            self.days_off = set(
+                adapter.day_off_model.objects.filter(
+                    master_id__in=self.resources,
+                    date__gte=first_date,
+                    date__lte=last_date,
+                ).values_list("master_id", "date")
+            )
+            self._load_busy_intervals(first_date, last_date)
+
+    def _load_category_resource_ids(self) -> dict[int, set[int]]:
+        category_ids = {service.category_id for service in self.services.values()}
+        if not category_ids:
+            return {}
+        resource_model = self.adapter.resource_model
+        rows = resource_model.objects.filter(
+            categories__in=category_ids,
+            status=resource_model.STATUS_ACTIVE,
+        ).values_list("categories", "pk")
+        resource_ids: dict[int, set[int]] = {}
+        for category_id, master_id in rows:
+            if category_id in category_ids:
+                resource_ids.setdefault(category_id, set()).add(master_id)
+        return resource_ids
+
+    def _load_busy_intervals(self, first_date: date, last_date: date) -> None:
+        from django.utils import timezone
+
+        range_start, _ = _day_bounds(first_date)
+        _, range_end = _day_bounds(last_date)
+        appointments = (
+            self.adapter.appointment_model.objects.filter(
+                master_id__in=self.resources,
+                datetime_start__gte=range_start,
+                datetime_start__lt=range_end,
+                status__in=self.adapter.appointment_status_filter,
+            )
+            .order_by("datetime_start")
+            .values_list("master_id", "datetime_start", "duration_minutes")
+        )
+        for master_id, datetime_start, duration_minutes in appointments:
+            start = datetime_start.astimezone(UTC).replace(second=0, microsecond=0)
+            day = self.busy_by_day.setdefault(timezone.localtime(datetime_start).date(), {})
+            day.setdefault(master_id, []).append((start, start + timedelta(minutes=duration_minutes)))
+
+    def _resolve_resource_ids(self, service: Any, weekday: int) -> list[str]:
+        if self.locked_resource_id:
+            return [str(self.locked_resource_id)]
+        selected_id = self.resource_selections.get(service.pk)
+        if selected_id is not None:
+            return [str(selected_id)]
+        return [
+            str(master_id)
+            for master_id in sorted(self.category_resource_ids.get(service.category_id, ()))
+            if weekday in self.working_weekdays.get(master_id, ())
+        ]
+
+    def build_engine_request(self, target_date: date) -> BookingEngineRequest | None:
+        weekday = target_date.weekday()
+        service_requests: list[ServiceRequest] = []
+        for service_id in self.service_ids:
+            service = self.services.get(service_id)
+            if service is None:
+                continue
+            possible_ids = self._resolve_resource_ids(service, weekday)
+            if not possible_ids:
+                continue
+            service_requests.append(
+                ServiceRequest(
+                    service_id=str(service_id),
+                    duration_minutes=service.duration,
+                    min_gap_after_minutes=getattr(service, "min_gap_after_minutes", 0) or 0,
+                    possible_resource_ids=possible_ids,
+                    parallel_group=getattr(service, "parallel_group", None) or None,
+                )
+            )
+        if not service_requests:
+            return None
+        return BookingEngineRequest(service_requests=service_requests, booking_date=target_date)
+
+    def build_resources_availability(self, resource_ids: set[str], target_date: date) -> dict[str, MasterAvailability]:
+        weekday = target_date.weekday()
+        schedule = self.settings.day_schedule(weekday)
+        if schedule is None:
+            return {}
+        busy_by_resource = self.busy_by_day.get(target_date, {})
+
+        availability: dict[str, MasterAvailability] = {}
+        for resource_id in resource_ids:
+            master = self.resources.get(int(resource_id))
+            if master is None or (master.pk, target_date) in self.days_off:
+                continue
+            if weekday not in self.working_weekdays.get(master.pk, ()):
+                continue
+            availability[resource_id] = self.adapter.build_master_availability(
+                master,
+                target_date,
+                schedule,
+                busy_by_resource.get(master.pk, []),
+            )
+        return availability
+
+    def has_available_slot(self, target_date: date) -> bool:
+        """Return whether at least one start on ``target_date`` fits the whole cart."""
+        request = self.build_engine_request(target_date)
+        if request is None:
+            return False
+        resource_ids = {resource_id for sr in request.service_requests for resource_id in sr.possible_resource_ids}
+        availability = self.build_resources_availability(resource_ids, target_date)
+        if not availability:
+            return False
+
+        min_start = None
+        if self.minimum_start_time is not None:
+            tz = zoneinfo.ZoneInfo(self.adapter.timezone or "UTC")
+            min_start = datetime.combine(target_date, self.minimum_start_time, tzinfo=tz)
+        finder = ChainFinder(step_minutes=self.adapter.step_minutes, min_start=min_start)
+        return finder.find(request=request, resources_availability=availability, max_solutions=1).has_solutions
+
+
 class BookingRuntimeEngineGateway(BookingEngineGateway):
     """Feature-facing engine gateway."""
 
     def __init__(self, provider: Any = None) -> None:
         self.provider = provider or get_booking_project_data_provider()
+        self.slot_memo = SlotResultMemo()
 
-    def _build_adapter(self, target_date: date | None = None) -> DjangoAvailabilityAdapter:
+    def _build_adapter(
+        self,
+        target_date: date | None = None,
+        settings: BookingSettingsSnapshot | None = None,
+    ) -> LilyBookingAvailabilityAdapter:
         from django.conf import settings as django_settings
 
-        from ..booking_settings import BookingSettings
-
+        settings = settings or get_booking_settings_snapshot()
         feature_models = self.provider.get_feature_models()
-        strategy = BookingSettings.load().load_strategy
         project_tz = getattr(django_settings, "TIME_ZONE", "UTC")
         return LilyBookingAvailabilityAdapter(
             resource_model=feature_models.resource_model,
@@ -257,22 +485,11 @@ class BookingRuntimeEngineGateway(BookingEngineGateway):
             day_off_model=feature_models.day_off_model,
             booking_settings_model=feature_models.booking_settings_model,
             timezone=project_tz,
-            load_strategy=strategy,
+            load_strategy=settings.load_strategy,
             target_date=target_date or date.today(),
+            settings_snapshot=settings,
         )
 
-    def _get_category_booking_start_time(self, service_ids: list[int]) -> time | None:
-        from features.main.models import Service
-
-        start_times = [
-            value
-            for value in Service.objects.filter(pk__in=service_ids, is_active=True).values_list(
-                "category__booking_start_time", flat=True
-            )
-            if value is not None
-        ]
-        return max(start_times) if start_times else None
-
     def get_calendar_data(
         self,
         *,
@@ -286,10 +503,8 @@ class BookingRuntimeEngineGateway(BookingEngineGateway):
     def get_available_slots(self, *, service_ids: list[int], target_date: date, **kwargs: Any) -> Any:
         from datetime import date as dt_date
 
-        from ..booking_settings import BookingSettings
-
         audience = str(kwargs.pop("audience", "public"))
-        settings = BookingSettings.load()
+        settings = kwargs.pop("settings", None) or get_booking_settings_snapshot()
         if audience == "public" and settings.book_only_from_next_day and target_date <= dt_date.today():
             return []
 
@@ -298,92 +513,198 @@ class BookingRuntimeEngineGateway(BookingEngineGateway):
             effective_kwargs.setdefault("max_unique_starts", MULTI_SERVICE_MAX_UNIQUE_STARTS)
             effective_kwargs.setdefault("max_solutions", MULTI_SERVICE_MAX_SOLUTIONS)
 
-        adapter = self._build_adapter(target_date=target_date)
+        memo_key = self._slot_memo_key(service_ids, target_date, audience, effective_kwargs, [target_date], settings)
         try:
-            result = runtime_get_available_slots(adapter, service_ids, target_date, **effective_kwargs)
+            return self.slot_memo.get_or_compute(
+                "get_available_slots",
+                memo_key,
+                lambda: self._find_available_slots(service_ids, target_date, effective_kwargs, settings),
+            )
         except Exception as exc:
             logger.debug("Booking get_available_slots fallback to empty payload: {}", exc)
             return EmptyAvailableSlots()
 
-        minimum_start_time = self._get_category_booking_start_time(service_ids)
+    def _find_available_slots(
+        self,
+        service_ids: list[int],
+        target_date: date,
+        kwargs: dict[str, Any],
+        settings: BookingSettingsSnapshot,
+    ) -> Any:
+        adapter = self._build_adapter(target_date=target_date, settings=settings)
+        result = runtime_get_available_slots(adapter, service_ids, target_date, **kwargs)
+        minimum_start_time = settings.minimum_start_time(service_ids)
         if minimum_start_time is None:
             return result
         return StartTimeFilteredSlots(result, minimum_start_time)
 
+    def get_available_dates(
+        self,
+        *,
+        service_ids: list[int],
+        start_date: date,
+        horizon: int,
+        locked_resource_id: int | None = None,
+        resource_selections: dict[str, str] | None = None,
+        audience: str = "public",
+        settings: BookingSettingsSnapshot | None = None,
+    ) -> set[str]:
+        """Return ISO dates in ``[start_date, start_date + horizon)`` with at least one bookable start.
+
+        Uses a single ``RangeAvailabilitySnapshot`` so the number of queries
+        does not grow with the horizon or the number of candidate masters.
+        """
+        target_dates = [start_date + timedelta(days=offset) for offset in range(max(horizon, 0))]
+        settings = settings or get_booking_settings_snapshot()
+        if audience == "public" and settings.book_only_from_next_day:
+            target_dates = [target_date for target_date in target_dates if target_date > date.today()]
+        if not service_ids or not target_dates:
+            return set()
+
+        adapter = self._build_adapter(target_date=target_dates[0], settings=settings)
+        snapshot = RangeAvailabilitySnapshot(
+            adapter,
+            service_ids=service_ids,
+            target_dates=target_dates,
+            locked_resource_id=locked_resource_id,
+            resource_selections=resource_selections,
+        )
+
+        available_dates: set[str] = set()
+        for target_date in target_dates:
+            try:
+                is_available = snapshot.has_available_slot(target_date)
+            except Exception as exc:
+                logger.debug("Booking range availability skipped {}: {}", target_date, exc)
+                continue
+            if is_available:
+                available_dates.add(target_date.isoformat())
+        return available_dates
+
     def get_nearest_slots(self, *, service_ids: list[int], search_from: date, **kwargs: Any) -> Any:
         from datetime import date as dt_date
 
-        from ..booking_settings import BookingSettings
-
         audience = str(kwargs.pop("audience", "public"))
-        settings = BookingSettings.load()
+        settings = kwargs.pop("settings", None) or get_booking_settings_snapshot()
         effective_search_from = search_from
         if audience == "public" and settings.book_only_from_next_day and search_from <= dt_date.today():
             effective_search_from = dt_date.today() + timedelta(days=1)
 
         effective_kwargs = {key: value for key, value in kwargs.items() if value is not None}
-        adapter = self._build_adapter(target_date=effective_search_from)
-        result = runtime_get_nearest_slots(adapter, service_ids, effective_search_from, **effective_kwargs)
-        minimum_start_time = self._get_category_booking_start_time(service_ids)
+        search_days = int(effective_kwargs.get("search_days", NEAREST_SLOTS_SEARCH_DAYS))
+        memo_key = self._slot_memo_key(
+            service_ids,
+            effective_search_from,
+            audience,
+            effective_kwargs,
+            [effective_search_from + timedelta(days=offset) for offset in range(search_days)],
+            settings,
+        )
+        return self.slot_memo.get_or_compute(
+            "get_nearest_slots",
+            memo_key,
+            lambda: self._find_nearest_slots(service_ids, effective_search_from, effective_kwargs, settings),
+        )
+
+    def _find_nearest_slots(
+        self,
+        service_ids: list[int],
+        search_from: date,
+        kwargs: dict[str, Any],
+        settings: BookingSettingsSnapshot,
+    ) -> Any:
+        adapter = self._build_adapter(target_date=search_from, settings=settings)
+        result = runtime_get_nearest_slots(adapter, service_ids, search_from, **kwargs)
+        minimum_start_time = settings.minimum_start_time(service_ids)
         if minimum_start_time is None:
             return result
         return StartTimeFilteredSlots(result, minimum_start_time)
 
+    @staticmethod
+    def _slot_memo_key(
+        service_ids: list[int],
+        target_date: date,
+        audience: str,
+        kwargs: dict[str, Any],
+        days: list[date],
+        settings: BookingSettingsSnapshot,
+    ) -> tuple[Any, ...] | None:
+        """Memo key for a slot search, or ``None`` when the schedule version is unknown.
+
+        Service ids keep their cart order because the chain is searched in that order.
+        """
+        version = get_schedule_version(days)
+        if version is None:
+            return None
+        return (
+            tuple(int(service_id) for service_id in service_ids),
+            target_date,
+            audience,
+            _freeze(kwargs),
+            version,
+            settings.version,
+        )
+
     def get_resource_day_slots(
         self,
         *,
         resource_id: int,
         target_date: date,
         audience: str = "public",
+        settings: BookingSettingsSnapshot | None = None,
     ) -> list[str]:
-        from django.utils import timezone
-
-        from ..booking_settings import BookingSettings
-        from ..models import Appointment, MasterDayOff, MasterWorkingDay
+        return self.get_resources_day_slots(
+            resource_ids=[resource_id],
+            target_date=target_date,
+            audience=audience,
+            settings=settings,
+        )[int(resource_id)]
 
-        settings = BookingSettings.load()
+    def get_resources_day_slots(
+        self,
+        *,
+        resource_ids: list[int],
+        target_date: date,
+        duration_minutes: int | None = None,
+        audience: str = "public",
+        settings: BookingSettingsSnapshot | None = None,
+    ) -> dict[int, list[str]]:
+        """Free starts on the settings step grid for every resource on one day.
+
+        ``duration_minutes`` defaults to one grid step.
+        """
+        settings = settings or get_booking_settings_snapshot()
+        ids = [int(resource_id) for resource_id in resource_ids]
         if audience == "public" and settings.book_only_from_next_day and target_date <= date.today():
-            return []
-
-        if MasterDayOff.objects.filter(master_id=resource_id, date=target_date).exists():
-            return []
-
-        weekday = target_date.weekday()
-        if not MasterWorkingDay.objects.filter(master_id=resource_id, weekday=weekday).exists():
-            return []
-
-        schedule = _get_settings_day_schedule(settings, weekday)
-        if schedule is None:
-            return []
-        start_time, end_time = schedule
+            return dict.fromkeys(ids, [])
+
+        step = settings.step_minutes
+        grids = get_day_grids(ids, target_date, settings=settings)
+        slots: dict[int, list[str]] = {}
+        for resource_id in ids:
+            grid = grids.get(resource_id)
+            slots[resource_id] = grid.free_starts(duration_minutes or step, step) if grid is not None else []
+        return slots
 
-        step = timedelta(minutes=settings.step_minutes or 30)
-        window_start = timezone.make_aware(datetime.combine(target_date, start_time))
-        window_end = timezone.make_aware(datetime.combine(target_date, end_time))
-        day_start, day_end = _day_bounds(target_date)
-        busy_ranges = [
-            (appt.datetime_start, appt.datetime_start + timedelta(minutes=appt.duration_minutes))
-            for appt in Appointment.objects.filter(
-                master_id=resource_id,
-                datetime_start__gte=day_start,
-                datetime_start__lt=day_end,
-                status__in=[
-                    Appointment.STATUS_PENDING,
-                    Appointment.STATUS_CONFIRMED,
-                    Appointment.STATUS_RESCHEDULE_PROPOSED,
-                ],
-            )
+    def get_resources_free_at(
+        self,
+        *,
+        resource_ids: list[int],
+        target_date: date,
+        start_time: time,
+        duration_minutes: int,
+        exclude_appointment_id: int | None = None,
+        settings: BookingSettingsSnapshot | None = None,
+    ) -> list[int]:
+        """Resources, in the given order, that can start at ``start_time`` for ``duration_minutes``."""
+        exclude_ids = {exclude_appointment_id} if exclude_appointment_id else set()
+        grids = get_day_grids(resource_ids, target_date, settings=settings, exclude_ids=exclude_ids)
+        return [
+            int(resource_id)
+            for resource_id in resource_ids
+            if (grid := grids.get(int(resource_id))) is not None and grid.can_start(start_time, duration_minutes)
         ]
 
-        slots: list[str] = []
-        current = window_start.replace(second=0, microsecond=0)
-        while current + step <= window_end:
-            candidate_end = current + step
-            if all(candidate_end <= busy_start or current >= busy_end for busy_start, busy_end in busy_ranges):
-                slots.append(current.strftime("%H:%M"))
-            current += step
-        return slots
-
     def create_booking(
         self,
         *,
@@ -396,8 +717,9 @@ class BookingRuntimeEngineGateway(BookingEngineGateway):
         **kwargs: Any,
     ) -> Any:
         kwargs.pop("audience", "public")
+        settings = kwargs.pop("settings", None)
         feature_models = self.provider.get_feature_models()
-        adapter = self._build_adapter(target_date=target_date)
+        adapter = self._build_adapter(target_date=target_date, settings=settings)
         extra_fields = build_single_service_extra_fields(
             service_ids,
             kwargs.pop("extra_fields", None),
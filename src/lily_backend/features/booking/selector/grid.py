@@ -0,0 +1,113 @@
+"""Integer-minute availability grid for one master on one local date.
+
+A ``MinuteDayGrid`` covers the master's working window minute by minute:
+busy appointments are marked in a ``bytearray`` with one slice assignment
+each, and every free stretch is then turned into a "free minutes from here"
+run array. Any question of the form "can this master start at T for D
+minutes" becomes a single array lookup, and listing free starts for a
+duration is one comparison per grid step. Grids are built from interval
+index entries, so a whole day for every master costs one index read.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING
+
+from .intervals import get_master_day_intervals
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from .intervals import MasterDayIntervals
+    from .snapshot import BookingSettingsSnapshot
+
+FREE = 0
+BUSY = 1
+
+
+def _format_minute(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+@dataclass(frozen=True)
+class MinuteDayGrid:
+    """Free-minute runs over a master's working window, offset 0 being the window start."""
+
+    start_minute: int
+    free_runs: array
+
+    @classmethod
+    def build(
+        cls,
+        day: MasterDayIntervals,
+        target_date: date,
+        *,
+        exclude_ids: Collection[int] = (),
+    ) -> MinuteDayGrid | None:
+        """Grid for one index entry, or ``None`` when the master does not work that day."""
+        from django.utils import timezone
+
+        if day.hours is None:
+            return None
+        start_time, end_time = day.hours
+        window_start = timezone.make_aware(datetime.combine(target_date, start_time))
+        window_end = timezone.make_aware(datetime.combine(target_date, end_time))
+        size = max(int((window_end - window_start).total_seconds()) // 60, 0)
+
+        busy = bytearray(size)
+        for busy_start, busy_end, appointment_id in day.busy:
+            if appointment_id in exclude_ids:
+                continue
+            first = max(int((busy_start - window_start).total_seconds()) // 60, 0)
+            last = min(-(-int((busy_end - window_start).total_seconds()) // 60), size)
+            if first < last:
+                busy[first:last] = bytes([BUSY]) * (last - first)
+
+        free_runs = array("I", bytes(4 * size))
+        position = 0
+        while position < size:
+            free_start = busy.find(FREE, position)
+            if free_start == -1:
+                break
+            free_end = busy.find(BUSY, free_start)
+            if free_end == -1:
+                free_end = size
+            free_runs[free_start:free_end] = array("I", range(free_end - free_start, 0, -1))
+            position = free_end
+        return cls(start_minute=start_time.hour * 60 + start_time.minute, free_runs=free_runs)
+
+    def __len__(self) -> int:
+        return len(self.free_runs)
+
+    def offset(self, start_time: time) -> int:
+        return start_time.hour * 60 + start_time.minute - self.start_minute
+
+    def can_start(self, start_time: time, duration_minutes: int) -> bool:
+        offset = self.offset(start_time)
+        return 0 <= offset < len(self.free_runs) and self.free_runs[offset] >= duration_minutes
+
+    def free_starts(self, duration_minutes: int, step_minutes: int) -> list[str]:
+        """``HH:MM`` starts on the ``step_minutes`` grid that fit ``duration_minutes``."""
+        runs = self.free_runs
+        return [
+            _format_minute(self.start_minute + offset)
+            for offset in range(0, len(runs), step_minutes)
+            if runs[offset] >= duration_minutes
+        ]
+
+
+def get_day_grids(
+    master_ids: Iterable[int],
+    target_date: date,
+    *,
+    settings: BookingSettingsSnapshot | None = None,
+    exclude_ids: Collection[int] = (),
+) -> dict[int, MinuteDayGrid | None]:
+    """Grids for every master on ``target_date`` from a single interval index read."""
+    return {
+        master_id: MinuteDayGrid.build(day, target_date, exclude_ids=exclude_ids)
+        for master_id, day in get_master_day_intervals(master_ids, target_date, settings=settings).items()
+    }
@@ -0,0 +1,279 @@
+"""Per-(master, date) free/busy interval index for slot search and overlap checks.
+
+Each entry holds the master's working hours for the local date (``None`` when
+the salon is closed, the master does not work that weekday or has a day off)
+and the blocking appointments as a sorted list of UTC intervals. Entries live
+in Redis through ``BookingIntervalIndexManager`` and are dropped by the model
+signals wired in ``BookingConfig.ready`` once the surrounding transaction
+commits. When Redis is disabled or unreachable the index is rebuilt from the
+database on every read, which matches the previous behaviour.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from ..redis import BookingIntervalIndexManager
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from .snapshot import BookingSettingsSnapshot
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_INDEX_TTL_SECONDS = 300
+INDEXED_APPOINTMENT_FIELDS = frozenset({"master", "master_id", "datetime_start", "duration_minutes", "status"})
+ORIGIN_ATTR = "_interval_index_origin"
+
+# Process-local schedule versions keyed by ISO date ("" is the generation).
+# They move immediately on write so this process never reads its own stale
+# results; the Redis counters carry the change to other processes on commit.
+_local_versions: dict[str, int] = {}
+_local_versions_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class MasterDayIntervals:
+    """Working hours and blocking appointments of one master on one local date."""
+
+    hours: tuple[time, time] | None
+    busy: tuple[tuple[datetime, datetime, int], ...] = ()
+
+    def busy_intervals(self, *, exclude_ids: Collection[int] = ()) -> list[tuple[datetime, datetime]]:
+        return [(start, end) for start, end, appointment_id in self.busy if appointment_id not in exclude_ids]
+
+    def overlaps(self, start_at: datetime, end_at: datetime, *, exclude_id: int | None = None) -> bool:
+        for busy_start, busy_end, appointment_id in self.busy:
+            if busy_start >= end_at:
+                break
+            if appointment_id != exclude_id and busy_end > start_at:
+                return True
+        return False
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "hours": [self.hours[0].isoformat(), self.hours[1].isoformat()] if self.hours else None,
+            "busy": [[start.isoformat(), end.isoformat(), appointment_id] for start, end, appointment_id in self.busy],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> MasterDayIntervals:
+        hours = payload.get("hours")
+        return cls(
+            hours=(time.fromisoformat(hours[0]), time.fromisoformat(hours[1])) if hours else None,
+            busy=tuple(
+                (datetime.fromisoformat(start), datetime.fromisoformat(end), int(appointment_id))
+                for start, end, appointment_id in payload.get("busy", [])
+            ),
+        )
+
+
+def get_interval_index_manager() -> BookingIntervalIndexManager:
+    return BookingIntervalIndexManager()
+
+
+def get_master_day_intervals(
+    master_ids: Iterable[int],
+    target_date: date,
+    *,
+    settings: BookingSettingsSnapshot | None = None,
+) -> dict[int, MasterDayIntervals]:
+    """Return index entries for ``master_ids`` on ``target_date``, building missing ones from the database."""
+    ids = sorted({int(master_id) for master_id in master_ids})
+    if not ids:
+        return {}
+
+    date_str = target_date.isoformat()
+    manager = get_interval_index_manager()
+    cached: dict[int, dict[str, Any]] = {}
+    stamp: str | None = None
+    try:
+        # Read before the database load: entries built from rows that a concurrent
+        # write changes are stored under a version that write has already moved past.
+        cached, stamp = manager.get_days(ids, date_str)
+    except Exception as exc:
+        logger.warning("Booking interval index read failed for %s: %s", date_str, exc)
+
+    result = {master_id: MasterDayIntervals.from_payload(payload) for master_id, payload in cached.items()}
+    missing = [master_id for master_id in ids if master_id not in result]
+    if not missing:
+        return result
+
+    built = load_master_day_intervals(missing, target_date, settings=settings)
+    result.update(built)
+    if stamp is not None:
+        try:
+            manager.set_days(
+                stamp,
+                date_str,
+                {master_id: entry.to_payload() for master_id, entry in built.items()},
+                timeout=INTERVAL_INDEX_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("Booking interval index write failed for %s: %s", date_str, exc)
+    return result
+
+
+def load_master_day_intervals(
+    master_ids: list[int],
+    target_date: date,
+    *,
+    settings: BookingSettingsSnapshot | None = None,
+) -> dict[int, MasterDayIntervals]:
+    """Build index entries from the database in at most three queries (plus a settings snapshot load)."""
+    from ..models import Appointment, MasterDayOff, MasterWorkingDay
+    from .engine import _day_bounds
+    from .snapshot import get_booking_settings_snapshot
+
+    settings = settings or get_booking_settings_snapshot()
+    schedule = settings.day_schedule(target_date.weekday())
+    working_ids: set[int] = set()
+    if schedule is not None:
+        working_ids = set(
+            MasterWorkingDay.objects.filter(master_id__in=master_ids, weekday=target_date.weekday()).values_list(
+                "master_id", flat=True
+            )
+        )
+    if working_ids:
+        working_ids -= set(
+            MasterDayOff.objects.filter(master_id__in=working_ids, date=target_date).values_list("master_id", flat=True)
+        )
+
+    day_start, day_end = _day_bounds(target_date)
+    busy: dict[int, list[tuple[datetime, datetime, int]]] = {}
+    appointments = (
+        Appointment.objects.filter(
+            master_id__in=master_ids,
+            datetime_start__gte=day_start,
+            datetime_start__lt=day_end,
+            status__in=[
+                Appointment.STATUS_PENDING,
+                Appointment.STATUS_CONFIRMED,
+                Appointment.STATUS_RESCHEDULE_PROPOSED,
+            ],
+        )
+        .order_by("datetime_start", "pk")
+        .values_list("master_id", "datetime_start", "duration_minutes", "pk")
+    )
+    for master_id, datetime_start, duration_minutes, appointment_id in appointments:
+        start = datetime_start.astimezone(UTC).replace(second=0, microsecond=0)
+        busy.setdefault(master_id, []).append((start, start + timedelta(minutes=duration_minutes), appointment_id))
+
+    return {
+        master_id: MasterDayIntervals(
+            hours=schedule if master_id in working_ids else None,
+            busy=tuple(busy.get(master_id, ())),
+        )
+        for master_id in master_ids
+    }
+
+
+# ── Schedule versions ────────────────────────────────────────────────────────
+
+
+def _bump_local_version(key: str) -> None:
+    with _local_versions_lock:
+        _local_versions[key] = _local_versions.get(key, 0) + 1
+
+
+def get_schedule_version(target_dates: Iterable[date]) -> tuple[Any, ...] | None:
+    """Return a token that changes whenever index entries of ``target_dates`` are dropped.
+
+    Returns ``None`` when Redis is disabled or the shared counters cannot be
+    read, in which case results derived from these days must not be reused:
+    the local versions alone miss writes made by other processes.
+    """
+    date_strs = [target_date.isoformat() for target_date in target_dates]
+    with _local_versions_lock:
+        local = tuple(_local_versions.get(key, 0) for key in ("", *date_strs))
+    try:
+        shared = get_interval_index_manager().get_versions(date_strs)
+    except Exception as exc:
+        logger.warning("Booking schedule version read failed: %s", exc)
+        return None
+    return None if shared is None else local + shared
+
+
+# ── Invalidation ─────────────────────────────────────────────────────────────
+
+
+def invalidate_master_day(master_id: int, target_date: date) -> None:
+    """Drop the entries of ``target_date`` once the current transaction commits.
+
+    Entries of the other masters on that date go too, since they share its version.
+    """
+    from django.db import transaction
+
+    _bump_local_version(target_date.isoformat())
+
+    def _invalidate() -> None:
+        _bump_local_version(target_date.isoformat())
+        try:
+            get_interval_index_manager().invalidate_day(target_date.isoformat())
+        except Exception as exc:
+            logger.warning("Booking interval index invalidation failed for %s/%s: %s", master_id, target_date, exc)
+
+    transaction.on_commit(_invalidate)
+
+
+def invalidate_all_master_days() -> None:
+    """Drop every entry once the current transaction commits (schedule-wide changes)."""
+    from django.db import transaction
+
+    _bump_local_version("")
+
+    def _invalidate() -> None:
+        _bump_local_version("")
+        try:
+            get_interval_index_manager().bump_generation()
+        except Exception as exc:
+            logger.warning("Booking interval index generation bump failed: %s", exc)
+
+    transaction.on_commit(_invalidate)
+
+
+def _appointment_day(master_id: int | None, datetime_start: datetime | None) -> tuple[int, date] | None:
+    from django.utils import timezone
+
+    if not master_id or datetime_start is None:
+        return None
+    return master_id, timezone.localtime(datetime_start).date()
+
+
+def _invalidate_origin_and_current(origin: tuple[int, date] | None, current: tuple[int, date] | None) -> None:
+    """Drop the (master, date) entry a row was indexed under and the one it moved to, once each."""
+    keys: list[tuple[int, date]] = [key for key in (origin, current) if key is not None]
+    for master_id, target_date in dict.fromkeys(keys):
+        invalidate_master_day(master_id, target_date)
+
+
+def invalidate_appointment_intervals(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """post_save/post_delete: drop the old and new (master, date) entries of an appointment."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not INDEXED_APPOINTMENT_FIELDS & set(update_fields):
+        return
+    origin = _appointment_day(instance.origin.get("master_id"), instance.origin.get("datetime_start"))
+    _invalidate_origin_and_current(origin, _appointment_day(instance.master_id, instance.datetime_start))
+
+
+def remember_day_off_origin(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """post_init: remember the (master, date) of a day off before it is edited."""
+    master_id, day = instance.__dict__.get("master_id"), instance.__dict__.get("date")
+    setattr(instance, ORIGIN_ATTR, (master_id, day) if master_id and isinstance(day, date) else None)
+
+
+def invalidate_day_off_intervals(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """post_save/post_delete: drop the entries a day off affects."""
+    current = (instance.master_id, instance.date) if isinstance(instance.date, date) else None
+    _invalidate_origin_and_current(getattr(instance, ORIGIN_ATTR, None), current)
+    setattr(instance, ORIGIN_ATTR, current)
+
+
+def invalidate_schedule_intervals(sender: Any, **kwargs: Any) -> None:
+    """post_save/post_delete of weekly schedules or salon hours: drop every entry."""
+    invalidate_all_master_days()
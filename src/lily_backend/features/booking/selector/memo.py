@@ -0,0 +1,79 @@
+"""Bounded, short-lived memo for slot search results.
+
+Keys are built by ``BookingRuntimeEngineGateway`` and always end with the
+schedule version of the searched days (see ``intervals.get_schedule_version``)
+and the settings snapshot version, so any appointment, schedule, settings or
+catalog write makes older entries unreachable; the TTL and LRU bound only cap
+memory and the window for cross-process lag.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+SLOT_MEMO_MAX_ENTRIES = 512
+SLOT_MEMO_TTL_SECONDS = 30
+
+SLOT_MEMO_LOOKUPS = Counter(
+    "lily_booking_slot_memo_lookups_total",
+    "Slot search memo lookups by gateway method and result (hit, miss, bypass).",
+    ["method", "result"],
+)
+
+
+class SlotResultMemo:
+    """Thread-safe LRU map with per-entry expiry."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = SLOT_MEMO_MAX_ENTRIES,
+        ttl_seconds: float = SLOT_MEMO_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, method: str, key: Hashable | None, compute: Callable[[], Any]) -> Any:
+        """Return the memoized result for ``key`` or compute and store it.
+
+        A ``None`` key bypasses the memo. Exceptions from ``compute`` are not cached.
+        """
+        if key is None:
+            SLOT_MEMO_LOOKUPS.labels(method=method, result="bypass").inc()
+            return compute()
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                SLOT_MEMO_LOOKUPS.labels(method=method, result="hit").inc()
+                return entry[1]
+
+        SLOT_MEMO_LOOKUPS.labels(method=method, result="miss").inc()
+        result = compute()
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,110 @@
+"""Read-only snapshot of the inputs every slot search needs besides the schedule.
+
+``BookingSettingsSnapshot`` bundles the booking settings row, the salon hours
+of each weekday and the category booking start time of each active service.
+It is cached per process and stamped with a version that the signals wired in
+``BookingConfig.ready`` bump whenever settings, services or categories are
+saved; other processes see the bump through ``BookingSettingsVersionManager``.
+When Redis is disabled or unreachable the snapshot is loaded on every call, so
+callers load it once per request and pass it down explicitly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from ..redis import BookingSettingsVersionManager
+from .versioned import VersionedCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import time
+
+_cache = VersionedCache("Booking settings", lambda: get_settings_version_manager())
+
+
+@dataclass(frozen=True)
+class BookingSettingsSnapshot:
+    """Booking settings with precomputed weekday hours and service start limits."""
+
+    settings: Any
+    day_schedules: tuple[tuple[time, time] | None, ...]
+    service_start_times: Mapping[int, time] = field(default_factory=lambda: MappingProxyType({}))
+    version: tuple[Any, ...] | None = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Any,
+        *,
+        service_start_times: Mapping[int, time] | None = None,
+        version: tuple[Any, ...] | None = None,
+    ) -> BookingSettingsSnapshot:
+        return cls(
+            settings=settings,
+            day_schedules=tuple(settings.get_day_schedule(weekday) for weekday in range(7)),
+            service_start_times=MappingProxyType(dict(service_start_times or {})),
+            version=version,
+        )
+
+    @property
+    def load_strategy(self) -> str:
+        return self.settings.load_strategy
+
+    @property
+    def book_only_from_next_day(self) -> bool:
+        return bool(self.settings.book_only_from_next_day)
+
+    @property
+    def step_minutes(self) -> int:
+        return self.settings.step_minutes or 30
+
+    @property
+    def max_advance_days(self) -> int:
+        return self.settings.max_advance_days
+
+    def day_schedule(self, weekday: int) -> tuple[time, time] | None:
+        """Salon hours for a ``date.weekday()`` value, ``None`` when closed."""
+        return self.day_schedules[weekday]
+
+    def minimum_start_time(self, service_ids: Iterable[int]) -> time | None:
+        """Latest category booking start time among the active services, if any."""
+        start_times = [
+            self.service_start_times[int(service_id)]
+            for service_id in service_ids
+            if int(service_id) in self.service_start_times
+        ]
+        return max(start_times) if start_times else None
+
+
+def get_settings_version_manager() -> BookingSettingsVersionManager:
+    return BookingSettingsVersionManager()
+
+
+def load_booking_settings_snapshot(*, version: tuple[Any, ...] | None = None) -> BookingSettingsSnapshot:
+    """Build a snapshot from the database in two queries."""
+    from features.main.models import Service
+
+    from ..booking_settings import BookingSettings
+
+    service_start_times = Service.objects.filter(
+        is_active=True,
+        category__booking_start_time__isnull=False,
+    ).values_list("pk", "category__booking_start_time")
+    return BookingSettingsSnapshot.from_settings(
+        BookingSettings.load(),
+        service_start_times=dict(service_start_times),
+        version=version,
+    )
+
+
+def get_booking_settings_snapshot() -> BookingSettingsSnapshot:
+    """Return the cached snapshot, reloading it when its version moved."""
+    return _cache.get_or_load(lambda version: load_booking_settings_snapshot(version=version))
+
+
+def invalidate_booking_settings_snapshot(sender: Any, **kwargs: Any) -> None:
+    """post_save/post_delete of settings, services or categories: drop every cached snapshot."""
+    _cache.invalidate()
@@ -0,0 +1,142 @@
+"""Per-master figures of the cabinet staff screens.
+
+``StaffOverview`` holds, for every master, the weekdays of the weekly
+schedule, the number of linked active services and the number of active
+appointments and days off from today on. It is built in four aggregate
+queries regardless of the number of masters, cached per process and stamped
+with a version that the signals wired in ``BookingConfig.ready`` bump whenever
+masters, schedules, days off, appointments or service links change; other
+processes see the bump through ``StaffOverviewVersionManager``. The version
+also carries the current date, so "upcoming" never lags behind midnight. When
+Redis is disabled or unreachable the overview is loaded on every call.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from django.utils import timezone
+
+from ..redis import StaffOverviewVersionManager
+from .versioned import VersionedCache
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Appointment fields the upcoming counts depend on; saves touching none of them keep the overview.
+OVERVIEW_APPOINTMENT_FIELDS = frozenset({"master", "master_id", "status", "datetime_start"})
+
+_cache = VersionedCache("Staff overview", lambda: get_staff_version_manager())
+
+
+@dataclass(frozen=True)
+class MasterOverview:
+    weekdays: tuple[int, ...] = ()
+    active_services_count: int = 0
+    upcoming_appointments_count: int = 0
+    upcoming_days_off_count: int = 0
+
+
+@dataclass(frozen=True)
+class StaffOverview:
+    """Figures of every master keyed by master id; masters without rows get an empty entry."""
+
+    masters: Mapping[int, MasterOverview]
+    version: tuple[Any, ...] | None = None
+
+    def get(self, master_id: int) -> MasterOverview:
+        return self.masters.get(master_id, MasterOverview())
+
+
+def get_staff_version_manager() -> StaffOverviewVersionManager:
+    return StaffOverviewVersionManager()
+
+
+def load_staff_overview(*, version: tuple[Any, ...] | None = None) -> StaffOverview:
+    """Build the overview from the database in four queries."""
+    from django.db.models import Count
+
+    from features.main.models import Service
+
+    from ..models import Appointment, MasterDayOff, MasterWorkingDay
+
+    today = timezone.localdate()
+    start_of_today = timezone.make_aware(dt.datetime.combine(today, dt.time.min))
+
+    weekdays: dict[int, list[int]] = {}
+    for master_id, weekday in MasterWorkingDay.objects.order_by("master_id", "weekday").values_list(
+        "master_id", "weekday"
+    ):
+        weekdays.setdefault(master_id, []).append(weekday)
+
+    services = dict(
+        Service.masters.through.objects.filter(service__is_active=True)
+        .values("master_id")
+        .annotate(count=Count("service_id"))
+        .order_by()
+        .values_list("master_id", "count")
+    )
+    appointments = dict(
+        Appointment.objects.filter(
+            master__isnull=False,
+            datetime_start__gte=start_of_today,
+            status__in=[
+                Appointment.STATUS_PENDING,
+                Appointment.STATUS_CONFIRMED,
+                Appointment.STATUS_RESCHEDULE_PROPOSED,
+            ],
+        )
+        .values("master_id")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("master_id", "count")
+    )
+    days_off = dict(
+        MasterDayOff.objects.filter(date__gte=today)
+        .values("master_id")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("master_id", "count")
+    )
+
+    master_ids = weekdays.keys() | services.keys() | appointments.keys() | days_off.keys()
+    return StaffOverview(
+        masters=MappingProxyType(
+            {
+                master_id: MasterOverview(
+                    weekdays=tuple(weekdays.get(master_id, ())),
+                    active_services_count=services.get(master_id, 0),
+                    upcoming_appointments_count=appointments.get(master_id, 0),
+                    upcoming_days_off_count=days_off.get(master_id, 0),
+                )
+                for master_id in master_ids
+            }
+        ),
+        version=version,
+    )
+
+
+def get_staff_overview() -> StaffOverview:
+    """Return the cached overview, reloading it when its version or the date moved."""
+    return _cache.get_or_load(
+        lambda version: load_staff_overview(version=version),
+        stamp=(timezone.localdate().isoformat(),),
+    )
+
+
+def invalidate_staff_overview(sender: Any, **kwargs: Any) -> None:
+    """post_save/post_delete/m2m_changed of overview inputs: drop every cached overview."""
+    if kwargs.get("action", "post_").startswith("pre_"):
+        return
+    _cache.invalidate()
+
+
+def invalidate_staff_overview_for_appointment(sender: Any, **kwargs: Any) -> None:
+    """post_save/post_delete of appointments: drop the overview unless the save left the counts alone."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not OVERVIEW_APPOINTMENT_FIELDS & set(update_fields):
+        return
+    invalidate_staff_overview(sender, **kwargs)
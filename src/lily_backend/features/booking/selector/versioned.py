@@ -0,0 +1,92 @@
+"""Per-process caches invalidated through a local and a shared version.
+
+A ``VersionedCache`` keeps values built from database rows together with the
+version they were built against. The version pairs a per-process counter,
+bumped as soon as this process writes an input, with the shared counter of a
+``BookingVersionManager`` that moves once such a write commits, so other
+processes drop their copies too. Invalidation bumps the local counter right
+away and again, together with the shared one, in ``transaction.on_commit``.
+When Redis is disabled or unreachable the shared version is ``None`` and
+values are loaded on every call instead of cached.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from ..redis import BookingVersionManager
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedCache:
+    """Values cached under a key while the version they were stored with is current."""
+
+    def __init__(self, label: str, manager: Callable[[], BookingVersionManager]) -> None:
+        self.label = label
+        self._manager = manager
+        self._local_version = 0
+        self._entries: dict[Hashable, tuple[tuple[Any, ...], Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self,
+        load: Callable[[tuple[Any, ...]], Any],
+        *,
+        key: Hashable = None,
+        stamp: tuple[Any, ...] = (),
+        store: bool = True,
+    ) -> Any:
+        """Return the value cached under ``key`` for the current version, else ``load(version)``.
+
+        The version is ``(local, shared, *stamp)``. A loaded value is kept only while the
+        shared version is known and ``store`` is set.
+        """
+        with self._lock:
+            local_version, entry = self._local_version, self._entries.get(key)
+        try:
+            shared_version = self._manager().get_version()
+        except Exception as exc:
+            logger.warning("%s version read failed: %s", self.label, exc)
+            shared_version = None
+
+        version = (local_version, shared_version, *stamp)
+        if shared_version is None:
+            return load(version)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = load(version)
+        if store:
+            with self._lock:
+                self._entries[key] = (version, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self, *, after_commit: Callable[[], None] | None = None) -> None:
+        """Drop every cached value now and in all processes once the transaction commits."""
+        from django.db import transaction
+
+        self._bump_local_version()
+
+        def _invalidate() -> None:
+            try:
+                self._manager().bump_version()
+            except Exception as exc:
+                logger.warning("%s version bump failed: %s", self.label, exc)
+            self._bump_local_version()
+            if after_commit is not None:
+                after_commit()
+
+        transaction.on_commit(_invalidate)
+
+    def _bump_local_version(self) -> None:
+        with self._lock:
+            self._local_version += 1
@@ -42,6 +42,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 from ..providers import get_booking_project_data_provider
+from ..selector.snapshot import BookingSettingsSnapshot, get_booking_settings_snapshot
 from .cabinet_availability import CabinetBookingAvailabilityService
 
 
@@ -51,14 +52,16 @@ class BookingCabinetWorkflowService:
     BLOCKING_SCHEDULE_STATUSES = {"pending", "confirmed", "reschedule_proposed", "completed", "no_show"}
     LIST_PAGE_SIZE = 15
 
-    def __init__(self, provider: Any = None) -> None:
+    def __init__(self, provider: Any = None, settings: BookingSettingsSnapshot | None = None) -> None:
         self.provider = provider or get_booking_project_data_provider()
-        from ..booking_settings import BookingSettings
-
-        self.settings = BookingSettings.load()
-        self.builder_day_horizon = self.settings.max_advance_days
+        self._settings = settings
         self.availability = CabinetBookingAvailabilityService()
 
+    @property
+    def settings(self) -> BookingSettingsSnapshot:
+        """Current settings snapshot; the workflow is a process-wide singleton, so it is never kept."""
+        return self._settings or get_booking_settings_snapshot()
+
     @staticmethod
     def modal_url(booking_id: int, *, mode: str | None = None) -> str:
         url = reverse("cabinet:booking_modal", kwargs={"pk": booking_id})
@@ -86,20 +89,14 @@ class BookingCabinetWorkflowService:
         if current_date == "today":
             current_date = today
         current_dt = datetime.strptime(current_date, "%Y-%m-%d")
-        day_schedule = self.settings.get_day_schedule(current_dt.weekday())
+        settings = self.settings
+        day_schedule = settings.day_schedule(current_dt.weekday())
         if day_schedule is None:
-            first_open = next(
-                (
-                    self.settings.get_day_schedule(idx)
-                    for idx in range(7)
-                    if self.settings.get_day_schedule(idx) is not None
-                ),
-                None,
-            )
+            first_open = next((schedule for schedule in settings.day_schedules if schedule is not None), None)
             day_schedule = first_open or (time(9, 0), time(18, 0))
         day_start = day_schedule[0].hour
         day_end = day_schedule[1].hour
-        step = self.settings.step_minutes or 30
+        step = settings.step_minutes
         rows_data = []
         for hour in range(day_start, day_end):
             for minute in range(0, 60, step):
@@ -120,13 +117,16 @@ class BookingCabinetWorkflowService:
 
         master_id_to_idx = {master["id"]: index for index, master in enumerate(masters)}
         events = []
-        show_cancelled = request.GET.get("show_cancelled") == "1"
-        for appt in self.provider.get_cabinet_appointments():
-            if str(appt.get("date")) != current_date:
-                continue
+        statuses = set(self.BLOCKING_SCHEDULE_STATUSES)
+        if request.GET.get("show_cancelled") == "1":
+            statuses.add("cancelled")
+        day_appointments = self.provider.get_cabinet_schedule_appointments(
+            date_from=current_dt.date(),
+            statuses=sorted(statuses),
+            resource_ids=list(master_id_to_idx),
+        )
+        for appt in day_appointments:
             status = str(appt.get("status", "pending"))
-            if status not in self.BLOCKING_SCHEDULE_STATUSES and not (show_cancelled and status == "cancelled"):
-                continue
             master_id = appt["master_id"]
             if master_id not in master_id_to_idx:
                 continue
@@ -233,7 +233,12 @@ class BookingCabinetWorkflowService:
         services = self.provider.get_cabinet_services()
         masters = self.provider.get_cabinet_masters()
         start_date = timezone.localdate()
-        available_days = self.availability.build_picker_days(start_date=start_date, horizon=self.builder_day_horizon)
+        settings = self.settings
+        available_days = self.availability.build_picker_days(
+            start_date=start_date,
+            horizon=settings.max_advance_days,
+            settings=settings,
+        )
 
         categories = self._get_selector_categories(services)
         selector = ServiceSelectorData(
@@ -267,7 +272,8 @@ class BookingCabinetWorkflowService:
             "builder_tabs": self._get_booking_builder_tabs(mode=mode),
             "selector": selector,
             "picker": picker,
-            "client_selector": ClientSelectorData(clients=self.provider.get_cabinet_clients()),
+            "client_selector": ClientSelectorData(clients=[]),
+            "client_search_url": reverse("cabinet:booking_client_search"),
             "separate_services": [
                 {
                     "id": str(service["id"]),
@@ -283,10 +289,14 @@ class BookingCabinetWorkflowService:
 
     def _build_series_booking_context(self, *, mode: str) -> dict[str, Any]:
         services = self.provider.get_cabinet_services()
-        clients = self.provider.get_cabinet_clients()
         masters = self.provider.get_cabinet_masters()
         start_date = timezone.localdate()
-        available_days = self.availability.build_picker_days(start_date=start_date, horizon=self.builder_day_horizon)
+        settings = self.settings
+        available_days = self.availability.build_picker_days(
+            start_date=start_date,
+            horizon=settings.max_advance_days,
+            settings=settings,
+        )
         return {
             "title": "Series booking",
             "builder_mode": mode,
@@ -296,7 +306,6 @@ class BookingCabinetWorkflowService:
                 "cadence": "every_3_days",
                 "min_gap_days": 3,
                 "start_date": timezone.localdate().isoformat(),
-                "client_count": len(clients),
             },
             "series_services": [
                 {
@@ -308,8 +317,8 @@ class BookingCabinetWorkflowService:
                 for service in services
             ],
             "series_masters": [{"id": str(master["id"]), "name": master["name"]} for master in masters],
-            "series_clients": clients,
-            "client_selector": ClientSelectorData(clients=clients),
+            "client_selector": ClientSelectorData(clients=[]),
+            "client_search_url": reverse("cabinet:booking_client_search"),
             "picker": DateTimePickerData(
                 available_days=available_days,
                 time_slots=[],
@@ -330,7 +339,12 @@ class BookingCabinetWorkflowService:
         services = self.provider.get_cabinet_services()
         masters = self.provider.get_cabinet_masters()
         start_date = timezone.localdate()
-        available_days = self.availability.build_picker_days(start_date=start_date, horizon=self.builder_day_horizon)
+        settings = self.settings
+        available_days = self.availability.build_picker_days(
+            start_date=start_date,
+            horizon=settings.max_advance_days,
+            settings=settings,
+        )
         service_items = [
             ServiceItem(
                 id=str(service["id"]),
@@ -369,9 +383,15 @@ class BookingCabinetWorkflowService:
             "selector": selector,
             "picker": picker,
             "summary": summary,
-            "client_selector": ClientSelectorData(clients=self.provider.get_cabinet_clients()),
+            "client_selector": ClientSelectorData(clients=[]),
+            "client_search_url": reverse("cabinet:booking_client_search"),
         }
 
+    def search_clients(self, request: Any) -> dict[str, Any]:
+        query = request.GET.get("q", "").strip()
+        page = request.GET.get("page", "")
+        return {"query": query, **self.provider.search_cabinet_clients(query, page=int(page) if page.isdigit() else 1)}
+
     def create_new_booking(self, request: Any) -> dict[str, Any]:
         try:
             payload = json.loads(request.POST.get("data", "{}"))
@@ -405,10 +425,7 @@ class BookingCabinetWorkflowService:
         client_phone = str(client_payload.get("phone", "")).strip()
         client_email = str(client_payload.get("email", "")).strip()
         if client_id and str(client_id).isdigit():
-            client = next(
-                (item for item in self.provider.get_cabinet_clients() if str(item["id"]) == str(client_id)),
-                None,
-            )
+            client = self.provider.get_cabinet_client(client_id)
             if client:
                 client_name = str(client.get("name", client_name))
                 client_phone = str(client.get("phone", client_phone))
@@ -506,14 +523,12 @@ class BookingCabinetWorkflowService:
             "date_from": request.GET.get("date_from"),
             "date_to": request.GET.get("date_to"),
         }
-        all_appts = self.provider.get_cabinet_appointments(**filters)
         masters_list = self.provider.get_cabinet_masters()
         masters = {master["id"]: master for master in masters_list}
-        appointments = all_appts
-        if active_status and active_status != "all":
-            appointments = [appt for appt in all_appts if appt["status"] == active_status]
+        # Pagination runs over the lazy queryset: one COUNT plus one LIMIT/OFFSET page query.
+        queryset = self.provider.get_cabinet_appointments_queryset(**{**filters, "status": active_status})
         page_number = request.GET.get("page") or 1
-        paginator = Paginator(appointments, self.LIST_PAGE_SIZE)
+        paginator = Paginator(queryset, self.LIST_PAGE_SIZE)
         page_obj = paginator.get_page(page_number)
         processed_rows = []
         status_map = {
@@ -524,7 +539,7 @@ class BookingCabinetWorkflowService:
             "no_show": {"label": "No show", "color": "#7f1d1d", "bg": "#fee2e2"},
             "reschedule_proposed": {"label": "Reschedule", "color": "#7c3aed", "bg": "#ede9fe"},
         }
-        for appt in page_obj.object_list:
+        for appt in map(self.provider.serialize_cabinet_appointment, page_obj.object_list):
             master = masters.get(appt["master_id"], {})
             client_name = appt.get("client_name", "Unknown")
             initials = "".join(part[0] for part in client_name.split() if part)[:2].upper()
@@ -542,13 +557,10 @@ class BookingCabinetWorkflowService:
                 }
             )
 
+        status_counts = self.provider.get_cabinet_appointment_status_counts(**filters)
         counts = {
-            "all": len(all_appts),
-            "pending": len([appt for appt in all_appts if appt["status"] == "pending"]),
-            "confirmed": len([appt for appt in all_appts if appt["status"] == "confirmed"]),
-            "completed": len([appt for appt in all_appts if appt["status"] == "completed"]),
-            "cancelled": len([appt for appt in all_appts if appt["status"] == "cancelled"]),
-            "no_show": len([appt for appt in all_appts if appt["status"] == "no_show"]),
+            "all": sum(status_counts.values()),
+            **{key: status_counts.get(key, 0) for key in ("pending", "confirmed", "completed", "cancelled", "no_show")},
         }
         return {
             "appointments": processed_rows,
@@ -564,6 +576,9 @@ class BookingCabinetWorkflowService:
 class BookingCabinetBridgeAdapter(BookingBridge):
     """Feature-owned cabinet bridge over the booking provider."""
 
+    # The bridge is a process-wide singleton, so per-request memoization lives on the request.
+    REQUEST_APPOINTMENT_MEMO_ATTR = "_booking_cabinet_appointments"
+
     def __init__(self, provider: Any = None) -> None:
         self.provider = provider or get_booking_project_data_provider()
 
@@ -572,9 +587,25 @@ class BookingCabinetBridgeAdapter(BookingBridge):
         url = reverse("cabinet:booking_modal", kwargs={"pk": booking_id})
         return f"{url}?mode={mode}" if mode else url
 
-    def _get_appointment(self, booking_id: int) -> dict[str, Any] | None:
-        appointments = self.provider.get_cabinet_appointments()
-        return next((item for item in appointments if item["id"] == int(booking_id)), None)
+    @classmethod
+    def _get_appointment_memo(cls, request: Any) -> dict[int, dict[str, Any] | None]:
+        if request is None:
+            return {}
+        memo = getattr(request, cls.REQUEST_APPOINTMENT_MEMO_ATTR, None)
+        if not isinstance(memo, dict):
+            memo = {}
+            setattr(request, cls.REQUEST_APPOINTMENT_MEMO_ATTR, memo)
+        return memo
+
+    def _get_appointment(self, booking_id: int, *, request: Any = None) -> dict[str, Any] | None:
+        memo = self._get_appointment_memo(request)
+        key = int(booking_id)
+        if key not in memo:
+            memo[key] = self.provider.get_cabinet_appointment(key)
+        return memo[key]
+
+    def _forget_appointment(self, booking_id: int, *, request: Any) -> None:
+        self._get_appointment_memo(request).pop(int(booking_id), None)
 
     @staticmethod
     def _build_profile(appt: Mapping[str, Any]) -> BookingProfileState:
@@ -687,7 +718,7 @@ class BookingCabinetBridgeAdapter(BookingBridge):
                 ],
             )
 
-        appt = self._get_appointment(booking_id)
+        appt = self._get_appointment(booking_id, request=request)
         if not appt:
             return BookingModalState(booking_id=booking_id, title="Not Found", mode=mode)
 
@@ -858,10 +889,7 @@ class BookingCabinetBridgeAdapter(BookingBridge):
             client_first_name = str(payload.get("client_first_name", "")).strip()
             client_last_name = str(payload.get("client_last_name", "")).strip()
             if client_id and client_id != "new":
-                client = next(
-                    (item for item in self.provider.get_cabinet_clients() if str(item["id"]) == str(client_id)),
-                    None,
-                )
+                client = self.provider.get_cabinet_client(client_id)
                 if client:
                     client_name = str(client["name"])
                     client_phone = str(client.get("phone", ""))
@@ -929,6 +957,7 @@ class BookingCabinetBridgeAdapter(BookingBridge):
                 start_time=selected_time,
             )
             updated_dict = cast("dict[str, Any] | None", updated)
+            self._forget_appointment(booking_id, request=request)
             if not updated_dict:
                 return BookingActionResult(
                     ok=False,
@@ -953,13 +982,15 @@ class BookingCabinetBridgeAdapter(BookingBridge):
                 target_url=self._modal_url(booking_id),
             )
 
-        del request
-        return self.provider.run_cabinet_action(
+        result = self.provider.run_cabinet_action(
             booking_id=booking_id,
             action=action,
             redirect_url=self._modal_url(booking_id),
             payload=payload,
         )
+        # The action may have changed the row; a follow-up modal render must not reuse the memo.
+        self._forget_appointment(booking_id, request=request)
+        return result
 
 
 _cabinet_workflow = None
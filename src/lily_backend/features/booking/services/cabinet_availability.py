@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
-from typing import Any
+from datetime import date
+from typing import TYPE_CHECKING, Any
 
 from codex_django.booking.selectors import (
     build_picker_day_rows,
@@ -14,13 +14,27 @@ from core.logger import logger
 
 from ..selector.engine import get_booking_engine_gateway
 
+if TYPE_CHECKING:
+    from ..selector.snapshot import BookingSettingsSnapshot
+
 
 class CabinetBookingAvailabilityService:
-    """Feature-level helper for cabinet booking date and slot availability."""
+    """Feature-level helper for cabinet booking date and slot availability.
+
+    ``settings`` is the booking settings snapshot of the current request; the
+    gateway loads its own when neither the service nor the call provides one.
+    """
 
-    def __init__(self, gateway: Any = None, *, audience: str = "cabinet") -> None:
+    def __init__(
+        self,
+        gateway: Any = None,
+        *,
+        audience: str = "cabinet",
+        settings: BookingSettingsSnapshot | None = None,
+    ) -> None:
         self.gateway = gateway or get_booking_engine_gateway()
         self.audience = audience
+        self.settings = settings
 
     def build_picker_days(
         self,
@@ -30,6 +44,7 @@ class CabinetBookingAvailabilityService:
         service_ids: list[int] | None = None,
         locked_resource_id: int | None = None,
         resource_selections: dict[str, str] | None = None,
+        settings: BookingSettingsSnapshot | None = None,
     ) -> list[dict[str, str | int | bool]]:
         service_ids = [int(service_id) for service_id in service_ids or [] if int(service_id) > 0]
         logger.debug(
@@ -46,6 +61,7 @@ class CabinetBookingAvailabilityService:
             service_ids=service_ids,
             locked_resource_id=locked_resource_id,
             resource_selections=resource_selections,
+            settings=settings,
         )
         rows = build_picker_day_rows(
             start_date=start_date,
@@ -64,42 +80,23 @@ class CabinetBookingAvailabilityService:
         service_ids: list[int],
         locked_resource_id: int | None = None,
         resource_selections: dict[str, str] | None = None,
+        settings: BookingSettingsSnapshot | None = None,
     ) -> set[str]:
-        del resource_selections
         if not service_ids:
             logger.debug("Booking available dates skipped because no service_ids were provided.")
             return set()
 
-        # Fast day-level availability check. It intentionally avoids the full
-        # slot search, but still respects resource assignment, working weekdays,
-        # explicit day-off records, and an optional locked master.
-        from ..models import MasterDayOff, MasterWorkingDay
-
-        working_days = MasterWorkingDay.objects.filter(
-            master__status="active",
-            master__services__id__in=service_ids,
+        # Day-level check backed by the range engine: one batch of queries for
+        # the whole horizon, and a day only counts when the cart actually fits.
+        available_dates = self.gateway.get_available_dates(
+            service_ids=service_ids,
+            start_date=start_date,
+            horizon=horizon,
+            locked_resource_id=locked_resource_id,
+            resource_selections=resource_selections,
+            audience=self.audience,
+            settings=settings or self.settings,
         )
-        if locked_resource_id:
-            working_days = working_days.filter(master_id=locked_resource_id)
-
-        master_ids_by_weekday: dict[int, set[int]] = {}
-        for master_id, weekday in working_days.values_list("master_id", "weekday").distinct():
-            master_ids_by_weekday.setdefault(weekday, set()).add(master_id)
-
-        available_dates: set[str] = set()
-        for offset in range(max(horizon, 0)):
-            target_date = start_date + timedelta(days=offset)
-            candidate_master_ids = master_ids_by_weekday.get(target_date.weekday(), set())
-            if not candidate_master_ids:
-                continue
-
-            blocked_master_ids = set(
-                MasterDayOff.objects.filter(master_id__in=candidate_master_ids, date=target_date).values_list(
-                    "master_id", flat=True
-                )
-            )
-            if candidate_master_ids - blocked_master_ids:
-                available_dates.add(target_date.isoformat())
 
         logger.debug(
             "Booking available dates resolved: start_date={} horizon={} service_ids={} available_dates={}",
@@ -117,6 +114,7 @@ class CabinetBookingAvailabilityService:
         service_ids: list[int],
         locked_resource_id: int | None = None,
         resource_selections: dict[str, str] | None = None,
+        settings: BookingSettingsSnapshot | None = None,
     ) -> list[str]:
         if not booking_date or not service_ids:
             logger.debug(
@@ -139,6 +137,7 @@ class CabinetBookingAvailabilityService:
                 locked_resource_id=locked_resource_id,
                 resource_selections=resource_selections,
                 audience=self.audience,
+                settings=settings or self.settings,
             )
         except Exception as e:
             logger.error(
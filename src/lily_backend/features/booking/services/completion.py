@@ -3,8 +3,10 @@ from __future__ import annotations
 import datetime as dt
 
 from django.utils import timezone
+from system.services.loyalty import LoyaltyService
 
 from features.booking.models import Appointment
+from features.booking.services.rollup import mark_days_pending
 
 
 def complete_finished_confirmed_appointments(*, now: dt.datetime | None = None) -> int:
@@ -23,10 +25,13 @@ def complete_finished_confirmed_appointments(*, now: dt.datetime | None = None)
     if not finished_ids:
         return 0
 
-    return Appointment.objects.filter(
-        id__in=finished_ids,
-        status=Appointment.STATUS_CONFIRMED,
-    ).update(
+    finished = Appointment.objects.filter(id__in=finished_ids, status=Appointment.STATUS_CONFIRMED)
+    touched = list(finished.values_list("client_id", "datetime_start"))
+    completed = finished.update(
         status=Appointment.STATUS_COMPLETED,
         updated_at=cutoff,
     )
+    # Queryset updates skip model signals, so flag loyalty rows and rollup days explicitly.
+    LoyaltyService.mark_clients_dirty(client_id for client_id, _start in touched)
+    mark_days_pending(timezone.localtime(datetime_start).date() for _client_id, datetime_start in touched)
+    return completed
@@ -0,0 +1,144 @@
+"""Transactional outbox for booking lifecycle notifications.
+
+Status changes record an outbox row in their own transaction instead of
+building notification context and enqueueing to ARQ inside the request. The
+system worker drains pending rows through ``POST /v1/booking/outbox/relay``;
+a row stays pending while the queue is unreachable, so nothing is lost when
+Redis is briefly down. Delivery is at-least-once: the relay claims rows in a
+short transaction, enqueues them with no transaction or row lock held, and a
+claim left behind by a relay that died is taken over after
+``OUTBOX_CLAIM_TIMEOUT``.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from features.booking.models import Appointment, BookingNotificationOutbox
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+log = logging.getLogger(__name__)
+
+OUTBOX_RELAY_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=5)
+
+
+def record_booking_event(appt: Appointment, event: str, *, origin: str | None = None) -> BookingNotificationOutbox:
+    """Queue ``event`` for ``appt``; call inside the transaction that changes the appointment."""
+    return BookingNotificationOutbox.objects.create(
+        event=event,
+        appointment=appt,
+        origin=origin or getattr(appt, "_booking_origin", BookingNotificationOutbox.Origin.CLIENT),
+    )
+
+
+def relay_booking_outbox(
+    *,
+    batch_size: int = OUTBOX_RELAY_BATCH_SIZE,
+    max_batches: int = 10,
+    dispatch: Callable[[str, Appointment], object] | None = None,
+) -> dict[str, int]:
+    """Dispatch pending outbox rows oldest first and return sent, retrying and failed counts.
+
+    Rows are claimed in keyset batches; a claimed row is skipped by concurrent
+    relays until it is settled or its claim expires. A failed row is retried on
+    the next run until it has used ``OUTBOX_MAX_ATTEMPTS``.
+    """
+    dispatch = dispatch or _dispatch_event
+    totals = {"sent": 0, "failed": 0, "retrying": 0}
+    after_id = 0
+    for _batch in range(max_batches):
+        processed, after_id = _relay_batch(after_id, batch_size, dispatch, totals)
+        if processed < batch_size:
+            break
+    return totals
+
+
+def _relay_batch(
+    after_id: int,
+    batch_size: int,
+    dispatch: Callable[[str, Appointment], object],
+    totals: dict[str, int],
+) -> tuple[int, int]:
+    rows = _claim_batch(after_id, batch_size)
+    if not rows:
+        return 0, after_id
+
+    appointments = Appointment.objects.select_related("client", "service", "master").in_bulk(
+        {row.appointment_id for row in rows}
+    )
+    for row in rows:
+        appt = appointments[row.appointment_id]
+        appt._booking_origin = row.origin
+        try:
+            dispatch(row.event, appt)
+        except Exception as exc:
+            log.exception("Booking outbox dispatch failed for outbox_id=%s", row.pk)
+            failed = row.attempts >= OUTBOX_MAX_ATTEMPTS
+            _settle(
+                row,
+                status=BookingNotificationOutbox.Status.FAILED if failed else BookingNotificationOutbox.Status.PENDING,
+                last_error=str(exc),
+            )
+            totals["failed" if failed else "retrying"] += 1
+            continue
+        # Settled row by row, so a relay that dies mid-batch resends as little as possible
+        _settle(row, status=BookingNotificationOutbox.Status.SENT, last_error="")
+        totals["sent"] += 1
+        if row.event == "booking.confirmed":
+            _schedule_reminder(appt)
+    return len(rows), rows[-1].pk
+
+
+def _claim_batch(after_id: int, batch_size: int) -> list[BookingNotificationOutbox]:
+    """Stamp the next pending rows as claimed and count the attempt, in one short transaction."""
+    now = timezone.now()
+    with transaction.atomic():
+        pending = BookingNotificationOutbox.objects.filter(
+            Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - OUTBOX_CLAIM_TIMEOUT),
+            status=BookingNotificationOutbox.Status.PENDING,
+            pk__gt=after_id,
+        ).order_by("pk")
+        if connection.features.has_select_for_update_skip_locked:
+            pending = pending.select_for_update(skip_locked=True)
+        rows = list(pending[:batch_size])
+        if rows:
+            BookingNotificationOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(
+                claimed_at=now, attempts=F("attempts") + 1
+            )
+    for row in rows:
+        row.claimed_at = now
+        row.attempts += 1
+    return rows
+
+
+def _settle(row: BookingNotificationOutbox, *, status: str, last_error: str) -> None:
+    processed_at = None if status == BookingNotificationOutbox.Status.PENDING else timezone.now()
+    BookingNotificationOutbox.objects.filter(pk=row.pk).update(
+        status=status, last_error=last_error, processed_at=processed_at, claimed_at=None
+    )
+
+
+def _schedule_reminder(appt: Appointment) -> None:
+    try:
+        from features.booking.services import reminders
+
+        reminders.schedule_booking_reminder(appt)
+    except Exception:
+        log.exception("Failed to schedule booking reminder for appointment_id=%s", appt.pk)
+
+
+def _dispatch_event(event: str, appt: Appointment) -> object:
+    from features.conversations.services.notifications import _get_engine
+
+    # Enqueue right away: deferred to on_commit, a Redis error would surface after the row was marked sent
+    return _get_engine(use_on_commit=False).dispatch_event(event, appt)
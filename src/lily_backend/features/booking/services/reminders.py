@@ -3,7 +3,6 @@ from __future__ import annotations
 import datetime as dt
 from typing import TYPE_CHECKING, Any
 
-from asgiref.sync import async_to_sync
 from core.arq.client import DjangoArqClient
 from django.utils import timezone
 
@@ -86,4 +85,4 @@ def _can_schedule_reminder(appt: Appointment, *, now: dt.datetime | None = None)
 
 
 def _enqueue_job_sync(*args: Any, **kwargs: Any) -> Any:
-    return async_to_sync(DjangoArqClient.enqueue_job)(*args, **kwargs)
+    return DjangoArqClient.enqueue_job_sync(*args, **kwargs)
@@ -0,0 +1,154 @@
+"""Daily appointment rollup used by cabinet analytics and reports.
+
+``AppointmentDailyRollup`` holds one row per local day, master, service and
+status. Appointment writes only record the touched days in
+``AppointmentRollupPendingDay`` (signals wired in ``BookingConfig.ready``)
+and the system worker rebuilds pending days every minute. Readers only read,
+so their cost depends on the window, not on the length of the appointment
+history, and a day touched since the last rebuild shows its previous numbers
+until the next one.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Any
+
+from django.db import connection, transaction
+from django.db.models import Count, DecimalField, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from features.booking.models import Appointment, AppointmentDailyRollup, AppointmentRollupPendingDay
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
+ROLLUP_APPOINTMENT_FIELDS = frozenset(
+    {
+        "master",
+        "master_id",
+        "service",
+        "service_id",
+        "client",
+        "client_id",
+        "datetime_start",
+        "status",
+        "price",
+        "price_actual",
+    }
+)
+ROLLUP_BATCH_DAYS = 31
+
+
+def _local_day(value: Any) -> date | None:
+    if not isinstance(value, datetime):
+        return None
+    return timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+
+
+def _day_filter(day: date) -> Q:
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+    return Q(datetime_start__gte=start, datetime_start__lt=end)
+
+
+def mark_days_pending(days: Iterable[date | None]) -> None:
+    """Record days whose rollup rows must be rebuilt."""
+    pending = [AppointmentRollupPendingDay(day=day) for day in {day for day in days if day is not None}]
+    if pending:
+        AppointmentRollupPendingDay.objects.bulk_create(pending, ignore_conflicts=True)
+
+
+def rebuild_days(days: Iterable[date]) -> int:
+    """Replace the rollup rows of ``days`` with fresh aggregates, one query per batch."""
+    days = sorted(set(days))
+    rebuilt = 0
+    for offset in range(0, len(days), ROLLUP_BATCH_DAYS):
+        batch = days[offset : offset + ROLLUP_BATCH_DAYS]
+        with transaction.atomic():
+            # Drop the markers first: a write racing this rebuild marks its day again.
+            AppointmentRollupPendingDay.objects.filter(day__in=batch).delete()
+            rows = (
+                Appointment.objects.filter(reduce(or_, (_day_filter(day) for day in batch)))
+                .annotate(day=TruncDate("datetime_start"))
+                .values("day", "master_id", "service_id", "status")
+                .annotate(
+                    appointment_count=Count("id"),
+                    revenue=Sum(Coalesce("price_actual", "price", output_field=DecimalField())),
+                )
+            )
+            AppointmentDailyRollup.objects.filter(day__in=batch).delete()
+            AppointmentDailyRollup.objects.bulk_create(
+                [
+                    AppointmentDailyRollup(
+                        day=row["day"],
+                        master_id=row["master_id"],
+                        service_id=row["service_id"],
+                        status=row["status"],
+                        appointment_count=row["appointment_count"],
+                        revenue=row["revenue"] or 0,
+                    )
+                    for row in rows
+                ]
+            )
+        rebuilt += len(batch)
+    return rebuilt
+
+
+def refresh_pending_days(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    *,
+    limit: int | None = None,
+) -> int:
+    """Rebuild pending days oldest first, optionally only those inside ``[date_from, date_to]``.
+
+    Each batch claims its markers first; on Postgres markers locked by a
+    concurrent refresh are skipped, so two refreshes never rebuild the same day
+    at once and collide on the rollup's unique constraint.
+    """
+    rebuilt = 0
+    while limit is None or rebuilt < limit:
+        batch_size = ROLLUP_BATCH_DAYS if limit is None else min(ROLLUP_BATCH_DAYS, limit - rebuilt)
+        with transaction.atomic():
+            pending = AppointmentRollupPendingDay.objects.order_by("day")
+            if date_from is not None:
+                pending = pending.filter(day__gte=date_from)
+            if date_to is not None:
+                pending = pending.filter(day__lte=date_to)
+            if connection.features.has_select_for_update_skip_locked:
+                pending = pending.select_for_update(skip_locked=True)
+            days = list(pending.values_list("day", flat=True)[:batch_size])
+            rebuilt += rebuild_days(days)
+        if len(days) < batch_size:
+            break
+    return rebuilt
+
+
+def rollup_rows(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    statuses: Iterable[str] | None = None,
+) -> QuerySet[AppointmentDailyRollup]:
+    """Rollup rows for a local date window (open ends read the whole history)."""
+    qs = AppointmentDailyRollup.objects.all()
+    if date_from is not None:
+        qs = qs.filter(day__gte=date_from)
+    if date_to is not None:
+        qs = qs.filter(day__lte=date_to)
+    if statuses is not None:
+        qs = qs.filter(status__in=list(statuses))
+    return qs
+
+
+def mark_appointment_rollup_days(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """post_save/post_delete: mark the old and new local day of an appointment pending."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not ROLLUP_APPOINTMENT_FIELDS & set(update_fields):
+        return
+    mark_days_pending({_local_day(instance.origin.get("datetime_start")), _local_day(instance.datetime_start)})
@@ -70,9 +70,6 @@ class CancelAppointmentView(TemplateView):
         note = request.POST.get("note", "")
         try:
             appt.cancel(reason=reason, note=note)
-            from features.conversations.services.notifications import _get_engine
-
-            _get_engine().dispatch_event("booking.cancelled", appt)
             return redirect(reverse("booking:cancel_success"))
         except ValidationError as e:
             return self.render_to_response(self.get_context_data(appointment=appt, error=str(e), can_cancel=False))
@@ -12,28 +12,13 @@ from features.booking.dto.public_cart import (
     get_cart,
     save_cart,
 )
-from features.main.models import Service, ServiceConflictRule
+from features.booking.selector.catalog import CartConflictGraph, get_bookable_catalog
 
 
-def _get_categories():
-    from features.booking.providers import get_booking_project_data_provider
-
-    provider = get_booking_project_data_provider()
-    services = provider.get_public_services()
-    categories: dict[str, dict] = {}
-    for s in services:
-        cat_slug = s["category_slug"]
-        if cat_slug not in categories:
-            categories[cat_slug] = {
-                "slug": cat_slug,
-                "name": s["category_name"],
-                "services": [],
-            }
-        categories[cat_slug]["services"].append(s)
-    return list(categories.values())
-
-
-def _render_cart(request: HttpRequest, cart, *, error: str = "") -> HttpResponse:
+def _render_cart(
+    request: HttpRequest, cart, *, error: str = "", graph: CartConflictGraph | None = None
+) -> HttpResponse:
+    graph = graph or get_bookable_catalog().cart_graph
     return render(
         request,
         "features/booking/partials/cart_panel.html",
@@ -41,68 +26,55 @@ def _render_cart(request: HttpRequest, cart, *, error: str = "") -> HttpResponse
             "cart": cart,
             "cart_ids": set(cart.service_ids()),
             "error": error,
-            "categories": _get_categories(),
+            "categories": graph.categories,
         },
     )
 
 
 class CartAddView(View):
-    """POST service_id → add to cart, apply conflict rules, return cart panel."""
+    """POST service_id → add to cart, apply conflict rules, return cart panel.
+
+    The service and its conflict rules come from the cached catalog graph, so
+    adding an item only touches the session.
+    """
 
     def post(self, request: HttpRequest) -> HttpResponse:
         service_id = request.POST.get("service_id")
         if not service_id:
             return HttpResponse(status=400)
 
+        graph = get_bookable_catalog().cart_graph
         try:
-            service = Service.objects.select_related("category").get(pk=int(service_id), is_active=True)
-        except (Service.DoesNotExist, ValueError):
+            service = graph.services.get(int(service_id))
+        except ValueError:
+            service = None
+        if service is None:
             return HttpResponse(status=404)
 
         cart = get_cart(request)
 
-        if cart.has(service.pk):
-            return _render_cart(request, cart)
+        if cart.has(service.id):
+            return _render_cart(request, cart, graph=graph)
 
         cart.clear_combo()
 
-        # Apply conflict rules (server-side, source → this service)
-        rules = ServiceConflictRule.objects.filter(source=service, is_active=True).select_related("target")
-
-        ids_to_remove: list[int] = []
-        for rule in rules:
-            if cart.has(rule.target_id):
-                if rule.rule_type == ServiceConflictRule.REPLACES:
-                    ids_to_remove.append(rule.target_id)
-                elif rule.rule_type == ServiceConflictRule.EXCLUDES:
-                    return _render_cart(
-                        request,
-                        cart,
-                        error=_(
-                            "Die Dienstleistung «%(service)s» ist nicht kompatibel mit den bereits ausgewählten Leistungen."
-                        )
-                        % {"service": service.name},
-                    )
-
-        # Also check reverse excludes (B excludes A even if rule is on target side)
-        reverse_excludes = ServiceConflictRule.objects.filter(
-            target=service, rule_type=ServiceConflictRule.EXCLUDES, is_active=True
-        ).values_list("source_id", flat=True)
-        for src_id in reverse_excludes:
-            if cart.has(src_id):
-                return _render_cart(
-                    request,
-                    cart,
-                    error=_(
-                        "Die Dienstleistung «%(service)s» ist nicht kompatibel mit den bereits ausgewählten Leistungen."
-                    )
-                    % {"service": service.name},
+        # Conflict rules in both directions: excluded pairs block, replaced targets drop out
+        ids_to_remove = graph.resolve_add(service.id, cart.service_ids())
+        if ids_to_remove is None:
+            return _render_cart(
+                request,
+                cart,
+                error=_(
+                    "Die Dienstleistung «%(service)s» ist nicht kompatibel mit den bereits ausgewählten Leistungen."
                 )
+                % {"service": service.name},
+                graph=graph,
+            )
 
-        cart.remove_ids(ids_to_remove)
+        cart.remove_ids(list(ids_to_remove))
         cart.add(
             PublicCartItem(
-                service_id=service.pk,
+                service_id=service.id,
                 service_title=service.name,
                 duration=service.duration,
                 price=service.price,
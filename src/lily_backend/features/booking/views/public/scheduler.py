@@ -8,8 +8,8 @@ from django.shortcuts import render
 from django.utils import formats, timezone
 from django.views import View
 
-from features.booking.booking_settings import BookingSettings
 from features.booking.dto.public_cart import get_cart, save_cart
+from features.booking.selector.snapshot import get_booking_settings_snapshot
 from features.booking.services.cabinet_availability import CabinetBookingAvailabilityService
 
 
@@ -80,8 +80,8 @@ class SchedulerCalendarView(View):
 
     def get(self, request: HttpRequest) -> HttpResponse:
         cart = get_cart(request)
-        settings = BookingSettings.load()
-        availability = CabinetBookingAvailabilityService(audience="public")
+        settings = get_booking_settings_snapshot()
+        availability = CabinetBookingAvailabilityService(audience="public", settings=settings)
         today = timezone.localdate()
         service_ids, scoped_service_id = _resolve_service_scope(request)
         selected_date = _get_selected_date(request, scoped_service_id=scoped_service_id)
@@ -44,5 +44,12 @@ class CampaignAdmin(ModelAdmin):
     list_display = ("subject", "status", "locale", "template_key", "created_at", "sent_at")
     list_filter = ("status", "locale", "template_key")
     search_fields = ("subject", "body_text")
-    readonly_fields = ("created_at", "updated_at", "sent_at", "arq_parent_job_id")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "sent_at",
+        "arq_parent_job_id",
+        "audience_size",
+        "recipients_materialized",
+    )
     inlines: ClassVar[list] = [CampaignRecipientInline]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from django.db.models import Case, DateTimeField, Value, When
 from django.utils import timezone
-from ninja import Router, Schema
+from ninja import Field, Router, Schema
 from system.api.auth import require_internal_scope
 
 from features.conversations.models.campaign import CampaignRecipient
@@ -15,20 +16,25 @@ class RecipientStatusPayload(Schema):
     error: str = ""
 
 
+def _recipient_pk(notification_id: str) -> int | None:
+    # notification_id format: "campaign_{campaign_id}_{recipient_pk}"
+    parts = notification_id.split("_")
+    if len(parts) != 3 or parts[0] != "campaign":
+        return None
+    try:
+        return int(parts[2])
+    except ValueError:
+        return None
+
+
 @router.post("/recipient-status", summary="Update campaign recipient delivery status")
 def update_recipient_status(request, payload: RecipientStatusPayload) -> dict:
     require_internal_scope(request, "campaigns.worker")
 
-    # notification_id format: "campaign_{campaign_id}_{recipient_pk}"
-    parts = payload.notification_id.split("_")
-    if len(parts) != 3 or parts[0] != "campaign":
+    recipient_pk = _recipient_pk(payload.notification_id)
+    if recipient_pk is None:
         return {"ok": False, "error": "invalid notification_id format"}
 
-    try:
-        recipient_pk = int(parts[2])
-    except ValueError:
-        return {"ok": False, "error": "invalid recipient pk"}
-
     updated = CampaignRecipient.objects.filter(pk=recipient_pk).update(
         status=payload.status,
         sent_at=timezone.now() if payload.status == CampaignRecipient.Status.SENT else None,
@@ -36,3 +42,39 @@ def update_recipient_status(request, payload: RecipientStatusPayload) -> dict:
     )
 
     return {"ok": bool(updated)}
+
+
+# Largest batch the worker reporter sends in one request
+RECIPIENT_STATUS_BATCH_LIMIT = 500
+
+
+class RecipientStatusBatchPayload(Schema):
+    items: list[RecipientStatusPayload] = Field(..., max_length=RECIPIENT_STATUS_BATCH_LIMIT)
+
+
+@router.post("/recipient-status/bulk", summary="Update delivery status for a batch of campaign recipients")
+def update_recipient_statuses(request, payload: RecipientStatusBatchPayload) -> dict:
+    """Applies up to RECIPIENT_STATUS_BATCH_LIMIT outcomes with a single UPDATE ... CASE statement."""
+    require_internal_scope(request, "campaigns.worker")
+
+    outcomes: dict[int, RecipientStatusPayload] = {}
+    invalid: list[str] = []
+    for item in payload.items:
+        recipient_pk = _recipient_pk(item.notification_id)
+        if recipient_pk is None or item.status not in CampaignRecipient.Status.values:
+            invalid.append(item.notification_id)
+            continue
+        # A later outcome for the same recipient wins
+        outcomes[recipient_pk] = item
+
+    updated = 0
+    if outcomes:
+        now = timezone.now()
+        sent_pks = [pk for pk, item in outcomes.items() if item.status == CampaignRecipient.Status.SENT]
+        updated = CampaignRecipient.objects.filter(pk__in=outcomes).update(
+            status=Case(*(When(pk=pk, then=Value(item.status)) for pk, item in outcomes.items())),
+            error=Case(*(When(pk=pk, then=Value(item.error)) for pk, item in outcomes.items())),
+            sent_at=Case(When(pk__in=sent_pks, then=Value(now)), default=Value(None), output_field=DateTimeField()),
+        )
+
+    return {"ok": not invalid, "updated": updated, "invalid": invalid}
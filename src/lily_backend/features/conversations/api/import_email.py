@@ -4,9 +4,14 @@ import logging
 from typing import Any
 
 from django.db import transaction
-from ninja import Router, Schema
+from ninja import Field, Router, Schema
 
-from features.conversations.models import Message, MessageReply
+from features.conversations.models import Message, MessageReference, MessageReply
+from features.conversations.services.email_import import (
+    normalize_message_id,
+    record_message_references,
+    resolve_threads,
+)
 
 router = Router(tags=["Conversations"])
 log = logging.getLogger(__name__)
@@ -35,12 +40,42 @@ class InboundEmailPayload(Schema):
     raw_size: int | None = None
 
 
+# Largest batch the IMAP importer posts in one request
+IMPORT_EMAIL_BATCH_LIMIT = 50
+
+
+class InboundEmailBatchPayload(Schema):
+    items: list[InboundEmailPayload] = Field(..., max_length=IMPORT_EMAIL_BATCH_LIMIT)
+
+
 @router.post("/import-email", summary="Persist one normalized inbound email")
 def import_email(request, payload: InboundEmailPayload) -> dict[str, Any]:
     from system.api.auth import require_internal_scope
 
     require_internal_scope(request, "conversations.import")
 
+    return _import_one(payload, _thread_index([payload]))
+
+
+@router.post("/import-email/bulk", summary="Persist a batch of normalized inbound emails")
+def import_emails(request, payload: InboundEmailBatchPayload) -> dict[str, Any]:
+    """Thread lookups for the whole batch share one query; each email is stored in its own transaction."""
+    from system.api.auth import require_internal_scope
+
+    require_internal_scope(request, "conversations.import")
+
+    threads = _thread_index(payload.items)
+    results: list[dict[str, Any]] = []
+    for item in payload.items:
+        try:
+            results.append(_import_one(item, threads))
+        except Exception as exc:
+            log.exception("Failed to import email message_id=%s from %s", item.message_id, item.sender_email)
+            results.append({"status": "failed", "message_id": None, "reply_id": None, "error": str(exc)})
+    return {"results": results}
+
+
+def _import_one(payload: InboundEmailPayload, threads: dict[str, Message]) -> dict[str, Any]:
     body = _with_attachment_note(
         payload.body,
         attachments=payload.attachments,
@@ -51,12 +86,13 @@ def import_email(request, payload: InboundEmailPayload) -> dict[str, Any]:
         body = "Письмо содержит вложение без текстового содержимого."
 
     with transaction.atomic():
-        thread = _find_thread(payload)
+        thread = _find_thread(payload, threads)
         if thread and not payload.spam:
             reply = MessageReply.objects.create(message=thread, body=body, is_inbound=True)
             thread.status = Message.Status.OPEN
             thread.is_read = False
             thread.save(update_fields=["status", "is_read", "updated_at"])
+            record_message_references(thread, [payload.message_id], direction=MessageReference.Direction.INBOUND)
             transaction.on_commit(
                 lambda message=thread, imported_reply=reply: _notify_imported_client_email(message, imported_reply)
             )
@@ -75,21 +111,32 @@ def import_email(request, payload: InboundEmailPayload) -> dict[str, Any]:
             admin_notes=_build_admin_notes(payload),
         )
         if not payload.spam:
+            record_message_references(message, [payload.message_id], direction=MessageReference.Direction.INBOUND)
             transaction.on_commit(
                 lambda imported_message=message: _notify_imported_client_email(imported_message, None)
             )
         return {"status": "message-created", "message_id": message.pk, "reply_id": None}
 
 
-def _find_thread(payload: InboundEmailPayload) -> Message | None:
-    if payload.thread_key:
-        return Message.objects.filter(thread_key=payload.thread_key).first()
-    tokens = [payload.in_reply_to, *payload.references]
-    for token in tokens:
-        if not token:
-            continue
-        clean = token.strip("<> ")
-        found = Message.objects.filter(thread_key=clean).first()
+def _thread_tokens(payload: InboundEmailPayload) -> list[str]:
+    # In order of precedence: explicit thread key, then the reply chain
+    tokens = [payload.thread_key or "", payload.in_reply_to, *payload.references]
+    return [clean for token in tokens if token and (clean := normalize_message_id(token))]
+
+
+def _thread_index(payloads: list[InboundEmailPayload]) -> dict[str, Message]:
+    """Every thread a batch may reply to, keyed by Message-ID or thread key, in one query."""
+    threads = resolve_threads(token for payload in payloads for token in _thread_tokens(payload))
+    # Threads that never sent an indexed reply can still be matched by an explicit thread key
+    unindexed = {payload.thread_key for payload in payloads if payload.thread_key} - threads.keys()
+    if unindexed:
+        threads.update({message.thread_key: message for message in Message.objects.filter(thread_key__in=unindexed)})
+    return threads
+
+
+def _find_thread(payload: InboundEmailPayload, threads: dict[str, Message]) -> Message | None:
+    for token in _thread_tokens(payload):
+        found = threads.get(token)
         if found:
             return found
     return None
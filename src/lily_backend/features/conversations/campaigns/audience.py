@@ -46,6 +46,18 @@ class RecipientDraft:
     unsubscribe_token: str
 
 
+@dataclass(frozen=True)
+class MaterializeResult:
+    """Recipient rows written for a campaign; ``skipped`` were already there."""
+
+    created: int = 0
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.created + self.skipped
+
+
 class AudienceBuilder(Protocol):
     def count(self, f: AudienceFilter) -> int: ...
     def materialize(self, f: AudienceFilter) -> Iterable[RecipientDraft]: ...
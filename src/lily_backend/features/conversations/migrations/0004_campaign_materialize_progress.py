@@ -0,0 +1,22 @@
+# Generated by Django 5.2.15 on 2026-10-18 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("conversations", "0003_rename_conversatio_campaig_idx_conversatio_campaig_ab0cbe_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="audience_size",
+            field=models.PositiveIntegerField(default=0, verbose_name="audience size"),
+        ),
+        migrations.AddField(
+            model_name="campaign",
+            name="recipients_materialized",
+            field=models.PositiveIntegerField(default=0, verbose_name="recipients materialized"),
+        ),
+    ]
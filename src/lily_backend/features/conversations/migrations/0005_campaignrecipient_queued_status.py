@@ -0,0 +1,30 @@
+# Generated by Django 5.2.15 on 2026-10-18 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("conversations", "0004_campaign_materialize_progress"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="campaignrecipient",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("queued", "Queued"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed"),
+                    ("bounced", "Bounced"),
+                    ("unsubscribed", "Unsubscribed"),
+                ],
+                db_index=True,
+                default="pending",
+                max_length=16,
+                verbose_name="status",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.15 on 2026-10-18 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("conversations", "0005_campaignrecipient_queued_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaignrecipient",
+            name="claimed_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="claimed at"),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.15 on 2026-10-18 15:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_thread_keys(apps, schema_editor):
+    # Outbound mail so far used the thread key as its Message-ID
+    Message = apps.get_model("conversations", "Message")
+    MessageReference = apps.get_model("conversations", "MessageReference")
+    MessageReference.objects.bulk_create(
+        (
+            MessageReference(message_id=thread_key, thread_id=pk, direction="outbound")
+            for pk, thread_key in Message.objects.values_list("pk", "thread_key").iterator()
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("conversations", "0006_campaignrecipient_claimed_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MessageReference",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("message_id", models.CharField(max_length=255, unique=True, verbose_name="Message-ID")),
+                (
+                    "direction",
+                    models.CharField(
+                        choices=[("outbound", "Outbound"), ("inbound", "Inbound")],
+                        max_length=10,
+                        verbose_name="direction",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="created at")),
+                (
+                    "thread",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="references",
+                        to="conversations.message",
+                        verbose_name="thread",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Message reference",
+                "verbose_name_plural": "Message references",
+            },
+        ),
+        migrations.RunPython(backfill_thread_keys, reverse_code=migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from .campaign import Campaign, CampaignRecipient
 from .message import Message
+from .reference import MessageReference
 from .reply import MessageReply
 
-__all__ = ["Campaign", "CampaignRecipient", "Message", "MessageReply"]
+__all__ = ["Campaign", "CampaignRecipient", "Message", "MessageReference", "MessageReply"]
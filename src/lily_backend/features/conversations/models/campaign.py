@@ -46,6 +46,8 @@ class Campaign(models.Model):
         db_index=True,
     )
     status_reason = models.TextField(_("status reason"), blank=True)
+    audience_size = models.PositiveIntegerField(_("audience size"), default=0)
+    recipients_materialized = models.PositiveIntegerField(_("recipients materialized"), default=0)
 
     send_at = models.DateTimeField(_("send at"), null=True, blank=True)
     sent_at = models.DateTimeField(_("sent at"), null=True, blank=True)
@@ -66,6 +68,7 @@ class Campaign(models.Model):
 class CampaignRecipient(models.Model):
     class Status(models.TextChoices):
         PENDING = "pending", _("Pending")
+        QUEUED = "queued", _("Queued")
         SENT = "sent", _("Sent")
         FAILED = "failed", _("Failed")
         BOUNCED = "bounced", _("Bounced")
@@ -97,6 +100,8 @@ class CampaignRecipient(models.Model):
         db_index=True,
     )
     arq_job_id = models.CharField(_("arq job id"), max_length=128, blank=True)
+    # Set while a claimed recipient is handed to the queue; a stale value means the sender died mid-claim.
+    claimed_at = models.DateTimeField(_("claimed at"), null=True, blank=True)
     sent_at = models.DateTimeField(_("sent at"), null=True, blank=True)
     error = models.TextField(_("error"), blank=True)
 
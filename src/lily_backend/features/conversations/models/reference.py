@@ -0,0 +1,35 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .message import Message
+
+
+class MessageReference(models.Model):
+    """
+    RFC 5322 Message-ID of a mail sent or received in a conversation thread.
+
+    Inbound mail is matched to its thread by looking up every token of its
+    In-Reply-To / References headers (and the thread key) in this table at once.
+    Stored without angle brackets.
+    """
+
+    class Direction(models.TextChoices):
+        OUTBOUND = "outbound", _("Outbound")
+        INBOUND = "inbound", _("Inbound")
+
+    message_id = models.CharField(_("Message-ID"), max_length=255, unique=True)
+    thread = models.ForeignKey(
+        Message,
+        on_delete=models.CASCADE,
+        related_name="references",
+        verbose_name=_("thread"),
+    )
+    direction = models.CharField(_("direction"), max_length=10, choices=Direction.choices)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Message reference")
+        verbose_name_plural = _("Message references")
+
+    def __str__(self):
+        return f"<{self.message_id}> → {self.thread_id}"
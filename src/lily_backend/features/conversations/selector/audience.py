@@ -20,6 +20,11 @@ class DjangoAudienceBuilder:
     """Materialises AudienceFilter into a QuerySet of the configured recipient model."""
 
     def _queryset(self, f: AudienceFilter) -> QuerySet:
+        """Compile the filter once into the recipient queryset shared by ``count`` and ``materialize``.
+
+        Relation filters go into an id subquery, so no ``DISTINCT`` runs over full rows.
+        Clients without an email address are never part of it.
+        """
         client_model = _get_client_model()
         qs = client_model.objects.all()
 
@@ -27,7 +32,6 @@ class DjangoAudienceBuilder:
             qs = qs.filter(consent_marketing=True)
 
         if f.has_valid_email:
-            qs = qs.exclude(Q(email__isnull=True) | Q(email=""))
             qs = qs.filter(email__regex=r"^[^@]+@[^@]+\.[^@]+$")
 
         # Exclude already opted-out
@@ -37,26 +41,33 @@ class DjangoAudienceBuilder:
             # Client has no per-client locale yet — skip locale filtering for now
             pass
 
+        related = Q()
         if f.has_appointment_since:
-            qs = qs.filter(appointments__start_time__date__gte=f.has_appointment_since).distinct()
+            related &= Q(appointments__start_time__date__gte=f.has_appointment_since)
 
         if f.service_ids:
-            qs = qs.filter(appointments__service_id__in=f.service_ids).distinct()
+            related &= Q(appointments__service_id__in=f.service_ids)
+
+        if related:
+            qs = qs.filter(pk__in=client_model.objects.filter(related).values("pk"))
 
-        return qs
+        # Only clients with an address become recipients, so the count matches what is materialized.
+        return qs.exclude(Q(email__isnull=True) | Q(email=""))
 
     def count(self, f: AudienceFilter) -> int:
         return self._queryset(f).count()
 
-    def materialize(self, f: AudienceFilter) -> Iterable[RecipientDraft]:
-        for client in self._queryset(f).iterator(chunk_size=500):
-            if not client.email:
-                continue
+    def materialize(self, f: AudienceFilter, *, chunk_size: int = 2000) -> Iterable[RecipientDraft]:
+        """Stream drafts as plain rows in primary key order."""
+        rows = (
+            self._queryset(f).order_by("pk").values_list("pk", "email", "first_name", "last_name", "unsubscribe_token")
+        )
+        for pk, email, first_name, last_name, unsubscribe_token in rows.iterator(chunk_size=chunk_size):
             yield RecipientDraft(
-                recipient_id=client.pk,
-                email=client.email,
-                first_name=client.first_name or "",
-                last_name=client.last_name or "",
+                recipient_id=pk,
+                email=email,
+                first_name=first_name or "",
+                last_name=last_name or "",
                 locale="de",
-                unsubscribe_token=str(client.unsubscribe_token),
+                unsubscribe_token=str(unsubscribe_token),
             )
@@ -161,12 +161,13 @@ def _build_reply_subject(message) -> str:
 def _build_reply_context(message, reply) -> dict[str, object]:
     from .email_import import build_mailbox_correlation_data
 
-    correlation = build_mailbox_correlation_data(thread_key=message.thread_key)
+    correlation = build_mailbox_correlation_data(thread_key=message.thread_key, reply_id=reply.pk)
     return {
         "message_id": message.pk,
         "reply_id": reply.pk,
         "thread_key": correlation.thread_key,
         "reply_match_token": correlation.reply_match_token,
+        "outbound_message_id": correlation.outbound_message_id,
         "reply_text": reply.body,
         "request_id": message.pk,
         "signature": "",
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+from itertools import islice
 from typing import Any
 
 from asgiref.sync import sync_to_async
-from django.db import transaction
+from django.db import connection, transaction
+from django.utils import timezone
 
-from features.conversations.campaigns.audience import AudienceBuilder, AudienceFilter
+from features.conversations.campaigns.audience import AudienceBuilder, AudienceFilter, MaterializeResult
 from features.conversations.campaigns.dispatcher import ArqCampaignDispatcher, CampaignDispatcher
 from features.conversations.campaigns.locales import LocaleResolver, SingleLocaleResolver
 from features.conversations.campaigns.templates import TemplateRegistry, template_registry
@@ -21,40 +25,125 @@ class CampaignService:
         dispatcher: CampaignDispatcher,
         templates: TemplateRegistry,
         locales: LocaleResolver,
+        send_batch_size: int = 25,
+        send_concurrency: int = 4,
+        claim_timeout: int = 600,
     ) -> None:
         self._audience = audience
         self._dispatcher = dispatcher
         self._templates = templates
         self._locales = locales
+        self._send_batch_size = max(1, send_batch_size)
+        self._send_concurrency = max(1, send_concurrency)
+        self._claim_timeout = timedelta(seconds=max(1, claim_timeout))
 
     def preview_count(self, f: AudienceFilter) -> int:
         return self._audience.count(f)
 
-    @transaction.atomic
-    def materialize_recipients(self, campaign: Campaign) -> int:
+    def materialize_recipients(self, campaign: Campaign, *, chunk_size: int = 1000) -> MaterializeResult:
+        """Write the audience as recipient rows in chunks, without one long transaction.
+
+        Each chunk is a single ``bulk_create(ignore_conflicts=True)``; rows that
+        already exist (a re-run) count as skipped. Progress lands on the campaign
+        row after every chunk and reaches ``audience_size`` once every chunk is written.
+        """
         f = AudienceFilter.from_dict(campaign.audience_filter)
-        count = 0
-        for draft in self._audience.materialize(f):
-            CampaignRecipient.objects.get_or_create(
+        recipients = CampaignRecipient.objects.filter(campaign=campaign)
+        campaign.audience_size = self._audience.count(f)
+        campaign.recipients_materialized = 0
+        Campaign.objects.filter(pk=campaign.pk).update(audience_size=campaign.audience_size, recipients_materialized=0)
+
+        existing = recipients.count()
+        drafts = iter(self._audience.materialize(f))
+        while chunk := list(islice(drafts, chunk_size)):
+            CampaignRecipient.objects.bulk_create(
+                [
+                    CampaignRecipient(
+                        campaign=campaign,
+                        recipient_id=draft.recipient_id,
+                        email=draft.email,
+                        first_name=draft.first_name,
+                        last_name=draft.last_name,
+                        locale=draft.locale,
+                    )
+                    for draft in chunk
+                ],
+                ignore_conflicts=True,
+            )
+            campaign.recipients_materialized += len(chunk)
+            Campaign.objects.filter(pk=campaign.pk).update(recipients_materialized=campaign.recipients_materialized)
+
+        # ignore_conflicts reports no inserted rows, so one count after the last chunk splits the total.
+        created = recipients.count() - existing if campaign.recipients_materialized else 0
+        return MaterializeResult(created=created, skipped=campaign.recipients_materialized - created)
+
+    def claim_batch(self, campaign: Campaign, *, after_id: int = 0) -> list[dict[str, Any]]:
+        """Flip the next pending recipients after ``after_id`` to QUEUED and return their send rows.
+
+        Rows are picked by keyset, never by offset. On Postgres, rows locked by a
+        concurrent sender are skipped, so two senders never claim the same recipient.
+        A pass starting at ``after_id=0`` first returns rows whose claim went stale
+        (the sender died before enqueueing them) to PENDING.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            if not after_id:
+                CampaignRecipient.objects.filter(
+                    campaign=campaign,
+                    status=CampaignRecipient.Status.QUEUED,
+                    claimed_at__lt=now - self._claim_timeout,
+                ).update(status=CampaignRecipient.Status.PENDING, claimed_at=None)
+            pending = CampaignRecipient.objects.filter(
                 campaign=campaign,
-                recipient_id=draft.recipient_id,
-                defaults=dict(
-                    email=draft.email,
-                    first_name=draft.first_name,
-                    last_name=draft.last_name,
-                    locale=draft.locale,
-                ),
+                status=CampaignRecipient.Status.PENDING,
+                pk__gt=after_id,
+            ).order_by("pk")
+            if connection.features.has_select_for_update_skip_locked:
+                pending = pending.select_for_update(skip_locked=True)
+            ids = list(pending.values_list("pk", flat=True)[: self._send_batch_size])
+            if not ids:
+                return []
+            CampaignRecipient.objects.filter(pk__in=ids).update(status=CampaignRecipient.Status.QUEUED, claimed_at=now)
+            rows = (
+                CampaignRecipient.objects.filter(pk__in=ids)
+                .order_by("pk")
+                .values("id", "email", "first_name", "last_name", "recipient__unsubscribe_token")
             )
-            count += 1
-        return count
+            return [
+                {
+                    "id": row["id"],
+                    "email": row["email"],
+                    "first_name": row["first_name"],
+                    "last_name": row["last_name"],
+                    "unsubscribe_token": str(row["recipient__unsubscribe_token"] or ""),
+                }
+                for row in rows
+            ]
+
+    def confirm_batch(self, recipient_ids: list[int]) -> None:
+        """Clear the claim of recipients whose batch reached the queue, so they are never reclaimed."""
+        CampaignRecipient.objects.filter(pk__in=recipient_ids, status=CampaignRecipient.Status.QUEUED).update(
+            claimed_at=None
+        )
+
+    def release_batch(self, recipient_ids: list[int]) -> None:
+        """Return claimed recipients whose batch could not be enqueued to PENDING."""
+        CampaignRecipient.objects.filter(pk__in=recipient_ids, status=CampaignRecipient.Status.QUEUED).update(
+            status=CampaignRecipient.Status.PENDING, claimed_at=None
+        )
 
     async def send(self, campaign: Campaign) -> None:
-        from django.conf import settings
+        """Materialize the audience, then claim and enqueue pending recipients in keyset order.
 
-        from features.conversations.models.campaign import CampaignRecipient
+        Claimed rows leave PENDING before they are enqueued, so a re-run after a
+        crash only picks up recipients that were never handed to the queue,
+        including claims older than ``CAMPAIGN_CLAIM_TIMEOUT_SECONDS`` that never
+        reached it.
+        """
+        from django.conf import settings
 
-        count = await sync_to_async(self.materialize_recipients)(campaign)
-        if count == 0:
+        result = await sync_to_async(self.materialize_recipients)(campaign)
+        if result.total == 0:
             campaign.status = Campaign.Status.FAILED
             campaign.status_reason = "empty_audience"
             await sync_to_async(campaign.save)()
@@ -69,42 +158,7 @@ class CampaignService:
             "logo_url": getattr(settings, "SITE_LOGO_URL", ""),
         }
 
-        batch_size = 25
-        offset = 0
-        total_enqueued = 0
-
-        while True:
-            # Fetch batch of recipient data
-            batch_data: list[dict[str, Any]] = await sync_to_async(list)(
-                CampaignRecipient.objects.filter(
-                    campaign=campaign,
-                    status=CampaignRecipient.Status.PENDING,
-                )
-                .order_by("id")
-                .values(
-                    "id",
-                    "email",
-                    "first_name",
-                    "last_name",
-                    "recipient__unsubscribe_token",
-                )[offset : offset + batch_size]
-            )
-
-            if not batch_data:
-                break
-
-            recipients = []
-            for row in batch_data:
-                recipients.append(
-                    {
-                        "id": row["id"],
-                        "email": row["email"],
-                        "first_name": row["first_name"],
-                        "last_name": row["last_name"],
-                        "unsubscribe_token": str(row["recipient__unsubscribe_token"] or ""),
-                    }
-                )
-
+        async def enqueue(recipients: list[dict[str, Any]]) -> None:
             payload = {
                 "campaign_id": campaign.pk,
                 "subject": campaign.subject,
@@ -113,16 +167,33 @@ class CampaignService:
                 "arq_template_name": tpl.arq_template_name,
                 "is_marketing": campaign.is_marketing,
                 "site_context": site_context,
+                "send_mode": "batch",
                 "recipients": recipients,
             }
-
-            await self._dispatcher.enqueue_batch(payload)
-
-            # Mark them as queued in the DB so we don't pick them up again if re-run
-            # For simplicity, we just increment offset, but ideally we'd mark them.
-            # But the user wants a simple immediate fix.
-            total_enqueued += len(recipients)
-            offset += batch_size
+            recipient_ids = [row["id"] for row in recipients]
+            try:
+                await self._dispatcher.enqueue_batch(payload)
+            except Exception:
+                await sync_to_async(self.release_batch)(recipient_ids)
+                raise
+            await sync_to_async(self.confirm_batch)(recipient_ids)
+
+        last_id = 0
+        while True:
+            # Claim up to `send_concurrency` batches, then enqueue them together
+            batches: list[list[dict[str, Any]]] = []
+            while len(batches) < self._send_concurrency:
+                recipients = await sync_to_async(self.claim_batch)(campaign, after_id=last_id)
+                if not recipients:
+                    break
+                batches.append(recipients)
+                last_id = recipients[-1]["id"]
+            if not batches:
+                break
+            outcomes = await asyncio.gather(*(enqueue(batch) for batch in batches), return_exceptions=True)
+            errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+            if errors:
+                raise errors[0]
 
         campaign.status = Campaign.Status.DONE  # In batch mode, we mark it done after enqueuing all batches
         import django.utils.timezone as tz
@@ -133,9 +204,14 @@ class CampaignService:
 
 def build_campaign_service() -> CampaignService:
     """Project glue-code factory. Lives here, not in the library."""
+    from django.conf import settings
+
     return CampaignService(
         audience=DjangoAudienceBuilder(),
         dispatcher=ArqCampaignDispatcher(),
         templates=template_registry,
         locales=SingleLocaleResolver("de"),
+        send_batch_size=getattr(settings, "CAMPAIGN_SEND_BATCH_SIZE", 25),
+        send_concurrency=getattr(settings, "CAMPAIGN_SEND_CONCURRENCY", 4),
+        claim_timeout=getattr(settings, "CAMPAIGN_CLAIM_TIMEOUT_SECONDS", 600),
     )
@@ -9,10 +9,19 @@ from __future__ import annotations
 
 import threading
 from dataclasses import dataclass
-from typing import Protocol
+from email.utils import parseaddr
+from typing import TYPE_CHECKING, Protocol
 
 from django.conf import settings
 
+from features.conversations.models import Message, MessageReference
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# MessageReference.message_id max_length; longer ids are not indexed
+_MAX_MESSAGE_ID_LENGTH = 255
+
 
 @dataclass(frozen=True)
 class MailboxCorrelationData:
@@ -20,6 +29,7 @@ class MailboxCorrelationData:
 
     thread_key: str
     reply_match_token: str
+    outbound_message_id: str = ""
 
 
 class MailboxSyncAdapter(Protocol):
@@ -65,14 +75,48 @@ def trigger_email_import() -> dict:
     return {"mode": "thread", "job_id": None}
 
 
-def build_mailbox_correlation_data(*, thread_key: str) -> MailboxCorrelationData:
+def build_mailbox_correlation_data(*, thread_key: str, reply_id: int | None = None) -> MailboxCorrelationData:
     """Return future-proof correlation metadata for email thread matching."""
     return MailboxCorrelationData(
         thread_key=thread_key,
         reply_match_token=thread_key,
+        outbound_message_id=outbound_message_id(thread_key=thread_key, reply_id=reply_id) if reply_id else "",
     )
 
 
+def outbound_message_id(*, thread_key: str, reply_id: int) -> str:
+    """Message-ID of an outbound reply; derived from the reply so it needs no lookup."""
+    domain = parseaddr(getattr(settings, "DEFAULT_FROM_EMAIL", ""))[1].rpartition("@")[2] or "localhost"
+    return f"{thread_key}.{reply_id}@{domain}"
+
+
+def normalize_message_id(value: str) -> str:
+    return value.strip().strip("<>").strip()
+
+
+def record_message_references(thread: Message, message_ids: Iterable[str], *, direction: str) -> None:
+    """Index Message-IDs of a thread's mail; ids already indexed keep their thread."""
+    ids = {
+        clean
+        for value in message_ids
+        if value and (clean := normalize_message_id(value)) and len(clean) <= _MAX_MESSAGE_ID_LENGTH
+    }
+    if ids:
+        MessageReference.objects.bulk_create(
+            [MessageReference(message_id=message_id, thread=thread, direction=direction) for message_id in ids],
+            ignore_conflicts=True,
+        )
+
+
+def resolve_threads(tokens: Iterable[str]) -> dict[str, Message]:
+    """Threads for any Message-ID or thread key among ``tokens``, in one query."""
+    ids = {clean for token in tokens if token and (clean := normalize_message_id(token))}
+    if not ids:
+        return {}
+    references = MessageReference.objects.filter(message_id__in=ids).select_related("thread")
+    return {reference.message_id: reference.thread for reference in references}
+
+
 def _run_import_sync() -> None:
     """
     Stub for synchronous email import (no-ARQ fallback).
@@ -73,8 +73,9 @@ def _get_selector() -> BaseEmailContentSelector:
     )
 
 
-@lru_cache(maxsize=1)
-def _get_engine() -> BaseNotificationEngine:
+@lru_cache(maxsize=2)
+def _get_engine(*, use_on_commit: bool = True) -> BaseNotificationEngine:
+    """Notification engine; ``use_on_commit=False`` enqueues immediately so enqueue errors reach the caller."""
     engine_arq_client = None
     if _HAS_ARQ:
         import contextlib
@@ -85,7 +86,7 @@ def _get_engine() -> BaseNotificationEngine:
             engine_arq_client = DjangoArqClient
 
     if engine_arq_client:
-        queue: Any = DjangoQueueAdapter(arq_client=engine_arq_client)
+        queue: Any = DjangoQueueAdapter(arq_client=engine_arq_client, use_on_commit=use_on_commit)
     else:
         log.warning("ARQ client not found or disabled. Falling back to DjangoDirectAdapter.")
         queue = DjangoDirectAdapter()
@@ -9,10 +9,10 @@ from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
-from features.conversations.models import Message, MessageReply
+from features.conversations.models import Message, MessageReference, MessageReply
 
 from .alerts import notify_compose_new, notify_thread_reply
-from .email_import import trigger_email_import
+from .email_import import outbound_message_id, record_message_references, trigger_email_import
 
 
 def create_manual_message(*, to_email: str, subject: str, body: str, user: Any) -> Message:
@@ -58,6 +58,12 @@ def create_reply(*, message: Message, body: str, user: Any) -> MessageReply:
         message.status = Message.Status.PROCESSED
         message.is_read = True
         message.save(update_fields=["status", "is_read", "updated_at"])
+        # The reply mail carries both ids: Message-ID and References/In-Reply-To
+        record_message_references(
+            message,
+            [message.thread_key, outbound_message_id(thread_key=message.thread_key, reply_id=reply.pk)],
+            direction=MessageReference.Direction.OUTBOUND,
+        )
     notify_thread_reply(message, reply)
     return reply
 
@@ -14,10 +14,11 @@ class MainConfig(AppConfig):
         import features.main.translation  # noqa
         import modeltranslation  # noqa
 
-        from django.db.models.signals import post_delete, post_migrate, post_save
+        from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 
+        from features.booking.selector.catalog import invalidate_bookable_catalog
         from features.main.cabinet import refresh_catalog_categories, register_catalog_shell
-        from features.main.models import ServiceCategory
+        from features.main.models import Service, ServiceCategory, ServiceConflictRule
 
         # 1. Register static shell items (safe, no DB)
         register_catalog_shell()
@@ -31,6 +32,24 @@ class MainConfig(AppConfig):
             update_sidebar, sender=ServiceCategory, dispatch_uid="features.main.refresh_catalog_on_delete"
         )
 
+        # Provider catalog methods serve the bookable catalog snapshot; drop it on catalog writes.
+        for catalog_model in (Service, ServiceCategory, ServiceConflictRule):
+            post_save.connect(
+                invalidate_bookable_catalog,
+                sender=catalog_model,
+                dispatch_uid=f"features.main.bookable_catalog_{catalog_model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_bookable_catalog,
+                sender=catalog_model,
+                dispatch_uid=f"features.main.bookable_catalog_{catalog_model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_bookable_catalog,
+            sender=Service.masters.through,
+            dispatch_uid="features.main.bookable_catalog_service_masters",
+        )
+
         # 3. Refresh categories after migrations are complete
         post_migrate.connect(
             lambda **kwargs: refresh_catalog_categories(),
@@ -11,9 +11,11 @@ class SystemConfig(AppConfig):
     def ready(self) -> None:
         from core.static_content_manager import get_static_content_manager
         from django.db.models.signals import post_delete, post_save
+        from features.booking.models import Appointment
 
         import system.translation  # noqa: F401
         from system.models import StaticTranslation
+        from system.services import loyalty
 
         def invalidate_static_translation_cache(**kwargs) -> None:
             get_static_content_manager().clear_all_languages()
@@ -28,3 +30,15 @@ class SystemConfig(AppConfig):
             sender=StaticTranslation,
             dispatch_uid="system.static_translation.invalidate_cache_on_delete",
         )
+
+        # Loyalty rows are recalculated in batches; appointment writes only flag them dirty.
+        post_save.connect(
+            loyalty.mark_appointment_loyalty_dirty,
+            sender=Appointment,
+            dispatch_uid="system.loyalty.mark_dirty_on_appointment_save",
+        )
+        post_delete.connect(
+            loyalty.mark_appointment_loyalty_dirty,
+            sender=Appointment,
+            dispatch_uid="system.loyalty.mark_dirty_on_appointment_delete",
+        )
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("system", "0003_client_unsubscribe"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="loyaltyprofile",
+            name="is_dirty",
+            field=models.BooleanField(db_index=True, default=False, verbose_name="needs recalculation"),
+        ),
+    ]
@@ -0,0 +1,60 @@
+import re
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+SEARCH_INDEX = "system_client_search_text_idx"
+
+
+def build_client_search_text(first_name, last_name, patronymic, phone, email):
+    # Frozen copy of system.models.client.build_client_search_text as of this migration.
+    phone = phone or ""
+    parts = [first_name, last_name, patronymic, phone, re.sub(r"\D", "", phone), email or ""]
+    return " ".join(part.strip().lower() for part in parts if part and part.strip())
+
+
+def backfill_search_text(apps, schema_editor):
+    Client = apps.get_model("system", "Client")
+    batch = []
+    for client in Client.objects.only("first_name", "last_name", "patronymic", "phone", "email").iterator(
+        chunk_size=1000
+    ):
+        client.search_text = build_client_search_text(
+            client.first_name, client.last_name, client.patronymic, client.phone, client.email
+        )
+        batch.append(client)
+        if len(batch) >= 1000:
+            Client.objects.bulk_update(batch, ["search_text"])
+            batch = []
+    if batch:
+        Client.objects.bulk_update(batch, ["search_text"])
+
+
+def create_search_index(apps, schema_editor):
+    # Substring matches (LIKE '%...%') can only use a trigram index. A B-tree
+    # cannot serve them, so other backends (SQLite) stay unindexed and scan.
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} ON system_client USING gin (search_text gin_trgm_ops)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("system", "0004_loyaltyprofile_is_dirty"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="client",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False, verbose_name="search text"),
+        ),
+        migrations.RunPython(backfill_search_text, reverse_code=migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, reverse_code=drop_search_index),
+    ]
@@ -1,3 +1,4 @@
+import re
 import uuid
 from typing import Any, ClassVar
 
@@ -5,6 +6,21 @@ from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+CLIENT_SEARCH_SOURCE_FIELDS = frozenset({"first_name", "last_name", "patronymic", "phone", "email"})
+
+
+def build_client_search_text(
+    first_name: str = "",
+    last_name: str = "",
+    patronymic: str = "",
+    phone: str | None = "",
+    email: str | None = "",
+) -> str:
+    """Lower-cased name, phone and email plus the digits-only phone, space separated."""
+    phone = phone or ""
+    parts = [first_name, last_name, patronymic, phone, re.sub(r"\D", "", phone), email or ""]
+    return " ".join(part.strip().lower() for part in parts if part and part.strip())
+
 
 class Client(models.Model):
     """
@@ -75,6 +91,9 @@ class Client(models.Model):
 
     note = models.TextField(_("internal note"), blank=True)
 
+    # Maintained by save(); indexed for typeahead search (pg_trgm on PostgreSQL).
+    search_text = models.TextField(_("search text"), blank=True, default="", editable=False)
+
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
@@ -90,6 +109,12 @@ class Client(models.Model):
     def save(self, *args: Any, **kwargs: Any) -> None:
         if not self.access_token:
             self.access_token = uuid.uuid4().hex
+        self.search_text = build_client_search_text(
+            self.first_name, self.last_name, self.patronymic, self.phone, self.email
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and CLIENT_SEARCH_SOURCE_FIELDS & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_text"}
         super().save(*args, **kwargs)
 
     @property
@@ -47,6 +47,7 @@ class LoyaltyProfile(models.Model):
     )
     source_hash = models.CharField(_("source hash"), max_length=64, blank=True, db_index=True)
     calculated_at = models.DateTimeField(_("calculated at"), null=True, blank=True)
+    is_dirty = models.BooleanField(_("needs recalculation"), default=False, db_index=True)
     stats = models.JSONField(_("stats"), default=dict, blank=True)
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
@@ -1,4 +1,5 @@
 from .client_profile import ClientProfileSelector
+from .client_search import ClientSearchPage, ClientSearchSelector
 from .users import UserSelector
 
-__all__ = ["ClientProfileSelector", "UserSelector"]
+__all__ = ["ClientProfileSelector", "ClientSearchPage", "ClientSearchSelector", "UserSelector"]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import and_
+
+from django.db.models import Q
+
+from system.models import Client
+
+CLIENT_SEARCH_PAGE_SIZE = 20
+CLIENT_SEARCH_MIN_CHARS = 2
+PHONE_TOKEN_RE = re.compile(r"^[\d+()\-./]+$")
+
+
+@dataclass(frozen=True)
+class ClientSearchPage:
+    results: list[Client] = field(default_factory=list)
+    page: int = 1
+    has_more: bool = False
+
+
+class ClientSearchSelector:
+    """Typeahead lookup over the normalized ``Client.search_text`` column."""
+
+    @staticmethod
+    def normalize_query(query: str) -> list[str]:
+        """Lower-case the query into tokens; phone-like tokens are reduced to digits."""
+        tokens = []
+        for token in query.lower().split():
+            if PHONE_TOKEN_RE.match(token):
+                token = re.sub(r"\D", "", token) or token
+            tokens.append(token)
+        return tokens
+
+    @classmethod
+    def search(
+        cls,
+        query: str,
+        *,
+        page: int = 1,
+        page_size: int = CLIENT_SEARCH_PAGE_SIZE,
+        include_blocked: bool = False,
+    ) -> ClientSearchPage:
+        page = max(page, 1)
+        page_size = min(max(page_size, 1), CLIENT_SEARCH_PAGE_SIZE)
+        if len(query.strip()) < CLIENT_SEARCH_MIN_CHARS:
+            return ClientSearchPage(page=page)
+
+        tokens = cls.normalize_query(query)
+        qs = Client.objects.filter(reduce(and_, (Q(search_text__contains=token) for token in tokens)))
+        if not include_blocked:
+            qs = qs.exclude(status=Client.STATUS_BLOCKED)
+
+        offset = (page - 1) * page_size
+        # Fetch one extra row to learn whether another page exists without a COUNT.
+        rows = list(qs.order_by("last_name", "first_name", "id")[offset : offset + page_size + 1])
+        return ClientSearchPage(results=rows[:page_size], page=page, has_more=len(rows) > page_size)
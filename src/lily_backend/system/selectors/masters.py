@@ -25,16 +25,20 @@ class MasterSelector:
     def get_masters_queryset() -> QuerySet:
         from features.booking.models.master import Master
 
-        return Master.objects.prefetch_related("categories", "working_days", "services").all().order_by("order", "name")
+        return Master.objects.prefetch_related("categories").all().order_by("order", "name")
 
     @classmethod
     def get_masters_grid(cls) -> CardGridData:
+        from features.booking.selector.staff import get_staff_overview
+
         queryset = cls.get_masters_queryset()
+        overview = get_staff_overview()
         items = []
 
         for master in queryset:
-            working_days = sorted(master.working_days.values_list("weekday", flat=True))
-            assigned_services_count = master.services.filter(is_active=True).count()
+            figures = overview.get(master.pk)
+            working_days = figures.weekdays
+            assigned_services_count = figures.active_services_count
             has_schedule = bool(working_days)
             is_bookable_ready = master.status == "active" and has_schedule and assigned_services_count > 0
 
@@ -75,6 +79,14 @@ class MasterSelector:
 
             meta.append(("bi-scissors", f"{assigned_services_count} {str(_('services assigned'))}"))
 
+            if figures.upcoming_appointments_count:
+                meta.append(
+                    ("bi-calendar-check", f"{figures.upcoming_appointments_count} {str(_('upcoming appointments'))}")
+                )
+
+            if figures.upcoming_days_off_count:
+                meta.append(("bi-calendar-minus", f"{figures.upcoming_days_off_count} {str(_('days off ahead'))}"))
+
             meta.append(
                 (
                     "bi-eye" if master.is_public else "bi-eye-slash",
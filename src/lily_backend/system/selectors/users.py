@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from codex_django.cabinet.types import CardGridData, CardItem
+from django.core.paginator import Page, Paginator
+from django.db.models import Exists, OuterRef, Q, Value
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
+from system.selectors.client_search import ClientSearchSelector
 from system.services.loyalty import LoyaltyService
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+    from system.models import Client
+    from system.services.loyalty import LoyaltyDisplayData
+
+USERS_PAGE_SIZE = 48
+GHOST_SEGMENTS = frozenset({"all", "shadows", "clients"})
+_USER_ROW = 0
+_GHOST_ROW = 1
+
 
 class UserSelector:
     @staticmethod
@@ -28,66 +39,119 @@ class UserSelector:
         return qs
 
     @classmethod
-    def get_users_grid(cls, segment: str | None = None) -> CardGridData:
+    def get_users_page(
+        cls,
+        segment: str | None = None,
+        *,
+        search: str = "",
+        page: str | int | None = None,
+        per_page: int = USERS_PAGE_SIZE,
+    ) -> Page:
+        """One page of ``(kind, pk)`` rows over registered users and ghost clients.
+
+        Both sources are merged by a single SQL ``UNION ALL`` ordered users first,
+        so paging costs one COUNT and one LIMIT/OFFSET query. Ghosts whose email
+        belongs to a user in the segment are left out; the user card stands for both.
+        """
         from system.models import Client
 
-        items = []
+        tokens = ClientSearchSelector.normalize_query(search) if search.strip() else []
+        rows = []
 
-        # 1. Real Users
         if segment != "shadows":
-            queryset = cls.get_users_queryset(segment)
-            for user in queryset:
-                profile = getattr(user, "profile", None)
-                if profile:
-                    full_name = profile.get_full_name() or user.get_full_name() or user.username
-                    avatar = profile.get_initials()
-                    loyalty = LoyaltyService.get_display_for_profile(profile)
-                else:
-                    full_name = user.get_full_name() or user.username
-                    avatar = user.username[0].upper() if user.username else "?"
-                    loyalty = None
-
-                items.append(
-                    CardItem(
-                        id=f"user_{user.pk}",
-                        title=f"{full_name}",
-                        subtitle=user.email,
-                        avatar=avatar,
-                        badge=profile.source.capitalize() if profile and profile.source else "",
-                        badge_style="primary" if profile and profile.source == "booking" else "secondary",
-                        url=str(reverse_lazy("cabinet:user_modal", kwargs={"id_token": f"user_{user.pk}"})),
-                        meta=[("bi-stars", loyalty.staff_label)] if loyalty else [],
-                    )
+            users = cls.get_users_queryset(segment)
+            for token in tokens:
+                users = users.filter(
+                    Q(username__icontains=token)
+                    | Q(email__icontains=token)
+                    | Q(profile__first_name__icontains=token)
+                    | Q(profile__last_name__icontains=token)
+                    | Q(profile__phone__icontains=token)
                 )
+            rows.append(users.annotate(kind=Value(_USER_ROW)).order_by().values_list("kind", "pk"))
 
-        # 2. Ghost Clients (system.Client where user is NULL)
-        if segment in ["all", "shadows", "clients"]:
+        if segment in GHOST_SEGMENTS:
             ghosts = Client.objects.filter(user__isnull=True)
+            if segment != "shadows":
+                registered = cls.get_users_queryset(segment).filter(email__iexact=OuterRef("email"))
+                ghosts = ghosts.annotate(has_user=Exists(registered)).exclude(has_user=True, email__gt="")
+            for token in tokens:
+                ghosts = ghosts.filter(search_text__contains=token)
+            rows.append(ghosts.annotate(kind=Value(_GHOST_ROW)).order_by().values_list("kind", "pk"))
 
-            # Efficiently get user emails/phones from the current grid to avoid duplication
-            existing_emails = {i.subtitle.lower() for i in items if i.subtitle and "@" in i.subtitle}
-
-            for ghost in ghosts:
-                # Deduplication: if a registered user with same email exists, skip the ghost card
-                # The UserService.get_client_detail will "glue" them when the user card is clicked
-                if ghost.email and ghost.email.lower() in existing_emails:
-                    continue
-
-                items.append(
-                    CardItem(
-                        id=f"ghost_{ghost.pk}",
-                        title=f"{ghost.first_name} {ghost.last_name}".strip() or str(_("Anonymous Client")),
-                        subtitle=ghost.email or str(_("No email")),
-                        avatar="👻",
-                        badge=str(_("Shadow")),
-                        badge_style="warning",
-                        url=str(reverse_lazy("cabinet:user_modal", kwargs={"id_token": f"ghost_{ghost.pk}"})),
-                        meta=[("bi-phone", ghost.phone)] if ghost.phone else [],
-                    )
-                )
+        merged = rows[0].union(*rows[1:], all=True) if len(rows) > 1 else rows[0]
+        return Paginator(merged.order_by("kind", "pk"), per_page).get_page(page)
+
+    @classmethod
+    def build_users_grid(cls, page_obj: Page) -> CardGridData:
+        """Cards for one page of ``get_users_page`` rows, with a fixed number of queries."""
+        from django.contrib.auth import get_user_model
+
+        from system.models import Client
+
+        rows = list(page_obj.object_list)
+        user_ids = [pk for kind, pk in rows if kind == _USER_ROW]
+        ghost_ids = [pk for kind, pk in rows if kind == _GHOST_ROW]
+        users = get_user_model().objects.select_related("profile").in_bulk(user_ids) if user_ids else {}
+        ghosts = Client.objects.in_bulk(ghost_ids) if ghost_ids else {}
+        loyalty_by_profile = LoyaltyService.get_display_for_profiles(
+            profile.pk for user in users.values() if (profile := getattr(user, "profile", None))
+        )
+
+        items = []
+        for kind, pk in rows:
+            if kind == _USER_ROW:
+                items.append(cls._user_card(users[pk], loyalty_by_profile))
+            else:
+                items.append(cls._ghost_card(ghosts[pk]))
 
         return CardGridData(
             items=items,
-            search_placeholder=str(_("Search users...")),
             empty_message=str(_("No users found")),
         )
+
+    @classmethod
+    def get_users_grid(
+        cls,
+        segment: str | None = None,
+        *,
+        search: str = "",
+        page: str | int | None = None,
+    ) -> CardGridData:
+        return cls.build_users_grid(cls.get_users_page(segment, search=search, page=page))
+
+    @staticmethod
+    def _user_card(user: Any, loyalty_by_profile: dict[int, LoyaltyDisplayData]) -> CardItem:
+        profile = getattr(user, "profile", None)
+        if profile:
+            full_name = profile.get_full_name() or user.get_full_name() or user.username
+            avatar = profile.get_initials()
+            loyalty = loyalty_by_profile.get(profile.pk)
+        else:
+            full_name = user.get_full_name() or user.username
+            avatar = user.username[0].upper() if user.username else "?"
+            loyalty = None
+
+        return CardItem(
+            id=f"user_{user.pk}",
+            title=f"{full_name}",
+            subtitle=user.email,
+            avatar=avatar,
+            badge=profile.source.capitalize() if profile and profile.source else "",
+            badge_style="primary" if profile and profile.source == "booking" else "secondary",
+            url=str(reverse_lazy("cabinet:user_modal", kwargs={"id_token": f"user_{user.pk}"})),
+            meta=[("bi-stars", loyalty.staff_label)] if loyalty else [],
+        )
+
+    @staticmethod
+    def _ghost_card(ghost: Client) -> CardItem:
+        return CardItem(
+            id=f"ghost_{ghost.pk}",
+            title=f"{ghost.first_name} {ghost.last_name}".strip() or str(_("Anonymous Client")),
+            subtitle=ghost.email or str(_("No email")),
+            avatar="👻",
+            badge=str(_("Shadow")),
+            badge_style="warning",
+            url=str(reverse_lazy("cabinet:user_modal", kwargs={"id_token": f"ghost_{ghost.pk}"})),
+            meta=[("bi-phone", ghost.phone)] if ghost.phone else [],
+        )
@@ -7,10 +7,14 @@ from datetime import timedelta
 from decimal import ROUND_HALF_UP, Decimal
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from system.models import LoyaltyProfile, UserProfile
 
 
@@ -31,7 +35,12 @@ class LoyaltyDisplayData:
 
 
 class LoyaltyService:
-    """Calculate and cache loyalty display state for registered client profiles."""
+    """Calculate and cache loyalty display state for registered client profiles.
+
+    Rows are recalculated in batches from per-client appointment aggregates.
+    Appointment writes only flag the affected rows dirty; reads return the
+    stored row and recalculate inline only when it is missing or dirty.
+    """
 
     MIN_MULTIPLIER: ClassVar[Decimal] = Decimal("0.70")
     MAX_MULTIPLIER: ClassVar[Decimal] = Decimal("1.30")
@@ -41,6 +50,17 @@ class LoyaltyService:
         Decimal("500"),
         Decimal("1000"),
     )
+    STALE_AFTER: ClassVar[timedelta] = timedelta(hours=24)
+    EMPTY_STATS: ClassVar[dict[str, Any]] = {
+        "paid_spend": Decimal("0"),
+        "completed_count": 0,
+        "current_completed_streak": 0,
+        "no_show_count": 0,
+        "late_cancel_count": 0,
+        "overdue_pending_count": 0,
+        "reschedule_count": 0,
+        "appointment_count": 0,
+    }
     SEGMENTS: ClassVar[dict[int, tuple[str, str, str]]] = {
         1: ("new", str(_("New")), "secondary"),
         2: ("regular", str(_("Regular")), "info"),
@@ -52,35 +72,110 @@ class LoyaltyService:
     def get_or_refresh_for_profile(cls, profile: UserProfile) -> LoyaltyProfile:
         from system.models import LoyaltyProfile
 
-        loyalty, _created = LoyaltyProfile.objects.get_or_create(profile=profile)
-        source_hash, calculation = cls._calculate(profile)
-
-        if loyalty.source_hash == source_hash:
+        loyalty = LoyaltyProfile.objects.filter(profile=profile).first()
+        if loyalty is not None and not loyalty.is_dirty:
             return loyalty
+        return cls.refresh_profiles([profile])[profile.pk]
+
+    @classmethod
+    def refresh_profiles(cls, profiles: Iterable[UserProfile]) -> dict[int, LoyaltyProfile]:
+        """Recalculate loyalty rows for many profiles with one aggregate query."""
+        from system.models import Client, LoyaltyProfile
+
+        profiles = {profile.pk: profile for profile in profiles}
+        if not profiles:
+            return {}
 
-        previous_best = loyalty.best_level or 1
-        loyalty.level = calculation["level"]
-        loyalty.best_level = max(previous_best, calculation["level"])
-        loyalty.progress_percent = calculation["progress_percent"]
-        loyalty.effective_spend_score = calculation["effective_spend_score"]
-        loyalty.behavior_multiplier = calculation["behavior_multiplier"]
-        loyalty.source_hash = source_hash
-        loyalty.calculated_at = timezone.now()
-        loyalty.stats = calculation["stats"]
-        loyalty.save(
-            update_fields=[
-                "level",
-                "best_level",
-                "progress_percent",
-                "effective_spend_score",
-                "behavior_multiplier",
-                "source_hash",
-                "calculated_at",
-                "stats",
-                "updated_at",
-            ]
+        # Clear the flag before reading, so appointment writes racing the refresh mark the row again.
+        LoyaltyProfile.objects.filter(profile_id__in=profiles, is_dirty=True).update(is_dirty=False)
+        LoyaltyProfile.objects.bulk_create(
+            [LoyaltyProfile(profile_id=profile_id) for profile_id in profiles],
+            ignore_conflicts=True,
         )
-        return loyalty
+        loyalties = {loyalty.profile_id: loyalty for loyalty in LoyaltyProfile.objects.filter(profile_id__in=profiles)}
+
+        user_ids = {profile.user_id: profile.pk for profile in profiles.values() if profile.user_id}
+        client_by_profile = {
+            user_ids[user_id]: client_id
+            for user_id, client_id in Client.objects.filter(user_id__in=user_ids).values_list("user_id", "pk")
+        }
+        stats_by_client = cls._aggregate_stats(client_by_profile.values())
+
+        now = timezone.now()
+        changed = []
+        for profile_id, loyalty in loyalties.items():
+            # Profiles without a client have no appointments and keep the empty stats.
+            client_id = client_by_profile.get(profile_id)
+            stats = cls.EMPTY_STATS if client_id is None else stats_by_client.get(client_id, cls.EMPTY_STATS)
+            source_hash = cls._hash_stats(profile_id=profile_id, stats=stats)
+            if loyalty.source_hash == source_hash:
+                continue
+
+            calculation = cls._calculate(stats)
+            loyalty.level = calculation["level"]
+            loyalty.best_level = max(loyalty.best_level or 1, calculation["level"])
+            loyalty.progress_percent = calculation["progress_percent"]
+            loyalty.effective_spend_score = calculation["effective_spend_score"]
+            loyalty.behavior_multiplier = calculation["behavior_multiplier"]
+            loyalty.source_hash = source_hash
+            loyalty.calculated_at = now
+            loyalty.stats = calculation["stats"]
+            loyalty.updated_at = now
+            loyalty.is_dirty = False
+            changed.append(loyalty)
+
+        if changed:
+            LoyaltyProfile.objects.bulk_update(
+                changed,
+                [
+                    "level",
+                    "best_level",
+                    "progress_percent",
+                    "effective_spend_score",
+                    "behavior_multiplier",
+                    "source_hash",
+                    "calculated_at",
+                    "stats",
+                    "updated_at",
+                ],
+            )
+        return loyalties
+
+    @classmethod
+    def refresh_dirty(cls, *, batch_size: int = 200, max_batches: int = 20) -> int:
+        """Refresh dirty rows and rows whose time-based counters may have moved."""
+        from system.models import LoyaltyProfile, UserProfile
+
+        stale_before = timezone.now() - cls.STALE_AFTER
+        pending = LoyaltyProfile.objects.filter(
+            Q(is_dirty=True) | Q(calculated_at__isnull=True) | Q(calculated_at__lt=stale_before)
+        ).order_by("pk")
+
+        refreshed = 0
+        for _batch in range(max_batches):
+            profile_ids = list(pending.values_list("profile_id", flat=True)[:batch_size])
+            if not profile_ids:
+                break
+            cls.refresh_profiles(UserProfile.objects.filter(pk__in=profile_ids))
+            # Unchanged rows keep their calculated_at; touch it so they leave the stale window.
+            LoyaltyProfile.objects.filter(profile_id__in=profile_ids, is_dirty=False).update(
+                calculated_at=timezone.now()
+            )
+            refreshed += len(profile_ids)
+        return refreshed
+
+    @staticmethod
+    def mark_clients_dirty(client_ids: Iterable[int | None]) -> int:
+        """Flag the loyalty rows of registered clients for the next refresh."""
+        from system.models import LoyaltyProfile
+
+        client_ids = {client_id for client_id in client_ids if client_id}
+        if not client_ids:
+            return 0
+        return LoyaltyProfile.objects.filter(
+            profile__user__client_profile__in=client_ids,
+            is_dirty=False,
+        ).update(is_dirty=True)
 
     @classmethod
     def get_display_data(cls, loyalty: LoyaltyProfile | None) -> LoyaltyDisplayData:
@@ -106,95 +201,118 @@ class LoyaltyService:
         return cls.get_display_data(cls.get_or_refresh_for_profile(profile))
 
     @classmethod
-    def _calculate(cls, profile: UserProfile) -> tuple[str, dict[str, Any]]:
-        rows = cls._source_rows(profile)
-        source_hash = cls._hash_rows(profile_id=profile.pk, rows=rows)
-
-        paid_spend = sum((row["amount"] for row in rows if row["status"] == "completed"), Decimal("0"))
-        completed_count = sum(1 for row in rows if row["status"] == "completed")
-        no_show_count = sum(1 for row in rows if row["status"] == "no_show")
-        late_cancel_count = sum(1 for row in rows if row["is_late_cancel"])
-        overdue_pending_count = sum(1 for row in rows if row["is_overdue_pending"])
-        reschedule_count = sum(1 for row in rows if row["is_reschedule"])
-        current_completed_streak = cls._completed_streak(rows)
+    def get_display_for_profiles(cls, profile_ids: Iterable[int]) -> dict[int, LoyaltyDisplayData]:
+        """Display data for many profiles from their stored rows, in one query.
+
+        Nothing is recalculated here: dirty rows show their last stored level
+        until the sweep refreshes them, and profiles without a row show level 1
+        and get an empty dirty row for the sweep to fill in.
+        """
+        from system.models import LoyaltyProfile
+
+        profile_ids = set(profile_ids)
+        if not profile_ids:
+            return {}
 
+        loyalties = {
+            loyalty.profile_id: loyalty
+            for loyalty in LoyaltyProfile.objects.filter(profile_id__in=profile_ids).only(
+                "profile_id", "level", "best_level", "progress_percent"
+            )
+        }
+        missing = profile_ids - loyalties.keys()
+        if missing:
+            LoyaltyProfile.objects.bulk_create(
+                [LoyaltyProfile(profile_id=profile_id, is_dirty=True) for profile_id in missing],
+                ignore_conflicts=True,
+            )
+        return {profile_id: cls.get_display_data(loyalties.get(profile_id)) for profile_id in profile_ids}
+
+    @classmethod
+    def _calculate(cls, stats: dict[str, Any]) -> dict[str, Any]:
+        paid_spend = stats["paid_spend"]
         multiplier = (
             Decimal("1.00")
-            + min(Decimal(completed_count) * Decimal("0.015"), Decimal("0.20"))
-            + min(Decimal(current_completed_streak) * Decimal("0.02"), Decimal("0.10"))
-            - Decimal(no_show_count) * Decimal("0.08")
-            - Decimal(late_cancel_count) * Decimal("0.05")
-            - Decimal(overdue_pending_count) * Decimal("0.04")
-            - Decimal(reschedule_count) * Decimal("0.02")
+            + min(Decimal(stats["completed_count"]) * Decimal("0.015"), Decimal("0.20"))
+            + min(Decimal(stats["current_completed_streak"]) * Decimal("0.02"), Decimal("0.10"))
+            - Decimal(stats["no_show_count"]) * Decimal("0.08")
+            - Decimal(stats["late_cancel_count"]) * Decimal("0.05")
+            - Decimal(stats["overdue_pending_count"]) * Decimal("0.04")
+            - Decimal(stats["reschedule_count"]) * Decimal("0.02")
         )
         multiplier = min(max(multiplier, cls.MIN_MULTIPLIER), cls.MAX_MULTIPLIER).quantize(Decimal("0.01"))
         effective_score = (paid_spend * multiplier).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
         level, progress_percent = cls._level_and_progress(effective_score)
 
-        return source_hash, {
+        return {
             "level": level,
             "progress_percent": progress_percent,
             "effective_spend_score": effective_score,
             "behavior_multiplier": multiplier,
             "stats": {
+                **stats,
                 "paid_spend": str(paid_spend.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)),
-                "completed_count": completed_count,
-                "current_completed_streak": current_completed_streak,
-                "no_show_count": no_show_count,
-                "late_cancel_count": late_cancel_count,
-                "overdue_pending_count": overdue_pending_count,
-                "reschedule_count": reschedule_count,
-                "appointment_count": len(rows),
             },
         }
 
     @classmethod
-    def _source_rows(cls, profile: UserProfile) -> list[dict[str, Any]]:
-        client = getattr(profile.user, "client_profile", None) if profile.user_id else None
-        if client is None or not client.pk:
-            return []
-
-        now = timezone.now()
-        return [cls._source_row(appt, now=now) for appt in client.appointments.all().order_by("datetime_start", "id")]
+    def _aggregate_stats(cls, client_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """Loyalty counters per client, computed by the database in a single grouped query."""
+        from features.booking.models import Appointment
 
-    @staticmethod
-    def _source_row(appt: Any, *, now: Any) -> dict[str, Any]:
-        amount = appt.price_actual if appt.price_actual is not None else appt.price
-        cancelled_at = appt.cancelled_at
-        is_late_cancel = (
-            appt.status == "cancelled"
-            and appt.cancel_reason == "client"
-            and cancelled_at is not None
-            and appt.datetime_start is not None
-            and timedelta(0) <= appt.datetime_start - cancelled_at < timedelta(hours=24)
-        )
-        is_overdue_pending = appt.status == "pending" and appt.datetime_start < now
-        is_reschedule = appt.status == "reschedule_proposed" or appt.cancel_reason == "reschedule"
+        from system.models import Client
 
-        return {
-            "id": appt.pk,
-            "status": appt.status,
-            "datetime_start": appt.datetime_start.isoformat(),
-            "amount": Decimal(amount),
-            "price": Decimal(appt.price),
-            "price_actual": Decimal(appt.price_actual) if appt.price_actual is not None else None,
-            "cancelled_at": cancelled_at.isoformat() if cancelled_at else None,
-            "cancel_reason": appt.cancel_reason,
-            "is_late_cancel": is_late_cancel,
-            "is_past": appt.datetime_start < now,
-            "is_overdue_pending": is_overdue_pending,
-            "is_reschedule": is_reschedule,
-        }
+        client_ids = set(client_ids)
+        if not client_ids:
+            return {}
 
-    @staticmethod
-    def _completed_streak(rows: list[dict[str, Any]]) -> int:
-        streak = 0
-        past_rows = [row for row in rows if row["is_past"]]
-        for row in sorted(past_rows, key=lambda item: (item["datetime_start"], item["id"]), reverse=True):
-            if row["status"] != "completed":
-                break
-            streak += 1
-        return streak
+        now = timezone.now()
+        last_break = (
+            Appointment.objects.filter(client=OuterRef("pk"), datetime_start__lt=now)
+            .exclude(status=Appointment.STATUS_COMPLETED)
+            .order_by("-datetime_start")
+            .values("datetime_start")[:1]
+        )
+        completed = Q(appointments__status=Appointment.STATUS_COMPLETED)
+        late_cancel = Q(
+            appointments__status=Appointment.STATUS_CANCELLED,
+            appointments__cancel_reason=Appointment.CANCEL_REASON_CLIENT,
+            appointments__cancelled_at__isnull=False,
+            appointments__datetime_start__gte=F("appointments__cancelled_at"),
+            appointments__datetime_start__lt=F("appointments__cancelled_at") + timedelta(hours=24),
+        )
+        streak = (
+            completed
+            & Q(appointments__datetime_start__lt=now)
+            & (Q(last_break__isnull=True) | Q(appointments__datetime_start__gt=F("last_break")))
+        )
+        rows = (
+            Client.objects.filter(pk__in=client_ids)
+            .annotate(last_break=Subquery(last_break))
+            .values("pk")
+            .annotate(
+                paid_spend=Sum(Coalesce("appointments__price_actual", "appointments__price"), filter=completed),
+                completed_count=Count("appointments", filter=completed),
+                current_completed_streak=Count("appointments", filter=streak),
+                no_show_count=Count("appointments", filter=Q(appointments__status=Appointment.STATUS_NO_SHOW)),
+                late_cancel_count=Count("appointments", filter=late_cancel),
+                overdue_pending_count=Count(
+                    "appointments",
+                    filter=Q(appointments__status=Appointment.STATUS_PENDING, appointments__datetime_start__lt=now),
+                ),
+                reschedule_count=Count(
+                    "appointments",
+                    filter=Q(appointments__status=Appointment.STATUS_RESCHEDULE_PROPOSED)
+                    | Q(appointments__cancel_reason=Appointment.CANCEL_REASON_RESCHEDULE),
+                ),
+                appointment_count=Count("appointments"),
+            )
+        )
+        stats_by_client = {}
+        for row in rows:
+            client_id = row.pop("pk")
+            stats_by_client[client_id] = {**row, "paid_spend": Decimal(row["paid_spend"] or 0)}
+        return stats_by_client
 
     @classmethod
     def _level_and_progress(cls, score: Decimal) -> tuple[int, int]:
@@ -215,11 +333,35 @@ class LoyaltyService:
         return int(min(max(value, Decimal("0")), Decimal("100")))
 
     @staticmethod
-    def _hash_rows(*, profile_id: int | None, rows: list[dict[str, Any]]) -> str:
+    def _hash_stats(*, profile_id: int | None, stats: dict[str, Any]) -> str:
         payload = {
             "profile_id": profile_id,
-            "rows": rows,
-            "version": 1,
+            "stats": stats,
+            "version": 2,
         }
         data = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
         return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+LOYALTY_APPOINTMENT_FIELDS = frozenset(
+    {"client", "client_id", "status", "price", "price_actual", "cancelled_at", "cancel_reason", "datetime_start"}
+)
+
+
+def _loyalty_fields(values: dict[str, Any]) -> tuple[Any, ...]:
+    return tuple(
+        values.get(name)
+        for name in ("client_id", "status", "price", "price_actual", "cancelled_at", "cancel_reason", "datetime_start")
+    )
+
+
+def mark_appointment_loyalty_dirty(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """post_save/post_delete: flag the old and new client when loyalty inputs changed."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not LOYALTY_APPOINTMENT_FIELDS & set(update_fields):
+        return
+    origin = _loyalty_fields(instance.origin)
+    current = _loyalty_fields(instance.__dict__)
+    deleted = "created" not in kwargs
+    if deleted or kwargs["created"] or origin != current:
+        LoyaltyService.mark_clients_dirty({origin[0], current[0]})
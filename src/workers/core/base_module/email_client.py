@@ -5,12 +5,17 @@ import aiosmtplib
 import httpx
 from loguru import logger
 
+from .smtp_pool import SmtpConnectionPool, smtp_tls_flags
+
 
 class AsyncEmailClient:
     """
     Клиент для отправки Email с двойной страховкой:
     1. Попытка через SMTP.
     2. Если SMTP недоступен — попытка через SendGrid HTTP API.
+
+    With ``smtp_pool`` and ``http_client`` (shared per worker) both paths
+    reuse open connections instead of a new handshake per message.
     """
 
     def __init__(
@@ -22,6 +27,8 @@ class AsyncEmailClient:
         smtp_from_email: str | None = None,
         smtp_use_tls: bool = False,
         sendgrid_api_key: str | None = None,
+        smtp_pool: SmtpConnectionPool | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -31,6 +38,8 @@ class AsyncEmailClient:
         self.smtp_use_tls = smtp_use_tls
         self.sendgrid_api_key = sendgrid_api_key
         self.sendgrid_url = "https://api.sendgrid.com/v3/mail/send"
+        self.smtp_pool = smtp_pool
+        self.http_client = http_client
 
     async def send_email(
         self,
@@ -82,8 +91,12 @@ class AsyncEmailClient:
         message.set_content("Please enable HTML to view this email.")
         message.add_alternative(html_content, subtype="html")
 
-        use_ssl = self.smtp_port == 465
-        start_tls = self.smtp_port == 587 or (self.smtp_use_tls and self.smtp_port != 465)
+        if self.smtp_pool is not None:
+            await self.smtp_pool.send_message(message, timeout=timeout)
+            logger.info(f"SMTP | Email sent successfully to {to_email}")
+            return
+
+        use_ssl, start_tls = smtp_tls_flags(self.smtp_port, self.smtp_use_tls)
 
         send_kwargs: dict[str, Any] = {
             "hostname": self.smtp_host,
@@ -121,9 +134,12 @@ class AsyncEmailClient:
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(self.sendgrid_url, json=payload, headers=headers, timeout=10.0)
-            if response.status_code not in [200, 201, 202]:
-                raise RuntimeError(f"SendGrid API error: {response.status_code} - {response.text}")
+        if self.http_client is not None:
+            response = await self.http_client.post(self.sendgrid_url, json=payload, headers=headers, timeout=10.0)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(self.sendgrid_url, json=payload, headers=headers, timeout=10.0)
+        if response.status_code not in [200, 201, 202]:
+            raise RuntimeError(f"SendGrid API error: {response.status_code} - {response.text}")
 
         logger.info(f"SendGrid | Email sent successfully to {to_email}")
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+
+import aiosmtplib
+from loguru import logger
+
+
+def smtp_tls_flags(port: int, use_tls: bool) -> tuple[bool, bool]:
+    """(implicit TLS, STARTTLS) for a port: 465 is implicit TLS, 587 or ``use_tls`` upgrade via STARTTLS."""
+    use_ssl = port == 465
+    start_tls = port == 587 or (use_tls and port != 465)
+    return use_ssl, start_tls
+
+
+@dataclass
+class _Session:
+    client: aiosmtplib.SMTP
+    messages_sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SmtpConnectionPool:
+    """
+    Long-lived, authenticated SMTP sessions shared by every email a worker sends.
+
+    At most ``size`` sessions are open at once. A session is recycled after
+    ``max_messages_per_session`` messages, dropped after ``idle_timeout``
+    seconds without use and probed with NOOP once it has idled for
+    ``noop_after`` seconds. A send that hits a dropped connection reconnects
+    and retries once.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = False,
+        start_tls: bool = False,
+        timeout: float = 15.0,
+        size: int = 4,
+        max_messages_per_session: int = 100,
+        idle_timeout: float = 60.0,
+        noop_after: float = 15.0,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.timeout = timeout
+        self.size = max(1, size)
+        self.max_messages_per_session = max(1, max_messages_per_session)
+        self.idle_timeout = idle_timeout
+        self.noop_after = noop_after
+        self._idle: list[_Session] = []
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def send_message(self, message: EmailMessage, timeout: float | None = None) -> None:
+        async with self._slots:
+            session = await self._checkout()
+            try:
+                try:
+                    await session.client.send_message(message, timeout=timeout or self.timeout)
+                except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+                    logger.info(f"SMTP pool | Session to {self.hostname} dropped, reconnecting")
+                    await self._discard(session)
+                    session = await self._open()
+                    await session.client.send_message(message, timeout=timeout or self.timeout)
+            except BaseException:
+                await self._discard(session)
+                raise
+
+            session.messages_sent += 1
+            session.last_used = time.monotonic()
+            if session.messages_sent >= self.max_messages_per_session:
+                await self._discard(session, graceful=True)
+            else:
+                self._idle.append(session)
+
+    async def close(self) -> None:
+        """Quit every idle session; call on worker shutdown."""
+        sessions, self._idle = self._idle, []
+        for session in sessions:
+            await self._discard(session, graceful=True)
+
+    async def _checkout(self) -> _Session:
+        # Most recently used first: it is the likeliest to still be alive
+        while self._idle:
+            session = self._idle.pop()
+            idle_for = time.monotonic() - session.last_used
+            if idle_for >= self.idle_timeout or not session.client.is_connected:
+                await self._discard(session, graceful=True)
+                continue
+            if idle_for >= self.noop_after:
+                try:
+                    await session.client.noop()
+                except Exception as e:
+                    logger.info(f"SMTP pool | NOOP failed on idle session: {e}")
+                    await self._discard(session)
+                    continue
+            return session
+        return await self._open()
+
+    async def _open(self) -> _Session:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        logger.debug(f"SMTP pool | Opened session to {self.hostname}:{self.port}")
+        return _Session(client=client)
+
+    async def _discard(self, session: _Session, graceful: bool = False) -> None:
+        client = session.client
+        if graceful and client.is_connected:
+            try:
+                await client.quit()
+                return
+            except Exception:
+                pass
+        client.close()
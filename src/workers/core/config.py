@@ -74,6 +74,17 @@ class WorkerSettings(BaseWorkerConfig):
     SEVEN_IO_API_KEY: str | None = None
     TWILIO_WHATSAPP_TEMPLATE_SID: str = "HXd8c4bef13f103fbd4f0796cd2ad03e8e"
 
+    # Shared SMTP sessions (notification worker)
+    smtp_pool_size: int = Field(default=4, alias="SMTP_POOL_SIZE")
+    smtp_max_messages_per_session: int = Field(default=100, alias="SMTP_MAX_MESSAGES_PER_SESSION")
+    smtp_idle_timeout_sec: float = Field(default=60.0, alias="SMTP_IDLE_TIMEOUT_SEC")
+    smtp_noop_after_sec: float = Field(default=15.0, alias="SMTP_NOOP_AFTER_SEC")
+
+    # Campaign batch sending and status callbacks (notification worker)
+    campaign_batch_concurrency: int = Field(default=4, alias="CAMPAIGN_BATCH_CONCURRENCY")
+    campaign_status_flush_size: int = Field(default=200, alias="CAMPAIGN_STATUS_FLUSH_SIZE")
+    campaign_status_flush_interval_sec: float = Field(default=2.0, alias="CAMPAIGN_STATUS_FLUSH_INTERVAL_SEC")
+
     # Worker templates
     TEMPLATES_DIR: str = "src/workers/templates"
 
@@ -94,11 +105,17 @@ class WorkerSettings(BaseWorkerConfig):
     imap_folder: str = Field(default="INBOX", alias="IMAP_FOLDER")
     imap_spam_folder: str = Field(default="Spam", alias="IMAP_SPAM_FOLDER")
     imap_archive_folder: str = Field(default="Archive", alias="IMAP_ARCHIVE_FOLDER")
+    # Empty: failed imports stay unseen in the inbox and are retried by the next run
+    imap_error_folder: str = Field(default="", alias="IMAP_ERROR_FOLDER")
     email_import_batch_size: int = Field(default=20, alias="EMAIL_IMPORT_BATCH_SIZE")
     email_import_interval_sec: int = Field(default=300, alias="EMAIL_IMPORT_INTERVAL_SEC")
     email_import_stale_after_sec: int = Field(default=900, alias="EMAIL_IMPORT_STALE_AFTER_SEC")
     email_import_max_body_chars: int = Field(default=262_144, alias="EMAIL_IMPORT_MAX_BODY_CHARS")
     email_import_max_raw_bytes: int = Field(default=2_097_152, alias="EMAIL_IMPORT_MAX_RAW_BYTES")
+    # Above 1 the system worker keeps a process pool for parsing batches of at least the minimum size
+    email_import_parse_workers: int = Field(default=1, alias="EMAIL_IMPORT_PARSE_WORKERS")
+    email_import_parse_pool_min_batch: int = Field(default=100, alias="EMAIL_IMPORT_PARSE_POOL_MIN_BATCH")
+    email_import_post_chunk_size: int = Field(default=25, alias="EMAIL_IMPORT_POST_CHUNK_SIZE")
 
     tracking_flush_interval_sec: int = Field(default=1800, alias="TRACKING_FLUSH_INTERVAL_SEC")
     tracking_flush_stale_after_sec: int = Field(default=3900, alias="TRACKING_FLUSH_STALE_AFTER_SEC")
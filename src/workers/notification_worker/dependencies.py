@@ -1,5 +1,6 @@
 from typing import Any, cast
 
+import httpx
 from codex_platform.workers.arq import BaseArqService
 from loguru import logger as log
 
@@ -10,8 +11,10 @@ from src.workers.core.base_module.dependencies import (
 )
 from src.workers.core.base_module.orchestrator import NotificationOrchestrator
 from src.workers.core.base_module.seven_io_client import SevenIOClient
+from src.workers.core.base_module.smtp_pool import SmtpConnectionPool, smtp_tls_flags
 from src.workers.core.base_module.twilio_service import TwilioService
 from src.workers.notification_worker.config import WorkerSettings
+from src.workers.notification_worker.services.campaign_status_reporter import CampaignStatusReporter
 from src.workers.notification_worker.services.notification_service import NotificationService
 
 
@@ -36,6 +39,72 @@ async def close_arq_service(ctx: dict[str, Any], settings: WorkerSettings) -> No
         log.info("ArqService closed.")
 
 
+async def init_email_transport(ctx: dict[str, Any], settings: WorkerSettings) -> None:
+    """Shared SMTP session pool and HTTP client for every email sent by this worker."""
+    log.info("Initializing email transport...")
+    site_settings = ctx["site_settings"]
+    ctx["http_client"] = httpx.AsyncClient(timeout=10.0)
+    ctx["smtp_pool"] = None
+    if not site_settings.smtp_host or not site_settings.smtp_port:
+        log.warning("SMTP host/port missing, email transport pool not created.")
+        return
+
+    use_tls, start_tls = smtp_tls_flags(site_settings.smtp_port, site_settings.smtp_use_tls)
+    credentials = site_settings.smtp_user and site_settings.smtp_password
+    ctx["smtp_pool"] = SmtpConnectionPool(
+        hostname=site_settings.smtp_host,
+        port=site_settings.smtp_port,
+        username=site_settings.smtp_user if credentials else None,
+        password=site_settings.smtp_password if credentials else None,
+        use_tls=use_tls,
+        start_tls=start_tls,
+        size=settings.smtp_pool_size,
+        max_messages_per_session=settings.smtp_max_messages_per_session,
+        idle_timeout=settings.smtp_idle_timeout_sec,
+        noop_after=settings.smtp_noop_after_sec,
+    )
+    log.info("Email transport initialized successfully.")
+
+
+async def close_email_transport(ctx: dict[str, Any], settings: WorkerSettings) -> None:
+    """Quit pooled SMTP sessions and close the shared HTTP client."""
+    smtp_pool = ctx.get("smtp_pool")
+    if smtp_pool:
+        await smtp_pool.close()
+    http_client = ctx.get("http_client")
+    if http_client:
+        await http_client.aclose()
+    log.info("Email transport closed.")
+
+
+async def init_campaign_status_reporter(ctx: dict[str, Any], settings: WorkerSettings) -> None:
+    """Buffered reporter that posts campaign recipient outcomes to Django in bulk."""
+    internal_api = ctx.get("internal_api")
+    token = settings.ops_worker_api_key
+    if not internal_api or not token:
+        log.warning("OPS_WORKER_API_KEY or internal API missing, campaign status callbacks disabled.")
+        ctx["campaign_status_reporter"] = None
+        return
+
+    reporter = CampaignStatusReporter(
+        internal_api,
+        token,
+        flush_size=settings.campaign_status_flush_size,
+        flush_interval=settings.campaign_status_flush_interval_sec,
+    )
+    reporter.start()
+    ctx["campaign_status_reporter"] = reporter
+    log.info("CampaignStatusReporter started.")
+
+
+async def close_campaign_status_reporter(ctx: dict[str, Any], settings: WorkerSettings) -> None:
+    """Flush buffered campaign outcomes before the internal API client closes."""
+    reporter = ctx.get("campaign_status_reporter")
+    if reporter:
+        await reporter.close()
+        log.info("CampaignStatusReporter flushed and stopped.")
+
+
 async def init_notification_service(ctx: dict[str, Any], settings: WorkerSettings) -> None:
     """Инициализация NotificationService."""
     log.info("Initializing NotificationService...")
@@ -57,6 +126,8 @@ async def init_notification_service(ctx: dict[str, Any], settings: WorkerSetting
             url_path_cancel=site_settings.url_path_cancel,
             url_path_reschedule=site_settings.url_path_reschedule,
             url_path_contact_form=site_settings.url_path_contact_form,
+            smtp_pool=ctx.get("smtp_pool"),
+            http_client=ctx.get("http_client"),
         )
         ctx["notification_service"] = notification_service
         log.info("NotificationService initialized successfully.")
@@ -128,6 +199,8 @@ async def init_orchestrator(ctx: dict[str, Any], settings: WorkerSettings) -> No
 STARTUP_DEPENDENCIES: list[DependencyFunction] = [
     init_common_dependencies,
     init_arq_service,
+    init_email_transport,
+    init_campaign_status_reporter,
     init_notification_service,
     init_seven_io_service,
     init_twilio_service,
@@ -135,6 +208,8 @@ STARTUP_DEPENDENCIES: list[DependencyFunction] = [
 ]
 
 SHUTDOWN_DEPENDENCIES: list[DependencyFunction] = [
+    close_campaign_status_reporter,
     close_arq_service,
+    close_email_transport,
     close_common_dependencies,
 ]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any
+
+from loguru import logger as log
+
+BULK_STATUS_PATH = "/v1/conversations/campaigns/recipient-status/bulk"
+# Must not exceed the backend's RECIPIENT_STATUS_BATCH_LIMIT
+MAX_ITEMS_PER_REQUEST = 500
+# Outcomes kept for retry while the backend is unreachable; the oldest are dropped beyond this
+MAX_BUFFERED_ITEMS = 20_000
+MAX_RETRY_DELAY_SEC = 60.0
+
+
+async def post_campaign_statuses(internal_api: Any, token: str, items: list[dict[str, str]]) -> None:
+    """Sends recipient outcomes to the bulk status endpoint, chunked to the backend's limit."""
+    for start in range(0, len(items), MAX_ITEMS_PER_REQUEST):
+        await internal_api.post(
+            BULK_STATUS_PATH,
+            scope="campaigns.worker",
+            token=token,
+            json={"items": items[start : start + MAX_ITEMS_PER_REQUEST]},
+        )
+
+
+class CampaignStatusReporter:
+    """
+    Buffers campaign recipient outcomes and posts them to Django in bulk.
+
+    The buffer is flushed once it holds ``flush_size`` items, by a background
+    loop every ``flush_interval`` seconds, and on worker shutdown. Items a
+    failed flush did not deliver go back to the front of the buffer and are
+    retried after an exponential backoff capped at ``MAX_RETRY_DELAY_SEC``;
+    their recipients stay ``queued`` in Django until they arrive. Beyond
+    ``max_buffered`` items the oldest are dropped and logged.
+    """
+
+    def __init__(
+        self,
+        internal_api: Any,
+        token: str,
+        flush_size: int = 200,
+        flush_interval: float = 2.0,
+        max_buffered: int = MAX_BUFFERED_ITEMS,
+    ):
+        self.internal_api = internal_api
+        self.token = token
+        self.flush_size = max(1, min(flush_size, MAX_ITEMS_PER_REQUEST))
+        self.flush_interval = flush_interval
+        self.max_buffered = max(max_buffered, self.flush_size)
+        self._buffer: list[dict[str, str]] = []
+        self._lock = asyncio.Lock()
+        self._loop_task: asyncio.Task[None] | None = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def start(self) -> None:
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._loop_task
+            self._loop_task = None
+        await self.flush(force=True)
+
+    async def report(self, notification_id: str, status: str, error: str = "") -> None:
+        await self.report_many([{"notification_id": notification_id, "status": status, "error": error}])
+
+    async def report_many(self, items: list[dict[str, str]]) -> None:
+        self._buffer.extend(items)
+        if len(self._buffer) >= self.flush_size:
+            await self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def flush(self, *, force: bool = False) -> None:
+        """Post the buffer; while backing off from a failure only ``force`` posts."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if not self._buffer or (now < self._retry_at and not force):
+                return
+            items, self._buffer = self._buffer, []
+            posted = 0
+            try:
+                for posted in range(0, len(items), MAX_ITEMS_PER_REQUEST):
+                    await post_campaign_statuses(
+                        self.internal_api, self.token, items[posted : posted + MAX_ITEMS_PER_REQUEST]
+                    )
+            except Exception as exc:
+                self._failures += 1
+                delay = min(self.flush_interval * 2**self._failures, MAX_RETRY_DELAY_SEC)
+                self._retry_at = now + delay
+                self._requeue(items[posted:])
+                log.warning(
+                    f"CampaignStatusReporter: bulk callback failed for {len(items) - posted} recipients, "
+                    f"retrying in {delay:.0f}s: {exc}"
+                )
+            else:
+                self._failures = 0
+                self._retry_at = 0.0
+
+    def _requeue(self, items: list[dict[str, str]]) -> None:
+        # Ahead of anything reported while the flush was in flight, so outcomes keep their order
+        self._buffer = items + self._buffer
+        overflow = len(self._buffer) - self.max_buffered
+        if overflow > 0:
+            del self._buffer[:overflow]
+            log.error(
+                f"CampaignStatusReporter: buffer full, dropped {overflow} oldest outcomes; "
+                "their recipients stay queued in Django"
+            )
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
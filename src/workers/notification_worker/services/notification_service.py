@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 from urllib.parse import quote
 
+import httpx
 from codex_core.common.text import transliterate
 from loguru import logger as log
 
 from src.workers.core.base_module.email_client import AsyncEmailClient
+from src.workers.core.base_module.smtp_pool import SmtpConnectionPool
 from src.workers.core.base_module.template_renderer import TemplateRenderer
 
 # ---------------------------------------------------------------------------
@@ -112,6 +114,8 @@ class NotificationService:
         url_path_cancel: str | None = None,
         url_path_reschedule: str | None = None,
         url_path_contact_form: str | None = None,
+        smtp_pool: SmtpConnectionPool | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         if not smtp_host or not smtp_port or not smtp_from_email:
             raise ValueError("Core SMTP settings are missing.")
@@ -124,6 +128,8 @@ class NotificationService:
             smtp_from_email=smtp_from_email,
             smtp_use_tls=smtp_use_tls,
             sendgrid_api_key=sendgrid_api_key,
+            smtp_pool=smtp_pool,
+            http_client=http_client,
         )
         self.renderer = TemplateRenderer(templates_dir)
         self.site_url = site_url.rstrip("/")
@@ -145,13 +151,14 @@ class NotificationService:
         headers: dict[str, str] | None = None,
     ) -> None:
         """Base method for sending any email notification."""
-        full_context = self.enrich_email_context(data)
-        full_template_path = self.resolve_template_path(template_name)
-
-        log.debug(f"NotificationService: Rendering {full_template_path} for {email}")
-        html_content = self.renderer.render(full_template_path, full_context)
+        log.debug(f"NotificationService: Rendering {template_name} for {email}")
+        html_content = self.render_email(template_name, data)
         await self.email_client.send_email(email, subject, html_content, headers=headers)
 
+    def render_email(self, template_name: str, data: dict) -> str:
+        """Renders a template with the enriched email context."""
+        return self.renderer.render(self.resolve_template_path(template_name), self.enrich_email_context(data))
+
     async def send_rendered_notification(
         self,
         email: str,
@@ -1,8 +1,25 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any, cast
 
+from arq import Retry
 from loguru import logger as log
+from markupsafe import escape
+
+from src.workers.notification_worker.services.campaign_status_reporter import CampaignStatusReporter
+from src.workers.notification_worker.tasks.notification_tasks import _CAMPAIGN_MAX_TRIES
+
+if TYPE_CHECKING:
+    from src.workers.notification_worker.services.notification_service import NotificationService
+
+# Rendered into the shared body once, then replaced per recipient
+_NAME_SLOT = "__lily_campaign_name__"
+_UNSUBSCRIBE_SLOT = "__lily_campaign_unsubscribe_url__"
+
+
+def _unsubscribe_url(site_url: str, token: str) -> str:
+    return f"{site_url}/u/{token}/" if token else ""
 
 
 async def send_campaign_batch_task(
@@ -10,8 +27,9 @@ async def send_campaign_batch_task(
     payload: dict[str, Any] | None = None,
 ) -> None:
     """
-    Independent batch task: receives pre-prepared data from Django
-    and enqueues individual send_universal_notification_task for each recipient.
+    Independent batch task: receives pre-prepared data from Django.
+    With ``send_mode="batch"`` the batch is rendered once and sent here;
+    otherwise one send_universal_notification_task is enqueued per recipient.
     No Django models imported.
     """
     if not payload:
@@ -19,34 +37,35 @@ async def send_campaign_batch_task(
         return
 
     campaign_id = payload.get("campaign_id")
-    subject = payload.get("subject")
-    body_text = payload.get("body_text")
-    arq_template_name = payload.get("arq_template_name")
-    is_marketing = payload.get("is_marketing", True)
-    site_context = payload.get("site_context", {})
     recipients = payload.get("recipients", [])
 
     if not recipients:
         log.warning(f"send_campaign_batch_task: campaign {campaign_id} batch is empty")
         return
 
+    if payload.get("send_mode") == "batch" and ctx.get("notification_service") is not None:
+        await _send_rendered_batch(ctx, payload)
+        return
+
     pool = ctx.get("arq_pool") or ctx.get("redis")
     if pool is None:
         log.error("send_campaign_batch_task: no arq_pool/redis in context")
         return
 
+    subject = payload.get("subject")
+    body_text = payload.get("body_text")
+    arq_template_name = payload.get("arq_template_name")
+    is_marketing = payload.get("is_marketing", True)
+    site_context = payload.get("site_context", {})
     site_url = str(site_context.get("site_url", "")).rstrip("/")
 
     for row in recipients:
-        token = row.get("unsubscribe_token", "")
-        unsubscribe_url = f"{site_url}/u/{token}/" if token else ""
-
         # Prepare context for the universal task
         context_data = {
             "body_text": body_text,
             "subject": subject,
             "name": row.get("first_name", ""),
-            "unsubscribe_url": unsubscribe_url,
+            "unsubscribe_url": _unsubscribe_url(site_url, row.get("unsubscribe_token", "")),
             "is_marketing": is_marketing,
             **site_context,
         }
@@ -72,3 +91,91 @@ async def send_campaign_batch_task(
             log.error(f"send_campaign_batch_task: enqueue failed for recipient {row['id']}: {exc}")
 
     log.info(f"send_campaign_batch_task: campaign {campaign_id} batch of {len(recipients)} recipients queued")
+
+
+async def _send_rendered_batch(ctx: dict[str, Any], payload: dict[str, Any]) -> None:
+    """
+    Renders the campaign template once with placeholder slots, fills in name and
+    unsubscribe URL per recipient and sends with bounded concurrency. Outcomes go
+    to the bulk status callback together.
+
+    A batch where every send failed is retried as a whole (nothing was delivered,
+    so nothing is sent twice); partial failures are reported as failed.
+    """
+    notification_service = cast("NotificationService", ctx["notification_service"])
+    campaign_id = payload.get("campaign_id")
+    subject = payload.get("subject") or "Notification from LILY Salon"
+    site_context = payload.get("site_context", {})
+    site_url = str(site_context.get("site_url", "")).rstrip("/")
+    recipients = payload["recipients"]
+
+    shared_html = notification_service.render_email(
+        payload.get("arq_template_name") or "",
+        {
+            "body_text": payload.get("body_text"),
+            "subject": subject,
+            "name": _NAME_SLOT,
+            "unsubscribe_url": _UNSUBSCRIBE_SLOT,
+            "is_marketing": payload.get("is_marketing", True),
+            **site_context,
+        },
+    )
+
+    settings = ctx.get("settings")
+    concurrency = max(1, getattr(settings, "campaign_batch_concurrency", 4))
+    slots = asyncio.Semaphore(concurrency)
+
+    async def send_one(row: dict[str, Any]) -> dict[str, str]:
+        notification_id = f"campaign_{campaign_id}_{row['id']}"
+        html_content = shared_html.replace(_NAME_SLOT, str(escape(row.get("first_name", "")))).replace(
+            _UNSUBSCRIBE_SLOT, str(escape(_unsubscribe_url(site_url, row.get("unsubscribe_token", ""))))
+        )
+        async with slots:
+            try:
+                await notification_service.send_rendered_notification(row["email"], subject, html_content)
+            except Exception as exc:
+                log.error(f"send_campaign_batch_task: send failed for recipient {row['id']}: {exc}")
+                return {"notification_id": notification_id, "status": "failed", "error": str(exc)}
+        return {"notification_id": notification_id, "status": "sent", "error": ""}
+
+    outcomes = await asyncio.gather(*(send_one(row) for row in recipients))
+
+    sent = sum(1 for outcome in outcomes if outcome["status"] == "sent")
+    job_try = ctx.get("job_try", 1)
+    if not sent and job_try < _CAMPAIGN_MAX_TRIES:
+        raise Retry(defer=job_try * 30)
+
+    await _report_campaign_statuses(ctx, outcomes)
+    log.info(f"send_campaign_batch_task: campaign {campaign_id} batch sent {sent}/{len(recipients)}")
+
+
+async def _report_campaign_statuses(ctx: dict[str, Any], items: list[dict[str, str]]) -> None:
+    if not items:
+        return
+    reporter = ctx.get("campaign_status_reporter") or _start_campaign_status_reporter(ctx)
+    if reporter is not None:
+        await reporter.report_many(items)
+
+
+def _start_campaign_status_reporter(ctx: dict[str, Any]) -> CampaignStatusReporter | None:
+    """Starts the buffered reporter on first use when worker startup did not."""
+    internal_api = ctx.get("internal_api")
+    if not internal_api:
+        return None
+    from src.workers.core.config import WorkerSettings
+
+    settings = ctx.get("settings") or WorkerSettings()
+    token = settings.ops_worker_api_key
+    if not token:
+        log.warning("_report_campaign_statuses: OPS_WORKER_API_KEY not set, skipping callback")
+        return None
+    reporter = CampaignStatusReporter(
+        internal_api,
+        token,
+        flush_size=settings.campaign_status_flush_size,
+        flush_interval=settings.campaign_status_flush_interval_sec,
+    )
+    reporter.start()
+    # Flushed by close_campaign_status_reporter on shutdown
+    ctx["campaign_status_reporter"] = reporter
+    return reporter
@@ -62,9 +62,11 @@ def _mailbox_headers(data: dict[str, Any]) -> dict[str, str] | None:
     if not thread_key:
         return None
     clean_key = str(thread_key).strip()
+    # Replies carry their own indexed Message-ID; older payloads reuse the thread key
+    message_id = str(data.get("outbound_message_id") or clean_key).strip()
     return {
         "X-Lily-Thread-Key": clean_key,
-        "Message-ID": f"<{clean_key}>",
+        "Message-ID": f"<{message_id}>",
         "References": f"<{clean_key}>",
         "In-Reply-To": f"<{clean_key}>",
     }
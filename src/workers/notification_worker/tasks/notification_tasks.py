@@ -22,6 +22,10 @@ async def _report_campaign_status(
 ) -> None:
     if not notification_id.startswith("campaign_"):
         return
+    reporter = ctx.get("campaign_status_reporter")
+    if reporter is not None:
+        await reporter.report(notification_id, status, error)
+        return
     internal_api = ctx.get("internal_api")
     if not internal_api:
         return
@@ -106,9 +110,11 @@ def _mailbox_headers(context: dict[str, Any]) -> dict[str, str] | None:
     if not thread_key:
         return None
     clean_key = str(thread_key).strip()
+    # Replies carry their own indexed Message-ID; older payloads reuse the thread key
+    message_id = str(context.get("outbound_message_id") or clean_key).strip()
     return {
         "X-Lily-Thread-Key": clean_key,
-        "Message-ID": f"<{clean_key}>",
+        "Message-ID": f"<{message_id}>",
         "References": f"<{clean_key}>",
         "In-Reply-To": f"<{clean_key}>",
     }
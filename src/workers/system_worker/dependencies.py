@@ -1,3 +1,6 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 from codex_platform.workers.arq import BaseArqService
@@ -24,12 +27,33 @@ async def close_arq_service(ctx: dict[str, Any], settings: WorkerSettings) -> No
         await arq_service.close()
 
 
+async def init_email_parse_pool(ctx: dict[str, Any], settings: WorkerSettings) -> None:
+    """Long-lived process pool for parsing large IMAP batches; none with EMAIL_IMPORT_PARSE_WORKERS=1."""
+    if settings.email_import_parse_workers <= 1:
+        ctx["email_parse_pool"] = None
+        return
+    # spawn: the worker process also runs threads, which fork does not copy safely
+    ctx["email_parse_pool"] = ProcessPoolExecutor(
+        max_workers=settings.email_import_parse_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    log.info(f"Email parse pool started with {settings.email_import_parse_workers} workers.")
+
+
+async def close_email_parse_pool(ctx: dict[str, Any], settings: WorkerSettings) -> None:
+    pool = ctx.get("email_parse_pool")
+    if pool:
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+
 STARTUP_DEPENDENCIES: list[DependencyFunction] = [
     init_common_dependencies,
     init_arq_service,
+    init_email_parse_pool,
 ]
 
 SHUTDOWN_DEPENDENCIES: list[DependencyFunction] = [
+    close_email_parse_pool,
     close_arq_service,
     close_common_dependencies,
 ]
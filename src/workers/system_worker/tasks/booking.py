@@ -120,6 +120,66 @@ async def complete_past_appointments_task(ctx: dict[str, Any]) -> dict[str, Any]
     return {"status": "ok", "completed": completed}
 
 
+async def refresh_loyalty_task(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Recalculate dirty and stale loyalty profiles through the booking internal API."""
+    settings = cast("WorkerSettings", ctx["settings"])
+    token = settings.booking_worker_api_key
+    if not token:
+        log.warning("refresh_loyalty_task: BOOKING_WORKER_API_KEY not set, skipping")
+        return {"status": "skipped", "refreshed": 0}
+
+    api = cast("InternalApiClient", ctx["internal_api"])
+    response = await api.post(
+        "/v1/booking/loyalty/refresh-dirty",
+        scope="booking.worker",
+        token=token,
+    )
+    refreshed = int(response.get("refreshed", 0))
+    log.info(f"refresh_loyalty_task: refreshed={refreshed}")
+    return {"status": "ok", "refreshed": refreshed}
+
+
+async def refresh_analytics_rollup_task(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild the analytics rollup for recently touched days through the booking internal API."""
+    settings = cast("WorkerSettings", ctx["settings"])
+    token = settings.booking_worker_api_key
+    if not token:
+        log.warning("refresh_analytics_rollup_task: BOOKING_WORKER_API_KEY not set, skipping")
+        return {"status": "skipped", "rebuilt_days": 0}
+
+    api = cast("InternalApiClient", ctx["internal_api"])
+    response = await api.post(
+        "/v1/booking/analytics/refresh-rollup",
+        scope="booking.worker",
+        token=token,
+    )
+    rebuilt_days = int(response.get("rebuilt_days", 0))
+    log.info(f"refresh_analytics_rollup_task: rebuilt_days={rebuilt_days}")
+    return {"status": "ok", "rebuilt_days": rebuilt_days}
+
+
+async def relay_booking_outbox_task(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Drain pending booking notification outbox rows through the booking internal API."""
+    settings = cast("WorkerSettings", ctx["settings"])
+    token = settings.booking_worker_api_key
+    if not token:
+        log.warning("relay_booking_outbox_task: BOOKING_WORKER_API_KEY not set, skipping")
+        return {"status": "skipped", "sent": 0}
+
+    api = cast("InternalApiClient", ctx["internal_api"])
+    response = await api.post(
+        "/v1/booking/outbox/relay",
+        scope="booking.worker",
+        token=token,
+    )
+    sent = int(response.get("sent", 0))
+    retrying = int(response.get("retrying", 0))
+    failed = int(response.get("failed", 0))
+    if sent or retrying or failed:
+        log.info(f"relay_booking_outbox_task: sent={sent} retrying={retrying} failed={failed}")
+    return {"status": "ok", "sent": sent, "retrying": retrying, "failed": failed}
+
+
 async def _schedule_next(ctx: dict[str, Any], task: HeartbeatTask) -> None:
     arq_service = ctx.get("arq_service")
     if not arq_service:
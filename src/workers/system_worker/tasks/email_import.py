@@ -9,6 +9,7 @@ from datetime import timedelta
 from email import message_from_bytes
 from email.policy import default
 from email.utils import getaddresses, parseaddr
+from functools import partial
 from html import unescape
 from typing import TYPE_CHECKING, Any, cast
 
@@ -17,6 +18,7 @@ from loguru import logger as log
 from src.workers.core.heartbeat import HeartbeatTask, WorkerHeartbeatRegistry
 
 if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
     from email.message import Message
 
     from src.workers.core.internal_api import InternalApiClient
@@ -25,6 +27,12 @@ if TYPE_CHECKING:
 TASK_ID = "conversations.import"
 QUEUE_NAME = "system"
 _SIZE_RE = re.compile(rb"RFC822\.SIZE\s+(\d+)", re.IGNORECASE)
+_UID_RE = re.compile(rb"\bUID\s+(\d+)", re.IGNORECASE)
+_FETCH_START_RE = re.compile(rb"^\d+\s+\(")
+# Matches IMPORT_EMAIL_BATCH_LIMIT of the backend bulk endpoint
+_MAX_POST_CHUNK = 50
+# Result statuses of the bulk endpoint for a stored email
+_IMPORTED_STATUSES = frozenset({"message-created", "reply-created"})
 _THREAD_KEY_RE = re.compile(r"(?:thread_key|thread|reply_match_token)[=:]\s*([A-Za-z0-9_\-]{16,128})", re.I)
 _QUOTED_HISTORY_MARKERS = [
     re.compile(r"\s*-{2,}\s*(?:Original Message|Urspr(?:ü|ue)ngliche Nachricht)\s*-{2,}.*", re.I | re.S),
@@ -52,6 +60,14 @@ class NormalizedEmail:
     raw_size: int | None
 
 
+@dataclass
+class _RawEmail:
+    uid: str
+    raw: bytes
+    raw_size: int | None
+    oversized: bool
+
+
 async def import_emails_task(ctx: dict[str, Any], payload: dict[str, Any] | None = None) -> dict[str, Any] | None:
     settings = cast("WorkerSettings", ctx["settings"])
     registry = cast("WorkerHeartbeatRegistry", ctx["heartbeat_registry"])
@@ -68,26 +84,31 @@ async def import_emails_task(ctx: dict[str, Any], payload: dict[str, Any] | None
 
     try:
         await registry.mark_started(task, job_id=str(ctx.get("job_id", "")))
-        emails = await asyncio.to_thread(_fetch_emails, settings)
+        emails = await asyncio.to_thread(_fetch_emails, settings, parse_pool=ctx.get("email_parse_pool"))
         client = cast("InternalApiClient", ctx["internal_api"])
-        imported = 0
-        spam = 0
-        oversized = 0
-        for item in emails:
-            if item.spam:
-                spam += 1
-            if item.oversized:
-                oversized += 1
-            await client.post(
-                "/v1/conversations/import-email",
-                scope=TASK_ID,
-                token=settings.conversations_import_api_key,
-                json=_to_payload(item),
-            )
-            imported += 1
+        spam = sum(1 for item in emails if item.spam)
+        oversized = sum(1 for item in emails if item.oversized)
+        imported: list[NormalizedEmail] = []
+        failed: list[NormalizedEmail] = []
+        chunk_size = max(1, min(settings.email_import_post_chunk_size, _MAX_POST_CHUNK))
+        try:
+            for start in range(0, len(emails), chunk_size):
+                chunk = emails[start : start + chunk_size]
+                response = await client.post(
+                    "/v1/conversations/import-email/bulk",
+                    scope=TASK_ID,
+                    token=settings.conversations_import_api_key,
+                    json={"items": [_to_payload(item) for item in chunk]},
+                )
+                chunk_imported, chunk_failed = _split_results(chunk, response)
+                imported.extend(chunk_imported)
+                failed.extend(chunk_failed)
+        finally:
+            # Only what the backend stored leaves the inbox, also when a later chunk could not be posted
+            await asyncio.to_thread(_file_messages, settings, imported, failed)
         await _schedule_next(ctx, task)
         await registry.mark_finished(task, status="success")
-        return {"imported": imported, "spam": spam, "oversized": oversized}
+        return {"imported": len(imported), "failed": len(failed), "spam": spam, "oversized": oversized}
     except Exception as exc:
         log.exception("import_emails_task failed")
         await registry.mark_finished(task, status="failed", error=str(exc))
@@ -98,51 +119,157 @@ async def import_emails_task(ctx: dict[str, Any], payload: dict[str, Any] | None
         await registry.release_lock(task.task_id)
 
 
-def _fetch_emails(settings: WorkerSettings) -> list[NormalizedEmail]:
-    if not settings.imap_host or not settings.imap_user or not settings.imap_password:
+def _fetch_emails(settings: WorkerSettings, parse_pool: ProcessPoolExecutor | None = None) -> list[NormalizedEmail]:
+    """
+    Reads one batch of unseen messages with a constant number of IMAP round trips:
+    one UID FETCH for headers and sizes and one for the bodies within the size limit.
+    Messages are only peeked at; ``_file_messages`` moves them once the backend stored them.
+    Parsing runs inline unless ``parse_pool`` is given and the batch is large enough.
+    """
+    if not _imap_configured(settings):
         log.info("IMAP import skipped: IMAP_HOST/IMAP_USER/IMAP_PASSWORD are incomplete.")
         return []
 
-    mailbox = imaplib.IMAP4_SSL(settings.imap_host, settings.imap_port)
+    mailbox = _open_mailbox(settings)
     try:
-        mailbox.login(settings.imap_user, settings.imap_password)
-        mailbox.select(settings.imap_folder)
         status, data = mailbox.uid("search", "UNSEEN")
         if status != "OK" or not data:
             return []
-        uids = data[0].split()[: settings.email_import_batch_size]
-        normalized = []
-        for uid_bytes in uids:
-            uid = uid_bytes.decode()
-            item = _fetch_one(mailbox, uid, settings)
-            if item is None:
-                continue
-            normalized.append(item)
-            if item.spam:
-                _move_message(mailbox, uid, settings.imap_spam_folder)
-            else:
-                _move_message(mailbox, uid, settings.imap_archive_folder)
+        uids = [uid.decode() for uid in data[0].split()[: settings.email_import_batch_size]]
+        raw_emails = _fetch_raw_batch(mailbox, uids, settings) if uids else []
+        if not raw_emails:
+            return []
+        return _parse_batch(raw_emails, settings, parse_pool)
+    finally:
+        with contextlib.suppress(imaplib.IMAP4.error):
+            mailbox.logout()
+
+
+def _file_messages(settings: WorkerSettings, imported: list[NormalizedEmail], failed: list[NormalizedEmail]) -> None:
+    """
+    Moves imported messages to the spam or archive folder with one UID MOVE (or COPY + STORE)
+    per target folder. Failed messages go to IMAP_ERROR_FOLDER when it is set and otherwise
+    stay unseen in the inbox, so the next run retries them.
+    """
+    moves = [
+        (settings.imap_spam_folder, [item.uid for item in imported if item.spam]),
+        (settings.imap_archive_folder, [item.uid for item in imported if not item.spam]),
+        (settings.imap_error_folder, [item.uid for item in failed]),
+    ]
+    moves = [(folder, uids) for folder, uids in moves if folder and uids]
+    if not moves or not _imap_configured(settings):
+        return
+
+    mailbox = _open_mailbox(settings)
+    try:
+        for folder, uids in moves:
+            _move_messages(mailbox, uids, folder)
         mailbox.expunge()
-        return normalized
     finally:
         with contextlib.suppress(imaplib.IMAP4.error):
             mailbox.logout()
 
 
-def _fetch_one(mailbox: imaplib.IMAP4_SSL, uid: str, settings: WorkerSettings) -> NormalizedEmail | None:
-    status, meta = mailbox.uid("fetch", uid, "(RFC822.SIZE BODY.PEEK[HEADER])")
+def _imap_configured(settings: WorkerSettings) -> bool:
+    return bool(settings.imap_host and settings.imap_user and settings.imap_password)
+
+
+def _open_mailbox(settings: WorkerSettings) -> imaplib.IMAP4_SSL:
+    mailbox = imaplib.IMAP4_SSL(cast("str", settings.imap_host), settings.imap_port)
+    mailbox.login(cast("str", settings.imap_user), cast("str", settings.imap_password))
+    mailbox.select(settings.imap_folder)
+    return mailbox
+
+
+def _split_results(
+    chunk: list[NormalizedEmail], response: dict[str, Any]
+) -> tuple[list[NormalizedEmail], list[NormalizedEmail]]:
+    """Pairs a chunk with the per-item results of the bulk endpoint; a missing result counts as failed."""
+    results = response.get("results")
+    if not isinstance(results, list):
+        results = []
+    imported: list[NormalizedEmail] = []
+    failed: list[NormalizedEmail] = []
+    for index, item in enumerate(chunk):
+        result = results[index] if index < len(results) and isinstance(results[index], dict) else {}
+        if result.get("status") in _IMPORTED_STATUSES:
+            imported.append(item)
+            continue
+        failed.append(item)
+        log.warning(
+            f"Email import failed uid={item.uid} message_id={item.message_id}: "
+            f"{result.get('error') or 'no result returned'}"
+        )
+    return imported, failed
+
+
+def _fetch_raw_batch(mailbox: imaplib.IMAP4_SSL, uids: list[str], settings: WorkerSettings) -> list[_RawEmail]:
+    status, meta = mailbox.uid("fetch", ",".join(uids), "(RFC822.SIZE BODY.PEEK[HEADER])")
     if status != "OK":
-        return None
-    raw_size = _extract_size(meta)
-    header_bytes = _extract_literal(meta) or b""
-    oversized = raw_size is not None and raw_size > settings.email_import_max_raw_bytes
-    raw_message = header_bytes
-    if not oversized:
-        status, raw = mailbox.uid("fetch", uid, "(BODY.PEEK[])")
+        return []
+    headers = _split_fetch_response(meta)
+    raw_emails: list[_RawEmail] = []
+    for uid in uids:
+        if uid not in headers:
+            continue
+        metadata, header_bytes = headers[uid]
+        raw_size = _extract_size([metadata])
+        oversized = raw_size is not None and raw_size > settings.email_import_max_raw_bytes
+        raw_emails.append(_RawEmail(uid=uid, raw=header_bytes or b"", raw_size=raw_size, oversized=oversized))
+
+    wanted = [item.uid for item in raw_emails if not item.oversized]
+    if wanted:
+        status, data = mailbox.uid("fetch", ",".join(wanted), "(BODY.PEEK[])")
         if status == "OK":
-            raw_message = _extract_literal(raw) or header_bytes
-    msg = message_from_bytes(raw_message, policy=default)
-    return _normalize(uid, msg, settings, raw_size=raw_size, oversized=oversized)
+            bodies = _split_fetch_response(data)
+            for item in raw_emails:
+                body = bodies.get(item.uid, (b"", None))[1]
+                if body and not item.oversized:
+                    item.raw = body
+    return raw_emails
+
+
+def _split_fetch_response(items: list[Any]) -> dict[str, tuple[bytes, bytes | None]]:
+    """Groups a multi-message FETCH response into ``{uid: (metadata, first literal)}``."""
+    messages: list[list[Any]] = []
+    for item in items:
+        if isinstance(item, tuple) and len(item) >= 2:
+            metadata, literal = item[0], item[1]
+        elif isinstance(item, bytes):
+            metadata, literal = item, None
+        else:
+            continue
+        if not messages or _FETCH_START_RE.match(metadata):
+            messages.append([metadata, literal])
+            continue
+        # Continuation of the previous message: trailing items or ")"
+        messages[-1][0] += b" " + metadata
+        if messages[-1][1] is None:
+            messages[-1][1] = literal
+    grouped: dict[str, tuple[bytes, bytes | None]] = {}
+    for metadata, literal in messages:
+        match = _UID_RE.search(metadata)
+        if match:
+            grouped[match.group(1).decode()] = (metadata, literal)
+    return grouped
+
+
+def _parse_batch(
+    raw_emails: list[_RawEmail],
+    settings: WorkerSettings,
+    pool: ProcessPoolExecutor | None = None,
+) -> list[NormalizedEmail]:
+    parse = partial(_parse_raw, settings=settings)
+    # Shipping messages to another process only pays off for large batches
+    if pool is None or len(raw_emails) < settings.email_import_parse_pool_min_batch:
+        return [parse(item) for item in raw_emails]
+    workers = max(1, settings.email_import_parse_workers)
+    return list(pool.map(parse, raw_emails, chunksize=max(1, len(raw_emails) // workers)))
+
+
+def _parse_raw(item: _RawEmail, settings: WorkerSettings) -> NormalizedEmail:
+    msg = message_from_bytes(item.raw, policy=default)
+    return _normalize(item.uid, msg, settings, raw_size=item.raw_size, oversized=item.oversized)
 
 
 def _normalize(
@@ -271,21 +398,23 @@ def _extract_size(items: list[Any]) -> int | None:
     return int(match.group(1)) if match else None
 
 
-def _extract_literal(items: list[Any]) -> bytes | None:
-    for item in items:
-        if isinstance(item, tuple) and len(item) >= 2 and isinstance(item[1], bytes):
-            return item[1]
-    return None
-
-
-def _move_message(mailbox: imaplib.IMAP4_SSL, uid: str, folder: str) -> None:
-    if not folder:
+def _move_messages(mailbox: imaplib.IMAP4_SSL, uids: list[str], folder: str) -> None:
+    if not folder or not uids:
         return
+    uid_set = ",".join(uids)
     try:
-        mailbox.uid("copy", uid, folder)
-        mailbox.uid("store", uid, "+FLAGS", r"(\Deleted)")
+        if "MOVE" in mailbox.capabilities:
+            status, _ = mailbox.uid("move", uid_set, folder)
+            if status != "OK":
+                log.warning(f"Could not move imported emails uids={uid_set} to folder={folder}: {status}")
+            return
+        status, _ = mailbox.uid("copy", uid_set, folder)
+        if status != "OK":
+            log.warning(f"Could not copy imported emails uids={uid_set} to folder={folder}: {status}")
+            return
+        mailbox.uid("store", uid_set, "+FLAGS", r"(\Deleted)")
     except imaplib.IMAP4.error as exc:
-        log.warning(f"Could not move imported email uid={uid} to folder={folder}: {exc}")
+        log.warning(f"Could not move imported emails uids={uid_set} to folder={folder}: {exc}")
 
 
 def _to_payload(item: NormalizedEmail) -> dict[str, Any]:
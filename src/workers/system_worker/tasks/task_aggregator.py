@@ -1,7 +1,12 @@
 from codex_platform.workers.arq import CORE_FUNCTIONS
 from loguru import logger
 
-from .booking import booking_maintenance_task
+from .booking import (
+    booking_maintenance_task,
+    refresh_analytics_rollup_task,
+    refresh_loyalty_task,
+    relay_booking_outbox_task,
+)
 from .email_import import import_emails_task
 from .maintenance import system_watchdog_task
 from .tracking import flush_tracking_task
@@ -10,6 +15,9 @@ FUNCTIONS = [
     import_emails_task,
     flush_tracking_task,
     booking_maintenance_task,
+    refresh_loyalty_task,
+    refresh_analytics_rollup_task,
+    relay_booking_outbox_task,
     system_watchdog_task,
 ] + CORE_FUNCTIONS
 
@@ -8,7 +8,12 @@ from loguru import logger as log
 from src.workers.core.config import WorkerSettings as CoreWorkerSettings
 
 from .dependencies import SHUTDOWN_DEPENDENCIES, STARTUP_DEPENDENCIES
-from .tasks.booking import complete_past_appointments_task
+from .tasks.booking import (
+    complete_past_appointments_task,
+    refresh_analytics_rollup_task,
+    refresh_loyalty_task,
+    relay_booking_outbox_task,
+)
 from .tasks.maintenance import ensure_tasks_scheduled, system_watchdog_task
 from .tasks.task_aggregator import FUNCTIONS
 
@@ -58,4 +63,7 @@ class WorkerSettings(BaseArqWorkerSettings):
             run_at_startup=True,
             max_tries=3,
         ),
+        cron(refresh_loyalty_task, minute={5, 20, 35, 50}, max_tries=3),
+        cron(refresh_analytics_rollup_task, minute=None, max_tries=3),
+        cron(relay_booking_outbox_task, second={0, 15, 30, 45}, run_at_startup=True),
     ]
@@ -59,6 +59,31 @@ def mock_redis_settings_sync():
         yield
 
 
+@pytest.fixture(autouse=True)
+def disable_booking_interval_index():
+    """Keep the booking interval index, settings snapshot, catalog and staff overview out of Redis.
+
+    on_commit never fires in tests.
+    """
+    with (
+        patch("features.booking.redis.BookingIntervalIndexManager._is_disabled", return_value=True),
+        patch("features.booking.redis.BookingSettingsVersionManager._is_disabled", return_value=True),
+        patch("features.booking.redis.BookingCatalogManager._is_disabled", return_value=True),
+        patch("features.booking.redis.StaffOverviewVersionManager._is_disabled", return_value=True),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_booking_slot_memo():
+    """Slot results are memoized on the process-wide gateway; start every test empty."""
+    from features.booking.selector.engine import get_booking_engine_gateway
+
+    get_booking_engine_gateway().slot_memo.clear()
+    yield
+    get_booking_engine_gateway().slot_memo.clear()
+
+
 @pytest.fixture(autouse=True)
 def mock_seo_redis():
     """Patch SeoRedisManager to prevent RedisConnectionError in tests."""
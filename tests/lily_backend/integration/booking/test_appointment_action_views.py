@@ -131,6 +131,9 @@ class TestCancelAppointmentView:
         pending_appointment.finalize_token = "CXLEVT"
         pending_appointment.save()
 
+        from features.booking.models import BookingNotificationOutbox
+        from features.booking.services.outbox import relay_booking_outbox
+
         with patch("features.conversations.services.notifications._get_engine") as mock_eng:
             engine_mock = MagicMock()
             mock_eng.return_value = engine_mock
@@ -138,11 +141,14 @@ class TestCancelAppointmentView:
                 reverse("booking:booking_cancel_action", kwargs={"token": "CXLEVT"}),
                 {"reason": "client"},
             )
-            # Called twice: once in model.cancel() and once in view
-            assert engine_mock.dispatch_event.call_count == 2
-            engine_mock.dispatch_event.assert_any_call("booking.cancelled", pending_appointment)
-            event_name = engine_mock.dispatch_event.call_args[0][0]
-            assert event_name == "booking.cancelled"
+            # The view only records the event; the relay dispatches it once
+            engine_mock.dispatch_event.assert_not_called()
+            entry = BookingNotificationOutbox.objects.get(appointment=pending_appointment)
+            assert (entry.event, entry.origin) == ("booking.cancelled", "client")
+
+            relay_booking_outbox()
+
+            engine_mock.dispatch_event.assert_called_once_with("booking.cancelled", pending_appointment)
 
     def test_post_already_cancelled_returns_error(self, db, pending_appointment, rf):
         from django.contrib.auth.models import AnonymousUser
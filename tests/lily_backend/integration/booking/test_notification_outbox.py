@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.utils import timezone
+from features.booking.models import Appointment, AppointmentGroup, AppointmentGroupItem, BookingNotificationOutbox
+from features.booking.providers.runtime import RuntimeBookingProvider
+from features.booking.services.outbox import OUTBOX_CLAIM_TIMEOUT, OUTBOX_MAX_ATTEMPTS, relay_booking_outbox
+
+
+class _RecordingDispatch:
+    def __init__(self, *, fail: bool = False):
+        self.fail = fail
+        self.calls: list[tuple[str, int, str]] = []
+
+    def __call__(self, event: str, appt: Appointment) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.calls.append((event, appt.pk, appt._booking_origin))
+
+
+@pytest.fixture
+def arq_enqueue(monkeypatch):
+    """Route the real notification engine to a stubbed ARQ client; set ``.fail`` to break Redis."""
+    from core.arq.client import DjangoArqClient
+    from features.conversations.services import notifications
+
+    class _Enqueue:
+        def __init__(self) -> None:
+            self.fail = False
+            self.calls: list[str] = []
+
+        def __call__(self, task_name: str, payload: dict | None = None, **kwargs) -> str:
+            self.calls.append(task_name)
+            if self.fail:
+                raise ConnectionError("redis down")
+            return f"job-{len(self.calls)}"
+
+    enqueue = _Enqueue()
+    monkeypatch.setattr(notifications, "_HAS_ARQ", True)
+    monkeypatch.setattr(DjangoArqClient, "enqueue", enqueue)
+    notifications._get_engine.cache_clear()
+    yield enqueue
+    notifications._get_engine.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def no_reminders(monkeypatch):
+    from features.booking.services import reminders
+
+    scheduled: list[int] = []
+    monkeypatch.setattr(reminders, "schedule_booking_reminder", lambda appt: scheduled.append(appt.pk))
+    return scheduled
+
+
+def test_status_change_records_event_without_dispatching(pending_appointment):
+    with patch("features.conversations.services.notifications._get_engine") as get_engine:
+        pending_appointment.confirm()
+
+    get_engine.assert_not_called()
+    entry = BookingNotificationOutbox.objects.get()
+    assert (entry.event, entry.appointment_id, entry.status) == (
+        "booking.confirmed",
+        pending_appointment.pk,
+        BookingNotificationOutbox.Status.PENDING,
+    )
+
+
+def test_relay_dispatches_pending_rows_once_and_schedules_reminders(pending_appointment, no_reminders):
+    pending_appointment.confirm()
+    dispatch = _RecordingDispatch()
+
+    assert relay_booking_outbox(dispatch=dispatch) == {"sent": 1, "failed": 0, "retrying": 0}
+    assert relay_booking_outbox(dispatch=dispatch) == {"sent": 0, "failed": 0, "retrying": 0}
+
+    assert dispatch.calls == [("booking.confirmed", pending_appointment.pk, "client")]
+    assert no_reminders == [pending_appointment.pk]
+    entry = BookingNotificationOutbox.objects.get()
+    assert entry.status == BookingNotificationOutbox.Status.SENT
+    assert entry.processed_at is not None
+
+
+def test_failed_dispatch_stays_pending_until_attempts_run_out(pending_appointment):
+    pending_appointment.confirm()
+    broken = _RecordingDispatch(fail=True)
+
+    for _attempt in range(OUTBOX_MAX_ATTEMPTS - 1):
+        assert relay_booking_outbox(dispatch=broken) == {"sent": 0, "failed": 0, "retrying": 1}
+    entry = BookingNotificationOutbox.objects.get()
+    assert (entry.status, entry.attempts, entry.last_error) == ("pending", OUTBOX_MAX_ATTEMPTS - 1, "redis down")
+
+    assert relay_booking_outbox(dispatch=broken) == {"sent": 0, "failed": 1, "retrying": 0}
+    assert BookingNotificationOutbox.objects.get().status == BookingNotificationOutbox.Status.FAILED
+
+
+def test_relay_enqueues_through_the_engine_before_marking_sent(pending_appointment, arq_enqueue):
+    pending_appointment.confirm()
+
+    assert relay_booking_outbox() == {"sent": 1, "failed": 0, "retrying": 0}
+
+    # Enqueued inside the relay, not deferred to a commit that this test never reaches
+    assert arq_enqueue.calls
+    assert BookingNotificationOutbox.objects.get().status == BookingNotificationOutbox.Status.SENT
+
+
+def test_relay_keeps_the_row_pending_when_the_arq_client_fails(pending_appointment, arq_enqueue, no_reminders):
+    pending_appointment.confirm()
+    arq_enqueue.fail = True
+
+    assert relay_booking_outbox() == {"sent": 0, "failed": 0, "retrying": 1}
+
+    entry = BookingNotificationOutbox.objects.get()
+    assert (entry.status, entry.attempts, entry.last_error) == ("pending", 1, "redis down")
+    assert no_reminders == []
+
+
+def test_relay_skips_live_claims_and_takes_over_stale_ones(pending_appointment):
+    pending_appointment.confirm()
+    entry = BookingNotificationOutbox.objects.get()
+    dispatch = _RecordingDispatch()
+
+    # Another relay is enqueueing the row right now
+    BookingNotificationOutbox.objects.filter(pk=entry.pk).update(claimed_at=timezone.now(), attempts=1)
+    assert relay_booking_outbox(dispatch=dispatch) == {"sent": 0, "failed": 0, "retrying": 0}
+
+    # That relay died before settling the row
+    stale = timezone.now() - OUTBOX_CLAIM_TIMEOUT - timedelta(seconds=1)
+    BookingNotificationOutbox.objects.filter(pk=entry.pk).update(claimed_at=stale)
+    assert relay_booking_outbox(dispatch=dispatch) == {"sent": 1, "failed": 0, "retrying": 0}
+
+    entry.refresh_from_db()
+    assert (entry.status, entry.attempts, entry.claimed_at) == ("sent", 2, None)
+    assert dispatch.calls == [("booking.confirmed", pending_appointment.pk, "client")]
+
+
+def test_staff_cancel_records_a_single_staff_event(pending_appointment):
+    RuntimeBookingProvider().run_cabinet_action(
+        booking_id=pending_appointment.pk,
+        action="cancel",
+        payload={"cancel_reason": "master"},
+    )
+    dispatch = _RecordingDispatch()
+
+    relay_booking_outbox(dispatch=dispatch)
+
+    assert dispatch.calls == [("booking.cancelled", pending_appointment.pk, "staff")]
+
+
+def test_group_confirm_records_one_event_per_appointment(client_obj, master, service, pending_appointment):
+    second = Appointment.objects.create(
+        client=client_obj,
+        master=master,
+        service=service,
+        datetime_start=pending_appointment.datetime_start + timedelta(hours=2),
+        duration_minutes=service.duration,
+        price=service.price,
+        status=Appointment.STATUS_PENDING,
+    )
+    group = AppointmentGroup.objects.create(client=client_obj)
+    for order, appt in enumerate([pending_appointment, second]):
+        AppointmentGroupItem.objects.create(group=group, appointment=appt, order=order)
+    group.confirm_all()
+    dispatch = _RecordingDispatch()
+
+    result = relay_booking_outbox(dispatch=dispatch, batch_size=10)
+
+    assert result["sent"] == 2
+    assert [call[:2] for call in dispatch.calls] == [
+        ("booking.confirmed", pending_appointment.pk),
+        ("booking.confirmed", second.pk),
+    ]
+
+
+def test_relay_endpoint_requires_worker_scope(client, settings, pending_appointment):
+    settings.BOOKING_WORKER_API_KEY = "booking-token"  # pragma: allowlist secret
+    headers = {"HTTP_X_INTERNAL_SCOPE": "booking.worker", "HTTP_X_INTERNAL_TOKEN": "booking-token"}
+    pending_appointment.confirm()
+
+    assert client.post("/api/v1/booking/outbox/relay").status_code == 403
+    with patch("features.conversations.services.notifications._get_engine", return_value=MagicMock()):
+        response = client.post("/api/v1/booking/outbox/relay", **headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "sent": 1, "failed": 0, "retrying": 0}
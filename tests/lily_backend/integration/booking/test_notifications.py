@@ -14,6 +14,7 @@ from features.booking.services.notifications import (
     handle_booking_received,
     handle_booking_rescheduled,
 )
+from features.booking.services.outbox import relay_booking_outbox
 from features.booking.views.public.commit import BookingCommitView
 from features.main.models import Service
 
@@ -141,6 +142,7 @@ def test_same_day_chain_auto_confirms_group_and_sends_admin_event(client_obj, ma
         patch("features.conversations.services.notifications._get_engine", return_value=engine),
     ):
         redirect_url = BookingCommitView()._commit_same_day(MagicMock(), cart, client_obj)
+        relay_booking_outbox()
 
     gateway.create_booking.assert_called_once_with(
         service_ids=[service.id, service_two.id],
@@ -8,6 +8,8 @@ any context/template errors.
 from __future__ import annotations
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from features.booking.dto.public_cart import (
     MODE_MULTI_DAY,
@@ -178,6 +180,39 @@ class TestCartAddView:
         assert cart.has(service.pk)
         assert not cart.has(old_svc.pk)
 
+    def test_reverse_excludes_rule_blocks_add(self, client, master, service, booking_settings):
+        from features.main.models import ServiceConflictRule
+        from tests.factories import ServiceFactory
+
+        service.masters.add(master)
+        in_cart = ServiceFactory(category=service.category, slug="in-cart-svc")
+        ServiceConflictRule.objects.create(source=in_cart, target=service, rule_type=ServiceConflictRule.EXCLUDES)
+        cart = PublicCart()
+        cart.add(PublicCartItem(service_id=in_cart.pk, service_title=in_cart.name, duration=30, price=in_cart.price))
+        _store_cart(client, cart)
+
+        resp = client.post(reverse("booking:cart_add"), {"service_id": str(service.pk)})
+
+        assert resp.status_code == 200
+        assert "bk-error-alert" in resp.content.decode()
+        assert not _read_cart(client).has(service.pk)
+
+    def test_add_reads_no_catalog_rows(self, client, master, service, booking_settings, monkeypatch):
+        from features.booking.selector.catalog import load_bookable_catalog
+
+        service.masters.add(master)
+        loaded = load_bookable_catalog()
+        monkeypatch.setattr("features.booking.views.public.cart.get_bookable_catalog", lambda: loaded)
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.post(reverse("booking:cart_add"), {"service_id": str(service.pk)})
+
+        assert resp.status_code == 200
+        assert _read_cart(client).has(service.pk)
+        catalog_tables = ('FROM "main_service" ', '"main_serviceconflictrule"', '"main_service_masters"')
+        sql = [query["sql"] for query in queries.captured_queries]
+        assert not [statement for statement in sql if any(table in statement for table in catalog_tables)]
+
 
 # ── CartRemoveView ────────────────────────────────────────────────────────────
 
@@ -10,6 +10,7 @@ from django.contrib.auth import get_user_model
 from django.test import RequestFactory
 from django.utils import timezone
 from features.booking.models import Appointment
+from features.booking.services.rollup import refresh_pending_days
 
 
 def _request(path: str = "/cabinet/analytics/reports/", query: str = ""):
@@ -52,6 +53,7 @@ def test_revenue_tab_uses_dual_axis_mixed_chart(confirmed_appointment):
 
 def test_services_tab_contains_table_rows_and_summary(client_obj, master, service):
     _appointment(client_obj, master, service, price_actual="120.00")
+    refresh_pending_days()
 
     report = LilyReportsService.build(_request(query="?tab=services&period=month"))
 
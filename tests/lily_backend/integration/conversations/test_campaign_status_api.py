@@ -0,0 +1,87 @@
+import pytest
+from django.test import RequestFactory, override_settings
+from features.conversations.api.campaigns import (
+    RECIPIENT_STATUS_BATCH_LIMIT,
+    RecipientStatusBatchPayload,
+    RecipientStatusPayload,
+    update_recipient_statuses,
+)
+from features.conversations.models.campaign import Campaign, CampaignRecipient
+from pydantic import ValidationError
+from system.models import Client
+
+
+def _worker_request():
+    return RequestFactory().post(
+        "/api/v1/conversations/campaigns/recipient-status/bulk",
+        HTTP_X_INTERNAL_SCOPE="campaigns.worker",
+        HTTP_X_INTERNAL_TOKEN="ops-token",
+    )
+
+
+@pytest.fixture
+def recipients(db):
+    campaign = Campaign.objects.create(subject="News", body_text="Body")
+    rows = []
+    for index in range(3):
+        client = Client.objects.create(
+            first_name=f"Reader{index}", email=f"reader{index}@example.com", phone=f"+4915200{index:04d}"
+        )
+        rows.append(
+            CampaignRecipient.objects.create(
+                campaign=campaign, recipient=client, email=client.email, status=CampaignRecipient.Status.QUEUED
+            )
+        )
+    return rows
+
+
+def _item(row, status, error=""):
+    return RecipientStatusPayload(notification_id=f"campaign_{row.campaign_id}_{row.pk}", status=status, error=error)
+
+
+@override_settings(OPS_WORKER_API_KEY="ops-token")  # pragma: allowlist secret
+def test_bulk_status_updates_every_recipient_in_one_callback(recipients, django_assert_num_queries):
+    payload = RecipientStatusBatchPayload(
+        items=[
+            _item(recipients[0], "sent"),
+            _item(recipients[1], "sent"),
+            _item(recipients[2], "failed", error="550 mailbox unavailable"),
+        ]
+    )
+
+    with django_assert_num_queries(1):
+        result = update_recipient_statuses(_worker_request(), payload)
+
+    assert result == {"ok": True, "updated": 3, "invalid": []}
+    sent, _, failed = (CampaignRecipient.objects.get(pk=row.pk) for row in recipients)
+    assert sent.status == CampaignRecipient.Status.SENT
+    assert sent.sent_at is not None
+    assert failed.status == CampaignRecipient.Status.FAILED
+    assert failed.error == "550 mailbox unavailable"
+
+
+@override_settings(OPS_WORKER_API_KEY="ops-token")  # pragma: allowlist secret
+def test_bulk_status_skips_malformed_items(recipients):
+    payload = RecipientStatusBatchPayload(
+        items=[
+            _item(recipients[0], "sent"),
+            RecipientStatusPayload(notification_id="booking_1", status="sent"),
+            _item(recipients[1], "delivered"),
+        ]
+    )
+
+    result = update_recipient_statuses(_worker_request(), payload)
+
+    assert result["updated"] == 1
+    assert result["invalid"] == ["booking_1", f"campaign_{recipients[1].campaign_id}_{recipients[1].pk}"]
+    assert CampaignRecipient.objects.get(pk=recipients[1].pk).status == CampaignRecipient.Status.QUEUED
+
+
+def test_bulk_status_rejects_oversized_batches():
+    items = [
+        {"notification_id": f"campaign_1_{index}", "status": "sent"}
+        for index in range(RECIPIENT_STATUS_BATCH_LIMIT + 1)
+    ]
+
+    with pytest.raises(ValidationError):
+        RecipientStatusBatchPayload(items=items)
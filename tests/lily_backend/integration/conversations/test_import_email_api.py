@@ -2,7 +2,8 @@ from unittest.mock import patch
 
 from django.test import RequestFactory, override_settings
 from features.conversations.api.import_email import InboundEmailPayload, import_email
-from features.conversations.models import Message
+from features.conversations.models import Message, MessageReference
+from features.conversations.services.email_import import record_message_references
 
 
 def _import_request():
@@ -130,3 +131,55 @@ def test_import_email_notifies_admin_for_known_client_reply(
     assert message == thread
     assert appointment == confirmed_appointment
     assert reply.pk == result["reply_id"]
+
+
+@override_settings(CONVERSATIONS_IMPORT_API_KEY="mail-token")  # pragma: allowlist secret
+def test_bulk_import_resolves_threads_for_the_whole_batch(db):
+    from features.conversations.api.import_email import InboundEmailBatchPayload, import_emails
+    from features.conversations.models import MessageReply
+
+    thread = Message.objects.create(sender_name="Anna", sender_email="anna@example.com", body="Question")
+    record_message_references(thread, ["reply-1@lily.test"], direction=MessageReference.Direction.OUTBOUND)
+    payload = InboundEmailBatchPayload(
+        items=[
+            InboundEmailPayload(sender_email="anna@example.com", body="Reply", in_reply_to="<reply-1@lily.test>"),
+            InboundEmailPayload(sender_email="new@example.com", subject="Hello", body="New thread"),
+            InboundEmailPayload(sender_email="spam@example.com", body="Casino", spam=True),
+        ]
+    )
+
+    with patch("features.conversations.services.notifications._get_engine"):
+        result = import_emails(_import_request(), payload)
+
+    assert [row["status"] for row in result["results"]] == ["reply-created", "message-created", "message-created"]
+    assert result["results"][0]["message_id"] == thread.pk
+    assert MessageReply.objects.get(pk=result["results"][0]["reply_id"]).body == "Reply"
+    assert Message.objects.get(pk=result["results"][2]["message_id"]).status == Message.Status.SPAM
+
+
+@override_settings(CONVERSATIONS_IMPORT_API_KEY="mail-token")  # pragma: allowlist secret
+def test_reply_chain_resolves_in_one_lookup_and_indexes_inbound_ids(db, django_assert_num_queries):
+    from features.conversations.api.import_email import _thread_index
+
+    thread = Message.objects.create(sender_name="Anna", sender_email="anna@example.com", body="Question")
+    record_message_references(thread, ["lily-2@lily.test"], direction=MessageReference.Direction.OUTBOUND)
+    chain = [f"<client-{index}@mail.example>" for index in range(40)]
+    payload = InboundEmailPayload(
+        sender_email="anna@example.com",
+        body="Another question",
+        message_id="<client-40@mail.example>",
+        in_reply_to="<client-39@mail.example>",
+        references=[*chain, "<lily-2@lily.test>"],
+    )
+
+    with django_assert_num_queries(1):
+        threads = _thread_index([payload])
+
+    assert threads == {"lily-2@lily.test": thread}
+    with patch("features.conversations.services.notifications._get_engine"):
+        result = import_email(_import_request(), payload)
+
+    assert result["message_id"] == thread.pk
+    assert MessageReference.objects.get(message_id="client-40@mail.example").thread == thread
+    follow_up = InboundEmailPayload(sender_email="anna@example.com", in_reply_to="<client-40@mail.example>")
+    assert _thread_index([follow_up]) == {"client-40@mail.example": thread}
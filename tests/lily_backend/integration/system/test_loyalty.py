@@ -9,7 +9,7 @@ from cabinet.services.client import ClientService
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from features.booking.models import Appointment
-from system.models import Client, UserProfile
+from system.models import Client, LoyaltyProfile, UserProfile
 from system.selectors.users import UserSelector
 from system.services.loyalty import LoyaltyService
 
@@ -184,3 +184,140 @@ def test_user_grid_shows_loyalty_for_registered_users_only(client_obj, master, s
     assert "/4" in registered.meta[0][1]
     assert ghost.badge
     assert not any("/4" in text for _icon, text in ghost.meta)
+
+
+def test_completed_streak_stops_at_last_past_non_completed_visit(client_obj, master, service):
+    user, profile = _user_with_profile("streak")
+    _link_client(user, client_obj)
+    now = timezone.now()
+    _appointment(client_obj, master, service, datetime_start=now - timedelta(days=30))
+    _appointment(
+        client_obj, master, service, status=Appointment.STATUS_CANCELLED, datetime_start=now - timedelta(days=20)
+    )
+    _appointment(client_obj, master, service, datetime_start=now - timedelta(days=10))
+    _appointment(client_obj, master, service, datetime_start=now - timedelta(days=5))
+    _appointment(client_obj, master, service, status=Appointment.STATUS_PENDING, datetime_start=now + timedelta(days=5))
+
+    loyalty = LoyaltyService.get_or_refresh_for_profile(profile)
+
+    assert loyalty.stats["current_completed_streak"] == 2
+    assert loyalty.stats["completed_count"] == 3
+    assert loyalty.stats["appointment_count"] == 5
+
+
+def test_clean_profile_read_is_a_single_query(client_obj, master, service, django_assert_num_queries):
+    user, profile = _user_with_profile("clean-read")
+    _link_client(user, client_obj)
+    _appointment(client_obj, master, service)
+    LoyaltyService.get_or_refresh_for_profile(profile)
+
+    with django_assert_num_queries(1):
+        LoyaltyService.get_or_refresh_for_profile(profile)
+
+
+def test_refresh_profiles_batches_many_clients(master, service, django_assert_max_num_queries):
+    profiles = []
+    for index in range(5):
+        user, profile = _user_with_profile(f"batch-{index}")
+        client = _link_client(user, Client.objects.create(first_name=f"Batch {index}", phone=f"+4911100020{index}"))
+        _appointment(client, master, service, price=Decimal("100.00") * (index + 1))
+        profiles.append(profile)
+
+    with django_assert_max_num_queries(6):
+        loyalties = LoyaltyService.refresh_profiles(profiles)
+
+    assert [loyalties[profile.pk].stats["paid_spend"] for profile in profiles] == [
+        "100.00",
+        "200.00",
+        "300.00",
+        "400.00",
+        "500.00",
+    ]
+
+
+def test_bulk_display_reads_stored_rows_in_one_query(master, service, django_assert_num_queries):
+    profiles = []
+    for index in range(3):
+        user, profile = _user_with_profile(f"bulk-{index}")
+        client = _link_client(user, Client.objects.create(first_name=f"Bulk {index}", phone=f"+4911100030{index}"))
+        _appointment(client, master, service, price=Decimal("300.00") * index)
+        profiles.append(profile)
+    LoyaltyService.refresh_profiles(profiles)
+
+    with django_assert_num_queries(1):
+        displays = LoyaltyService.get_display_for_profiles(profile.pk for profile in profiles)
+
+    assert [displays[profile.pk].level for profile in profiles] == [1, 2, 3]
+
+
+def test_bulk_display_creates_missing_rows_dirty_for_the_sweep():
+    _user, profile = _user_with_profile("bulk-missing")
+
+    displays = LoyaltyService.get_display_for_profiles([profile.pk])
+
+    assert displays[profile.pk].level == 1
+    assert LoyaltyProfile.objects.get(profile=profile).is_dirty is True
+
+
+def test_status_and_price_changes_mark_profile_dirty(client_obj, master, service):
+    user, profile = _user_with_profile("dirty")
+    _link_client(user, client_obj)
+    appt = _appointment(client_obj, master, service)
+    loyalty = LoyaltyService.get_or_refresh_for_profile(profile)
+
+    appt.client_notes = "bring photos"
+    appt.save(update_fields=["client_notes", "updated_at"])
+    appt.save()
+    loyalty.refresh_from_db()
+    assert loyalty.is_dirty is False
+
+    appt.price_actual = Decimal("90.00")
+    appt.save(update_fields=["price_actual", "updated_at"])
+    loyalty.refresh_from_db()
+    assert loyalty.is_dirty is True
+
+    loyalty = LoyaltyService.get_or_refresh_for_profile(profile)
+    assert loyalty.is_dirty is False
+    assert loyalty.stats["paid_spend"] == "90.00"
+
+
+def test_auto_completion_marks_profile_dirty(client_obj, master, service):
+    from features.booking.services.completion import complete_finished_confirmed_appointments
+
+    user, profile = _user_with_profile("auto-complete")
+    _link_client(user, client_obj)
+    _appointment(client_obj, master, service, status=Appointment.STATUS_CONFIRMED)
+    LoyaltyService.get_or_refresh_for_profile(profile)
+
+    assert complete_finished_confirmed_appointments() == 1
+
+    assert LoyaltyProfile.objects.get(profile=profile).is_dirty is True
+
+
+def test_refresh_dirty_recalculates_flagged_and_stale_rows(client_obj, master, service):
+    user, profile = _user_with_profile("sweep")
+    _link_client(user, client_obj)
+    _other_user, other_profile = _user_with_profile("sweep-other")
+    appt = _appointment(client_obj, master, service, price=Decimal("80.00"))
+    LoyaltyService.refresh_profiles([profile, other_profile])
+    LoyaltyProfile.objects.filter(profile=other_profile).update(calculated_at=timezone.now() - timedelta(days=2))
+
+    appt.status = Appointment.STATUS_NO_SHOW
+    appt.save(update_fields=["status", "updated_at"])
+
+    assert LoyaltyService.refresh_dirty() == 2
+    assert LoyaltyService.refresh_dirty() == 0
+    loyalty = LoyaltyProfile.objects.get(profile=profile)
+    assert loyalty.is_dirty is False
+    assert loyalty.stats["no_show_count"] == 1
+
+
+def test_refresh_dirty_endpoint_requires_worker_scope(client, settings):
+    settings.BOOKING_WORKER_API_KEY = "booking-token"  # pragma: allowlist secret
+    headers = {"HTTP_X_INTERNAL_SCOPE": "booking.worker", "HTTP_X_INTERNAL_TOKEN": "booking-token"}
+
+    assert client.post("/api/v1/booking/loyalty/refresh-dirty").status_code == 403
+    response = client.post("/api/v1/booking/loyalty/refresh-dirty", **headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "refreshed": 0}
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from system.models import Client, UserProfile
+from system.selectors.users import UserSelector
+
+
+def _user(username: str, **profile_fields) -> object:
+    user = get_user_model().objects.create_user(username=username, email=f"{username}@test.local")
+    UserProfile.objects.create(user=user, source="booking", **profile_fields)
+    return user
+
+
+def _ids(segment: str, **kwargs) -> list[str]:
+    return [item.id for item in UserSelector.get_users_grid(segment, **kwargs).items]
+
+
+def test_users_and_ghosts_are_paged_as_one_list():
+    users = [_user(f"page-{index}", first_name=f"Page {index}") for index in range(3)]
+    ghosts = [Client.objects.create(first_name=f"Ghost {index}", phone=f"+4917000000{index}") for index in range(2)]
+
+    first = UserSelector.get_users_page("all", page=1, per_page=4)
+    second = UserSelector.get_users_page("all", page=2, per_page=4)
+
+    assert first.paginator.count == 5
+    assert [item.id for item in UserSelector.build_users_grid(first).items] == [
+        *(f"user_{user.pk}" for user in users),
+        f"ghost_{ghosts[0].pk}",
+    ]
+    assert [item.id for item in UserSelector.build_users_grid(second).items] == [f"ghost_{ghosts[1].pk}"]
+
+
+def test_page_cost_does_not_grow_with_the_number_of_users(django_assert_max_num_queries):
+    for index in range(30):
+        _user(f"bulk-{index}", first_name=f"Bulk {index}")
+        Client.objects.create(first_name=f"Ghost {index}", phone=f"+4917100000{index:02d}")
+    UserSelector.get_users_grid("all", page=1)
+
+    with django_assert_max_num_queries(5):
+        grid = UserSelector.get_users_grid("all", page=1)
+
+    assert len(grid.items) == 48
+
+
+def test_search_filters_users_and_ghosts_in_sql():
+    anna = _user("anna", first_name="Anna", last_name="Schmidt")
+    _user("bob", first_name="Bob")
+    ghost = Client.objects.create(first_name="Anna", last_name="Ghost", phone="+49 170 5550101")
+
+    assert _ids("all", search="anna") == [f"user_{anna.pk}", f"ghost_{ghost.pk}"]
+    assert _ids("all", search="anna schmidt") == [f"user_{anna.pk}"]
+    assert _ids("all", search="1705550101") == [f"ghost_{ghost.pk}"]
+    assert _ids("staff", search="anna") == []
+
+
+def test_ghost_with_a_registered_email_is_shown_once():
+    user = _user("glued")
+    Client.objects.create(first_name="Glued", email="GLUED@test.local")
+    nameless = Client.objects.create(first_name="No Email")
+
+    assert _ids("clients") == [f"user_{user.pk}", f"ghost_{nameless.pk}"]
+    assert len(_ids("shadows")) == 2
@@ -6,6 +6,7 @@ from django.http import HttpResponse
 from django.test import RequestFactory
 from django.utils import timezone
 from features.booking.models import Appointment
+from features.booking.services.rollup import refresh_pending_days
 
 from lily_backend.cabinet.services.analytics import (
     AnalyticsService,
@@ -66,6 +67,7 @@ class TestAnalyticsService:
             status=Appointment.STATUS_CONFIRMED,
         )
 
+        refresh_pending_days()
         metrics = AnalyticsService.get_kpi_metrics()
         assert metrics["revenue"].value == "100"
         assert metrics["revenue"].trend_value == "+100%"
@@ -100,6 +102,7 @@ class TestAnalyticsService:
             status=Appointment.STATUS_COMPLETED,
         )
 
+        refresh_pending_days()
         data = AnalyticsService.get_chart_data()
         assert "revenue_chart" in data
         assert data["revenue_chart"]["kpi_trend"] == "+100%"
@@ -133,6 +136,7 @@ class TestAnalyticsService:
             status=Appointment.STATUS_CONFIRMED,
         )
 
+        refresh_pending_days()
         lists = AnalyticsService.get_top_lists()
         assert len(lists["top_masters"].items) == 1
         assert lists["top_masters"].items[0].label == "Test Master"
@@ -157,6 +161,7 @@ class TestAnalyticsService:
         )
 
         # Default (month)
+        refresh_pending_days()
         request = rf.get("/cabinet/reports/")
         context = AnalyticsService.get_reports_context(request)
         assert context["active_tab"] == "revenue"
@@ -239,6 +244,7 @@ class TestLilyReportsService:
         )
 
         request = rf.get("/cabinet/reports/", {"tab": "revenue", "period": "month"})
+        refresh_pending_days()
         report = LilyReportsService.build(request)
 
         assert report.active_tab == "revenue"
@@ -259,6 +265,7 @@ class TestLilyReportsService:
         )
 
         request = rf.get("/cabinet/reports/", {"tab": "services"})
+        refresh_pending_days()
         report = LilyReportsService.build(request)
         assert report.active_tab == "services"
         assert any(item for item in report.table.rows if item["service"] == "Test Service")
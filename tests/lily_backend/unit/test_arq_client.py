@@ -2,16 +2,24 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from core.arq.metrics import ARQ_CLIENT_POOLS
 
+from src.lily_backend.core.arq import client as client_module
 from src.lily_backend.core.arq.client import DjangoArqClient
 
 
+def _pool_lookups(path: str, result: str) -> float:
+    return ARQ_CLIENT_POOLS.labels(path=path, result=result)._value.get()
+
+
 @pytest.mark.unit
 class TestDjangoArqClient:
     def setup_method(self):
         # Reset class variables
         DjangoArqClient._pool = None
         DjangoArqClient._pool_loop = None
+        DjangoArqClient._sync_pool = None
+        DjangoArqClient._sync_pool_loop = None
 
     @pytest.mark.asyncio
     @patch("src.lily_backend.core.arq.client.create_pool")
@@ -70,5 +78,51 @@ class TestDjangoArqClient:
         res = DjangoArqClient.enqueue("task", {"data": 1}, queue_name="high")
 
         assert res == "sync_job"
-        # Since it uses async_to_sync, the call happens in a thread/loop
+        # The coroutine runs on the background enqueue loop
         mock_aenqueue.assert_called_with("task", {"data": 1}, queue_name="high")
+
+    @patch("src.lily_backend.core.arq.client.create_pool")
+    def test_sync_calls_reuse_one_pool(self, mock_create_pool):
+        """Sync enqueues share the background loop and its single pool."""
+        mock_pool = MagicMock(enqueue_job=AsyncMock(side_effect=lambda *a, **kw: MagicMock(job_id=kw.get("_job_id"))))
+        mock_create_pool.return_value = mock_pool
+        created, reused = _pool_lookups("sync", "created"), _pool_lookups("sync", "reused")
+
+        job_ids = [DjangoArqClient.enqueue("task", {"n": index}, job_id=f"job-{index}") for index in range(5)]
+        DjangoArqClient.enqueue_job_sync("other_task", _queue_name="notifications")
+
+        assert job_ids == [f"job-{index}" for index in range(5)]
+        mock_create_pool.assert_called_once()
+        assert mock_pool.enqueue_job.await_count == 6
+        assert _pool_lookups("sync", "created") - created == 1
+        assert _pool_lookups("sync", "reused") - reused == 5
+        assert DjangoArqClient._pool is None
+
+    @patch("src.lily_backend.core.arq.client.create_pool")
+    def test_forked_process_gets_its_own_loop_and_pool(self, mock_create_pool):
+        """A pid change (fork) starts a new background loop and pool."""
+        mock_create_pool.side_effect = lambda *a, **kw: MagicMock(enqueue_job=AsyncMock())
+        DjangoArqClient.enqueue_job_sync("task")
+        parent_pool = DjangoArqClient._sync_pool
+
+        with patch.object(client_module.os, "getpid", return_value=-1):
+            DjangoArqClient.enqueue_job_sync("task")
+
+        assert mock_create_pool.call_count == 2
+        assert DjangoArqClient._sync_pool is not parent_pool
+
+    def test_timed_out_call_is_cancelled_on_the_loop(self):
+        """A sync call that times out also stops its coroutine on the background loop."""
+        cancelled = client_module.threading.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            client_module._sync_loop.run(hang(), timeout=0.05)
+
+        assert cancelled.wait(timeout=1)
@@ -28,10 +28,10 @@ def test_django_audience_builder_count():
 
     print(f"DEBUG: All clients: {list(Client.objects.values_list('email', 'consent_marketing'))}")
 
-    # Opt-in only
+    # Opt-in only; a client without an email is never a recipient
     count1 = builder.count(AudienceFilter(email_opt_in=True, has_valid_email=False))
     print(f"DEBUG: Count 1: {count1}")
-    assert count1 == 2
+    assert count1 == 1
 
     # Valid email only
     count2 = builder.count(AudienceFilter(email_opt_in=False, has_valid_email=True))
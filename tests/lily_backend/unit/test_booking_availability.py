@@ -14,32 +14,31 @@ class TestCabinetBookingAvailability:
     def service(self, mock_gateway):
         return CabinetBookingAvailabilityService(gateway=mock_gateway)
 
-    def test_get_available_dates_logic(self, service):
-        # Mock MasterWorkingDay rows as (master_id, weekday), then no day-off blocks.
-        mock_working_days = MagicMock()
-        mock_working_days.values_list.return_value.distinct.return_value = [(1, 0), (1, 2), (1, 4)]
-        mock_days_off = MagicMock()
-        mock_days_off.values_list.return_value = []
-
-        with (
-            patch("features.booking.models.MasterWorkingDay.objects.filter", return_value=mock_working_days),
-            patch("features.booking.models.MasterDayOff.objects.filter", return_value=mock_days_off),
-        ):
-            start_date = date(2026, 4, 13)  # Monday
-            horizon = 7
-
-            available = service.get_available_dates(start_date=start_date, horizon=horizon, service_ids=[1])
-
-            # Should have 2026-04-13 (Mon), 2026-04-15 (Wed), 2026-04-17 (Fri)
-            assert "2026-04-13" in available
-            assert "2026-04-15" in available
-            assert "2026-04-17" in available
-            assert "2026-04-14" not in available
-            assert len(available) == 3
+    def test_get_available_dates_delegates_to_range_engine(self, service, mock_gateway):
+        mock_gateway.get_available_dates.return_value = {"2026-04-13", "2026-04-15"}
+
+        available = service.get_available_dates(
+            start_date=date(2026, 4, 13),
+            horizon=7,
+            service_ids=[1],
+            locked_resource_id=5,
+        )
+
+        assert available == {"2026-04-13", "2026-04-15"}
+        mock_gateway.get_available_dates.assert_called_once_with(
+            service_ids=[1],
+            start_date=date(2026, 4, 13),
+            horizon=7,
+            locked_resource_id=5,
+            resource_selections=None,
+            audience="cabinet",
+            settings=None,
+        )
 
     def test_get_available_dates_no_services(self, service):
         available = service.get_available_dates(start_date=date(2026, 4, 13), horizon=7, service_ids=[])
         assert available == set()
+        service.gateway.get_available_dates.assert_not_called()
 
     def test_build_picker_days_integration(self, service):
         # We mock the internal get_available_dates and the library build_picker_day_rows
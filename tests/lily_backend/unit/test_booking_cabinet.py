@@ -2,6 +2,7 @@ from datetime import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from features.booking.selector.snapshot import BookingSettingsSnapshot
 from features.booking.services.cabinet import BookingCabinetWorkflowService
 
 
@@ -21,11 +22,11 @@ class TestBookingCabinetWorkflow:
 
     @pytest.fixture
     def service(self, mock_provider, mock_settings):
-        with (
-            patch("features.booking.booking_settings.BookingSettings.load", return_value=mock_settings),
-            patch("features.booking.services.cabinet.CabinetBookingAvailabilityService", autospec=True),
-        ):
-            return BookingCabinetWorkflowService(provider=mock_provider)
+        with patch("features.booking.services.cabinet.CabinetBookingAvailabilityService", autospec=True):
+            return BookingCabinetWorkflowService(
+                provider=mock_provider,
+                settings=BookingSettingsSnapshot.from_settings(mock_settings),
+            )
 
     def test_client_styling_is_deterministic(self, service):
         name = "Anna Schmidt"
@@ -47,7 +48,7 @@ class TestBookingCabinetWorkflow:
             {"id": 1, "name": "Master Lily"},
             {"id": 2, "name": "Master Rose"},
         ]
-        mock_provider.get_cabinet_appointments.return_value = [
+        mock_provider.get_cabinet_schedule_appointments.return_value = [
             {
                 "id": 101,
                 "master_id": 1,
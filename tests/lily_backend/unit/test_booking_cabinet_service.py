@@ -19,9 +19,12 @@ def _mock_provider() -> MagicMock:
         {"id": 2, "name": "Rose Master"},
     ]
     prov.get_cabinet_appointments.return_value = []
+    prov.get_cabinet_appointment.return_value = None
+    prov.get_cabinet_schedule_appointments.return_value = []
     prov.get_cabinet_clients.return_value = [
         {"id": 1, "name": "Anna T", "phone": "+49111", "email": "a@t.de"},
     ]
+    prov.get_cabinet_client.return_value = {"id": 1, "name": "Anna T", "phone": "+49111", "email": "a@t.de"}
     prov.get_cabinet_services.return_value = [
         {
             "id": 10,
@@ -62,15 +65,13 @@ def _mock_settings() -> MagicMock:
 
 
 def _make_workflow(provider=None, settings=None):
+    from features.booking.selector.snapshot import BookingSettingsSnapshot
     from features.booking.services.cabinet import BookingCabinetWorkflowService
 
     prov = provider or _mock_provider()
     s = settings or _mock_settings()
-    with (
-        patch("features.booking.booking_settings.BookingSettings.load", return_value=s),
-        patch("features.booking.services.cabinet.CabinetBookingAvailabilityService"),
-    ):
-        svc = BookingCabinetWorkflowService(provider=prov)
+    with patch("features.booking.services.cabinet.CabinetBookingAvailabilityService"):
+        svc = BookingCabinetWorkflowService(provider=prov, settings=BookingSettingsSnapshot.from_settings(s))
     return svc, prov, s
 
 
@@ -140,15 +141,16 @@ class TestGetScheduleContext:
 
     def test_closed_day_falls_back_to_first_open(self):
         # Day schedule returns None for weekday 0, but (9,18) for others
-        svc, prov, s = _make_workflow()
+        s = _mock_settings()
         s.get_day_schedule.side_effect = lambda wd: (time(9, 0), time(18, 0)) if wd != 0 else None
+        svc, prov, _ = _make_workflow(settings=s)
         # Monday 2026-05-11 weekday=0 → fallback to Tuesday schedule
         ctx = svc.get_schedule_context(self._request("2026-05-11"))
         assert "rows" in ctx
 
     def test_appointments_rendered_as_calendar_slots(self):
         prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
+        prov.get_cabinet_schedule_appointments.return_value = [
             {
                 "id": 1,
                 "master_id": 1,
@@ -171,7 +173,7 @@ class TestGetScheduleContext:
     def test_appointment_with_new_client_badge(self):
         prov = _mock_provider()
         recent_dt = (datetime.now() - timedelta(days=1)).isoformat()
-        prov.get_cabinet_appointments.return_value = [
+        prov.get_cabinet_schedule_appointments.return_value = [
             {
                 "id": 2,
                 "master_id": 1,
@@ -194,7 +196,7 @@ class TestGetScheduleContext:
 
     def test_appointment_long_duration_indicator(self):
         prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
+        prov.get_cabinet_schedule_appointments.return_value = [
             {
                 "id": 3,
                 "master_id": 1,
@@ -217,7 +219,7 @@ class TestGetScheduleContext:
 
     def test_appointment_unknown_master_skipped(self):
         prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
+        prov.get_cabinet_schedule_appointments.return_value = [
             {
                 "id": 4,
                 "master_id": 99,  # not in masters list
@@ -237,31 +239,24 @@ class TestGetScheduleContext:
         ctx = svc.get_schedule_context(self._request("2026-05-11"))
         assert ctx["calendar"].events == []
 
+    def test_schedule_queries_only_the_requested_day(self):
+        svc, prov, _ = _make_workflow()
+        svc.get_schedule_context(self._request("2026-05-11"))
+        prov.get_cabinet_appointments.assert_not_called()
+        kwargs = prov.get_cabinet_schedule_appointments.call_args.kwargs
+        assert kwargs["date_from"] == datetime(2026, 5, 11).date()
+        assert kwargs["resource_ids"] == [1, 2]
+
     def test_cancelled_appointment_is_hidden_from_schedule_by_default(self):
-        prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
-            {
-                "id": 5,
-                "master_id": 1,
-                "date": "2026-05-11",
-                "time": "10:00",
-                "duration": 60,
-                "client_name": "Cancelled Client",
-                "status": "cancelled",
-                "service_title": "Cut",
-                "price": 50,
-                "admin_notes": "",
-                "client_notes": "",
-                "client_created_at": None,
-            }
-        ]
-        svc, _, _ = _make_workflow(provider=prov)
-        ctx = svc.get_schedule_context(self._request("2026-05-11"))
-        assert ctx["calendar"].events == []
+        svc, prov, _ = _make_workflow()
+        svc.get_schedule_context(self._request("2026-05-11"))
+        statuses = prov.get_cabinet_schedule_appointments.call_args.kwargs["statuses"]
+        assert "cancelled" not in statuses
+        assert "confirmed" in statuses
 
     def test_cancelled_appointment_can_be_shown_with_optional_layer(self):
         prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
+        prov.get_cabinet_schedule_appointments.return_value = [
             {
                 "id": 6,
                 "master_id": 1,
@@ -281,6 +276,7 @@ class TestGetScheduleContext:
         req.GET.get.side_effect = lambda k, d=None: {"date": "2026-05-11", "show_cancelled": "1"}.get(k, d)
         svc, _, _ = _make_workflow(provider=prov)
         ctx = svc.get_schedule_context(req)
+        assert "cancelled" in prov.get_cabinet_schedule_appointments.call_args.kwargs["statuses"]
         assert len(ctx["calendar"].events) == 1
 
 
@@ -439,31 +435,36 @@ class TestGetListContext:
             "client_created_at": None,
         }
 
-    def test_no_filter_returns_all(self):
+    def _provider(self, rows: list[dict]) -> MagicMock:
+        """Provider whose list queryset is a plain list filtered by the requested status."""
         prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
-            self._appt("pending"),
-            self._appt("confirmed"),
+        prov.get_cabinet_appointments_queryset.side_effect = lambda **kw: [
+            row for row in rows if kw.get("status") in (None, "all") or row["status"] == kw["status"]
         ]
+        prov.serialize_cabinet_appointment.side_effect = lambda row: row
+        counts: dict[str, int] = {}
+        for row in rows:
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+        prov.get_cabinet_appointment_status_counts.return_value = counts
+        return prov
+
+    def test_no_filter_returns_all(self):
+        prov = self._provider([self._appt("pending"), self._appt("confirmed")])
         svc, _, _ = _make_workflow(provider=prov)
         ctx = svc.get_list_context(MagicMock())
         assert len(ctx["appointments"]) == 2
         assert ctx["counts"]["all"] == 2
 
     def test_status_filter(self):
-        prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [
-            self._appt("pending"),
-            self._appt("confirmed"),
-        ]
+        prov = self._provider([self._appt("pending"), self._appt("confirmed")])
         svc, _, _ = _make_workflow(provider=prov)
         ctx = svc.get_list_context(MagicMock(), status="pending")
         assert len(ctx["appointments"]) == 1
         assert ctx["appointments"][0]["status"] == "pending"
+        assert prov.get_cabinet_appointments_queryset.call_args.kwargs["status"] == "pending"
 
     def test_appointments_have_master_name(self):
-        prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [self._appt("confirmed")]
+        prov = self._provider([self._appt("confirmed")])
         svc, _, _ = _make_workflow(provider=prov)
         ctx = svc.get_list_context(MagicMock())
         row = ctx["appointments"][0]
@@ -472,8 +473,7 @@ class TestGetListContext:
         assert "status_color" in row
 
     def test_paginates_rows_and_counts_before_pagination(self):
-        prov = _mock_provider()
-        prov.get_cabinet_appointments.return_value = [self._appt("pending") | {"id": idx} for idx in range(20)]
+        prov = self._provider([self._appt("pending") | {"id": idx} for idx in range(20)])
         req = MagicMock()
         req.GET.get.side_effect = lambda key, default=None: {"page": "2", "status": "pending"}.get(key, default)
         svc, _, _ = _make_workflow(provider=prov)
@@ -481,7 +481,10 @@ class TestGetListContext:
         assert len(ctx["appointments"]) == 5
         assert ctx["counts"]["all"] == 20
         assert ctx["counts"]["pending"] == 20
+        assert ctx["counts"]["no_show"] == 0
         assert ctx["page_obj"].number == 2
+        prov.get_cabinet_appointments.assert_not_called()
+        assert prov.serialize_cabinet_appointment.call_count == 5
 
 
 # ── BookingCabinetBridgeAdapter ───────────────────────────────────────────────
@@ -589,20 +592,20 @@ class TestBridgeGetModalState:
 
     def test_mode_not_found(self):
         bridge, prov = _make_bridge()
-        prov.get_cabinet_appointments.return_value = []  # empty → not found
+        prov.get_cabinet_appointment.return_value = None  # missing → not found
         state = bridge.get_modal_state(self._req(), booking_id=99, mode="detail")
         assert state.title == "Not Found"
 
     def test_mode_detail_pending_has_confirm_action(self):
         bridge, prov = _make_bridge()
-        prov.get_cabinet_appointments.return_value = [self._appt_dict()]
+        prov.get_cabinet_appointment.return_value = self._appt_dict()
         state = bridge.get_modal_state(self._req(), booking_id=10, mode="detail")
         action_values = [a.value for a in state.actions]
         assert "confirm" in action_values
 
     def test_mode_confirm(self):
         bridge, prov = _make_bridge()
-        prov.get_cabinet_appointments.return_value = [self._appt_dict()]
+        prov.get_cabinet_appointment.return_value = self._appt_dict()
         state = bridge.get_modal_state(self._req(), booking_id=10, mode="confirm")
         assert state.mode == "confirm"
         assert state.form is not None
@@ -610,7 +613,7 @@ class TestBridgeGetModalState:
 
     def test_mode_cancel(self):
         bridge, prov = _make_bridge()
-        prov.get_cabinet_appointments.return_value = [self._appt_dict()]
+        prov.get_cabinet_appointment.return_value = self._appt_dict()
         state = bridge.get_modal_state(self._req(), booking_id=10, mode="cancel")
         assert state.mode == "cancel"
         assert state.form is not None
@@ -618,7 +621,7 @@ class TestBridgeGetModalState:
 
     def test_mode_reschedule(self):
         bridge, prov = _make_bridge()
-        prov.get_cabinet_appointments.return_value = [self._appt_dict()]
+        prov.get_cabinet_appointment.return_value = self._appt_dict()
         state = bridge.get_modal_state(self._req(date="2026-05-12"), booking_id=10, mode="reschedule")
         assert state.mode == "reschedule"
         assert state.slot_picker is not None
@@ -626,7 +629,7 @@ class TestBridgeGetModalState:
     def test_mode_detail_confirmed_no_confirm_action(self):
         bridge, prov = _make_bridge()
         appt = {**self._appt_dict(), "status": "confirmed"}
-        prov.get_cabinet_appointments.return_value = [appt]
+        prov.get_cabinet_appointment.return_value = appt
         state = bridge.get_modal_state(self._req(), booking_id=10, mode="detail")
         action_values = [a.value for a in state.actions]
         assert "confirm" not in action_values
@@ -634,7 +637,7 @@ class TestBridgeGetModalState:
     def test_mode_detail_confirmed_has_complete_and_no_show_actions(self):
         bridge, prov = _make_bridge()
         appt = {**self._appt_dict(), "status": "confirmed"}
-        prov.get_cabinet_appointments.return_value = [appt]
+        prov.get_cabinet_appointment.return_value = appt
         state = bridge.get_modal_state(self._req(), booking_id=10, mode="detail")
         action_values = [a.value for a in state.actions]
         assert "complete" in action_values
@@ -643,12 +646,30 @@ class TestBridgeGetModalState:
     def test_mode_detail_completed_is_terminal(self):
         bridge, prov = _make_bridge()
         appt = {**self._appt_dict(), "status": "completed"}
-        prov.get_cabinet_appointments.return_value = [appt]
+        prov.get_cabinet_appointment.return_value = appt
         state = bridge.get_modal_state(self._req(), booking_id=10, mode="detail")
         action_values = [a.value for a in state.actions]
         assert action_values == [""]
         assert state.actions[0].kind == "close"
 
+    def test_appointment_is_fetched_once_per_request(self):
+        bridge, prov = _make_bridge()
+        prov.get_cabinet_appointment.return_value = self._appt_dict()
+        req = self._req()
+        bridge.get_modal_state(req, booking_id=10, mode="detail")
+        bridge.get_modal_state(req, booking_id=10, mode="confirm")
+        prov.get_cabinet_appointment.assert_called_once_with(10)
+        prov.get_cabinet_appointments.assert_not_called()
+
+    def test_memo_is_dropped_after_action(self):
+        bridge, prov = _make_bridge()
+        prov.get_cabinet_appointment.return_value = self._appt_dict()
+        req = self._req()
+        bridge.get_modal_state(req, booking_id=10, mode="detail")
+        bridge.execute_action(req, booking_id=10, action="confirm", payload={})
+        bridge.get_modal_state(req, booking_id=10, mode="detail")
+        assert prov.get_cabinet_appointment.call_count == 2
+
 
 @pytest.mark.unit
 class TestBridgeExecuteAction:
@@ -797,9 +818,6 @@ class TestGetBookingBridgeAndWorkflow:
 
         # Reset singleton so the test creates a fresh one
         cab_module._cabinet_workflow = None
-        with (
-            patch("features.booking.booking_settings.BookingSettings.load", return_value=_mock_settings()),
-            patch("features.booking.services.cabinet.CabinetBookingAvailabilityService"),
-        ):
+        with patch("features.booking.services.cabinet.CabinetBookingAvailabilityService"):
             w = get_booking_cabinet_workflow()
         assert w is get_booking_cabinet_workflow()
@@ -0,0 +1,178 @@
+"""Unit tests for features/booking/selector/catalog.py and the provider catalog methods."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import connection, transaction
+from features.booking.providers.runtime import RuntimeBookingProvider
+from features.booking.redis import BookingCatalogManager
+from features.booking.selector import catalog
+from features.booking.selector.catalog import (
+    BookableCatalogSnapshot,
+    get_bookable_catalog,
+    load_bookable_catalog,
+)
+from features.booking.selector.versioned import VersionedCache
+
+
+@pytest.fixture
+def catalog_manager(monkeypatch, fake_sync_redis):
+    """Catalog version and payload backed by fakeredis with Redis enabled.
+
+    Request it after fixtures that write catalog rows: their on_commit bump never fires in tests.
+    """
+    manager = BookingCatalogManager(sync_client_factory=lambda: fake_sync_redis)
+    monkeypatch.setattr(BookingCatalogManager, "_is_disabled", lambda self: False)
+    monkeypatch.setattr(catalog, "get_catalog_manager", lambda: manager)
+    monkeypatch.setattr(catalog, "_cache", VersionedCache("Booking catalog", lambda: manager))
+    monkeypatch.setattr(connection, catalog.PENDING_WRITE_ATTR, False, raising=False)
+    return manager
+
+
+@pytest.fixture
+def services(master):
+    from features.main.models import ServiceConflictRule
+    from tests.factories import ServiceCategoryFactory, ServiceFactory
+
+    category = ServiceCategoryFactory(slug="nails", bento_group="nails")
+    rows = [ServiceFactory(category=category, slug=f"service-{index}", order=index) for index in range(6)]
+    for row in rows:
+        row.masters.add(master)
+    ServiceConflictRule.objects.create(source=rows[0], target=rows[1], rule_type=ServiceConflictRule.EXCLUDES)
+    return rows
+
+
+# ── Loading ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestLoadBookableCatalog:
+    def test_query_count_does_not_grow_with_services(self, services, django_assert_num_queries):
+        with django_assert_num_queries(3):
+            loaded = load_bookable_catalog()
+
+        assert [service.id for service in loaded.services] == [service.pk for service in services]
+        assert all(service.master_ids for service in loaded.services)
+        assert loaded.rules_for(services[0].pk) == [{"target_id": services[1].pk, "rule_type": "excludes"}]
+
+    def test_payload_round_trip(self, services):
+        loaded = load_bookable_catalog()
+
+        restored = BookableCatalogSnapshot.from_payload(loaded.to_payload())
+
+        assert restored.services == loaded.services
+        assert dict(restored.categories) == dict(loaded.categories)
+        assert dict(restored.conflict_rules) == dict(loaded.conflict_rules)
+
+    def test_provider_methods_serve_from_one_snapshot(self, monkeypatch, services, django_assert_num_queries):
+        provider = RuntimeBookingProvider()
+        loaded = load_bookable_catalog()
+        monkeypatch.setattr("features.booking.providers.runtime.get_bookable_catalog", lambda: loaded)
+
+        with django_assert_num_queries(0):
+            cabinet = provider.get_cabinet_services()
+            public = provider.get_public_services()
+            categories = provider.get_service_categories()
+
+        assert cabinet[0]["conflicts_with"] == [services[1].pk]
+        assert public[0]["category_slug"] == "nails"
+        assert [category.slug for category in categories] == ["nails"]
+
+
+# ── Process and Redis cache ──────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestGetBookableCatalog:
+    def test_reused_until_a_catalog_write(self, services, catalog_manager, master, django_assert_num_queries):
+        first = get_bookable_catalog()
+
+        with django_assert_num_queries(0):
+            assert get_bookable_catalog() is first
+
+        services[0].masters.remove(master)
+
+        assert services[0].pk not in {service.id for service in get_bookable_catalog().services}
+
+    def test_other_process_reads_the_shared_payload(self, services, catalog_manager, django_assert_num_queries):
+        get_bookable_catalog()
+        catalog._cache.clear()
+
+        with django_assert_num_queries(0):
+            shared = get_bookable_catalog()
+
+        assert [service.id for service in shared.services] == [service.pk for service in services]
+
+    def test_uncommitted_write_bypasses_shared_payload(self, services, catalog_manager, master):
+        first = get_bookable_catalog()
+
+        services[0].masters.remove(master)
+        assert catalog._has_pending_write()
+
+        latest = get_bookable_catalog()
+        assert services[0].pk not in {service.id for service in latest.services}
+        # Built from uncommitted rows, so not cached for other threads.
+        assert get_bookable_catalog() is not latest
+        assert latest is not first
+
+    def test_shared_version_bump_reloads(self, services, catalog_manager):
+        first = get_bookable_catalog()
+
+        catalog_manager.bump_version()
+
+        assert get_bookable_catalog() is not first
+
+    def test_disabled_redis_loads_every_time(self, services, django_assert_num_queries):
+        get_bookable_catalog()
+
+        with django_assert_num_queries(3):
+            get_bookable_catalog()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_write_stops_bypassing_shared_payload(services, catalog_manager, master, django_assert_num_queries):
+    get_bookable_catalog()
+    catalog._cache.clear()
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        services[0].masters.remove(master)
+        raise RuntimeError("rollback")
+
+    with django_assert_num_queries(0):
+        shared = get_bookable_catalog()
+
+    assert services[0].pk in {service.id for service in shared.services}
+    assert not catalog._has_pending_write()
+
+
+# ── Cart conflict graph ──────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestCartConflictGraph:
+    def test_excludes_block_in_both_directions(self, services):
+        graph = load_bookable_catalog().cart_graph
+
+        assert graph.resolve_add(services[0].pk, [services[1].pk]) is None
+        assert graph.resolve_add(services[1].pk, [services[0].pk]) is None
+        assert graph.resolve_add(services[2].pk, [services[0].pk]) == ()
+
+    def test_replaces_only_targets_in_the_cart(self, services):
+        from features.main.models import ServiceConflictRule
+
+        for target in services[3:5]:
+            ServiceConflictRule.objects.create(
+                source=services[2], target=target, rule_type=ServiceConflictRule.REPLACES
+            )
+        graph = load_bookable_catalog().cart_graph
+
+        assert graph.resolve_add(services[2].pk, [services[4].pk, services[5].pk]) == (services[4].pk,)
+        assert graph.resolve_add(services[4].pk, [services[2].pk]) == ()
+
+    def test_built_once_per_snapshot_with_grouped_categories(self, services):
+        loaded = load_bookable_catalog()
+
+        assert loaded.cart_graph is loaded.cart_graph
+        assert [group["slug"] for group in loaded.cart_graph.categories] == ["nails"]
+        assert [row["id"] for row in loaded.cart_graph.categories[0]["services"]] == [s.pk for s in services]
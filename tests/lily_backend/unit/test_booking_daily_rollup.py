@@ -0,0 +1,173 @@
+"""Unit tests for features/booking/services/rollup.py and its analytics readers."""
+
+from __future__ import annotations
+
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+from cabinet.services.analytics import AnalyticsService
+from cabinet.services.reports import LilyReportsService
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from features.booking.models import Appointment, AppointmentDailyRollup, AppointmentRollupPendingDay
+from features.booking.services.rollup import refresh_pending_days, rollup_rows
+
+DAY = dt.date(2026, 5, 11)
+
+
+def _book(client_obj, master, service, day: dt.date = DAY, hour: int = 10, **kwargs) -> Appointment:
+    defaults = {
+        "client": client_obj,
+        "master": master,
+        "service": service,
+        "datetime_start": timezone.make_aware(dt.datetime.combine(day, dt.time(hour))),
+        "duration_minutes": 60,
+        "price": Decimal("50.00"),
+        "status": Appointment.STATUS_CONFIRMED,
+    }
+    defaults.update(kwargs)
+    return Appointment.objects.create(**defaults)
+
+
+def _pending() -> set[dt.date]:
+    return set(AppointmentRollupPendingDay.objects.values_list("day", flat=True))
+
+
+# ── Rollup maintenance ───────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestDailyRollup:
+    def test_rebuild_groups_by_master_service_and_status(self, client_obj, master, service):
+        from system.models import Client
+
+        other = Client.objects.create(first_name="Other", phone="+49111000777")
+        _book(client_obj, master, service, hour=9, price_actual=Decimal("70.00"))
+        _book(other, master, service, hour=11)
+        _book(client_obj, master, service, hour=13, status=Appointment.STATUS_CANCELLED)
+
+        refresh_pending_days()
+        rows = {row.status: row for row in rollup_rows(DAY, DAY)}
+
+        confirmed = rows[Appointment.STATUS_CONFIRMED]
+        assert (confirmed.appointment_count, confirmed.revenue) == (2, Decimal("120.00"))
+        assert rows[Appointment.STATUS_CANCELLED].appointment_count == 1
+        assert _pending() == set()
+
+    def test_writes_mark_old_and_new_day(self, client_obj, master, service):
+        appointment = _book(client_obj, master, service)
+        refresh_pending_days()
+
+        appointment.client_notes = "window seat"
+        appointment.save(update_fields=["client_notes", "updated_at"])
+        assert _pending() == set()
+
+        appointment.datetime_start += dt.timedelta(days=1)
+        appointment.save(update_fields=["datetime_start", "updated_at"])
+        assert _pending() == {DAY, DAY + dt.timedelta(days=1)}
+
+        refresh_pending_days()
+        assert list(AppointmentDailyRollup.objects.values_list("day", flat=True)) == [DAY + dt.timedelta(days=1)]
+
+        appointment.delete()
+        refresh_pending_days()
+        assert not AppointmentDailyRollup.objects.exists()
+
+    def test_auto_completion_marks_days(self, client_obj, master, service):
+        from features.booking.services.completion import complete_finished_confirmed_appointments
+
+        _book(client_obj, master, service)
+        refresh_pending_days()
+
+        complete_finished_confirmed_appointments(now=timezone.make_aware(dt.datetime.combine(DAY, dt.time(12))))
+
+        assert _pending() == {DAY}
+        refresh_pending_days()
+        assert rollup_rows(DAY, DAY).get().status == Appointment.STATUS_COMPLETED
+
+    def test_refresh_only_touches_the_requested_window(self, client_obj, master, service):
+        _book(client_obj, master, service)
+        _book(client_obj, master, service, day=DAY + dt.timedelta(days=40))
+
+        assert refresh_pending_days(DAY, DAY) == 1
+
+        assert _pending() == {DAY + dt.timedelta(days=40)}
+
+    def test_refresh_stops_at_the_limit_oldest_first(self, client_obj, master, service):
+        for offset in range(3):
+            _book(client_obj, master, service, day=DAY + dt.timedelta(days=offset))
+
+        assert refresh_pending_days(limit=2) == 2
+
+        assert _pending() == {DAY + dt.timedelta(days=2)}
+
+    def test_readers_do_not_rebuild_pending_days(self, client_obj, master, service):
+        _book(client_obj, master, service)
+
+        assert list(rollup_rows(DAY, DAY)) == []
+        assert _pending() == {DAY}
+
+
+# ── Readers ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestRollupReaders:
+    def _report_queries(self, tab: str) -> int:
+        request = RequestFactory().get("/cabinet/analytics/reports/", {"tab": tab, "period": "month"})
+        with CaptureQueriesContext(connection) as queries:
+            LilyReportsService.build(request)
+        return len(queries)
+
+    def _dashboard_queries(self) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            AnalyticsService.get_kpi_metrics()
+            AnalyticsService.get_chart_data()
+            AnalyticsService.get_top_lists()
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_history(self, client_obj, master, service):
+        today = timezone.localdate()
+        _book(client_obj, master, service, day=today)
+        refresh_pending_days()
+        baseline = {tab: self._report_queries(tab) for tab in ("revenue", "services")}
+        dashboard = self._dashboard_queries()
+
+        for days_ago in range(30, 3650, 45):
+            _book(client_obj, master, service, day=today - dt.timedelta(days=days_ago))
+        refresh_pending_days()
+
+        assert {tab: self._report_queries(tab) for tab in ("revenue", "services")} == baseline
+        assert self._dashboard_queries() == dashboard
+
+    def test_revenue_report_reads_rollup(self, client_obj, master, service):
+        today = timezone.localdate()
+        _book(client_obj, master, service, day=today, price_actual=Decimal("80.00"))
+        _book(client_obj, master, service, day=today, hour=12, status=Appointment.STATUS_PENDING)
+        refresh_pending_days()
+
+        request = RequestFactory().get("/cabinet/analytics/reports/", {"tab": "revenue", "period": "week"})
+        report = LilyReportsService.build(request)
+
+        assert report.table.summary_row["revenue"] == "€80"
+        assert report.table.summary_row["bookings"] == 2
+        assert report.table.summary_row["completed"] == "0 / 2"
+
+
+# ── Worker endpoint ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+def test_refresh_rollup_endpoint_rebuilds_pending_days(client, settings, client_obj, master, service):
+    settings.BOOKING_WORKER_API_KEY = "booking-token"  # pragma: allowlist secret
+    _book(client_obj, master, service)
+    headers = {"HTTP_X_INTERNAL_SCOPE": "booking.worker", "HTTP_X_INTERNAL_TOKEN": "booking-token"}
+
+    assert client.post("/api/v1/booking/analytics/refresh-rollup").status_code == 403
+    response = client.post("/api/v1/booking/analytics/refresh-rollup", **headers)
+
+    assert response.json() == {"success": True, "rebuilt_days": 1}
+    assert AppointmentDailyRollup.objects.filter(day=DAY).exists()
@@ -0,0 +1,148 @@
+"""Unit tests for features/booking/selector/grid.py and its gateway consumers."""
+
+from __future__ import annotations
+
+import datetime as dt
+import random
+
+import pytest
+from django.utils import timezone
+from features.booking.selector.engine import BookingRuntimeEngineGateway
+from features.booking.selector.grid import MinuteDayGrid
+from features.booking.selector.intervals import MasterDayIntervals
+
+MONDAY = dt.date(2026, 5, 11)
+HOURS = (dt.time(9, 0), dt.time(18, 0))
+
+
+def _busy(start: str, minutes: int, appointment_id: int = 1) -> tuple[dt.datetime, dt.datetime, int]:
+    local = timezone.make_aware(dt.datetime.combine(MONDAY, dt.time.fromisoformat(start)))
+    utc = local.astimezone(dt.UTC)
+    return utc, utc + dt.timedelta(minutes=minutes), appointment_id
+
+
+def _naive_starts(day: MasterDayIntervals, duration: int, step: int) -> list[str]:
+    """The per-step overlap scan the grid replaces."""
+    window_start = timezone.make_aware(dt.datetime.combine(MONDAY, day.hours[0]))
+    window_end = timezone.make_aware(dt.datetime.combine(MONDAY, day.hours[1]))
+    current, starts = window_start, []
+    while current + dt.timedelta(minutes=duration) <= window_end:
+        end = current + dt.timedelta(minutes=duration)
+        if all(end <= busy_start or current >= busy_end for busy_start, busy_end, _ in day.busy):
+            starts.append(current.strftime("%H:%M"))
+        current += dt.timedelta(minutes=step)
+    return starts
+
+
+def _book(master, service, start: str, minutes: int = 60):
+    from features.booking.models import Appointment
+
+    return Appointment.objects.create(
+        master=master,
+        service=service,
+        datetime_start=timezone.make_aware(dt.datetime.combine(MONDAY, dt.time.fromisoformat(start))),
+        duration_minutes=minutes,
+        price="50.00",
+        status=Appointment.STATUS_CONFIRMED,
+    )
+
+
+# ── MinuteDayGrid ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestMinuteDayGrid:
+    def test_closed_day_has_no_grid(self):
+        assert MinuteDayGrid.build(MasterDayIntervals(hours=None), MONDAY) is None
+
+    def test_free_runs_stop_at_busy_ranges_and_window_end(self):
+        day = MasterDayIntervals(hours=HOURS, busy=(_busy("08:30", 60), _busy("12:00", 30, 2)))
+
+        grid = MinuteDayGrid.build(day, MONDAY)
+
+        assert len(grid) == 9 * 60
+        assert grid.free_runs[0] == 0
+        assert grid.free_runs[30] == 150
+        assert grid.free_runs[len(grid) - 1] == 1
+
+    def test_can_start(self):
+        grid = MinuteDayGrid.build(MasterDayIntervals(hours=HOURS, busy=(_busy("12:00", 30),)), MONDAY)
+
+        assert grid.can_start(dt.time(11, 0), 60) is True
+        assert grid.can_start(dt.time(11, 1), 60) is False
+        assert grid.can_start(dt.time(12, 30), 330) is True
+        assert grid.can_start(dt.time(17, 30), 31) is False
+        assert grid.can_start(dt.time(8, 30), 30) is False
+
+    def test_excluded_appointment_is_free(self):
+        day = MasterDayIntervals(hours=HOURS, busy=(_busy("12:00", 30, appointment_id=7),))
+
+        grid = MinuteDayGrid.build(day, MONDAY, exclude_ids={7})
+
+        assert grid.free_runs[0] == 9 * 60
+
+    @pytest.mark.parametrize(("duration", "step"), [(30, 30), (60, 30), (45, 15), (90, 60)])
+    def test_free_starts_match_overlap_scan(self, duration, step):
+        rng = random.Random(duration * 100 + step)
+        for _ in range(25):
+            busy = sorted(
+                _busy(f"{rng.randrange(8, 18):02d}:{rng.randrange(0, 60, 5):02d}", rng.choice([15, 30, 45, 90]), index)
+                for index in range(rng.randrange(0, 8))
+            )
+            day = MasterDayIntervals(hours=HOURS, busy=tuple(busy))
+
+            assert MinuteDayGrid.build(day, MONDAY).free_starts(duration, step) == _naive_starts(day, duration, step)
+
+
+# ── Gateway ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestGatewayDayGrid:
+    def test_bulk_day_slots_for_all_masters(self, master, service, booking_settings, django_assert_max_num_queries):
+        from tests.factories import MasterFactory
+
+        others = [MasterFactory() for _ in range(5)]
+        _book(master, service, "09:00", minutes=8 * 60)
+        ids = [master.pk, *(other.pk for other in others)]
+
+        with django_assert_max_num_queries(5):
+            slots = BookingRuntimeEngineGateway().get_resources_day_slots(
+                resource_ids=ids,
+                target_date=MONDAY,
+                duration_minutes=60,
+                audience="cabinet",
+            )
+
+        assert slots[master.pk] == ["17:00"]
+        assert all(slots[other.pk][0] == "09:00" for other in others)
+
+    def test_resources_free_at_keeps_order_and_respects_duration(self, master, service, booking_settings):
+        from tests.factories import MasterFactory
+
+        other = MasterFactory()
+        _book(master, service, "11:00")
+        gateway = BookingRuntimeEngineGateway()
+
+        def free_at(start: str, minutes: int, **kwargs):
+            return gateway.get_resources_free_at(
+                resource_ids=[other.pk, master.pk],
+                target_date=MONDAY,
+                start_time=dt.time.fromisoformat(start),
+                duration_minutes=minutes,
+                **kwargs,
+            )
+
+        assert free_at("10:00", 60) == [other.pk, master.pk]
+        assert free_at("10:00", 90) == [other.pk]
+        appointment_id = master.appointments.get().pk
+        assert free_at("10:00", 90, exclude_appointment_id=appointment_id) == [other.pk, master.pk]
+
+    def test_prefill_outside_master_columns_picks_first_free_master(self, master, service, booking_settings):
+        from features.booking.providers.runtime import RuntimeBookingProvider
+
+        _book(master, service, "10:00")
+        provider = RuntimeBookingProvider()
+
+        assert provider.get_schedule_prefill(schedule_date=MONDAY.isoformat(), col=99, row=2).resource_id == master.pk
+        assert provider.get_schedule_prefill(schedule_date=MONDAY.isoformat(), col=99, row=4).resource_id is None
@@ -2,7 +2,8 @@
 
 Tests: EmptyAvailableSlots, LoadAwareDjangoAvailabilityAdapter priority/load
 sorting, _row_to_time, BookingRuntimeEngineGateway.get_resource_day_slots,
-get_available_slots (audience filtering, fallback).
+get_available_slots (audience filtering, fallback), get_available_dates
+(range availability engine).
 """
 
 from __future__ import annotations
@@ -163,9 +164,7 @@ class TestLilyBookingAvailabilityAdapter:
         assert start.tzinfo.key == "Europe/Berlin"
         assert start.astimezone(dt.UTC).time() == dt.time(6, 0)
 
-    def test_working_hours_treat_scaffold_utc_master_timezone_as_project_timezone(
-        self, db, master, booking_settings
-    ):
+    def test_working_hours_treat_scaffold_utc_master_timezone_as_project_timezone(self, db, master, booking_settings):
         booking_settings.monday_is_closed = False
         booking_settings.work_start_monday = dt.time(8, 0)
         booking_settings.work_end_monday = dt.time(18, 0)
@@ -439,6 +438,130 @@ class TestGetAvailableSlots:
         assert slots.get_unique_start_times() == ["08:00", "08:45", "09:00"]
 
 
+# ── BookingRuntimeEngineGateway: get_available_dates ─────────────────────────
+
+
+def _book(master, service, start: dt.datetime, minutes: int, status: str = "confirmed"):
+    from features.booking.models import Appointment
+
+    return Appointment.objects.create(
+        master=master,
+        service=service,
+        datetime_start=timezone.make_aware(start),
+        duration_minutes=minutes,
+        price="50.00",
+        status=status,
+    )
+
+
+@pytest.mark.unit
+class TestGetAvailableDates:
+    MONDAY = dt.date(2026, 5, 11)
+
+    def _dates(self, service_ids, *, start_date=None, horizon=7, **kwargs):
+        return BookingRuntimeEngineGateway().get_available_dates(
+            service_ids=service_ids,
+            start_date=start_date or self.MONDAY,
+            horizon=horizon,
+            audience=kwargs.pop("audience", "cabinet"),
+            **kwargs,
+        )
+
+    def test_open_weekdays_are_available(self, db, master, service, booking_settings):
+        # Sunday is closed in BookingSettings even though the master works every day.
+        assert self._dates([service.pk]) == {(self.MONDAY + dt.timedelta(days=i)).isoformat() for i in range(6)}
+
+    def test_day_off_and_missing_working_day_are_excluded(self, db, master, service, booking_settings):
+        from features.booking.models import MasterDayOff
+
+        MasterDayOff.objects.create(master=master, date=self.MONDAY)
+        master.working_days.filter(weekday=1).delete()
+
+        dates = self._dates([service.pk], horizon=3)
+
+        assert dates == {"2026-05-13"}
+
+    def test_fully_booked_day_is_excluded(self, db, master, service, booking_settings):
+        _book(master, service, dt.datetime(2026, 5, 11, 9, 0), 9 * 60)
+        _book(master, service, dt.datetime(2026, 5, 12, 9, 0), 9 * 60, status="cancelled")
+
+        assert self._dates([service.pk], horizon=2) == {"2026-05-12"}
+
+    def test_multi_service_cart_needs_a_sequential_fit(self, db, master, service, category, booking_settings):
+        from features.main.models import Service
+
+        second = Service.objects.create(
+            category=category, name="Second", slug="second", price="10.00", duration=60, is_active=True
+        )
+        # Leaves only 16:00–18:00 on Monday and 17:00–18:00 on Tuesday.
+        _book(master, service, dt.datetime(2026, 5, 11, 9, 0), 7 * 60)
+        _book(master, service, dt.datetime(2026, 5, 12, 9, 0), 8 * 60)
+
+        assert self._dates([service.pk], horizon=2) == {"2026-05-11", "2026-05-12"}
+        assert self._dates([service.pk, second.pk], horizon=2) == {"2026-05-11"}
+
+    def test_category_booking_start_time_is_respected(self, db, master, service, booking_settings):
+        service.category.booking_start_time = dt.time(17, 0)
+        service.category.save(update_fields=["booking_start_time"])
+        _book(master, service, dt.datetime(2026, 5, 11, 17, 0), 60)
+
+        assert self._dates([service.pk], horizon=2) == {"2026-05-12"}
+
+    def test_masters_outside_service_category_are_ignored(self, db, service, booking_settings):
+        from tests.factories import MasterFactory
+
+        MasterFactory()
+
+        assert self._dates([service.pk]) == set()
+
+    def test_locked_resource_limits_candidates(self, db, master, service, booking_settings):
+        from tests.factories import MasterFactory
+
+        other = MasterFactory(categories=[service.category])
+        _book(master, service, dt.datetime(2026, 5, 11, 9, 0), 9 * 60)
+
+        assert "2026-05-11" in self._dates([service.pk], horizon=1)
+        assert self._dates([service.pk], horizon=1, locked_resource_id=master.pk) == set()
+        assert self._dates([service.pk], horizon=1, locked_resource_id=other.pk) == {"2026-05-11"}
+
+    def test_public_audience_skips_today_when_next_day_only(self, db, master, service, booking_settings):
+        booking_settings.book_only_from_next_day = True
+        booking_settings.save()
+        today = dt.date.today()
+
+        dates = self._dates([service.pk], start_date=today, horizon=2, audience="public")
+
+        assert today.isoformat() not in dates
+
+    def test_matches_single_day_slot_search(self, db, master, service, booking_settings):
+        _book(master, service, dt.datetime(2026, 5, 11, 9, 0), 9 * 60)
+        _book(master, service, dt.datetime(2026, 5, 13, 9, 0), 8 * 60 + 30)
+        gateway = BookingRuntimeEngineGateway()
+
+        dates = self._dates([service.pk])
+
+        for offset in range(7):
+            target = self.MONDAY + dt.timedelta(days=offset)
+            slots = gateway.get_available_slots(service_ids=[service.pk], target_date=target, audience="cabinet")
+            assert (target.isoformat() in dates) == bool(slots.get_unique_start_times()), target
+
+    def test_query_count_does_not_grow_with_horizon(self, db, master, service, booking_settings):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from features.booking.models import MasterDayOff
+
+        for offset in range(0, 60, 3):
+            MasterDayOff.objects.create(master=master, date=self.MONDAY + dt.timedelta(days=offset))
+            _book(master, service, dt.datetime.combine(self.MONDAY + dt.timedelta(days=offset + 1), dt.time(10)), 60)
+
+        with CaptureQueriesContext(connection) as short_range:
+            self._dates([service.pk], horizon=3)
+        with CaptureQueriesContext(connection) as long_range:
+            self._dates([service.pk], horizon=60)
+
+        assert len(long_range.captured_queries) == len(short_range.captured_queries)
+
+
 # ── BookingRuntimeEngineGateway: get_nearest_slots ───────────────────────────
 
 
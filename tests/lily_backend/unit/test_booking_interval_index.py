@@ -0,0 +1,283 @@
+"""Unit tests for features/booking/selector/intervals.py and the booking Redis index manager."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+from django.utils import timezone
+from features.booking.redis import BookingIntervalIndexManager
+from features.booking.selector import intervals
+from features.booking.selector.intervals import MasterDayIntervals, get_master_day_intervals
+from features.booking.selector.snapshot import BookingSettingsSnapshot
+
+MONDAY = dt.date(2026, 5, 11)
+
+
+@pytest.fixture
+def index_manager(monkeypatch, fake_sync_redis):
+    """Interval index backed by fakeredis with Redis enabled."""
+    manager = BookingIntervalIndexManager(sync_client_factory=lambda: fake_sync_redis)
+    monkeypatch.setattr(BookingIntervalIndexManager, "_is_disabled", lambda self: False)
+    monkeypatch.setattr(intervals, "get_interval_index_manager", lambda: manager)
+    return manager
+
+
+def _book(master, service, start: dt.datetime, minutes: int = 60, status: str = "confirmed"):
+    from features.booking.models import Appointment
+
+    return Appointment.objects.create(
+        master=master,
+        service=service,
+        datetime_start=timezone.make_aware(start),
+        duration_minutes=minutes,
+        price="50.00",
+        status=status,
+    )
+
+
+# ── MasterDayIntervals ────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestMasterDayIntervals:
+    def _day(self) -> MasterDayIntervals:
+        start = dt.datetime(2026, 5, 11, 8, 0, tzinfo=dt.UTC)
+        return MasterDayIntervals(
+            hours=(dt.time(9, 0), dt.time(18, 0)),
+            busy=(
+                (start, start + dt.timedelta(hours=1), 1),
+                (start + dt.timedelta(hours=3), start + dt.timedelta(hours=4), 2),
+            ),
+        )
+
+    def test_payload_round_trip(self):
+        day = self._day()
+        assert MasterDayIntervals.from_payload(day.to_payload()) == day
+        assert MasterDayIntervals.from_payload(MasterDayIntervals(hours=None).to_payload()).hours is None
+
+    def test_overlaps_respects_bounds_and_exclusion(self):
+        day = self._day()
+        at = dt.datetime(2026, 5, 11, 9, 0, tzinfo=dt.UTC)
+
+        assert day.overlaps(at, at + dt.timedelta(hours=2)) is False
+        assert day.overlaps(at, at + dt.timedelta(hours=2, minutes=1)) is True
+        assert day.overlaps(at - dt.timedelta(minutes=30), at) is True
+        assert day.overlaps(at - dt.timedelta(minutes=30), at, exclude_id=1) is False
+
+    def test_busy_intervals_excludes_ids(self):
+        assert len(self._day().busy_intervals(exclude_ids={2})) == 1
+
+
+# ── Building entries ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestLoadMasterDayIntervals:
+    def test_working_day_has_settings_hours_and_sorted_busy(self, master, service, booking_settings):
+        late = _book(master, service, dt.datetime(2026, 5, 11, 14, 0))
+        early = _book(master, service, dt.datetime(2026, 5, 11, 10, 0), minutes=30)
+        _book(master, service, dt.datetime(2026, 5, 11, 12, 0), status="cancelled")
+
+        day = intervals.load_master_day_intervals([master.pk], MONDAY)[master.pk]
+
+        assert day.hours == (dt.time(9, 0), dt.time(18, 0))
+        assert [appointment_id for _, _, appointment_id in day.busy] == [early.pk, late.pk]
+        assert day.busy[0][1] - day.busy[0][0] == dt.timedelta(minutes=30)
+
+    def test_day_off_closed_day_and_missing_weekday_have_no_hours(self, master, booking_settings):
+        from features.booking.models import MasterDayOff
+
+        MasterDayOff.objects.create(master=master, date=MONDAY)
+        master.working_days.filter(weekday=1).delete()
+
+        loaded = {
+            target: intervals.load_master_day_intervals([master.pk], target)[master.pk].hours
+            for target in (MONDAY, MONDAY + dt.timedelta(days=1), MONDAY + dt.timedelta(days=6))
+        }
+
+        assert set(loaded.values()) == {None}
+
+
+# ── Redis-backed reads and invalidation ──────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestGetMasterDayIntervals:
+    def test_second_read_is_served_from_redis(
+        self, index_manager, master, service, booking_settings, django_assert_num_queries
+    ):
+        _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+        first = get_master_day_intervals(
+            [master.pk], MONDAY, settings=BookingSettingsSnapshot.from_settings(booking_settings)
+        )
+
+        with django_assert_num_queries(0):
+            second = get_master_day_intervals(
+                [master.pk], MONDAY, settings=BookingSettingsSnapshot.from_settings(booking_settings)
+            )
+
+        assert second == first
+
+    def test_disabled_redis_reads_database(self, master, booking_settings, django_assert_num_queries):
+        get_master_day_intervals([master.pk], MONDAY, settings=BookingSettingsSnapshot.from_settings(booking_settings))
+
+        with django_assert_num_queries(3):
+            get_master_day_intervals(
+                [master.pk], MONDAY, settings=BookingSettingsSnapshot.from_settings(booking_settings)
+            )
+
+    def test_redis_errors_fall_back_to_database(self, monkeypatch, master, booking_settings):
+        def broken(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(BookingIntervalIndexManager, "_is_disabled", lambda self: False)
+        monkeypatch.setattr(BookingIntervalIndexManager, "get_days", broken)
+
+        day = get_master_day_intervals(
+            [master.pk], MONDAY, settings=BookingSettingsSnapshot.from_settings(booking_settings)
+        )[master.pk]
+
+        assert day.hours == (dt.time(9, 0), dt.time(18, 0))
+
+    def test_new_appointment_drops_entry_on_commit(
+        self, index_manager, master, service, booking_settings, django_capture_on_commit_callbacks
+    ):
+        assert get_master_day_intervals([master.pk], MONDAY)[master.pk].busy == ()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+
+        assert len(get_master_day_intervals([master.pk], MONDAY)[master.pk].busy) == 1
+
+    def test_entry_built_before_a_commit_is_not_served_after_it(
+        self, monkeypatch, index_manager, master, service, booking_settings, django_capture_on_commit_callbacks
+    ):
+        load = intervals.load_master_day_intervals
+
+        def load_then_book(*args, **kwargs):
+            built = load(*args, **kwargs)
+            # A booking commits between the reader's database load and its write-back.
+            with django_capture_on_commit_callbacks(execute=True):
+                _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+            return built
+
+        monkeypatch.setattr(intervals, "load_master_day_intervals", load_then_book)
+        assert get_master_day_intervals([master.pk], MONDAY)[master.pk].busy == ()
+
+        monkeypatch.setattr(intervals, "load_master_day_intervals", load)
+        assert len(get_master_day_intervals([master.pk], MONDAY)[master.pk].busy) == 1
+
+    def test_reschedule_drops_old_and_new_day(
+        self, index_manager, master, service, booking_settings, django_capture_on_commit_callbacks
+    ):
+        from features.booking.models import Appointment
+
+        appointment = _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+        tuesday = MONDAY + dt.timedelta(days=1)
+        get_master_day_intervals([master.pk], MONDAY)
+        get_master_day_intervals([master.pk], tuesday)
+
+        appointment = Appointment.objects.get(pk=appointment.pk)
+        appointment.datetime_start = timezone.make_aware(dt.datetime(2026, 5, 12, 10, 0))
+        with django_capture_on_commit_callbacks(execute=True):
+            appointment.save(update_fields=["datetime_start"])
+
+        assert get_master_day_intervals([master.pk], MONDAY)[master.pk].busy == ()
+        assert len(get_master_day_intervals([master.pk], tuesday)[master.pk].busy) == 1
+
+    def test_second_reschedule_of_the_same_instance_drops_the_day_in_between(
+        self, index_manager, master, service, booking_settings, django_capture_on_commit_callbacks
+    ):
+        appointment = _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+        tuesday = MONDAY + dt.timedelta(days=1)
+
+        appointment.datetime_start = timezone.make_aware(dt.datetime(2026, 5, 12, 10, 0))
+        with django_capture_on_commit_callbacks(execute=True):
+            appointment.save(update_fields=["datetime_start"])
+        assert len(get_master_day_intervals([master.pk], tuesday)[master.pk].busy) == 1
+
+        appointment.datetime_start = timezone.make_aware(dt.datetime(2026, 5, 13, 10, 0))
+        with django_capture_on_commit_callbacks(execute=True):
+            appointment.save(update_fields=["datetime_start"])
+
+        assert appointment.origin["datetime_start"] == appointment.datetime_start
+        assert get_master_day_intervals([master.pk], tuesday)[master.pk].busy == ()
+
+    def test_unrelated_update_keeps_entry(
+        self, index_manager, master, service, booking_settings, django_capture_on_commit_callbacks
+    ):
+        appointment = _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            appointment.admin_notes = "VIP"
+            appointment.save(update_fields=["admin_notes"])
+
+        assert callbacks == []
+
+    def test_day_off_and_schedule_changes_drop_entries(
+        self, index_manager, master, booking_settings, django_capture_on_commit_callbacks
+    ):
+        from features.booking.models import MasterDayOff
+
+        assert get_master_day_intervals([master.pk], MONDAY)[master.pk].hours is not None
+        with django_capture_on_commit_callbacks(execute=True):
+            MasterDayOff.objects.create(master=master, date=MONDAY)
+        assert get_master_day_intervals([master.pk], MONDAY)[master.pk].hours is None
+
+        saturday = MONDAY + dt.timedelta(days=5)
+        assert get_master_day_intervals([master.pk], saturday)[master.pk].hours == (dt.time(10, 0), dt.time(14, 0))
+        booking_settings.saturday_is_closed = True
+        with django_capture_on_commit_callbacks(execute=True):
+            booking_settings.save()
+        assert (
+            get_master_day_intervals(
+                [master.pk], saturday, settings=BookingSettingsSnapshot.from_settings(booking_settings)
+            )[master.pk].hours
+            is None
+        )
+
+
+# ── Consumers ────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestIntervalIndexConsumers:
+    def test_overlap_check_reads_index_and_database_alike(self, index_manager, master, service, booking_settings):
+        from features.booking.providers.runtime import RuntimeBookingProvider
+
+        appointment = _book(master, service, dt.datetime(2026, 5, 11, 10, 0))
+        provider = RuntimeBookingProvider()
+        cases = [
+            (dt.datetime(2026, 5, 11, 9, 30), None),
+            (dt.datetime(2026, 5, 11, 11, 0), None),
+            (dt.datetime(2026, 5, 11, 10, 30), appointment.pk),
+        ]
+
+        for start, exclude_id in cases:
+            kwargs = {
+                "resource_id": master.pk,
+                "start_at": timezone.make_aware(start),
+                "duration_minutes": 60,
+                "exclude_appointment_id": exclude_id,
+            }
+            assert provider._has_blocking_overlap(**kwargs) == provider._has_blocking_overlap(
+                **kwargs, use_index=False
+            ), start
+
+    def test_slot_search_uses_index_unless_fresh_data_is_requested(
+        self, index_manager, master, service, booking_settings
+    ):
+        from features.booking.selector.engine import BookingRuntimeEngineGateway
+
+        gateway = BookingRuntimeEngineGateway()
+        adapter = gateway._build_adapter(target_date=MONDAY)
+        get_master_day_intervals([master.pk], MONDAY)
+        # Written behind the index's back (no commit), so only a fresh read sees it.
+        _book(master, service, dt.datetime(2026, 5, 11, 9, 0), minutes=9 * 60)
+
+        cached = adapter.build_resources_availability([master.pk], MONDAY, cache_ttl=300)
+        fresh = adapter.build_resources_availability([master.pk], MONDAY, cache_ttl=0)
+
+        assert cached[str(master.pk)].free_windows
+        assert fresh[str(master.pk)].free_windows == []
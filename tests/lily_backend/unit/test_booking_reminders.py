@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from django.utils import timezone
 from features.booking.models import Appointment
+from features.booking.services.outbox import relay_booking_outbox
 from tests.factories.booking import AppointmentFactory
 
 
@@ -103,5 +104,8 @@ def test_confirmed_appointment_schedules_reminder(monkeypatch):
     with patch("features.conversations.services.notifications._get_engine") as get_engine:
         get_engine.return_value = MagicMock()
         appt.confirm()
+        assert scheduled == []
+
+        relay_booking_outbox()
 
     assert scheduled == [appt.pk]
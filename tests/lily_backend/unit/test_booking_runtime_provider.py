@@ -207,6 +207,134 @@ class TestGetCabinetAppointments:
         assert row["price"] == 0.0
 
 
+@pytest.mark.unit
+class TestGetCabinetAppointment:
+    def test_fetches_single_row_by_pk(
+        self, db, pending_appointment, confirmed_appointment, provider, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            row = provider.get_cabinet_appointment(pending_appointment.pk)
+
+        assert row == provider.serialize_cabinet_appointment(pending_appointment)
+        assert row["status"] == "pending"
+
+    def test_missing_returns_none(self, db, provider):
+        assert provider.get_cabinet_appointment(999999) is None
+
+
+# ── cabinet list queryset / status counts ─────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestCabinetAppointmentListQueries:
+    def test_status_counts_use_single_grouped_query(
+        self, db, pending_appointment, confirmed_appointment, provider, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            counts = provider.get_cabinet_appointment_status_counts(status="pending")
+
+        assert counts == {"pending": 1, "confirmed": 1}
+
+    def test_queryset_page_is_sliced_in_sql(self, db, master, service, client_obj, provider, django_assert_num_queries):
+        from django.core.paginator import Paginator
+        from features.booking.models import Appointment
+
+        start = timezone.now() + dt.timedelta(days=3)
+        Appointment.objects.bulk_create(
+            [
+                Appointment(
+                    client=client_obj,
+                    master=master,
+                    service=service,
+                    datetime_start=start + dt.timedelta(hours=idx),
+                    duration_minutes=60,
+                    price=service.price,
+                    finalize_token=f"token-{idx}",
+                )
+                for idx in range(30)
+            ]
+        )
+
+        with django_assert_num_queries(2):
+            page = Paginator(provider.get_cabinet_appointments_queryset(), 15).get_page(2)
+            rows = [provider.serialize_cabinet_appointment(appt) for appt in page.object_list]
+
+        assert len(rows) == 15
+        assert page.paginator.count == 30
+
+    def test_date_filters_use_local_day_bounds(self, db, pending_appointment, provider):
+        local_day = timezone.localtime(pending_appointment.datetime_start).date()
+
+        assert provider.get_cabinet_appointments_queryset(date_from=local_day.isoformat(), date_to=local_day).exists()
+        assert not provider.get_cabinet_appointments_queryset(date_to=local_day - dt.timedelta(days=1)).exists()
+        assert provider.get_cabinet_appointments_queryset(date_from="not-a-date").exists()
+
+
+# ── get_cabinet_schedule_appointments ─────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestGetCabinetScheduleAppointments:
+    @staticmethod
+    def _create(master, service, client_obj, start, status="confirmed"):
+        from features.booking.models import Appointment
+
+        return Appointment.objects.create(
+            client=client_obj,
+            master=master,
+            service=service,
+            datetime_start=start,
+            duration_minutes=service.duration,
+            price=service.price,
+            status=status,
+        )
+
+    @staticmethod
+    def _at(day: dt.date, hour: int) -> dt.datetime:
+        return timezone.make_aware(dt.datetime.combine(day, dt.time(hour, 0)))
+
+    def test_returns_only_rows_of_requested_day_and_statuses(self, db, master, service, client_obj, provider):
+        day = dt.date(2026, 5, 11)
+        kept = self._create(master, service, client_obj, self._at(day, 10))
+        self._create(master, service, client_obj, self._at(day, 12), status="cancelled")
+        self._create(master, service, client_obj, self._at(day + dt.timedelta(days=1), 10))
+
+        rows = provider.get_cabinet_schedule_appointments(date_from=day, statuses=["pending", "confirmed"])
+
+        assert [row["id"] for row in rows] == [kept.pk]
+        assert rows[0]["date"] == "2026-05-11"
+        assert rows[0]["time"] == "10:00"
+        assert rows[0]["client_name"] == "Anna Testova"
+        assert rows[0]["service_title"] == service.name
+
+    def test_query_and_row_count_do_not_grow_with_history(
+        self, db, master, service, client_obj, provider, django_assert_num_queries
+    ):
+        day = dt.date(2026, 5, 11)
+        self._create(master, service, client_obj, self._at(day, 10))
+        self._create(master, service, client_obj, self._at(day, 14))
+
+        with django_assert_num_queries(1):
+            before = provider.get_cabinet_schedule_appointments(date_from=day)
+
+        for offset in range(1, 40):
+            self._create(master, service, client_obj, self._at(day - dt.timedelta(days=offset), 10))
+
+        with django_assert_num_queries(1):
+            after = provider.get_cabinet_schedule_appointments(date_from=day)
+
+        assert len(before) == len(after) == 2
+
+    def test_date_range_includes_last_day(self, db, master, service, client_obj, provider):
+        day = dt.date(2026, 5, 11)
+        self._create(master, service, client_obj, self._at(day, 10))
+        self._create(master, service, client_obj, self._at(day + dt.timedelta(days=2), 10))
+
+        rows = provider.get_cabinet_schedule_appointments(date_from=day, date_to=day + dt.timedelta(days=2))
+
+        assert [row["date"] for row in rows] == ["2026-05-11", "2026-05-13"]
+
+
 # ── get_schedule_prefill ──────────────────────────────────────────────────────
 
 
@@ -274,11 +402,14 @@ class TestGetQuickCreateServices:
 @pytest.mark.unit
 class TestGetQuickCreateClients:
     def test_returns_client_options(self, db, client_obj, provider):
-        result = provider.get_quick_create_clients()
+        result = provider.get_quick_create_clients("anna")
         assert any(str(client_obj.pk) == o.value for o in result)
 
+    def test_empty_query_returns_no_options(self, db, client_obj, provider):
+        assert provider.get_quick_create_clients() == []
+
     def test_has_search_text(self, db, client_obj, provider):
-        result = provider.get_quick_create_clients()
+        result = provider.get_quick_create_clients("testova")
         opt = next(o for o in result if str(client_obj.pk) == o.value)
         assert opt.search_text  # non-empty string
 
@@ -0,0 +1,141 @@
+"""Unit tests for features/booking/selector/snapshot.py."""
+
+from __future__ import annotations
+
+import datetime as dt
+from unittest.mock import MagicMock, patch
+
+import pytest
+from features.booking.redis import BookingSettingsVersionManager
+from features.booking.selector import snapshot
+from features.booking.selector.engine import BookingRuntimeEngineGateway
+from features.booking.selector.snapshot import (
+    BookingSettingsSnapshot,
+    get_booking_settings_snapshot,
+    load_booking_settings_snapshot,
+)
+from features.booking.selector.versioned import VersionedCache
+
+MONDAY = dt.date(2026, 5, 11)
+
+
+@pytest.fixture
+def version_manager(monkeypatch, fake_sync_redis):
+    """Settings version counter backed by fakeredis with Redis enabled."""
+    manager = BookingSettingsVersionManager(sync_client_factory=lambda: fake_sync_redis)
+    monkeypatch.setattr(BookingSettingsVersionManager, "_is_disabled", lambda self: False)
+    monkeypatch.setattr(snapshot, "_cache", VersionedCache("Booking settings", lambda: manager))
+    return manager
+
+
+# ── BookingSettingsSnapshot ──────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestBookingSettingsSnapshot:
+    def test_load_precomputes_weekday_hours_and_start_limits(self, service, booking_settings):
+        from features.main.models import Service
+
+        service.category.booking_start_time = dt.time(9, 30)
+        service.category.save(update_fields=["booking_start_time"])
+        Service.objects.create(
+            name="Hidden",
+            slug="hidden",
+            category=service.category,
+            price="10.00",
+            duration=30,
+            is_active=False,
+        )
+
+        loaded = load_booking_settings_snapshot()
+
+        assert loaded.day_schedule(0) == (dt.time(9, 0), dt.time(18, 0))
+        assert loaded.day_schedule(6) is None
+        assert dict(loaded.service_start_times) == {service.pk: dt.time(9, 30)}
+        assert loaded.minimum_start_time([service.pk, 999]) == dt.time(9, 30)
+        assert loaded.minimum_start_time([999]) is None
+
+    def test_load_takes_two_queries(self, booking_settings, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            load_booking_settings_snapshot()
+
+
+# ── Process cache ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestGetBookingSettingsSnapshot:
+    def test_snapshot_is_reused_until_a_write(self, version_manager, booking_settings, django_assert_num_queries):
+        first = get_booking_settings_snapshot()
+
+        with django_assert_num_queries(0):
+            assert get_booking_settings_snapshot() is first
+
+        booking_settings.book_only_from_next_day = True
+        booking_settings.save()
+
+        assert get_booking_settings_snapshot().book_only_from_next_day is True
+
+    def test_other_process_bump_reloads(self, version_manager, booking_settings):
+        first = get_booking_settings_snapshot()
+
+        version_manager.bump_version()
+
+        assert get_booking_settings_snapshot() is not first
+
+    def test_disabled_redis_loads_every_time(self, booking_settings, django_assert_num_queries):
+        get_booking_settings_snapshot()
+
+        with django_assert_num_queries(2):
+            get_booking_settings_snapshot()
+
+    def test_category_change_invalidates(self, version_manager, service, booking_settings):
+        assert get_booking_settings_snapshot().minimum_start_time([service.pk]) is None
+
+        service.category.booking_start_time = dt.time(10, 0)
+        service.category.save(update_fields=["booking_start_time"])
+
+        assert get_booking_settings_snapshot().minimum_start_time([service.pk]) == dt.time(10, 0)
+
+
+# ── Consumers ────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestSnapshotConsumers:
+    def test_gateway_uses_the_passed_snapshot(self, service, booking_settings):
+        from features.booking.booking_settings import BookingSettings
+
+        service.category.booking_start_time = dt.time(9, 0)
+        service.category.save(update_fields=["booking_start_time"])
+        settings = load_booking_settings_snapshot()
+        gateway = BookingRuntimeEngineGateway()
+        result = MagicMock()
+        result.get_unique_start_times.return_value = ["08:00", "09:00"]
+
+        with (
+            patch.object(BookingSettings, "load", side_effect=AssertionError("settings reloaded")),
+            patch("features.booking.selector.engine.runtime_get_available_slots", return_value=result) as mock_slots,
+        ):
+            slots = gateway.get_available_slots(service_ids=[service.pk], target_date=MONDAY, settings=settings)
+
+        assert mock_slots.call_args.args[0].settings_snapshot is settings
+        assert slots.get_unique_start_times() == ["09:00"]
+
+    def test_workflow_reads_current_snapshot(self, booking_settings):
+        from features.booking.services.cabinet import BookingCabinetWorkflowService
+
+        workflow = BookingCabinetWorkflowService(provider=MagicMock())
+        booking_settings.max_advance_days = 14
+        booking_settings.save()
+
+        assert workflow.settings.max_advance_days == 14
+
+    def test_from_settings_accepts_any_settings_object(self):
+        settings = MagicMock()
+        settings.get_day_schedule.side_effect = lambda weekday: None if weekday == 6 else (dt.time(9), dt.time(17))
+
+        built = BookingSettingsSnapshot.from_settings(settings)
+
+        assert built.day_schedules[:2] == ((dt.time(9), dt.time(17)),) * 2
+        assert built.day_schedule(6) is None
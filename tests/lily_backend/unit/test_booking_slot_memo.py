@@ -0,0 +1,205 @@
+"""Unit tests for features/booking/selector/memo.py and the gateway slot memo."""
+
+from __future__ import annotations
+
+import datetime as dt
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.utils import timezone
+from features.booking.redis import BookingIntervalIndexManager
+from features.booking.selector import intervals
+from features.booking.selector.engine import BookingRuntimeEngineGateway, EmptyAvailableSlots
+from features.booking.selector.memo import SLOT_MEMO_LOOKUPS, SlotResultMemo
+
+MONDAY = dt.date(2026, 5, 11)
+
+
+def _lookups(method: str, result: str) -> float:
+    return SLOT_MEMO_LOOKUPS.labels(method=method, result=result)._value.get()
+
+
+@pytest.fixture
+def schedule_versions(monkeypatch, fake_sync_redis):
+    """Shared schedule versions backed by fakeredis with Redis enabled."""
+    manager = BookingIntervalIndexManager(sync_client_factory=lambda: fake_sync_redis)
+    monkeypatch.setattr(BookingIntervalIndexManager, "_is_disabled", lambda self: False)
+    monkeypatch.setattr(intervals, "get_interval_index_manager", lambda: manager)
+    return manager
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ── SlotResultMemo ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestSlotResultMemo:
+    def test_hit_returns_stored_result_and_counts(self):
+        memo = SlotResultMemo()
+        compute = MagicMock(return_value="slots")
+        hits, misses = _lookups("test", "hit"), _lookups("test", "miss")
+
+        assert memo.get_or_compute("test", ("a",), compute) == "slots"
+        assert memo.get_or_compute("test", ("a",), compute) == "slots"
+
+        assert compute.call_count == 1
+        assert _lookups("test", "hit") == hits + 1
+        assert _lookups("test", "miss") == misses + 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        memo = SlotResultMemo(ttl_seconds=30, clock=clock)
+        compute = MagicMock(side_effect=["first", "second"])
+
+        memo.get_or_compute("test", "key", compute)
+        clock.now = 29.0
+        assert memo.get_or_compute("test", "key", compute) == "first"
+        clock.now = 30.0
+        assert memo.get_or_compute("test", "key", compute) == "second"
+
+    def test_least_recently_used_entry_is_evicted(self):
+        memo = SlotResultMemo(max_entries=2)
+        memo.get_or_compute("test", "a", lambda: 1)
+        memo.get_or_compute("test", "b", lambda: 2)
+        memo.get_or_compute("test", "a", lambda: 0)
+        memo.get_or_compute("test", "c", lambda: 3)
+
+        assert len(memo) == 2
+        assert memo.get_or_compute("test", "a", lambda: 0) == 1
+        assert memo.get_or_compute("test", "b", lambda: 0) == 0
+
+    def test_none_key_bypasses_memo(self):
+        memo = SlotResultMemo()
+        compute = MagicMock(return_value="slots")
+        bypasses = _lookups("test", "bypass")
+
+        memo.get_or_compute("test", None, compute)
+        memo.get_or_compute("test", None, compute)
+
+        assert compute.call_count == 2
+        assert len(memo) == 0
+        assert _lookups("test", "bypass") == bypasses + 2
+
+    def test_exceptions_are_not_cached(self):
+        memo = SlotResultMemo()
+        compute = MagicMock(side_effect=[RuntimeError("boom"), "slots"])
+
+        with pytest.raises(RuntimeError):
+            memo.get_or_compute("test", "key", compute)
+
+        assert memo.get_or_compute("test", "key", compute) == "slots"
+
+
+# ── Gateway ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("schedule_versions")
+class TestGatewaySlotMemo:
+    def _search(self, gateway: BookingRuntimeEngineGateway, **kwargs):
+        return gateway.get_available_slots(service_ids=[1, 2], target_date=MONDAY, **kwargs)
+
+    def test_repeated_search_is_served_from_memo(self, db, booking_settings):
+        gateway = BookingRuntimeEngineGateway()
+        with (
+            patch.object(gateway, "_build_adapter", return_value=MagicMock()),
+            patch("features.booking.selector.engine.runtime_get_available_slots") as mock_slots,
+        ):
+            first = self._search(gateway, resource_selections={"1": "2"})
+            second = self._search(gateway, resource_selections={"1": "2"})
+            self._search(gateway, resource_selections={"1": "3"})
+            self._search(gateway, audience="cabinet")
+
+        assert second is first
+        assert mock_slots.call_count == 3
+
+    def test_service_order_is_part_of_the_key(self, db, booking_settings):
+        gateway = BookingRuntimeEngineGateway()
+        with (
+            patch.object(gateway, "_build_adapter", return_value=MagicMock()),
+            patch("features.booking.selector.engine.runtime_get_available_slots") as mock_slots,
+        ):
+            gateway.get_available_slots(service_ids=[1, 2], target_date=MONDAY)
+            gateway.get_available_slots(service_ids=[2, 1], target_date=MONDAY)
+
+        assert mock_slots.call_count == 2
+
+    def test_appointment_write_on_the_day_recomputes(self, master, service, booking_settings):
+        from features.booking.models import Appointment
+
+        gateway = BookingRuntimeEngineGateway()
+        with (
+            patch.object(gateway, "_build_adapter", return_value=MagicMock()),
+            patch("features.booking.selector.engine.runtime_get_available_slots") as mock_slots,
+        ):
+            self._search(gateway)
+            Appointment.objects.create(
+                master=master,
+                service=service,
+                datetime_start=timezone.make_aware(dt.datetime(2026, 5, 12, 10, 0)),
+                duration_minutes=60,
+                price="50.00",
+            )
+            self._search(gateway)
+            Appointment.objects.create(
+                master=master,
+                service=service,
+                datetime_start=timezone.make_aware(dt.datetime(2026, 5, 11, 10, 0)),
+                duration_minutes=60,
+                price="50.00",
+            )
+            self._search(gateway)
+
+        assert mock_slots.call_count == 2
+
+    def test_disabled_redis_bypasses_memo(self, monkeypatch, db, booking_settings):
+        monkeypatch.setattr(BookingIntervalIndexManager, "_is_disabled", lambda self: True)
+        gateway = BookingRuntimeEngineGateway()
+        bypasses = _lookups("get_available_slots", "bypass")
+        with (
+            patch.object(gateway, "_build_adapter", return_value=MagicMock()),
+            patch("features.booking.selector.engine.runtime_get_available_slots") as mock_slots,
+        ):
+            self._search(gateway)
+            self._search(gateway)
+
+        assert mock_slots.call_count == 2
+        assert len(gateway.slot_memo) == 0
+        assert _lookups("get_available_slots", "bypass") == bypasses + 2
+
+    def test_failed_search_is_not_memoized(self, db, booking_settings):
+        gateway = BookingRuntimeEngineGateway()
+        with (
+            patch.object(gateway, "_build_adapter", return_value=MagicMock()),
+            patch(
+                "features.booking.selector.engine.runtime_get_available_slots",
+                side_effect=[RuntimeError("boom"), MagicMock()],
+            ) as mock_slots,
+        ):
+            assert isinstance(self._search(gateway), EmptyAvailableSlots)
+            assert not isinstance(self._search(gateway), EmptyAvailableSlots)
+
+        assert mock_slots.call_count == 2
+
+    def test_nearest_slots_track_every_searched_day(self, master, booking_settings):
+        from features.booking.models import MasterDayOff
+
+        gateway = BookingRuntimeEngineGateway()
+        with (
+            patch.object(gateway, "_build_adapter", return_value=MagicMock()),
+            patch("features.booking.selector.engine.runtime_get_nearest_slots") as mock_nearest,
+        ):
+            gateway.get_nearest_slots(service_ids=[1], search_from=MONDAY, search_days=7)
+            MasterDayOff.objects.create(master=master, date=MONDAY + dt.timedelta(days=10))
+            gateway.get_nearest_slots(service_ids=[1], search_from=MONDAY, search_days=7)
+            MasterDayOff.objects.create(master=master, date=MONDAY + dt.timedelta(days=6))
+            gateway.get_nearest_slots(service_ids=[1], search_from=MONDAY, search_days=7)
+
+        assert mock_nearest.call_count == 2
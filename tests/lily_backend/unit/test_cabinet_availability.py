@@ -10,9 +10,8 @@ from tests.factories.main import ServiceFactory
 @pytest.mark.django_db
 class TestCabinetAvailabilityService:
     def test_get_available_dates(self):
-        master = MasterFactory(working_days=False)
         booking_service = ServiceFactory()
-        booking_service.masters.add(master)
+        master = MasterFactory(categories=[booking_service.category], working_days=False)
         MasterWorkingDayFactory(master=master, weekday=0)  # Monday
 
         service = CabinetBookingAvailabilityService()
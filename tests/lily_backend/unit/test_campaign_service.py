@@ -0,0 +1,155 @@
+"""Unit tests for CampaignService materialization, the claim-based send loop and the shared audience queryset."""
+
+from __future__ import annotations
+
+import pytest
+from asgiref.sync import async_to_sync
+from features.conversations.campaigns.audience import AudienceFilter
+from features.conversations.models.campaign import Campaign, CampaignRecipient
+from features.conversations.selector.audience import DjangoAudienceBuilder
+from features.conversations.services.campaign_service import build_campaign_service
+from system.models import Client
+
+
+@pytest.fixture
+def audience():
+    for index in range(5):
+        Client.objects.create(
+            first_name=f"Reader{index}",
+            email=f"reader{index}@example.com",
+            phone=f"+4915200{index:04d}",
+            consent_marketing=True,
+        )
+    Client.objects.create(
+        first_name="Silent", email="silent@example.com", phone="+49152009999", consent_marketing=False
+    )
+    return list(Client.objects.filter(consent_marketing=True).order_by("pk"))
+
+
+@pytest.fixture
+def campaign():
+    return Campaign.objects.create(subject="News", body_text="Body", audience_filter=AudienceFilter().to_dict())
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestMaterializeRecipients:
+    def test_count_and_materialize_share_the_audience(self, audience):
+        builder = DjangoAudienceBuilder()
+        f = AudienceFilter()
+
+        drafts = list(builder.materialize(f))
+
+        assert builder.count(f) == len(drafts) == 5
+        assert [draft.recipient_id for draft in drafts] == [client.pk for client in audience]
+
+    def test_chunks_report_counts_and_progress(self, audience, campaign, django_assert_max_num_queries):
+        # Counts and the progress reset, then one insert and one progress update per chunk.
+        with django_assert_max_num_queries(11):
+            result = build_campaign_service().materialize_recipients(campaign, chunk_size=2)
+
+        campaign.refresh_from_db()
+        assert (result.created, result.skipped) == (5, 0)
+        assert (campaign.audience_size, campaign.recipients_materialized) == (5, 5)
+        assert set(campaign.recipients.values_list("recipient_id", flat=True)) == {client.pk for client in audience}
+
+    def test_progress_reaches_audience_size_when_clients_lack_an_email(self, audience, campaign):
+        Client.objects.create(first_name="Offline", email=None, phone="+49152008888", consent_marketing=True)
+
+        result = build_campaign_service().materialize_recipients(campaign, chunk_size=2)
+
+        campaign.refresh_from_db()
+        assert result.total == campaign.audience_size == campaign.recipients_materialized == 5
+
+    def test_rerun_skips_existing_rows(self, audience, campaign):
+        CampaignRecipient.objects.create(
+            campaign=campaign, recipient=audience[0], email=audience[0].email, status=CampaignRecipient.Status.SENT
+        )
+
+        result = build_campaign_service().materialize_recipients(campaign, chunk_size=2)
+
+        assert (result.created, result.skipped, result.total) == (4, 1, 5)
+        assert campaign.recipients.get(recipient=audience[0]).status == CampaignRecipient.Status.SENT
+
+
+# ── Claim-based send loop ────────────────────────────────────────────────────
+
+
+class _RecordingDispatcher:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.batches: list[list[int]] = []
+        self.fail = fail
+
+    async def enqueue_batch(self, payload):
+        if self.fail:
+            raise ConnectionError("arq unavailable")
+        self.batches.append([row["id"] for row in payload["recipients"]])
+        return "job"
+
+
+def _service(dispatcher, *, batch_size=2, concurrency=2):
+    from features.conversations.campaigns.locales import SingleLocaleResolver
+    from features.conversations.campaigns.templates import template_registry
+    from features.conversations.services.campaign_service import CampaignService
+
+    return CampaignService(
+        audience=DjangoAudienceBuilder(),
+        dispatcher=dispatcher,
+        templates=template_registry,
+        locales=SingleLocaleResolver("de"),
+        send_batch_size=batch_size,
+        send_concurrency=concurrency,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestCampaignSend:
+    def test_claims_every_pending_recipient_once(self, audience, campaign):
+        dispatcher = _RecordingDispatcher()
+
+        async_to_sync(_service(dispatcher).send)(campaign)
+
+        ids = list(campaign.recipients.order_by("pk").values_list("pk", flat=True))
+        assert dispatcher.batches == [ids[0:2], ids[2:4], ids[4:5]]
+        assert set(campaign.recipients.values_list("status", flat=True)) == {CampaignRecipient.Status.QUEUED}
+        campaign.refresh_from_db()
+        assert campaign.status == Campaign.Status.DONE
+
+    def test_rerun_only_enqueues_unclaimed_recipients(self, audience, campaign):
+        service = _service(_RecordingDispatcher())
+        service.materialize_recipients(campaign)
+        claimed = service.claim_batch(campaign)
+        dispatcher = _RecordingDispatcher()
+
+        async_to_sync(_service(dispatcher).send)(campaign)
+
+        sent = [pk for batch in dispatcher.batches for pk in batch]
+        assert len(sent) == 3
+        assert not {row["id"] for row in claimed} & set(sent)
+
+    def test_stale_claim_is_reclaimed_by_the_next_run(self, audience, campaign):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        service = _service(_RecordingDispatcher())
+        service.materialize_recipients(campaign)
+        # The sender died between claim and enqueue.
+        stuck = [row["id"] for row in service.claim_batch(campaign)]
+        fresh = [row["id"] for row in service.claim_batch(campaign, after_id=stuck[-1])]
+        CampaignRecipient.objects.filter(pk__in=stuck).update(claimed_at=timezone.now() - timedelta(hours=1))
+        dispatcher = _RecordingDispatcher()
+
+        async_to_sync(_service(dispatcher).send)(campaign)
+
+        sent = [pk for batch in dispatcher.batches for pk in batch]
+        assert set(stuck) <= set(sent)
+        assert not set(fresh) & set(sent)
+        assert not campaign.recipients.filter(pk__in=sent, claimed_at__isnull=False).exists()
+
+    def test_failed_enqueue_releases_the_claim(self, audience, campaign):
+        with pytest.raises(ConnectionError):
+            async_to_sync(_service(_RecordingDispatcher(fail=True)).send)(campaign)
+
+        assert set(campaign.recipients.values_list("status", flat=True)) == {CampaignRecipient.Status.PENDING}
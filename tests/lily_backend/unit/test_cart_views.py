@@ -11,8 +11,9 @@ class TestCartViews:
     @patch("features.booking.views.public.cart.get_cart")
     @patch("features.booking.views.public.cart.save_cart")
     @patch("features.booking.views.public.cart.render")
-    def test_cart_add_view(self, mock_render, mock_save, mock_get, rf):
+    def test_cart_add_view(self, mock_render, mock_save, mock_get, rf, master):
         service = ServiceFactory(name="Test Service")
+        service.masters.add(master)
         request = rf.post("/booking/cart/add/", {"service_id": str(service.pk)})
         request.session = {}
         cart = PublicCart()
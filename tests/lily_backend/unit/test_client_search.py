@@ -0,0 +1,102 @@
+"""Unit tests for system/selectors/client_search.py and the cabinet client typeahead."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import reverse
+from system.models import Client
+from system.models.client import build_client_search_text
+from system.selectors.client_search import CLIENT_SEARCH_PAGE_SIZE, ClientSearchSelector
+
+
+def _ids(query: str, **kwargs) -> list[int]:
+    return [client.pk for client in ClientSearchSelector.search(query, **kwargs).results]
+
+
+# ── Search column ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestClientSearchText:
+    def test_build_normalizes_name_phone_and_email(self):
+        text = build_client_search_text("Anna", "Müller", "", "+49 151-2345", "Anna@Example.DE")
+
+        assert text == "anna müller +49 151-2345 491512345 anna@example.de"
+
+    def test_save_maintains_column_for_partial_updates(self, client_obj):
+        client_obj.last_name = "Schmidt"
+        client_obj.save(update_fields=["last_name", "updated_at"])
+        client_obj.refresh_from_db()
+
+        assert "schmidt" in client_obj.search_text
+        assert "49111000001" in client_obj.search_text
+
+
+# ── Selector ─────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestClientSearchSelector:
+    def test_matches_every_token_case_insensitively(self, client_obj):
+        Client.objects.create(first_name="Anna", last_name="Other", phone="+49111000002")
+
+        assert _ids("ANNA test") == [client_obj.pk]
+        assert _ids("anna@test") == [client_obj.pk]
+
+    def test_formatted_phone_matches_digits(self, client_obj):
+        assert _ids("+49 (111) 000-001") == [client_obj.pk]
+        assert _ids("0001") == [client_obj.pk]
+
+    def test_blocked_and_short_queries_return_nothing(self, client_obj):
+        client_obj.status = Client.STATUS_BLOCKED
+        client_obj.save(update_fields=["status"])
+
+        assert _ids("anna") == []
+        assert _ids("anna", include_blocked=True) == [client_obj.pk]
+        assert _ids("a") == []
+
+    def test_pages_are_capped(self, django_assert_num_queries):
+        for index in range(CLIENT_SEARCH_PAGE_SIZE + 5):
+            Client.objects.create(first_name="Lena", last_name=f"L{index:02d}", phone=f"+4915100{index:04d}")
+
+        with django_assert_num_queries(1):
+            first = ClientSearchSelector.search("lena", page_size=500)
+        second = ClientSearchSelector.search("lena", page=2)
+
+        assert (len(first.results), first.has_more) == (CLIENT_SEARCH_PAGE_SIZE, True)
+        assert (len(second.results), second.has_more) == (5, False)
+        assert {c.pk for c in first.results}.isdisjoint(c.pk for c in second.results)
+
+
+# ── Cabinet endpoint and builders ────────────────────────────────────────────
+
+
+@pytest.mark.unit
+def test_client_search_endpoint_requires_staff(client, client_obj):
+    url = reverse("cabinet:booking_client_search")
+    assert client.get(url, {"q": "anna"}).status_code != 200
+
+    staff = get_user_model().objects.create_user(username="desk", password="x-pass-123", is_staff=True)
+    client.force_login(staff)
+    response = client.get(url, {"q": "anna", "page": "1"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "query": "anna",
+        "results": [{"id": client_obj.pk, "name": "Anna Testova", "phone": "+49111000001", "email": "anna@test.local"}],
+        "page": 1,
+        "has_more": False,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["single", "separate", "series"])
+def test_booking_builders_do_not_preload_clients(mode, client_obj, booking_settings):
+    from features.booking.services.cabinet import BookingCabinetWorkflowService
+
+    context = BookingCabinetWorkflowService().get_new_booking_context(RequestFactory().get("/", {"mode": mode}))
+
+    assert context["client_selector"].clients == []
+    assert context["client_search_url"] == reverse("cabinet:booking_client_search")
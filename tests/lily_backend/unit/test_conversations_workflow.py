@@ -59,6 +59,18 @@ class TestConversationsWorkflow:
             assert msg.status == Message.Status.PROCESSED
             mock_notify.assert_called_once_with(msg, reply)
 
+    def test_create_reply_indexes_outbound_message_ids(self):
+        from features.conversations.models import MessageReference
+        from features.conversations.services.email_import import outbound_message_id
+
+        msg = Message.objects.create(sender_name="1", sender_email="1@1.com")
+
+        with patch("features.conversations.services.workflow.notify_thread_reply"):
+            reply = create_reply(message=msg, body="Reply Text", user=None)
+
+        indexed = set(MessageReference.objects.filter(thread=msg).values_list("message_id", flat=True))
+        assert indexed == {msg.thread_key, outbound_message_id(thread_key=msg.thread_key, reply_id=reply.pk)}
+
     def test_mark_thread_read(self):
         msg = Message.objects.create(is_read=False)
         mark_thread_read(message=msg)
@@ -1,20 +1,10 @@
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from system.services.loyalty import LoyaltyService
 
 
 class TestLoyaltyService:
-    def test_completed_streak_logic(self):
-        rows = [
-            {"id": 1, "datetime_start": "2026-04-01T10:00", "status": "completed", "is_past": True},
-            {"id": 2, "datetime_start": "2026-04-02T10:00", "status": "completed", "is_past": True},
-            {"id": 3, "datetime_start": "2026-04-03T10:00", "status": "cancelled", "is_past": True},
-            {"id": 4, "datetime_start": "2026-04-04T10:00", "status": "completed", "is_past": True},
-        ]
-        # Should be 1, because the streak is broken by the cancellation at id=3 (sorting reverse)
-        assert LoyaltyService._completed_streak(rows) == 1
-
     def test_level_and_progress_calculation(self):
         # Thresholds: 0, 200, 500, 1000
 
@@ -39,86 +29,27 @@ class TestLoyaltyService:
         assert progress == 100
 
     def test_multiplier_calculation(self):
-        # Mock profile and rows
-        profile = MagicMock()
-        rows = [
-            # 5 completed -> +0.075 (5 * 0.015)
-            # Streak 3 completed -> +0.06 (3 * 0.02)
-            # 1 no_show -> -0.08
-            # Total: 1.0 + 0.075 + 0.06 - 0.08 = 1.055
-            {
-                "status": "completed",
-                "amount": Decimal("100"),
-                "is_late_cancel": False,
-                "is_overdue_pending": False,
-                "is_reschedule": False,
-                "is_past": True,
-                "datetime_start": "2026-04-01",
-                "id": 1,
-            },
-            {
-                "status": "completed",
-                "amount": Decimal("100"),
-                "is_late_cancel": False,
-                "is_overdue_pending": False,
-                "is_reschedule": False,
-                "is_past": True,
-                "datetime_start": "2026-04-02",
-                "id": 2,
-            },
-            {
-                "status": "completed",
-                "amount": Decimal("100"),
-                "is_late_cancel": False,
-                "is_overdue_pending": False,
-                "is_reschedule": False,
-                "is_past": True,
-                "datetime_start": "2026-04-03",
-                "id": 3,
-            },
-            {
-                "status": "completed",
-                "amount": Decimal("100"),
-                "is_late_cancel": False,
-                "is_overdue_pending": False,
-                "is_reschedule": False,
-                "is_past": False,
-                "datetime_start": "2026-04-04",
-                "id": 4,
-            },
-            {
-                "status": "completed",
-                "amount": Decimal("100"),
-                "is_late_cancel": False,
-                "is_overdue_pending": False,
-                "is_reschedule": False,
-                "is_past": False,
-                "datetime_start": "2026-04-05",
-                "id": 5,
-            },
-            {
-                "status": "completed",
-                "amount": Decimal("100"),
-                "is_late_cancel": False,
-                "is_overdue_pending": False,
-                "is_reschedule": False,
-                "is_past": True,
-                "datetime_start": "2026-04-06",
-                "id": 6,
-            },
-        ]
+        stats = {
+            **LoyaltyService.EMPTY_STATS,
+            "paid_spend": Decimal("600"),
+            "completed_count": 6,
+            "current_completed_streak": 4,
+            "appointment_count": 6,
+        }
+
+        result = LoyaltyService._calculate(stats)
+
+        # 1.0 + 6*0.015 + 4*0.02 = 1.0 + 0.09 + 0.08 = 1.17
+        assert result["behavior_multiplier"] == Decimal("1.17")
+        # Effective score: 600 * 1.17 = 702
+        assert result["effective_spend_score"] == Decimal("702.00")
+        assert result["level"] == 3
+        assert result["stats"]["paid_spend"] == "600.00"
 
-        with (
-            patch.object(LoyaltyService, "_source_rows", return_value=rows),
-            patch.object(LoyaltyService, "_hash_rows", return_value="hash"),
-        ):
-            _hash, result = LoyaltyService._calculate(profile)
+    def test_multiplier_is_clamped(self):
+        stats = {**LoyaltyService.EMPTY_STATS, "paid_spend": Decimal("100"), "no_show_count": 10}
 
-            # 1.0 + 6*0.015 + 4*0.02 = 1.0 + 0.09 + 0.08 = 1.17
-            assert result["behavior_multiplier"] == Decimal("1.17")
-            # Effective score: 600 * 1.17 = 702
-            assert result["effective_spend_score"] == Decimal("702.00")
-            assert result["level"] == 3
+        assert LoyaltyService._calculate(stats)["behavior_multiplier"] == LoyaltyService.MIN_MULTIPLIER
 
     def test_display_data_mapping(self):
         loyalty = MagicMock()
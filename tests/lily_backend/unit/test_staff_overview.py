@@ -0,0 +1,128 @@
+"""Unit tests for features/booking/selector/staff.py and the staff grid built on it."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+from django.utils import timezone
+from features.booking.redis import StaffOverviewVersionManager
+from features.booking.selector import staff
+from features.booking.selector.staff import get_staff_overview, load_staff_overview
+from features.booking.selector.versioned import VersionedCache
+from system.selectors.masters import MasterSelector
+from tests.factories.booking import MasterFactory
+from tests.factories.main import ServiceFactory
+
+
+@pytest.fixture
+def staff_manager(monkeypatch, fake_sync_redis):
+    """Overview version backed by fakeredis with Redis enabled."""
+    manager = StaffOverviewVersionManager(sync_client_factory=lambda: fake_sync_redis)
+    monkeypatch.setattr(StaffOverviewVersionManager, "_is_disabled", lambda self: False)
+    monkeypatch.setattr(staff, "_cache", VersionedCache("Staff overview", lambda: manager))
+    return manager
+
+
+@pytest.fixture
+def team():
+    masters = [MasterFactory(slug=f"master-{index}", order=index) for index in range(4)]
+    for master in masters:
+        ServiceFactory(is_active=True).masters.add(master)
+        ServiceFactory(is_active=False).masters.add(master)
+    return masters
+
+
+@pytest.mark.unit
+class TestLoadStaffOverview:
+    def test_query_count_does_not_grow_with_masters(self, team, django_assert_num_queries):
+        with django_assert_num_queries(4):
+            overview = load_staff_overview()
+
+        for master in team:
+            figures = overview.get(master.pk)
+            assert figures.weekdays == tuple(range(7))
+            assert figures.active_services_count == 1
+
+    def test_counts_only_upcoming_active_appointments_and_days_off(self, pending_appointment, master):
+        from features.booking.models import Appointment, MasterDayOff
+
+        Appointment.objects.filter(pk=pending_appointment.pk).update(status=Appointment.STATUS_CONFIRMED)
+        past = timezone.now() - dt.timedelta(days=3)
+        Appointment.objects.create(
+            client=pending_appointment.client,
+            master=master,
+            service=pending_appointment.service,
+            datetime_start=past,
+            duration_minutes=60,
+            price=pending_appointment.price,
+            status=Appointment.STATUS_CONFIRMED,
+        )
+        today = timezone.localdate()
+        MasterDayOff.objects.create(master=master, date=today + dt.timedelta(days=5))
+        MasterDayOff.objects.create(master=master, date=today - dt.timedelta(days=5))
+
+        figures = load_staff_overview().get(master.pk)
+
+        assert figures.upcoming_appointments_count == 1
+        assert figures.upcoming_days_off_count == 1
+
+    def test_master_without_rows_gets_empty_figures(self):
+        master = MasterFactory(working_days=False)
+
+        figures = load_staff_overview().get(master.pk)
+
+        assert (figures.weekdays, figures.active_services_count) == ((), 0)
+
+
+@pytest.mark.unit
+class TestGetStaffOverview:
+    def test_reused_until_a_service_link_changes(self, team, staff_manager, django_assert_num_queries):
+        first = get_staff_overview()
+
+        with django_assert_num_queries(0):
+            assert get_staff_overview() is first
+
+        ServiceFactory(is_active=True).masters.add(team[0])
+
+        assert get_staff_overview().get(team[0].pk).active_services_count == 2
+
+    def test_schedule_change_reloads(self, team, staff_manager):
+        get_staff_overview()
+
+        team[1].working_days.filter(weekday=6).delete()
+
+        assert get_staff_overview().get(team[1].pk).weekdays == tuple(range(6))
+
+    def test_appointment_note_keeps_the_overview(self, pending_appointment, staff_manager):
+        first = get_staff_overview()
+
+        pending_appointment.admin_notes = "VIP"
+        pending_appointment.save(update_fields=["admin_notes"])
+        assert get_staff_overview() is first
+
+        pending_appointment.cancel()
+        assert get_staff_overview().get(pending_appointment.master_id).upcoming_appointments_count == 0
+
+    def test_shared_version_bump_reloads(self, team, staff_manager):
+        first = get_staff_overview()
+
+        staff_manager.bump_version()
+
+        assert get_staff_overview() is not first
+
+    def test_disabled_redis_loads_every_time(self, team, django_assert_num_queries):
+        get_staff_overview()
+
+        with django_assert_num_queries(4):
+            get_staff_overview()
+
+
+@pytest.mark.unit
+def test_masters_grid_query_count_does_not_grow_with_masters(team, django_assert_num_queries):
+    # Masters, their prefetched categories and the four overview aggregates.
+    with django_assert_num_queries(6):
+        grid = MasterSelector.get_masters_grid()
+
+    assert len(grid.items) == len(team)
+    assert all(item.badge == "Booking Ready" for item in grid.items)
@@ -8,7 +8,12 @@ from django.urls import reverse
 from django.utils import timezone
 
 from src.lily_backend.cabinet.services.staff import StaffService
-from src.lily_backend.cabinet.views.staff import StaffDaysOffView, StaffListView, StaffQuickEditView
+from src.lily_backend.cabinet.views.staff import (
+    StaffDaysOffRangeView,
+    StaffDaysOffView,
+    StaffListView,
+    StaffQuickEditView,
+)
 
 
 @pytest.fixture
@@ -154,6 +159,119 @@ def test_staff_service_save_days_off_blocks_dates_with_active_appointments(maste
     assert result["blocked_dates"] == [blocked_day]
 
 
+def test_staff_service_save_days_off_ranges_closes_recurring_days_for_several_masters(
+    master, service, client_obj, django_assert_max_num_queries
+):
+    from features.booking.models.appointment import Appointment
+    from features.booking.models.schedule import MasterDayOff
+    from tests.factories.booking import MasterFactory
+
+    second = MasterFactory(slug="second-master")
+    MasterDayOff.objects.create(master=second, date=dt.date(2026, 8, 3))
+    Appointment.objects.create(
+        client=client_obj,
+        master=master,
+        service=service,
+        datetime_start=timezone.make_aware(dt.datetime(2026, 8, 10, 10, 0)),
+        duration_minutes=service.duration,
+        price=service.price,
+        status=Appointment.STATUS_CONFIRMED,
+    )
+
+    # Masters, existing rows, grouped conflicts and one bulk insert, however many days.
+    with django_assert_max_num_queries(6):
+        result = StaffService.save_days_off_ranges(
+            master_ids=[master.pk, second.pk, 999_999],
+            ranges=[(dt.date(2026, 8, 1), dt.date(2026, 8, 31))],
+            weekdays=[0],
+            reason="Summer",
+        )
+
+    mondays = [dt.date(2026, 8, day) for day in (3, 10, 17, 24, 31)]
+    assert result["conflicts"] == {master.pk: [dt.date(2026, 8, 10)]}
+    assert result["created"] == 8
+    assert set(MasterDayOff.objects.filter(master=master).values_list("date", flat=True)) == set(mondays) - {
+        dt.date(2026, 8, 10)
+    }
+    assert set(MasterDayOff.objects.filter(master=second).values_list("date", flat=True)) == set(mondays)
+    assert MasterDayOff.objects.get(master=master, date=dt.date(2026, 8, 3)).reason == "Summer"
+
+
+def test_staff_service_save_days_off_ranges_remove_reopens_only_the_range(master):
+    from features.booking.models.schedule import MasterDayOff
+
+    for day in (1, 2, 20):
+        MasterDayOff.objects.create(master=master, date=dt.date(2026, 8, day))
+
+    result = StaffService.save_days_off_ranges(
+        master_ids=[master.pk],
+        ranges=[(dt.date(2026, 8, 1), dt.date(2026, 8, 10))],
+        remove=True,
+    )
+
+    assert (result["created"], result["deleted"], result["conflicts"]) == (0, 2, {})
+    assert list(MasterDayOff.objects.filter(master=master).values_list("date", flat=True)) == [dt.date(2026, 8, 20)]
+
+
+def test_staff_service_save_days_off_ranges_rejects_backwards_range(master):
+    with pytest.raises(ValueError):
+        StaffService.save_days_off_ranges(
+            master_ids=[master.pk],
+            ranges=[(dt.date(2026, 8, 10), dt.date(2026, 8, 1))],
+        )
+
+
+def test_staff_days_off_range_view_post(rf, staff_user, master, mock_staff_service):
+    url = reverse("cabinet:staff_days_off_range")
+    request = rf.post(
+        url,
+        data={
+            "masters": [str(master.pk)],
+            "date_from": "2026-08-01",
+            "date_to": "2026-08-31",
+            "weekdays": ["0"],
+            "action": "add",
+            "reason": "Vacation",
+        },
+    )
+    request.user = staff_user
+    mock_staff_service.save_days_off_ranges.return_value = {
+        "created": 4,
+        "deleted": 0,
+        "conflicts": {master.pk: [dt.date(2026, 8, 10)]},
+    }
+
+    with patch("src.lily_backend.cabinet.views.staff.messages") as mock_messages:
+        response = StaffDaysOffRangeView.as_view()(request)
+
+    assert response.status_code == 302
+    assert response.url == f"{reverse('cabinet:staff_days_off')}?master_id={master.pk}&year=2026&month=8"
+    mock_staff_service.save_days_off_ranges.assert_called_once_with(
+        master_ids=[master.pk],
+        ranges=[(dt.date(2026, 8, 1), dt.date(2026, 8, 31))],
+        weekdays=[0],
+        remove=False,
+        reason="Vacation",
+    )
+    assert "2026-08-10" in str(mock_messages.warning.call_args)
+    mock_messages.success.assert_called_once()
+
+
+def test_staff_days_off_range_view_rejects_invalid_range(rf, staff_user, master, mock_staff_service):
+    request = rf.post(
+        reverse("cabinet:staff_days_off_range"),
+        data={"masters": [str(master.pk)], "date_from": "2026-08-31", "date_to": "2026-08-01", "action": "add"},
+    )
+    request.user = staff_user
+
+    with patch("src.lily_backend.cabinet.views.staff.messages") as mock_messages:
+        response = StaffDaysOffRangeView.as_view()(request)
+
+    assert response.status_code == 302
+    mock_staff_service.save_days_off_ranges.assert_not_called()
+    mock_messages.error.assert_called_once()
+
+
 def test_staff_quick_edit_post_valid(rf, staff_user):
     url = reverse("cabinet:staff_modal", kwargs={"pk": 1})
     request = rf.post(url, data={"name": "Updated"})
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.workers.notification_worker.services.campaign_status_reporter import (
+    BULK_STATUS_PATH,
+    MAX_ITEMS_PER_REQUEST,
+    CampaignStatusReporter,
+    post_campaign_statuses,
+)
+
+
+def _item(index: int, status: str = "sent") -> dict[str, str]:
+    return {"notification_id": f"campaign_1_{index}", "status": status, "error": ""}
+
+
+@pytest.fixture
+def internal_api():
+    return MagicMock(post=AsyncMock())
+
+
+def _posted_items(internal_api) -> list[list[str]]:
+    return [
+        [item["notification_id"] for item in call.kwargs["json"]["items"]] for call in internal_api.post.call_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_buffer_reaches_size(internal_api):
+    reporter = CampaignStatusReporter(internal_api, "ops-token", flush_size=3, flush_interval=60)
+
+    for index in range(7):
+        await reporter.report(f"campaign_1_{index}", "sent")
+
+    assert _posted_items(internal_api) == [
+        ["campaign_1_0", "campaign_1_1", "campaign_1_2"],
+        ["campaign_1_3", "campaign_1_4", "campaign_1_5"],
+    ]
+    args, kwargs = internal_api.post.call_args
+    assert args[0] == BULK_STATUS_PATH
+    assert (kwargs["scope"], kwargs["token"]) == ("campaigns.worker", "ops-token")
+
+    await reporter.close()
+
+    assert _posted_items(internal_api)[-1] == ["campaign_1_6"]
+
+
+@pytest.mark.asyncio
+async def test_background_loop_flushes_by_time(internal_api):
+    reporter = CampaignStatusReporter(internal_api, "ops-token", flush_size=100, flush_interval=0.01)
+    reporter.start()
+
+    await reporter.report_many([_item(1), _item(2, "failed")])
+    await asyncio.sleep(0.05)
+
+    assert _posted_items(internal_api) == [["campaign_1_1", "campaign_1_2"]]
+    await reporter.close()
+    internal_api.post.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried_after_backoff(internal_api, monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: clock["now"])
+    internal_api.post.side_effect = ConnectionError("backend down")
+    reporter = CampaignStatusReporter(internal_api, "ops-token", flush_size=2, flush_interval=2.0)
+
+    await reporter.report_many([_item(1), _item(2)])
+    internal_api.post.side_effect = None
+    await reporter.report(_item(3)["notification_id"], "sent")
+
+    assert reporter.pending == 3
+    assert internal_api.post.await_count == 1
+
+    clock["now"] += 4.0
+    await reporter.flush()
+
+    assert _posted_items(internal_api)[-1] == ["campaign_1_1", "campaign_1_2", "campaign_1_3"]
+    assert reporter.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_partially_posted_flush_requeues_only_the_rest(internal_api):
+    internal_api.post.side_effect = [None, ConnectionError("backend down")]
+    reporter = CampaignStatusReporter(internal_api, "ops-token", flush_size=MAX_ITEMS_PER_REQUEST)
+
+    await reporter.report_many([_item(index) for index in range(MAX_ITEMS_PER_REQUEST + 3)])
+    internal_api.post.side_effect = None
+    await reporter.close()
+
+    assert _posted_items(internal_api)[-1] == [f"campaign_1_{index}" for index in range(500, 503)]
+    assert reporter.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_buffer_drops_oldest_items_beyond_cap(internal_api):
+    internal_api.post.side_effect = ConnectionError("backend down")
+    reporter = CampaignStatusReporter(internal_api, "ops-token", flush_size=2, max_buffered=3)
+
+    await reporter.report_many([_item(1), _item(2)])
+    await reporter.flush(force=True)
+    await reporter.report_many([_item(3), _item(4)])
+    await reporter.flush(force=True)
+
+    assert [item["notification_id"] for item in reporter._buffer] == ["campaign_1_2", "campaign_1_3", "campaign_1_4"]
+
+
+@pytest.mark.asyncio
+async def test_post_chunks_to_backend_limit(internal_api):
+    await post_campaign_statuses(
+        internal_api, "ops-token", [_item(index) for index in range(MAX_ITEMS_PER_REQUEST + 1)]
+    )
+
+    assert [len(chunk) for chunk in _posted_items(internal_api)] == [MAX_ITEMS_PER_REQUEST, 1]
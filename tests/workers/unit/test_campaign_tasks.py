@@ -2,12 +2,14 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from src.workers.notification_worker.tasks.campaign_tasks import send_campaign_batch_task
 
+
 @pytest.fixture
 def mock_ctx():
     return {
         "arq_pool": MagicMock(enqueue_job=AsyncMock()),
     }
 
+
 @pytest.mark.asyncio
 async def test_send_campaign_batch_task_success(mock_ctx):
     payload = {
@@ -16,7 +18,13 @@ async def test_send_campaign_batch_task_success(mock_ctx):
         "body_text": "Body",
         "arq_template_name": "mk_basic",
         "recipients": [
-            {"id": 101, "email": "test@example.com", "first_name": "Anna", "last_name": "L", "unsubscribe_token": "token1"},
+            {
+                "id": 101,
+                "email": "test@example.com",
+                "first_name": "Anna",
+                "last_name": "L",
+                "unsubscribe_token": "token1",
+            },
         ],
         "site_context": {"site_url": "http://site"},
     }
@@ -34,7 +42,95 @@ async def test_send_campaign_batch_task_success(mock_ctx):
     assert task_payload["context_data"]["unsubscribe_url"] == "http://site/u/token1/"
     assert task_payload["context_data"]["body_text"] == "Body"
 
+
 @pytest.mark.asyncio
 async def test_send_campaign_batch_task_empty(mock_ctx):
     await send_campaign_batch_task(mock_ctx, payload={"recipients": []})
     mock_ctx["arq_pool"].enqueue_job.assert_not_called()
+
+
+def _batch_payload(count=3):
+    return {
+        "campaign_id": 7,
+        "subject": "Spring",
+        "body_text": "Body",
+        "arq_template_name": "mk_basic",
+        "send_mode": "batch",
+        "recipients": [
+            {
+                "id": 100 + index,
+                "email": f"client{index}@example.com",
+                "first_name": f"Anna<{index}>",
+                "last_name": "L",
+                "unsubscribe_token": f"tok{index}",
+            }
+            for index in range(count)
+        ],
+        "site_context": {"site_url": "http://site/"},
+    }
+
+
+@pytest.fixture
+async def batch_ctx(mock_ctx):
+    service = MagicMock()
+    service.render_email.return_value = "<p>__lily_campaign_name__|__lily_campaign_unsubscribe_url__</p>"
+    service.send_rendered_notification = AsyncMock()
+    mock_ctx.update(
+        notification_service=service,
+        internal_api=MagicMock(post=AsyncMock()),
+        settings=MagicMock(
+            ops_worker_api_key="ops-token",
+            campaign_batch_concurrency=2,
+            campaign_status_flush_size=200,
+            campaign_status_flush_interval_sec=60.0,
+        ),
+    )
+    yield mock_ctx
+    if mock_ctx.get("campaign_status_reporter"):
+        await mock_ctx["campaign_status_reporter"].close()
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_renders_once_and_reports_in_bulk(batch_ctx):
+    await send_campaign_batch_task(batch_ctx, payload=_batch_payload())
+
+    service = batch_ctx["notification_service"]
+    service.render_email.assert_called_once()
+    assert service.send_rendered_notification.await_count == 3
+    batch_ctx["arq_pool"].enqueue_job.assert_not_called()
+
+    email, subject, html = service.send_rendered_notification.await_args_list[0].args
+    assert (email, subject) == ("client0@example.com", "Spring")
+    assert html == "<p>Anna&lt;0&gt;|http://site/u/tok0/</p>"
+
+    batch_ctx["internal_api"].post.assert_not_called()
+    await batch_ctx["campaign_status_reporter"].flush()
+    batch_ctx["internal_api"].post.assert_awaited_once()
+    args, kwargs = batch_ctx["internal_api"].post.call_args
+    assert args[0] == "/v1/conversations/campaigns/recipient-status/bulk"
+    assert [item["status"] for item in kwargs["json"]["items"]] == ["sent", "sent", "sent"]
+    assert kwargs["json"]["items"][2]["notification_id"] == "campaign_7_102"
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_reports_partial_failures(batch_ctx):
+    batch_ctx["notification_service"].send_rendered_notification.side_effect = [None, OSError("refused"), None]
+
+    await send_campaign_batch_task(batch_ctx, payload=_batch_payload())
+    await batch_ctx["campaign_status_reporter"].flush()
+
+    items = batch_ctx["internal_api"].post.call_args.kwargs["json"]["items"]
+    assert [item["status"] for item in items] == ["sent", "failed", "sent"]
+    assert items[1]["error"] == "refused"
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_retries_when_nothing_was_sent(batch_ctx):
+    from arq import Retry
+
+    batch_ctx["notification_service"].send_rendered_notification.side_effect = OSError("smtp down")
+
+    with pytest.raises(Retry):
+        await send_campaign_batch_task(batch_ctx, payload=_batch_payload())
+
+    assert batch_ctx.get("campaign_status_reporter") is None
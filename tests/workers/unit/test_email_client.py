@@ -66,3 +66,18 @@ async def test_smtp_ssl_port(email_client):
         kwargs = mock_send.call_args[1]
         assert kwargs["use_tls"] is True
         assert kwargs["start_tls"] is False
+
+
+@pytest.mark.asyncio
+async def test_sendgrid_uses_shared_http_client():
+    http_client = MagicMock()
+    http_client.post = AsyncMock(return_value=MagicMock(status_code=202))
+    client = AsyncEmailClient(
+        "host", 587, sendgrid_api_key="SG.xxx", http_client=http_client
+    )  # pragma: allowlist secret
+
+    with patch("aiosmtplib.send", side_effect=Exception("SMTP Down")), patch("httpx.AsyncClient") as client_cls:
+        await client.send_email("to@test.com", "Subject", "<h1>Content</h1>")
+
+    http_client.post.assert_awaited_once()
+    client_cls.assert_not_called()
@@ -7,10 +7,10 @@ from src.workers.system_worker.config import WorkerSettings
 from src.workers.system_worker.tasks.email_import import (
     _extract_text,
     _fetch_emails,
-    _fetch_one,
+    _fetch_raw_batch,
     _find_thread_key,
     _looks_like_spam,
-    _move_message,
+    _move_messages,
     _schedule_next,
     import_emails_task,
 )
@@ -60,8 +60,17 @@ class TestEmailImportLogic:
         # 5. store(1) -> OK
         mock_conn.uid.side_effect = [
             ("OK", [b"1"]),  # search
-            ("OK", [b"RFC822.SIZE 100", (None, b"From: anna@test.com\r\nSubject: Test\r\n\r\n")]),  # fetch meta
-            ("OK", [(None, b"From: anna@test.com\r\nSubject: Test\r\n\r\nBody")]),  # fetch body
+            (
+                "OK",
+                [
+                    (b"1 (UID 1 RFC822.SIZE 100 BODY[HEADER] {36}", b"From: anna@test.com\r\nSubject: Test\r\n\r\n"),
+                    b")",
+                ],
+            ),  # fetch meta
+            (
+                "OK",
+                [(b"1 (UID 1 BODY[] {40}", b"From: anna@test.com\r\nSubject: Test\r\n\r\nBody"), b")"],
+            ),  # fetch body
             ("OK", [b"OK"]),  # copy
             ("OK", [b"OK"]),  # store
         ]
@@ -71,15 +80,23 @@ class TestEmailImportLogic:
         assert emails[0].sender_email == "anna@test.com"
 
     @patch("src.workers.system_worker.tasks.email_import.imaplib.IMAP4_SSL")
-    def test_fetch_one_oversized(self, mock_imap, settings):
+    def test_fetch_raw_batch_oversized(self, mock_imap, settings):
+        from src.workers.system_worker.tasks.email_import import _parse_raw
+
         mock_conn = MagicMock()
         # RFC822.SIZE 9999999
-        mock_conn.uid.return_value = ("OK", [b"RFC822.SIZE 9999999", (None, b"From: a@b.c\r\n\r\n")])
+        mock_conn.uid.return_value = (
+            "OK",
+            [(b"1 (UID 1 RFC822.SIZE 9999999 BODY[HEADER] {15}", b"From: a@b.c\r\n\r\n"), b")"],
+        )
 
         settings.email_import_max_raw_bytes = 1000
-        item = _fetch_one(mock_conn, "1", settings)
+        (raw,) = _fetch_raw_batch(mock_conn, ["1"], settings)
+        item = _parse_raw(raw, settings)
         assert item.oversized is True
         assert item.body == ""
+        # No body fetch for oversized messages
+        mock_conn.uid.assert_called_once()
 
     def test_looks_like_spam(self):
         assert _looks_like_spam(sender_email="scam@scam.com", subject="Meta Business", body="Verify account") is True
@@ -130,10 +147,14 @@ class TestEmailImportLogic:
 
         with patch("src.workers.system_worker.tasks.email_import._fetch_emails") as mock_fetch:
             mock_fetch.return_value = [MagicMock(spam=False, oversized=False), MagicMock(spam=True, oversized=False)]
+            ctx["internal_api"].post.return_value = {
+                "results": [{"status": "message-created"}, {"status": "message-created"}]
+            }
             res = await import_emails_task(ctx)
             assert res["imported"] == 2
             assert res["spam"] == 1
-            assert ctx["internal_api"].post.call_count == 2
+            # One bulk request for both emails
+            assert ctx["internal_api"].post.call_count == 1
 
     @pytest.mark.asyncio
     async def test_import_emails_task_failure(self, ctx):
@@ -151,7 +172,7 @@ class TestEmailImportLogic:
         import imaplib
 
         mock_conn.uid.side_effect = imaplib.IMAP4.error("imap failure")
-        _move_message(mock_conn, "1", "Folder")
+        _move_messages(mock_conn, ["1"], "Folder")
 
     @pytest.mark.asyncio
     async def test_schedule_next(self, ctx):
@@ -210,17 +231,17 @@ class TestEmailImportLogic:
         assert _fetch_emails(settings) == []
 
     @patch("src.workers.system_worker.tasks.email_import.imaplib.IMAP4_SSL")
-    def test_fetch_emails_fetch_one_none(self, mock_imap, settings):
+    def test_fetch_emails_header_fetch_failed(self, mock_imap, settings):
         mock_conn = MagicMock()
         mock_imap.return_value = mock_conn
         mock_conn.uid.side_effect = [
             ("OK", [b"1"]),  # search
-            ("ERROR", []),  # fetch meta (causes fetch_one to return None)
+            ("ERROR", []),  # fetch meta (no message of the batch is imported)
         ]
         assert _fetch_emails(settings) == []
 
     def test_move_message_no_folder(self):
-        _move_message(MagicMock(), "1", "")
+        _move_messages(MagicMock(), ["1"], "")
         # Should return silently
 
     @pytest.mark.asyncio
@@ -228,5 +249,6 @@ class TestEmailImportLogic:
         ctx["heartbeat_registry"].should_run.return_value = True
         with patch("src.workers.system_worker.tasks.email_import._fetch_emails") as mock_fetch:
             mock_fetch.return_value = [MagicMock(spam=False, oversized=True)]
+            ctx["internal_api"].post.return_value = {"results": [{"status": "message-created"}]}
             res = await import_emails_task(ctx)
             assert res["oversized"] == 1
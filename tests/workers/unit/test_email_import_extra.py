@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.workers.system_worker.tasks.email_import import _fetch_emails, _fetch_one, _extract_literal
+from src.workers.system_worker.tasks.email_import import _fetch_emails, _fetch_raw_batch, _split_fetch_response
 
 @pytest.fixture
 def mock_settings():
@@ -15,6 +15,8 @@ def mock_settings():
     s.email_import_stale_after_sec = 120
     s.email_import_max_raw_bytes = 1024
     s.email_import_max_body_chars = 1000
+    s.email_import_parse_workers = 1
+    s.email_import_post_chunk_size = 25
     s.conversations_import_api_key = "test-key"  # pragma: allowlist secret
     return s
 
@@ -25,24 +27,24 @@ def test_fetch_emails_search_failed(mock_settings):
         res = _fetch_emails(mock_settings)
         assert res == []
 
-def test_fetch_one_failed(mock_settings):
+def test_fetch_raw_batch_failed(mock_settings):
     mbox = MagicMock()
     mbox.uid.return_value = ("NO", None)
-    res = _fetch_one(mbox, "1", mock_settings)
-    assert res is None
+    res = _fetch_raw_batch(mbox, ["1"], mock_settings)
+    assert res == []
 
 def test_fetch_emails_item_none(mock_settings):
     with patch("imaplib.IMAP4_SSL") as mock_imap:
         mbox = mock_imap.return_value
         mbox.uid.side_effect = [
             ("OK", [b"1"]), # search
-            ("NO", None), # fetch in _fetch_one
+            ("NO", None), # header fetch for the batch
         ]
         res = _fetch_emails(mock_settings)
         assert res == []
 
-def test_extract_literal_none():
-    assert _extract_literal(["not a tuple"]) is None
+def test_split_fetch_response_ignores_untagged_junk():
+    assert _split_fetch_response([None, "not bytes"]) == {}
 
 @pytest.mark.asyncio
 async def test_import_emails_with_spam(mock_settings):
@@ -50,7 +52,7 @@ async def test_import_emails_with_spam(mock_settings):
     ctx = {
         "settings": mock_settings,
         "heartbeat_registry": MagicMock(should_run=AsyncMock(return_value=True), mark_started=AsyncMock(), mark_finished=AsyncMock(), release_lock=AsyncMock()),
-        "internal_api": MagicMock(post=AsyncMock()),
+        "internal_api": MagicMock(post=AsyncMock(return_value={"results": [{"status": "message-created"}]})),
         "arq_service": MagicMock(enqueue_job=AsyncMock()),
     }
 
@@ -60,6 +62,10 @@ async def test_import_emails_with_spam(mock_settings):
         message_id="id", in_reply_to="", references=[], attachments=[], raw_size=100
     )
 
-    with patch("src.workers.system_worker.tasks.email_import._fetch_emails", return_value=[spam_item]):
+    with (
+        patch("src.workers.system_worker.tasks.email_import._fetch_emails", return_value=[spam_item]),
+        patch("src.workers.system_worker.tasks.email_import._file_messages") as file_messages,
+    ):
         res = await import_emails_task(ctx)
         assert res["spam"] == 1
+        file_messages.assert_called_once_with(mock_settings, [spam_item], [])
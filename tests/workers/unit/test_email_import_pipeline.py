@@ -0,0 +1,244 @@
+import imaplib
+import multiprocessing
+import socketserver
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from email.message import EmailMessage
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.workers.system_worker.config import WorkerSettings
+from src.workers.system_worker.tasks import email_import
+from src.workers.system_worker.tasks.email_import import _fetch_emails, _file_messages, import_emails_task
+
+
+class LocalImapServer(socketserver.ThreadingTCPServer):
+    """Minimal IMAP4rev1 stand-in: one mailbox of unseen messages, records every command it receives."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, messages: dict[int, bytes], *, supports_move: bool = True):
+        super().__init__(("127.0.0.1", 0), _ImapHandler)
+        self.messages = messages
+        self.supports_move = supports_move
+        self.commands: list[str] = []
+        self.moved: dict[str, list[int]] = {}
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def count(self, prefix: str) -> int:
+        return sum(1 for command in self.commands if command.startswith(prefix))
+
+
+class _ImapHandler(socketserver.StreamRequestHandler):
+    server: LocalImapServer
+
+    def reply(self, line: str | bytes) -> None:
+        self.wfile.write((line.encode() if isinstance(line, str) else line) + b"\r\n")
+
+    def handle(self) -> None:
+        self.reply("* OK IMAP4rev1 stand-in ready")
+        while line := self.rfile.readline():
+            tag, _, rest = line.decode().strip().partition(" ")
+            command = rest.upper()
+            self.server.commands.append(command)
+            if command.startswith("CAPABILITY"):
+                self.reply("* CAPABILITY IMAP4rev1" + (" MOVE" if self.server.supports_move else ""))
+            elif command.startswith("SELECT"):
+                self.reply(f"* {len(self.server.messages)} EXISTS")
+            elif command.startswith("UID SEARCH"):
+                self.reply("* SEARCH " + " ".join(str(uid) for uid in self.server.messages))
+            elif command.startswith("UID FETCH"):
+                self._fetch(rest.split(" ", 3)[2], command)
+            elif command.startswith(("UID MOVE", "UID COPY")):
+                _, _, uid_set, folder = rest.split(" ", 3)
+                self.server.moved.setdefault(folder, []).extend(int(uid) for uid in uid_set.split(","))
+            elif command.startswith("LOGOUT"):
+                self.reply("* BYE")
+                self.reply(f"{tag} OK LOGOUT completed")
+                return
+            self.reply(f"{tag} OK completed")
+
+    def _fetch(self, uid_set: str, command: str) -> None:
+        uids = list(self.server.messages)
+        for uid in (int(value) for value in uid_set.split(",")):
+            raw = self.server.messages[uid]
+            if "BODY.PEEK[HEADER]" in command:
+                literal = raw.split(b"\r\n\r\n", 1)[0] + b"\r\n\r\n"
+                prefix = (
+                    f"* {uids.index(uid) + 1} FETCH (UID {uid} RFC822.SIZE {len(raw)} BODY[HEADER] {{{len(literal)}}}"
+                )
+            else:
+                literal = raw
+                prefix = f"* {uids.index(uid) + 1} FETCH (UID {uid} BODY[] {{{len(literal)}}}"
+            self.reply(prefix)
+            self.wfile.write(literal)
+            self.reply(")")
+
+
+def _raw_email(sender: str, subject: str, body: str) -> bytes:
+    msg = EmailMessage()
+    msg["From"] = sender
+    msg["Subject"] = subject
+    msg["Message-ID"] = f"<{subject.replace(' ', '-')}@example.com>"
+    msg.set_content(body)
+    return msg.as_bytes().replace(b"\n", b"\r\n")
+
+
+@pytest.fixture
+def messages() -> dict[int, bytes]:
+    return {
+        11: _raw_email("anna@example.com", "Termin", "Kann ich morgen kommen?"),
+        12: _raw_email("promo@example.com", "Casino bonus", "Your casino wallet is ready"),
+        13: _raw_email("big@example.com", "Large", "x" * 4000),
+        14: _raw_email("bob@example.com", "Frage", "Haben Sie Samstag offen?"),
+    }
+
+
+def _serve(server: LocalImapServer) -> LocalImapServer:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def imap_server(messages, monkeypatch):
+    monkeypatch.setattr(email_import.imaplib, "IMAP4_SSL", imaplib.IMAP4)
+    server = _serve(LocalImapServer(messages))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _settings(server: LocalImapServer, **overrides) -> WorkerSettings:
+    values = {
+        "imap_host": "127.0.0.1",
+        "imap_port": server.port,
+        "imap_user": "lily",
+        "imap_password": "secret",  # pragma: allowlist secret
+        "email_import_max_raw_bytes": 2000,
+        "email_import_parse_workers": 1,
+    } | overrides
+    return WorkerSettings(**values)
+
+
+def test_batch_is_fetched_with_two_range_commands(imap_server):
+    emails = _fetch_emails(_settings(imap_server))
+
+    assert [item.uid for item in emails] == ["11", "12", "13", "14"]
+    assert imap_server.count("UID FETCH") == 2
+    assert "UID FETCH 11,12,14 (BODY.PEEK[])" in imap_server.commands
+    assert emails[0].body == "Kann ich morgen kommen?"
+    assert (emails[2].oversized, emails[2].body) == (True, "")
+    assert [item.spam for item in emails] == [False, True, False, False]
+    # Nothing leaves the inbox before the backend stored it
+    assert imap_server.moved == {}
+
+
+def test_large_batches_are_parsed_in_the_worker_pool(imap_server):
+    settings = _settings(imap_server, email_import_parse_workers=2, email_import_parse_pool_min_batch=4)
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        emails = _fetch_emails(settings, parse_pool=pool)
+
+    assert [item.sender_email for item in emails] == [
+        "anna@example.com",
+        "promo@example.com",
+        "big@example.com",
+        "bob@example.com",
+    ]
+    assert emails[3].body == "Haben Sie Samstag offen?"
+
+
+def test_small_batches_are_parsed_inline(imap_server):
+    pool = MagicMock()
+
+    emails = _fetch_emails(_settings(imap_server, email_import_parse_pool_min_batch=5), parse_pool=pool)
+
+    assert len(emails) == 4
+    pool.map.assert_not_called()
+
+
+def test_falls_back_to_range_copy_and_store_without_move(imap_server):
+    imap_server.supports_move = False
+    settings = _settings(imap_server)
+
+    _file_messages(settings, _fetch_emails(settings), [])
+
+    assert imap_server.count("UID MOVE") == 0
+    assert imap_server.count("UID COPY") == 2
+    assert "UID STORE 11,13,14 +FLAGS (\\DELETED)" in imap_server.commands
+
+
+def _ctx(settings: WorkerSettings, internal_api: MagicMock) -> dict:
+    return {
+        "settings": settings,
+        "heartbeat_registry": MagicMock(
+            should_run=AsyncMock(return_value=True),
+            mark_started=AsyncMock(),
+            mark_finished=AsyncMock(),
+            release_lock=AsyncMock(),
+        ),
+        "internal_api": internal_api,
+        "arq_service": None,
+    }
+
+
+def _bulk_results(*statuses: str) -> dict:
+    return {"results": [{"status": status, "error": "boom" if status == "failed" else None} for status in statuses]}
+
+
+@pytest.mark.asyncio
+async def test_task_posts_the_batch_to_the_bulk_endpoint_in_chunks(imap_server):
+    internal_api = MagicMock(
+        post=AsyncMock(
+            side_effect=[
+                _bulk_results("message-created", "message-created", "reply-created"),
+                _bulk_results("message-created"),
+            ]
+        )
+    )
+
+    result = await import_emails_task(_ctx(_settings(imap_server, email_import_post_chunk_size=3), internal_api))
+
+    assert result == {"imported": 4, "failed": 0, "spam": 1, "oversized": 1}
+    assert [call.args[0] for call in internal_api.post.call_args_list] == ["/v1/conversations/import-email/bulk"] * 2
+    assert [len(call.kwargs["json"]["items"]) for call in internal_api.post.call_args_list] == [3, 1]
+    assert imap_server.moved == {"Spam": [12], "Archive": [11, 13, 14]}
+    assert imap_server.count("UID MOVE") == 2
+
+
+@pytest.mark.asyncio
+async def test_partially_failed_batch_keeps_failed_messages_out_of_the_archive(imap_server):
+    internal_api = MagicMock(post=AsyncMock(return_value=_bulk_results("message-created", "message-created", "failed")))
+
+    result = await import_emails_task(_ctx(_settings(imap_server), internal_api))
+
+    # The fourth email got no result at all and counts as failed too
+    assert result == {"imported": 2, "failed": 2, "spam": 1, "oversized": 1}
+    assert imap_server.moved == {"Spam": [12], "Archive": [11]}
+
+
+@pytest.mark.asyncio
+async def test_failed_messages_go_to_the_error_folder_when_set(imap_server):
+    internal_api = MagicMock(
+        post=AsyncMock(return_value=_bulk_results("failed", "message-created", "failed", "reply-created"))
+    )
+
+    await import_emails_task(_ctx(_settings(imap_server, imap_error_folder="Import-Errors"), internal_api))
+
+    assert imap_server.moved == {"Spam": [12], "Archive": [14], "Import-Errors": [11, 13]}
+
+
+@pytest.mark.asyncio
+async def test_chunks_stored_before_a_post_error_are_still_archived(imap_server):
+    internal_api = MagicMock(
+        post=AsyncMock(side_effect=[_bulk_results("message-created", "message-created"), RuntimeError("down")])
+    )
+
+    with pytest.raises(RuntimeError, match="down"):
+        await import_emails_task(_ctx(_settings(imap_server, email_import_post_chunk_size=2), internal_api))
+
+    assert imap_server.moved == {"Spam": [12], "Archive": [11]}
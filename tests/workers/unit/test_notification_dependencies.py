@@ -4,7 +4,11 @@ import pytest
 
 from src.workers.notification_worker.dependencies import (
     close_arq_service,
+    close_campaign_status_reporter,
+    close_email_transport,
     init_arq_service,
+    init_campaign_status_reporter,
+    init_email_transport,
     init_notification_service,
     init_orchestrator,
     init_seven_io_service,
@@ -114,3 +118,50 @@ async def test_init_orchestrator():
     }
     await init_orchestrator(ctx, MagicMock())
     assert "orchestrator" in ctx
+
+
+@pytest.mark.asyncio
+async def test_init_and_close_email_transport():
+    ctx: dict = {
+        "site_settings": MagicMock(
+            smtp_host="smtp",
+            smtp_port=465,
+            smtp_user="user",
+            smtp_password="pass",  # pragma: allowlist secret
+            smtp_use_tls=False,
+        )
+    }
+    settings = MagicMock(
+        smtp_pool_size=3, smtp_max_messages_per_session=50, smtp_idle_timeout_sec=30.0, smtp_noop_after_sec=5.0
+    )
+
+    await init_email_transport(ctx, settings)
+
+    pool = ctx["smtp_pool"]
+    assert (pool.use_tls, pool.start_tls, pool.size, pool.max_messages_per_session) == (True, False, 3, 50)
+    await close_email_transport(ctx, settings)
+    assert ctx["http_client"].is_closed
+
+
+@pytest.mark.asyncio
+async def test_campaign_status_reporter_flushes_on_close():
+    internal_api = MagicMock(post=AsyncMock())
+    ctx: dict = {"internal_api": internal_api}
+    settings = MagicMock(
+        ops_worker_api_key="ops-token", campaign_status_flush_size=50, campaign_status_flush_interval_sec=60.0
+    )
+
+    await init_campaign_status_reporter(ctx, settings)
+    await ctx["campaign_status_reporter"].report("campaign_1_2", "sent")
+    await close_campaign_status_reporter(ctx, settings)
+
+    internal_api.post.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_campaign_status_reporter_disabled_without_token():
+    ctx: dict = {"internal_api": MagicMock()}
+
+    await init_campaign_status_reporter(ctx, MagicMock(ops_worker_api_key=None))
+
+    assert ctx["campaign_status_reporter"] is None
@@ -74,6 +74,8 @@ class TestBotPayloadEnricher:
 def test_helpers():
     assert _mailbox_headers({"thread_key": "xyz"})["X-Lily-Thread-Key"] == "xyz"
     assert _mailbox_headers({}) is None
+    headers = _mailbox_headers({"thread_key": "xyz", "outbound_message_id": "xyz.7@lily.test"})
+    assert (headers["Message-ID"], headers["In-Reply-To"]) == ("<xyz.7@lily.test>", "<xyz>")
     assert _stream_event_type("booking.received") == "new_appointment"
     assert _notification_label("booking.confirmed", None) == "Подтверждение записи"
 
@@ -48,6 +48,13 @@ async def test_report_campaign_status_error(mock_ctx):
         # Should catch and log
         await _report_campaign_status(mock_ctx, "campaign_123", "sent")
 
+@pytest.mark.asyncio
+async def test_report_campaign_status_goes_through_reporter(mock_ctx):
+    mock_ctx["campaign_status_reporter"] = MagicMock(report=AsyncMock())
+    await _report_campaign_status(mock_ctx, "campaign_1_2", "failed", error="boom")
+    mock_ctx["campaign_status_reporter"].report.assert_awaited_once_with("campaign_1_2", "failed", "boom")
+    mock_ctx["internal_api"].post.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_send_universal_rendered_success(mock_ctx):
     payload = {
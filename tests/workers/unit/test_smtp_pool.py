@@ -0,0 +1,170 @@
+import asyncio
+from email.message import EmailMessage
+
+import pytest
+
+from src.workers.core.base_module.email_client import AsyncEmailClient
+from src.workers.core.base_module.smtp_pool import SmtpConnectionPool, smtp_tls_flags
+
+
+class LocalSmtpServer:
+    """Minimal plain-text SMTP stand-in: counts sessions, NOOPs and delivered messages."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.noops = 0
+        self.messages: list[bytes] = []
+        self.writers: list[asyncio.StreamWriter] = []
+        self.port = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.drop_connections()
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_connections(self):
+        for writer in self.writers:
+            writer.close()
+        self.writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.sessions += 1
+        self.writers.append(writer)
+
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        try:
+            await reply("220 localhost ESMTP stand-in")
+            while line := await reader.readline():
+                command = line.decode().strip().upper()
+                if command.startswith("EHLO"):
+                    await reply("250-localhost\r\n250 8BITMIME")
+                elif command.startswith("DATA"):
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    body = b""
+                    while (chunk := await reader.readline()) != b".\r\n":
+                        body += chunk
+                    self.messages.append(body)
+                    await reply("250 OK queued")
+                elif command.startswith("NOOP"):
+                    self.noops += 1
+                    await reply("250 OK")
+                elif command.startswith("QUIT"):
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("250 OK")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def smtp_server():
+    server = LocalSmtpServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _message(index: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "lily@test.com"
+    message["To"] = f"client{index}@test.com"
+    message["Subject"] = f"Hello {index}"
+    message.set_content("Body")
+    return message
+
+
+def _pool(server: LocalSmtpServer, **kwargs) -> SmtpConnectionPool:
+    return SmtpConnectionPool(hostname="127.0.0.1", port=server.port, timeout=5, **kwargs)
+
+
+def test_smtp_tls_flags():
+    assert smtp_tls_flags(465, False) == (True, False)
+    assert smtp_tls_flags(587, False) == (False, True)
+    assert smtp_tls_flags(25, True) == (False, True)
+    assert smtp_tls_flags(25, False) == (False, False)
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_and_recycled(smtp_server):
+    pool = _pool(smtp_server, size=1, max_messages_per_session=3)
+
+    for index in range(7):
+        await pool.send_message(_message(index))
+    await pool.close()
+
+    assert len(smtp_server.messages) == 7
+    assert smtp_server.sessions == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_stay_within_pool_size(smtp_server):
+    pool = _pool(smtp_server, size=2)
+
+    await asyncio.gather(*(pool.send_message(_message(index)) for index in range(10)))
+    await pool.close()
+
+    assert len(smtp_server.messages) == 10
+    assert smtp_server.sessions <= 2
+
+
+@pytest.mark.asyncio
+async def test_idle_session_is_probed_with_noop(smtp_server):
+    pool = _pool(smtp_server, noop_after=0)
+
+    await pool.send_message(_message(1))
+    await pool.send_message(_message(2))
+    await pool.close()
+
+    assert smtp_server.noops == 1
+    assert smtp_server.sessions == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_session_reconnects(smtp_server):
+    pool = _pool(smtp_server, noop_after=60)
+
+    await pool.send_message(_message(1))
+    smtp_server.drop_connections()
+    await asyncio.sleep(0.05)
+    await pool.send_message(_message(2))
+    await pool.close()
+
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.sessions == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_idle_session_is_replaced(smtp_server):
+    pool = _pool(smtp_server, idle_timeout=0)
+
+    await pool.send_message(_message(1))
+    await pool.send_message(_message(2))
+    await pool.close()
+
+    assert smtp_server.sessions == 2
+    assert smtp_server.noops == 0
+
+
+@pytest.mark.asyncio
+async def test_email_client_sends_through_pool(smtp_server):
+    pool = _pool(smtp_server)
+    client = AsyncEmailClient("127.0.0.1", smtp_server.port, smtp_from_email="lily@test.com", smtp_pool=pool)
+
+    await client.send_email("a@test.com", "One", "<p>1</p>")
+    await client.send_email("b@test.com", "Two", "<p>2</p>")
+    await pool.close()
+
+    assert smtp_server.sessions == 1
+    assert b"Subject: Two" in smtp_server.messages[1]
@@ -7,6 +7,9 @@ from src.workers.system_worker.tasks.booking import (
     _schedule_next,
     booking_maintenance_task,
     complete_past_appointments_task,
+    refresh_analytics_rollup_task,
+    refresh_loyalty_task,
+    relay_booking_outbox_task,
 )
 
 
@@ -201,6 +204,48 @@ async def test_complete_past_appointments_task_skips_without_api_key(mock_ctx):
     mock_ctx["internal_api"].post.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_refresh_loyalty_task_calls_scoped_internal_api(mock_ctx):
+    mock_ctx["internal_api"].post.return_value = {"success": True, "refreshed": 12}
+
+    result = await refresh_loyalty_task(mock_ctx)
+
+    assert result == {"status": "ok", "refreshed": 12}
+    mock_ctx["internal_api"].post.assert_awaited_once_with(
+        "/v1/booking/loyalty/refresh-dirty",
+        scope="booking.worker",
+        token="test-token",
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_analytics_rollup_task_calls_scoped_internal_api(mock_ctx):
+    mock_ctx["internal_api"].post.return_value = {"success": True, "rebuilt_days": 3}
+
+    result = await refresh_analytics_rollup_task(mock_ctx)
+
+    assert result == {"status": "ok", "rebuilt_days": 3}
+    mock_ctx["internal_api"].post.assert_awaited_once_with(
+        "/v1/booking/analytics/refresh-rollup",
+        scope="booking.worker",
+        token="test-token",
+    )
+
+
+@pytest.mark.asyncio
+async def test_relay_booking_outbox_task_calls_scoped_internal_api(mock_ctx):
+    mock_ctx["internal_api"].post.return_value = {"success": True, "sent": 4, "retrying": 1, "failed": 0}
+
+    result = await relay_booking_outbox_task(mock_ctx)
+
+    assert result == {"status": "ok", "sent": 4, "retrying": 1, "failed": 0}
+    mock_ctx["internal_api"].post.assert_awaited_once_with(
+        "/v1/booking/outbox/relay",
+        scope="booking.worker",
+        token="test-token",
+    )
+
+
 def test_system_worker_registers_daily_local_morning_completion():
     from src.workers.system_worker.worker import WorkerSettings
 
@@ -2,7 +2,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.workers.system_worker.dependencies import close_arq_service, init_arq_service
+from src.workers.system_worker.dependencies import (
+    close_arq_service,
+    close_email_parse_pool,
+    init_arq_service,
+    init_email_parse_pool,
+)
 
 
 @pytest.fixture
@@ -37,3 +42,22 @@ class TestSystemWorkerDependencies:
         ctx = {}
         # Should not raise
         await close_arq_service(ctx, mock_settings)
+
+    async def test_email_parse_pool_is_off_with_one_worker(self):
+        ctx = {}
+
+        await init_email_parse_pool(ctx, MagicMock(email_import_parse_workers=1))
+
+        assert ctx["email_parse_pool"] is None
+        await close_email_parse_pool(ctx, MagicMock())
+
+    async def test_email_parse_pool_lives_for_the_worker(self):
+        ctx = {}
+
+        await init_email_parse_pool(ctx, MagicMock(email_import_parse_workers=2))
+        pool = ctx["email_parse_pool"]
+        assert pool._max_workers == 2
+
+        await close_email_parse_pool(ctx, MagicMock())
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
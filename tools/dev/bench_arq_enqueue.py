@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Enqueue jobs into ARQ from synchronous code and report throughput and pool reuse.
+
+Compares the persistent sync path (``DjangoArqClient.enqueue``) with the old
+per-call ``async_to_sync`` wrapper, which builds a new Redis pool every time.
+Needs a reachable Redis (``REDIS_HOST``/``REDIS_PORT`` from the Django settings).
+
+    python tools/dev/bench_arq_enqueue.py --jobs 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import django
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR / "src" / "lily_backend"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.dev")
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from core.arq.client import DjangoArqClient  # noqa: E402
+from core.arq.metrics import ARQ_CLIENT_POOLS  # noqa: E402
+
+QUEUE_NAME = "arq:bench"
+TASK_NAME = "bench_noop_task"
+
+
+def _pool_lookups() -> dict[str, int]:
+    return {
+        f"{path}/{result}": int(ARQ_CLIENT_POOLS.labels(path=path, result=result)._value.get())
+        for path in ("sync", "async")
+        for result in ("created", "reused")
+    }
+
+
+def _run(label: str, jobs: int, enqueue) -> None:
+    before = _pool_lookups()
+    run_id = uuid.uuid4().hex[:8]
+    started = time.perf_counter()
+    for index in range(jobs):
+        enqueue(TASK_NAME, {"n": index}, queue_name=QUEUE_NAME, job_id=f"bench:{run_id}:{index}")
+    elapsed = time.perf_counter() - started
+
+    pools = {key: value - before[key] for key, value in _pool_lookups().items() if value != before[key]}
+    print(f"{label:<14} {jobs} jobs in {elapsed:.2f}s ({jobs / elapsed:,.0f} jobs/s)  pools: {pools}")
+
+
+def _cleanup() -> None:
+    async def drop_queue() -> None:
+        pool = await DjangoArqClient.get_pool()
+        job_ids = await pool.zrange(QUEUE_NAME, 0, -1)
+        if job_ids:
+            await pool.delete(*(f"arq:job:{job_id.decode()}" for job_id in job_ids))
+        await pool.delete(QUEUE_NAME)
+
+    DjangoArqClient.run_sync(drop_queue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000, help="Jobs to enqueue per variant (default: 1000)")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only measure the persistent sync path")
+    args = parser.parse_args()
+
+    _run("persistent", args.jobs, DjangoArqClient.enqueue)
+    if not args.skip_legacy:
+        _run("async_to_sync", args.jobs, async_to_sync(DjangoArqClient.aenqueue))
+    _cleanup()
+
+
+if __name__ == "__main__":
+    main()